@@ -1,5 +1,4 @@
 import os
-import re
 import getpass
 
 from collections import deque
@@ -10,7 +9,7 @@ from dcc.maya.libs import plugutils
 from mpy import mpynodeextension, mpyattribute
 from mpy.abstract import mabcmeta
 from ..interfaces import controlrig
-from ..libs import Side, Type, Style, Status, componentfactory, interfacefactory
+from ..libs import Side, Type, Style, Status, componentfactory, componenthierarchy, interfacefactory
 
 import logging
 logging.basicConfig()
@@ -63,6 +62,7 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
         self._controlRig = self.nullWeakReference
         self._componentManager = componentfactory.ComponentFactory.getInstance(asWeakReference=True)
         self._interfaceManager = interfacefactory.InterfaceFactory.getInstance(asWeakReference=True)
+        self._componentHierarchy = componenthierarchy.ComponentHierarchy.getInstance()
     # endregion
 
     # region Attributes
@@ -89,6 +89,16 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
 
         return self._componentManager()
 
+    @property
+    def componentHierarchy(self):
+        """
+        Getter method that returns the component hierarchy index.
+
+        :rtype: componenthierarchy.ComponentHierarchy
+        """
+
+        return self._componentHierarchy
+
     @componentName.changed
     def componentName(self, value):
         """
@@ -102,6 +112,8 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
         self.markSkeletonDirty()
         # self.markPivotsDirty()
 
+        self.componentHierarchy.notifyChanged(self, 'componentName')
+
     @componentSide.changed
     def componentSide(self, value):
         """
@@ -115,6 +127,8 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
         self.markSkeletonDirty()
         # self.markPivotsDirty()
 
+        self.componentHierarchy.notifyChanged(self, 'componentSide')
+
     @componentId.changed
     def componentId(self, value):
         """
@@ -127,6 +141,30 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
         self.invalidateName()
         self.markSkeletonDirty()
         # self.markPivotsDirty()
+
+        self.componentHierarchy.notifyChanged(self, 'componentId')
+
+    @componentChildren.changed
+    def componentChildren(self, componentChildren):
+        """
+        Changed method that notifies any component children changes.
+
+        :type componentChildren: List[om.MObject]
+        :rtype: None
+        """
+
+        self.componentHierarchy.invalidate(component=self)
+
+    @componentStatus.changed
+    def componentStatus(self, value):
+        """
+        Changed method that notifies any component status changes.
+
+        :type value: int
+        :rtype: None
+        """
+
+        self.componentHierarchy.notifyChanged(self, 'componentStatus')
     # endregion
 
     # region Methods
@@ -226,33 +264,7 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
         :rtype: AbstractComponent
         """
 
-        # Iterate through message destinations
-        #
-        plug = self.findPlug('message')
-        otherPlugs = plug.destinations()
-
-        for otherPlug in otherPlugs:
-
-            # Check if this a rig component
-            #
-            plugName = otherPlug.partialName(
-                includeNodeName=False,
-                useLongNames=True,
-                includeNonMandatoryIndices=True,
-                useFullAttributePath=True
-            )
-
-            isComponent = re.fullmatch(r'^componentChildren\[[0-9]+]$', plugName)
-
-            if isComponent:
-
-                return self.scene(otherPlug.node())
-
-            else:
-
-                continue
-
-        return None
+        return self.componentHierarchy.componentParent(self)
 
     def iterComponentAncestors(self):
         """
@@ -276,7 +288,7 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
         :rtype: List[AbstractComponent]
         """
 
-        return [component for component in self.iterComponentAncestors() if any(cls.__name__.endswith(typeName) for cls in component.iterBases())]
+        return self.componentHierarchy.findComponentAncestors(self, typeName)
 
     def traceComponent(self):
         """
@@ -295,7 +307,7 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
         :rtype: int
         """
 
-        return self.findPlug('componentChildren').numConnectedElements()
+        return len(self.componentHierarchy.componentChildren(self))
 
     def iterComponentChildren(self):
         """
@@ -304,15 +316,7 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
         :rtype: Iterator[AbstractComponent]
         """
 
-        # Iterate through connected elements
-        #
-        plug = self.findPlug('componentChildren')
-        elementCount = plug.numConnectedElements()
-
-        for i in range(elementCount):
-
-            element = plug.connectionByPhysicalIndex(i)
-            yield self.scene(element.source().node())
+        yield from self.componentHierarchy.componentChildren(self)
 
     def popComponentChild(self, index):
         """
@@ -342,6 +346,10 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
             self.disconnectPlugs(source, destination)
             plugutils.removeMultiInstances(destination, [index])
 
+            # Notify child change
+            #
+            self.__class__.componentChildren.notify(self)
+
             return component
 
         elif isinstance(index, slice):
@@ -385,16 +393,16 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
             #
             plugutils.removeMultiInstances(plug, logicalIndices)
 
+            # Notify child change
+            #
+            self.__class__.componentChildren.notify(self)
+
             return components
 
         else:
 
             raise TypeError(f'popComponentChild() expects an int ({type(index).__name__} given)!')
 
-        # Notify child change
-        #
-        self.__class__.componentChildren.notify(self)
-
     def insertComponentChild(self, insertAt, child):
         """
         Inserts a child, at the specified index, to this component.
@@ -519,7 +527,7 @@ class AbstractComponent(mpynodeextension.MPyNodeExtension, metaclass=mabcmeta.MA
         :rtype: List[AbstractComponent]
         """
 
-        return [component for component in self.iterComponentDescendants() if any(cls.__name__.endswith(typeName) for cls in component.iterBases())]
+        return self.componentHierarchy.findComponentDescendants(self, typeName)
 
     def walkComponents(self, includeSelf=True):
         """
@@ -5,7 +5,7 @@ from dcc.maya.json import melsonobject
 from dcc.collections import notifylist
 from dcc.vendor.six import string_types
 from abc import ABCMeta, abstractmethod
-from ..libs import driverspec
+from ..libs import driverspec, buildsession, specindex
 
 import logging
 logging.basicConfig()
@@ -30,10 +30,16 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         '_defaultMatrix',
         '_driver',
         '_parent',
-        '_children'
+        '_children',
+        '_dirty',
+        '_fragment',
+        '_pending',
+        '_flattened'
     )
 
     __default_name__ = 'transform'
+    __enabled_flag__ = 1
+    __passthrough_flag__ = 2
 
     def __init__(self, *args, **kwargs):
         """
@@ -55,15 +61,35 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         self._uuid = om.MUuid()
         self._matrix = None
         self._defaultMatrix = om.MTransformationMatrix.kIdentity
-        self._driver = driverspec.DriverSpec(driven=self.weakReference())
+        self._driver = None  # Drivers are only allocated once they are written to!
         self._parent = self.nullWeakReference
         self._children = notifylist.NotifyList()
         self._enabled = True
+        self._dirty = True
+        self._fragment = None
+        self._pending = None
+        self._flattened = None
 
         # Register callbacks
         #
         self._children.addCallback('itemAdded', self.childAdded)
         self._children.addCallback('itemRemoved', self.childRemoved)
+
+    def __getstate__(self):
+        """
+        Private method that returns an object state for serialization.
+        Default drivers are omitted since they are restored by default!
+
+        :rtype: Dict[str, Any]
+        """
+
+        state = super(AbstractSpec, self).__getstate__()
+
+        if not self.hasDriver():
+
+            state.pop('driver', None)
+
+        return state
     # endregion
 
     # region Properties
@@ -107,6 +133,10 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         """
 
         self._enabled = enabled
+        self.markDirty()
+        self.invalidateFlattened()
+
+        buildsession.invalidate(self.component)
 
     @property
     def name(self):
@@ -128,6 +158,9 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         """
 
         self._name = name
+        self.markDirty()
+
+        specindex.invalidate(self.component)
 
     @name.deleter
     def name(self):
@@ -138,6 +171,9 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         """
 
         self._name = ''
+        self.markDirty()
+
+        specindex.invalidate(self.component)
 
     @property
     def uuid(self):
@@ -161,6 +197,9 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         if isinstance(uuid, om.MUuid):
 
             self._uuid.copy(uuid)
+            self.markDirty()
+
+            specindex.invalidate(self.component)
 
         elif isinstance(uuid, string_types):
 
@@ -179,6 +218,9 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         """
 
         self._uuid.__init__()
+        self.markDirty()
+
+        specindex.invalidate(self.component)
 
     @property
     def matrix(self):
@@ -221,6 +263,8 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
 
             raise TypeError(f'matrix.setter() expects an transformation matrix ({type(matrix).__name__} given)!')
 
+        self.markDirty()
+
     @matrix.deleter
     def matrix(self):
         """
@@ -230,6 +274,7 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         """
 
         self._matrix = None  # This forces the default matrix to be used in its place!
+        self.markDirty()
 
     @property
     def defaultMatrix(self):
@@ -266,6 +311,8 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
 
             raise TypeError(f'defaultMatrix.setter() expects an transformation matrix ({type(defaultMatrix).__name__} given)!')
 
+        self.markDirty()
+
     @defaultMatrix.deleter
     def defaultMatrix(self):
         """
@@ -275,23 +322,30 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         """
 
         self._defaultMatrix = om.MMatrix.kIdentity
+        self.markDirty()
 
     @property
     def driver(self):
         """
         Getter method that returns the driver.
 
-        :rtype: driverspec.DriverSpec
+        :rtype: Union[driverspec.DriverSpec, driverspec.DriverProxy]
         """
 
-        return self._driver
+        if self._driver is not None:
+
+            return self._driver
+
+        else:
+
+            return driverspec.DriverProxy(self)
 
     @driver.setter
     def driver(self, driver):
         """
         Setter method that updates the driver.
 
-        :type driver: Union[str, driverspec.DriverSpec]
+        :type driver: Union[str, driverspec.DriverSpec, driverspec.DriverProxy]
         :rtype: None
         """
 
@@ -299,10 +353,16 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
 
             self._driver = driver
             self._driver._driven = self.weakReference()
+            self.markDirty()
+
+        elif isinstance(driver, driverspec.DriverProxy):
+
+            self._driver = None
+            self.markDirty()
 
         elif isinstance(driver, string_types):
 
-            self._driver.name = driver
+            self.driver.name = driver
 
         else:
 
@@ -326,6 +386,10 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         :rtype: List[AbstractSpec]
         """
 
+        if self._pending is not None:
+
+            self.loadChildren()
+
         return self._children
 
     @children.setter
@@ -337,6 +401,8 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         :rtype: None
         """
 
+        self._pending = None
+
         self._children.clear()
         self._children.extend(children)
     # endregion
@@ -352,6 +418,11 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         """
 
         child._parent = self.weakReference()
+        self.markDirty()
+        self.invalidateFlattened()
+
+        buildsession.invalidate(self.component)
+        specindex.invalidate(self.component)
 
     def childRemoved(self, child):
         """
@@ -362,9 +433,215 @@ class AbstractSpec(melsonobject.MELSONObject, metaclass=ABCMeta):
         """
 
         child._parent = self.nullWeakReference
+        self.markDirty()
+        self.invalidateFlattened()
+
+        buildsession.invalidate(self.component)
+        specindex.invalidate(self.component)
     # endregion
 
     # region Methods
+    def isDirty(self):
+        """
+        Evaluates if this spec, or any of its descendants, has changed since it was last encoded.
+
+        :rtype: bool
+        """
+
+        return self._dirty
+
+    def markDirty(self):
+        """
+        Marks this spec and its ancestors as dirty.
+        Since dirty specs always have dirty ancestors, the walk stops at the first dirty ancestor!
+
+        :rtype: None
+        """
+
+        spec = self
+
+        while spec is not None and not getattr(spec, '_dirty', True):  # Specs that are still initializing are dirty by default!
+
+            spec._dirty = True
+            spec = spec._parent()
+
+    def markClean(self):
+        """
+        Marks this spec as clean.
+        This should only be called once all descendants are also clean!
+
+        :rtype: None
+        """
+
+        self._dirty = False
+
+    def hasDriver(self):
+        """
+        Evaluates if this spec has allocated its own driver.
+
+        :rtype: bool
+        """
+
+        return self._driver is not None
+
+    def ensureDriver(self):
+        """
+        Returns the driver for this spec, allocating it if it does not exist.
+
+        :rtype: driverspec.DriverSpec
+        """
+
+        if self._driver is None:
+
+            self._driver = driverspec.DriverSpec(driven=self.weakReference())
+            self.markDirty()
+
+        return self._driver
+
+    def flattened(self):
+        """
+        Returns this spec and its descendants as cached pre-order arrays.
+        The arrays consist of the specs, their parent indices, the index after each subtree and their enabled/passthrough flags.
+        The arrays are cached until this spec, or any of its descendants, changes its children or flags!
+
+        :rtype: Tuple[List[AbstractSpec], List[int], List[int], bytearray]
+        """
+
+        # Check if arrays are cached
+        #
+        if self._flattened is not None:
+
+            return self._flattened
+
+        # Collect specs in pre-order
+        # An explicit stack is used so deep chains cannot exceed the recursion limit!
+        #
+        specs, parents, ends, flags = [], [], [], bytearray()
+        stack = [(self, -1)]
+
+        while len(stack) > 0:
+
+            spec, parentIndex = stack.pop()
+            index = len(specs)
+
+            specs.append(spec)
+            parents.append(parentIndex)
+            ends.append(index + 1)
+
+            enabledFlag = self.__enabled_flag__ if getattr(spec, 'enabled', False) else 0
+            passthroughFlag = self.__passthrough_flag__ if getattr(spec, 'passthrough', False) else 0
+            flags.append(enabledFlag | passthroughFlag)
+
+            stack.extend([(child, index) for child in reversed(spec.children) if isinstance(child, AbstractSpec)])
+
+        # Propagate subtree ends
+        # Descendants always have a higher index than their ancestors so a single reverse pass is sufficient!
+        #
+        for index in range(len(specs) - 1, 0, -1):
+
+            parentIndex = parents[index]
+
+            if ends[index] > ends[parentIndex]:
+
+                ends[parentIndex] = ends[index]
+
+        self._flattened = (specs, parents, ends, flags)
+        return self._flattened
+
+    def invalidateFlattened(self):
+        """
+        Removes the cached pre-order arrays from this spec and its ancestors.
+
+        :rtype: None
+        """
+
+        spec = self
+
+        while spec is not None:
+
+            spec._flattened = None
+            spec = spec._parent()
+
+    def cachedFragment(self, token):
+        """
+        Returns the encoded fragment cached by the supplied encoder token.
+
+        :type token: object
+        :rtype: Union[bytes, None]
+        """
+
+        if self._fragment is not None and self._fragment[0] is token:
+
+            return self._fragment[1]
+
+        else:
+
+            return None
+
+    def cacheFragment(self, token, fragment):
+        """
+        Caches the encoded fragment for the supplied encoder token.
+
+        :type token: object
+        :type fragment: bytes
+        :rtype: None
+        """
+
+        self._fragment = (token, fragment)
+
+    def deferChildren(self, loader):
+        """
+        Defers decoding the child specs until they are first accessed.
+
+        :type loader: Callable
+        :rtype: None
+        """
+
+        self._pending = loader
+
+    def hasPendingChildren(self):
+        """
+        Evaluates if the child specs have yet to be decoded.
+
+        :rtype: bool
+        """
+
+        return self._pending is not None
+
+    def loadChildren(self):
+        """
+        Decodes any deferred child specs.
+        Decoding does not change the contents, so no specs are dirtied and no build caches are invalidated!
+
+        :rtype: None
+        """
+
+        # Check if children are pending
+        #
+        loader, self._pending = self._pending, None
+
+        if loader is None:
+
+            return
+
+        # Bulk assign decoded children
+        # The callbacks are only registered afterwards so none of the per-child invalidation is triggered!
+        #
+        reference = self.weakReference()
+
+        children = notifylist.NotifyList()
+        children.extend(self._children)
+        children.extend(loader())
+
+        for child in children:
+
+            child._parent = reference
+
+        children.addCallback('itemAdded', self.childAdded)
+        children.addCallback('itemRemoved', self.childRemoved)
+
+        self._children = children
+
     def enable(self):
         """
         Enables this spec.
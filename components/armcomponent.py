@@ -16,6 +16,7 @@ class ArmComponent(TwoBoneLimbComponent):
 
     # region Dunderscores
     __version__ = 1.0
+    __refinalize__ = True  # Finalizing only reconnects the opposite wrist space switch so it can safely re-run!
     __default_component_name__ = 'Arm'
     __default_hinge_name__ = 'Elbow'
     __default_limb_names__ = ('UpperArm', 'Forearm', 'Wrist')
@@ -1,3 +1,7 @@
+import base64
+import hashlib
+
+from maya import cmds as mc
 from maya.api import OpenMaya as om
 from mpy import mpynode, mpyattribute
 from dcc.maya.libs import dagutils, shapeutils
@@ -6,7 +10,7 @@ from abc import abstractmethod
 from collections import deque
 from collections.abc import MutableSequence
 from ..abstract import abstractcomponent, abstractspec
-from ..libs import skeletonspec, pivotspec
+from ..libs import skeletonspec, pivotspec, nodenetwork, speccodec, buildsession, specindex
 
 import logging
 logging.basicConfig()
@@ -25,9 +29,16 @@ class BaseComponent(abstractcomponent.AbstractComponent):
     PIVOTS_KEY = 'pivots'
     PIVOTS_DIRTY_KEY = 'arePivotsDirty'
     SHAPE_CACHE = 'shapes'
+    FINGERPRINT_KEY = 'fingerprint'
     # endregion
 
     # region Dunderscores
+    __compact_specs__ = False  # Opt-in per component class, only compact specs reuse the encoded fragments of clean specs on push!
+    __refinalize__ = False  # Opt-in per component class, only idempotent finalizers are re-run when a descendant is rebuilt incrementally!
+    __fingerprint_excludes__ = ('componentStatus', 'componentChildren', 'controlsGroup', 'privateGroup', 'jointsGroup')
+    __dag_types__ = {}
+    __shape_types__ = {}
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -44,6 +55,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         self._callbackID = None
         self._pending = deque()
         self._bin = deque()
+        self._encoders = {}
 
     def __post_init__(self, *args, **kwargs):
         """
@@ -96,7 +108,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         component.userProperties[cls.SKELETON_KEY] = []
         component.userProperties[cls.PIVOTS_DIRTY_KEY] = True
         component.userProperties[cls.PIVOTS_KEY] = []
-        component.userProperties.pushBuffer()
+        component.pushUserProperties()
 
         return component
 
@@ -125,11 +137,156 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         #
         return super(BaseComponent, self).delete()
 
+    def loadSpecs(self, key):
+        """
+        Returns the spec trees stored under the supplied user property key.
+        Compact encodings are decoded once and cached inside the user properties until they are next pulled!
+        Only the top-level specs are decoded upfront, any child specs are decoded once they are first accessed.
+
+        :type key: str
+        :rtype: List[abstractspec.AbstractSpec]
+        """
+
+        specs = self.userProperties.get(key, [])
+
+        if speccodec.isEncoded(specs):
+
+            decoder = speccodec.SpecDecoder(objectHook=self.__user_property_init__, lazy=True)
+            specs = decoder.decode(base64.b64decode(specs[len(speccodec.__magic__):]))
+
+            self._encoders[key] = decoder.encoder
+            self.userProperties[key] = specs
+
+        return specs
+
+    def dumpSpecs(self, key):
+        """
+        Returns the compact encoding for the specs stored under the supplied user property key.
+        Specs that have not been decoded yet are returned as stored, otherwise the cached encoder is reused so only dirty specs are re-encoded!
+
+        :type key: str
+        :rtype: str
+        """
+
+        specs = self.userProperties.get(key, [])
+
+        if speccodec.isEncoded(specs):
+
+            return specs
+
+        encoder = self._encoders.get(key, None)
+
+        if encoder is None:
+
+            encoder = self._encoders[key] = speccodec.SpecEncoder()
+
+        return encoder.dumps(specs)
+
+    def pushUserProperties(self):
+        """
+        Pushes the user properties to the node's buffer.
+        If compact specs are enabled then the spec trees are temporarily swapped for their compact encoding!
+        Each spec key reuses the same encoder so only specs that changed since the last push are re-encoded.
+
+        :rtype: None
+        """
+
+        # Check if compact specs are enabled
+        #
+        if not self.__compact_specs__:
+
+            self.userProperties.pushBuffer()
+            return
+
+        # Swap spec trees for compact encodings
+        #
+        decoded = {}
+
+        for key in (self.SKELETON_KEY, self.PIVOTS_KEY):
+
+            specs = self.userProperties.get(key, None)
+
+            if isinstance(specs, MutableSequence):
+
+                decoded[key] = specs
+                self.userProperties[key] = self.dumpSpecs(key)
+
+        try:
+
+            self.userProperties.pushBuffer()
+
+        finally:
+
+            for (key, specs) in decoded.items():
+
+                self.userProperties[key] = specs
+
     @classmethod
     def flattenSpecs(cls, specs, **kwargs):
         """
         Returns a generator that yields all skeleton specs.
         By default, this method ignores disabled specs and skips over passthrough specs!
+        Each spec tree is scanned using its cached pre-order arrays, disabled specs are skipped by jumping to the end of their subtree.
+
+        :type specs: Union[skeletonspec.SkeletonSpec, List[skeletonspec.SkeletonSpec]]
+        :type skipDisabled: bool
+        :type skipPassthrough: bool
+        :rtype: Iterator[skeletonspec.SkeletonSpec]
+        """
+
+        # Evaluate supplied specs
+        #
+        if isinstance(specs, abstractspec.AbstractSpec):
+
+            specs = [specs]
+
+        # Iterate through specs
+        #
+        skipDisabled = kwargs.get('skipDisabled', True)
+        skipPassthrough = kwargs.get('skipPassthrough', True)
+
+        enabledFlag = abstractspec.AbstractSpec.__enabled_flag__
+        passthroughFlag = abstractspec.AbstractSpec.__passthrough_flag__
+
+        for spec in specs:
+
+            # Evaluate item type
+            #
+            if not isinstance(spec, abstractspec.AbstractSpec):
+
+                continue
+
+            # Scan pre-order arrays
+            #
+            flatSpecs, parents, ends, flags = spec.flattened()
+            index, count = 0, len(flatSpecs)
+
+            while index < count:
+
+                # Check if spec is enabled
+                # If not, go ahead and skip it and ignore children
+                #
+                flag = flags[index]
+
+                if skipDisabled and not (flag & enabledFlag):
+
+                    index = ends[index]
+                    continue
+
+                # Check if spec is marked to passthrough
+                # If so, go ahead and move onto children
+                #
+                if not (skipPassthrough and (flag & passthroughFlag)):
+
+                    yield flatSpecs[index]
+
+                index += 1
+
+    @classmethod
+    def iterTopLevelSpecs(cls, specs, **kwargs):
+        """
+        Returns a generator that yields the top-level skeleton specs.
+        Unlike filtering `flattenSpecs`, this method only descends through passthrough specs so no other children are decoded!
 
         :type specs: Union[skeletonspec.SkeletonSpec, List[skeletonspec.SkeletonSpec]]
         :type skipDisabled: bool
@@ -157,7 +314,6 @@ class BaseComponent(abstractcomponent.AbstractComponent):
                 continue
 
             # Check if spec is enabled
-            # If so, go ahead and skip it and ignore children
             #
             enabled = getattr(spec, 'enabled', False)
 
@@ -166,18 +322,21 @@ class BaseComponent(abstractcomponent.AbstractComponent):
                 continue
 
             # Check if spec is marked to passthrough
-            # If so, go ahead and continue and move onto children
+            # If so, its children are also considered top-level!
             #
             passthrough = getattr(spec, 'passthrough', False)
 
-            if skipPassthrough and passthrough:
+            if passthrough:
+
+                if not skipPassthrough:
 
-                yield from cls.flattenSpecs(spec.children, **kwargs)
+                    yield spec
+
+                yield from cls.iterTopLevelSpecs(spec.children, **kwargs)
 
             else:
 
                 yield spec
-                yield from cls.flattenSpecs(spec.children, **kwargs)
 
     @classmethod
     def unpackSpecs(cls, *args):
@@ -285,6 +444,9 @@ class BaseComponent(abstractcomponent.AbstractComponent):
 
             pass
 
+        buildsession.invalidate(self)  # Top-level spec lists do not notify their owner!
+        specindex.invalidate(self)
+
         return childSpecs
 
     def resizeHierarchicalSpecs(self, size, topLevelSpec, cls=None):
@@ -349,6 +511,70 @@ class BaseComponent(abstractcomponent.AbstractComponent):
 
         return hierarchy
 
+    def specIndex(self):
+        """
+        Returns the rig-wide skeleton spec index.
+
+        :rtype: specindex.SpecIndex
+        """
+
+        return specindex.SpecIndex.getInstance()
+
+    def filterSpecEntries(self, entries, rigWide=False):
+        """
+        Returns the specs from the supplied index entries.
+        Unless `rigWide` is enabled, only the specs owned by this component are returned!
+
+        :type entries: List[specindex.SpecEntry]
+        :type rigWide: bool
+        :rtype: List[skeletonspec.SkeletonSpec]
+        """
+
+        if rigWide:
+
+            return [entry.spec for entry in entries]
+
+        else:
+
+            hashCode = self.hashCode()
+            return [entry.spec for entry in entries if entry.component.hashCode() == hashCode]
+
+    def findSkeletonSpecByName(self, name, rigWide=False):
+        """
+        Returns the skeleton spec with the specified name.
+
+        :type name: str
+        :type rigWide: bool
+        :rtype: Union[skeletonspec.SkeletonSpec, None]
+        """
+
+        skeletonSpecs = self.filterSpecEntries(self.specIndex().findSpecsByName(self, name), rigWide=rigWide)
+        return skeletonSpecs[0] if len(skeletonSpecs) > 0 else None
+
+    def findSkeletonSpecByUuid(self, uuid, rigWide=False):
+        """
+        Returns the skeleton spec with the specified UUID.
+
+        :type uuid: om.MUuid
+        :type rigWide: bool
+        :rtype: Union[skeletonspec.SkeletonSpec, None]
+        """
+
+        skeletonSpecs = self.filterSpecEntries(self.specIndex().findSpecsByUuid(self, uuid), rigWide=rigWide)
+        return skeletonSpecs[0] if len(skeletonSpecs) > 0 else None
+
+    def findSkeletonSpecsByType(self, side, type, rigWide=False):
+        """
+        Returns the skeleton specs with the specified side and type.
+
+        :type side: Side
+        :type type: Type
+        :type rigWide: bool
+        :rtype: List[skeletonspec.SkeletonSpec]
+        """
+
+        return self.filterSpecEntries(self.specIndex().findSpecsByType(self, side, type), rigWide=rigWide)
+
     def getAttachmentOptions(self):
         """
         Returns the attachment options for this component.
@@ -477,6 +703,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         """
 
         self.userProperties[self.SKELETON_DIRTY_KEY] = True
+        buildsession.invalidate(self, key=self.SKELETON_KEY)
 
     def markSkeletonClean(self):
         """
@@ -490,24 +717,28 @@ class BaseComponent(abstractcomponent.AbstractComponent):
     def skeleton(self, **kwargs):
         """
         Returns the skeleton specs for this component.
+        While a build session is active, any reorganized specs are memoized until the skeleton is invalidated!
 
         :type flatten: bool
         :type topLevelOnly: bool
+        :type skipDisabled: bool
+        :type skipPassthrough: bool
         :type force: bool
         :rtype: List[skeletonspec.SkeletonSpec]
         """
 
         # Check if skeleton specs are clean
+        # The component status is only queried when the skeleton is dirty!
         #
-        isDirty = self.isSkeletonDirty()
-        isMeta = (self.componentStatus == self.Status.META)
         force = kwargs.get('force', False)
+        skeletonSpecs = self.loadSpecs(self.SKELETON_KEY)
 
-        skeletonSpecs = self.userProperties.get(self.SKELETON_KEY, [])
-
-        if (isDirty and isMeta) or force:
+        if force or (self.isSkeletonDirty() and self.componentStatus == self.Status.META):
 
             log.info(f'Invalidating "{self}" skeleton specs...')
+            buildsession.invalidate(self, key=self.SKELETON_KEY)
+            specindex.invalidate(self)
+
             skeletonSpecs = self.invalidateSkeleton(skeletonSpecs)
 
         # Check if skeleton specs require reorganizing
@@ -515,19 +746,32 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         topLevelOnly = kwargs.pop('topLevelOnly', False)
         flatten = kwargs.pop('flatten', False)
 
-        if topLevelOnly:
+        if not (topLevelOnly or flatten):
 
-            skeletonSpecs = [skeletonSpec for skeletonSpec in self.flattenSpecs(skeletonSpecs, **kwargs) if skeletonSpec.parent is None]
+            return skeletonSpecs
 
-        elif flatten:
+        # Check if reorganized specs have been memoized
+        #
+        session = buildsession.getSession()
+        options = (topLevelOnly, flatten, kwargs.get('skipDisabled', True), kwargs.get('skipPassthrough', True))
 
-            skeletonSpecs = list(self.flattenSpecs(skeletonSpecs, **kwargs))
+        derivedSpecs = session.get(self, self.SKELETON_KEY, skeletonSpecs, options) if session is not None else None
 
-        else:
+        if derivedSpecs is None:
 
-            pass
+            if topLevelOnly:
 
-        return skeletonSpecs
+                derivedSpecs = list(self.iterTopLevelSpecs(skeletonSpecs, **kwargs))
+
+            else:
+
+                derivedSpecs = list(self.flattenSpecs(skeletonSpecs, **kwargs))
+
+            if session is not None:
+
+                session.set(self, self.SKELETON_KEY, skeletonSpecs, options, derivedSpecs)
+
+        return list(derivedSpecs)  # Copied so callers cannot corrupt the memoized specs!
 
     def resizeSkeleton(self, size, parentSpec, hierarchical=False):
         """
@@ -556,7 +800,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         :rtype: List[skeletonspec.SkeletonSpec]
         """
 
-        self.userProperties.pushBuffer()
+        self.pushUserProperties()
         self.markSkeletonClean()
 
         return skeletonSpecs
@@ -586,7 +830,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
 
             # Locate associated joint by name and update UUID
             #
-            joint = self.scene.getNodeByName(skeletonSpec.name)
+            joint = self.specIndex().findNodeByName(self.scene, skeletonSpec.name)
 
             if joint is None:
 
@@ -611,7 +855,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
 
         # Push changes to property buffer
         #
-        self.userProperties.pushBuffer()
+        self.pushUserProperties()
 
     def cacheSkeleton(self, delete=False, push=False, save=False):
         """
@@ -630,11 +874,13 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         manager = self.skeletonManager()
         skeletonSpecs = self.skeleton(flatten=True, skipDisabled=True)
 
-        for skeletonSpec in skeletonSpecs:
+        with manager.transaction():
 
-            manager.cacheJoint(skeletonSpec, delete=delete, push=push)
+            for skeletonSpec in skeletonSpecs:
 
-        self.userProperties.pushBuffer()
+                manager.cacheJoint(skeletonSpec, delete=delete, push=push)
+
+        self.pushUserProperties()
 
         # Check if changes require saving
         #
@@ -718,8 +964,9 @@ class BaseComponent(abstractcomponent.AbstractComponent):
     def bindSkeleton(self):
         """
         Binds the skeleton for this component.
+        Returns a report describing how each export joint was bound.
 
-        :rtype: None
+        :rtype: rigotron.libs.driverspec.BindReport
         """
 
         # Reparent export skeleton
@@ -731,9 +978,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         manager = self.skeletonManager()
         skeletonSpecs = self.skeleton(flatten=True)
 
-        for skeletonSpec in skeletonSpecs:
-
-            manager.bindJoint(skeletonSpec)
+        return manager.bindJoints(skeletonSpecs)
 
     def unbindSkeleton(self):
         """
@@ -751,9 +996,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         manager = self.skeletonManager()
         skeletonSpecs = self.skeleton(flatten=True)
 
-        for skeletonSpec in skeletonSpecs:
-
-            manager.unbindJoint(skeletonSpec, reset=True)
+        manager.unbindJoints(skeletonSpecs, reset=True)
 
     def flushSkeleton(self, save=False):
         """
@@ -786,9 +1029,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         manager = self.skeletonManager()
         skeletonSpecs = self.skeleton(flatten=True, skipDisabled=False, skipPassthrough=True)
 
-        for skeletonSpec in skeletonSpecs:
-
-            manager.syncJoint(skeletonSpec)
+        manager.syncJoints(skeletonSpecs)
 
     def skeletonCompleted(self):
         """
@@ -798,7 +1039,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         """
 
         self.flushSkeleton(save=True)
-        self.userProperties.pushBuffer()
+        self.pushUserProperties()
 
     def arePivotsDirty(self):
         """
@@ -817,6 +1058,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         """
 
         self.userProperties[self.PIVOTS_DIRTY_KEY] = True
+        buildsession.invalidate(self, key=self.PIVOTS_KEY)
 
     def markPivotsClean(self):
         """
@@ -848,15 +1090,14 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         """
 
         # Check if pivot specs are clean
+        # The component status is only queried when the pivots are dirty!
         #
-        isDirty = self.arePivotsDirty()
-        isMeta = (self.componentStatus == self.Status.META)
         force = kwargs.get('force', False)
+        pivotSpecs = self.loadSpecs(self.PIVOTS_KEY)
 
-        pivotSpecs = self.userProperties.get(self.PIVOTS_KEY, [])
-
-        if (isDirty and isMeta) or force:
+        if force or (self.arePivotsDirty() and self.componentStatus == self.Status.META):
 
+            buildsession.invalidate(self, key=self.PIVOTS_KEY)
             pivotSpecs = self.invalidatePivots(pivotSpecs, **kwargs)
 
         # Check if pivot specs require reorganizing
@@ -864,19 +1105,32 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         flatten = kwargs.pop('flatten', False)
         skipDisabled = kwargs.get('skipDisabled', False)
 
-        if flatten:
+        if not (flatten or skipDisabled):
 
-            pivotSpecs = list(self.flattenSpecs(pivotSpecs, **kwargs))
+            return pivotSpecs
 
-        elif skipDisabled:
+        # Check if reorganized specs have been memoized
+        #
+        session = buildsession.getSession()
+        options = (flatten, skipDisabled, kwargs.get('skipPassthrough', True))
 
-            pivotSpecs = list(filter(lambda spec: spec.enabled, pivotSpecs))
+        derivedSpecs = session.get(self, self.PIVOTS_KEY, pivotSpecs, options) if session is not None else None
 
-        else:
+        if derivedSpecs is None:
 
-            pass
+            if flatten:
 
-        return pivotSpecs
+                derivedSpecs = list(self.flattenSpecs(pivotSpecs, **kwargs))
+
+            else:
+
+                derivedSpecs = list(filter(lambda spec: spec.enabled, pivotSpecs))
+
+            if session is not None:
+
+                session.set(self, self.PIVOTS_KEY, pivotSpecs, options, derivedSpecs)
+
+        return list(derivedSpecs)  # Copied so callers cannot corrupt the memoized specs!
 
     def invalidatePivots(self, pivotSpecs, **kwargs):
         """
@@ -886,7 +1140,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         :rtype: List[pivotspec.PivotSpec]
         """
 
-        self.userProperties.pushBuffer()
+        self.pushUserProperties()
         self.markPivotsClean()
 
         return pivotSpecs
@@ -898,7 +1152,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         :rtype: None
         """
 
-        self.userProperties.pushBuffer()
+        self.pushUserProperties()
 
     def prepareToBuildPivots(self):
         """
@@ -973,7 +1227,7 @@ class BaseComponent(abstractcomponent.AbstractComponent):
 
         # Push changes to user property buffer
         #
-        self.userProperties.pushBuffer()
+        self.pushUserProperties()
 
     def cachePivots(self, delete=False):
         """
@@ -1104,6 +1358,289 @@ class BaseComponent(abstractcomponent.AbstractComponent):
             #
             hyperLayout.addMember(node)
 
+    @classmethod
+    def isDagType(cls, typeName):
+        """
+        Evaluates if the supplied node type derives from a DAG node.
+        The results are cached since type inheritance never changes during a session!
+
+        :type typeName: str
+        :rtype: bool
+        """
+
+        isDag = cls.__dag_types__.get(typeName, None)
+
+        if isDag is None:
+
+            isDag = 'dagNode' in (mc.nodeType(typeName, isTypeName=True, inherited=True) or [])
+            cls.__dag_types__[typeName] = isDag
+
+        return isDag
+
+    @classmethod
+    def isShapeType(cls, typeName):
+        """
+        Evaluates if the supplied node type derives from a shape node.
+        The results are cached since type inheritance never changes during a session!
+
+        :type typeName: str
+        :rtype: bool
+        """
+
+        isShape = cls.__shape_types__.get(typeName, None)
+
+        if isShape is None:
+
+            isShape = 'shape' in (mc.nodeType(typeName, isTypeName=True, inherited=True) or [])
+            cls.__shape_types__[typeName] = isShape
+
+        return isShape
+
+    @staticmethod
+    def newPlugValue(modifier, plug, value, convertUnits=True):
+        """
+        Adds a plug value operation to the supplied modifier based on the plug's attribute type.
+        If the value cannot be expressed by a modifier, such as compounds or arrays, then false is returned!
+
+        :type modifier: om.MDGModifier
+        :type plug: om.MPlug
+        :type value: Any
+        :type convertUnits: bool
+        :rtype: bool
+        """
+
+        # Check if this is a compound or array plug
+        #
+        if plug.isCompound or plug.isArray or isinstance(value, (list, tuple, dict)):
+
+            return False
+
+        # Evaluate attribute type
+        #
+        attribute = plug.attribute()
+
+        if attribute.hasFn(om.MFn.kUnitAttribute):
+
+            unitType = om.MFnUnitAttribute(attribute).unitType()
+
+            if unitType == om.MFnUnitAttribute.kAngle:
+
+                unit = om.MAngle.uiUnit() if convertUnits else om.MAngle.kRadians
+                modifier.newPlugValueMAngle(plug, om.MAngle(float(value), unit))
+
+            elif unitType == om.MFnUnitAttribute.kDistance:
+
+                unit = om.MDistance.uiUnit() if convertUnits else om.MDistance.kCentimeters
+                modifier.newPlugValueMDistance(plug, om.MDistance(float(value), unit))
+
+            elif unitType == om.MFnUnitAttribute.kTime:
+
+                unit = om.MTime.uiUnit() if convertUnits else om.MTime.k6000FPS
+                modifier.newPlugValueMTime(plug, om.MTime(float(value), unit))
+
+            else:
+
+                return False
+
+        elif attribute.hasFn(om.MFn.kEnumAttribute):
+
+            modifier.newPlugValueShort(plug, int(value))
+
+        elif attribute.hasFn(om.MFn.kNumericAttribute):
+
+            numericType = om.MFnNumericAttribute(attribute).numericType()
+
+            if numericType == om.MFnNumericData.kBoolean:
+
+                modifier.newPlugValueBool(plug, bool(value))
+
+            elif numericType in (om.MFnNumericData.kByte, om.MFnNumericData.kChar):
+
+                modifier.newPlugValueChar(plug, int(value))
+
+            elif numericType == om.MFnNumericData.kShort:
+
+                modifier.newPlugValueShort(plug, int(value))
+
+            elif numericType in (om.MFnNumericData.kInt, om.MFnNumericData.kLong, om.MFnNumericData.kInt64, om.MFnNumericData.kAddr):
+
+                modifier.newPlugValueInt(plug, int(value))
+
+            elif numericType == om.MFnNumericData.kFloat:
+
+                modifier.newPlugValueFloat(plug, float(value))
+
+            elif numericType == om.MFnNumericData.kDouble:
+
+                modifier.newPlugValueDouble(plug, float(value))
+
+            else:
+
+                return False
+
+        elif attribute.hasFn(om.MFn.kTypedAttribute) and isinstance(value, str):
+
+            modifier.newPlugValueString(plug, value)
+
+        else:
+
+            return False
+
+        return True
+
+    def createNetwork(self):
+        """
+        Returns a new node network that can be committed using `commitNetwork`.
+
+        :rtype: nodenetwork.NodeNetwork
+        """
+
+        return nodenetwork.NodeNetwork()
+
+    def commitNetwork(self, network):
+        """
+        Commits the supplied node network and returns the created nodes in creation order.
+        Nodes are created and renamed by a single DAG and DG modifier, followed by a single modifier for any values and another for any connections.
+        Values are dispatched on the attribute type, any values that cannot be expressed by a modifier, such as compounds, are set before the connections are made!
+
+        :type network: nodenetwork.NodeNetwork
+        :rtype: List[mpynode.MPyNode]
+        """
+
+        # Create network nodes
+        #
+        dagModifier = om.MDagModifier()
+        dgModifier = om.MDGModifier()
+
+        numNodes = len(network)
+        objects = [None] * numNodes
+
+        for node in network:
+
+            # Evaluate parent type
+            #
+            parent = node.parent
+
+            if isinstance(parent, nodenetwork.NetworkNode):
+
+                parentObject = objects[parent.index]
+
+            elif parent is not None:
+
+                parentObject = self.scene(parent).object()
+
+            else:
+
+                parentObject = om.MObject.kNullObj
+
+            # Create node using the appropriate modifier
+            # DAG nodes must go through the DAG modifier so they are parented correctly!
+            #
+            isDag = self.isDagType(node.typeName)
+
+            if isDag:
+
+                if parentObject.isNull() and self.isShapeType(node.typeName):
+
+                    raise TypeError(f'commitNetwork() expects a parent for {node.typeName} shapes!')
+
+                obj = dagModifier.createNode(node.typeName, parent=parentObject)
+                modifier = dagModifier
+
+            elif parent is None:
+
+                obj = dgModifier.createNode(node.typeName)
+                modifier = dgModifier
+
+            else:
+
+                raise TypeError(f'commitNetwork() expects no parent for {node.typeName} nodes!')
+
+            if not stringutils.isNullOrEmpty(node.name):
+
+                modifier.renameNode(obj, node.name)
+
+            objects[node.index] = obj
+
+        dagModifier.doIt()
+        dgModifier.doIt()
+
+        nodes = [self.scene(obj) for obj in objects]
+
+        # Resolve network plugs
+        #
+        def findPlug(plug):
+
+            if isinstance(plug, nodenetwork.NetworkPlug):
+
+                if not network.isMember(plug.node):
+
+                    raise TypeError(f'commitNetwork() expects plugs from the same network ({plug.node} given)!')
+
+                return nodes[plug.node.index][plug.path]
+
+            elif isinstance(plug, om.MPlug):
+
+                return plug
+
+            else:
+
+                raise TypeError(f'commitNetwork() expects a valid plug ({type(plug).__name__} given)!')
+
+        # Update plug values
+        #
+        modifier = om.MDGModifier()
+        deferred = []
+
+        for (description, value, convertUnits) in network.values:
+
+            plug = findPlug(description)
+            success = self.newPlugValue(modifier, plug, value, convertUnits=convertUnits)
+
+            if not success:
+
+                deferred.append((description, plug, value, convertUnits))
+
+        modifier.doIt()
+
+        # Update any deferred plug values
+        #
+        for (description, plug, value, convertUnits) in deferred:
+
+            if isinstance(description, nodenetwork.NetworkPlug):
+
+                nodes[description.node.index].setAttr(description.path, value, convertUnits=convertUnits)
+
+            else:
+
+                plugPath = plug.partialName(useLongNames=True, includeNonMandatoryIndices=True, useFullAttributePath=True)
+                self.scene(plug.node()).setAttr(plugPath, value, convertUnits=convertUnits)
+
+        # Connect plugs
+        #
+        modifier = om.MDGModifier()
+
+        for (source, destination, force) in network.connections:
+
+            source, destination = findPlug(source), findPlug(destination)
+
+            if destination.isDestination:
+
+                if force:
+
+                    modifier.disconnect(destination.source(), destination)
+
+                else:
+
+                    log.warning(f'Skipping "{source.info}" > "{destination.info}" connection, destination is already connected!')
+                    continue
+
+            modifier.connect(source, destination)
+
+        modifier.doIt()
+
+        return nodes
+
     def prepareToBuildRig(self):
         """
         Notifies the component that the rig is about to be built.
@@ -1224,13 +1761,112 @@ class BaseComponent(abstractcomponent.AbstractComponent):
         #
         self.userProperties[self.SHAPE_CACHE] = cache
 
-    def deleteRig(self):
+    def deleteRig(self, unbind=True):
         """
         Removes all control rig related nodes.
+        Disabling `unbind` skips unbinding the skeleton, for when it has already been unbound!
 
+        :type unbind: bool
         :rtype: None
         """
 
-        self.unbindSkeleton()
+        if unbind:
+
+            self.unbindSkeleton()
+
         self.deleteMembers()
+
+    def iterFingerprintAttributes(self):
+        """
+        Returns a generator that yields the attribute names and values that contribute towards the fingerprint.
+        Any excluded or message attributes are skipped since they do not affect the build!
+
+        :rtype: Iterator[Tuple[str, Any]]
+        """
+
+        # Collect attributes from class hierarchy
+        #
+        attributeNames = set()
+
+        for cls in type(self).__mro__:
+
+            for (attributeName, attribute) in cls.__dict__.items():
+
+                if isinstance(attribute, mpyattribute.MPyAttribute) and attributeName not in self.__fingerprint_excludes__:
+
+                    attributeNames.add(attributeName)
+
+        # Yield attribute values in a stable order
+        #
+        for attributeName in sorted(attributeNames):
+
+            value = getattr(self, attributeName)
+
+            if isinstance(value, om.MObject):
+
+                continue
+
+            yield attributeName, value
+
+    def fingerprint(self, parentFingerprint=None):
+        """
+        Returns a content fingerprint for this component.
+        The fingerprint consists of the attribute values, encoded skeleton and pivot specs, attachment ID and parent fingerprint.
+        Encoded specs are hashed as stored so unchanged components never have to decode them!
+        If no parent fingerprint is supplied then it will be computed from the component parent!
+
+        :type parentFingerprint: Union[str, None]
+        :rtype: str
+        """
+
+        # Check if parent fingerprint requires computing
+        #
+        if parentFingerprint is None:
+
+            componentParent = self.componentParent()
+            parentFingerprint = componentParent.fingerprint() if isinstance(componentParent, BaseComponent) else ''
+
+        # Hash component contents
+        #
+        hashes = hashlib.sha1(parentFingerprint.encode('utf-8'))
+        hashes.update(f'attachmentId={self.attachmentId};'.encode('utf-8'))
+
+        for (attributeName, value) in self.iterFingerprintAttributes():
+
+            hashes.update(f'{attributeName}={value!r};'.encode('utf-8'))
+
+        for key in (self.SKELETON_KEY, self.PIVOTS_KEY):
+
+            hashes.update(self.dumpSpecs(key).encode('utf-8'))
+
+        return hashes.hexdigest()
+
+    def isFingerprintOutdated(self, fingerprint=None):
+        """
+        Evaluates if the fingerprint recorded at build time no longer matches.
+
+        :type fingerprint: Union[str, None]
+        :rtype: bool
+        """
+
+        if fingerprint is None:
+
+            fingerprint = self.fingerprint()
+
+        return self.userProperties.get(self.FINGERPRINT_KEY, '') != fingerprint
+
+    def markFingerprint(self, fingerprint=None):
+        """
+        Records the supplied fingerprint as the one used to build this component.
+
+        :type fingerprint: Union[str, None]
+        :rtype: None
+        """
+
+        if fingerprint is None:
+
+            fingerprint = self.fingerprint()
+
+        self.userProperties[self.FINGERPRINT_KEY] = fingerprint
+        self.pushUserProperties()
     # endregion
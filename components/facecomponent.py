@@ -88,6 +88,7 @@ class FaceComponent(basecomponent.BaseComponent):
     # region Dunderscores
     __version__ = 1.0
     __default_component_name__ = 'Face'
+    __compact_specs__ = True
     __default_component_matrix__ = om.MMatrix(
         [
             (0.0, 0.0, 1.0, 0.0),
@@ -56,6 +56,7 @@ class HandComponent(extremitycomponent.ExtremityComponent):
     # region Dunderscores
     __version__ = 1.0
     __default_component_name__ = 'Hand'
+    __compact_specs__ = True
     __default_digit_name__ = 'Finger'
     __default_digit_types__ = ('Thumb', 'Index', 'Middle', 'Ring', 'Pinky')
     __default_hand_matrices__ = {
@@ -471,6 +472,7 @@ class HandComponent(extremitycomponent.ExtremityComponent):
     def buildFullRig(self):
         """
         Builds the full control rig for this component.
+        All utility nodes are described by a single node network that is committed once the finger controls exist!
 
         :rtype: None
         """
@@ -567,43 +569,48 @@ class HandComponent(extremitycomponent.ExtremityComponent):
         handIKSpaceSwitch.connectPlugs(handCtrl['localForearmLock'], 'target[1].targetWeight')
         handIKSpaceSwitch.connectPlugs('outputMatrix', handSpaceSwitch['target[1].targetMatrix'], force=True)
 
+        # Create utility network
+        # Everything described below is committed at once after the finger controls have been created!
+        #
+        network = self.createNetwork()
+
         # Create pose driver negate nodes
         #
         fingerHalfSpreadName = self.formatName(subname='HalfSpread', type='floatMath')
-        fingerHalfSpread = self.scene.createNode('floatMath', name=fingerHalfSpreadName)
-        fingerHalfSpread.operation = 2  # Multiply
-        fingerHalfSpread.connectPlugs(handCtrl['spread'], 'inAngleA')
-        fingerHalfSpread.setAttr('inAngleB', 0.5)
+        fingerHalfSpread = network.createNode('floatMath', name=fingerHalfSpreadName)
+        network.setAttr(fingerHalfSpread['operation'], 2)  # Multiply
+        network.connectPlugs(handCtrl['spread'], fingerHalfSpread['inAngleA'])
+        network.setAttr(fingerHalfSpread['inAngleB'], 0.5)
 
         fingerNegateHalfSpreadName = self.formatName(subname='NegateHalfSpread', type='floatMath')
-        fingerNegateHalfSpread = self.scene.createNode('floatMath', name=fingerNegateHalfSpreadName)
-        fingerNegateHalfSpread.operation = 2  # Multiply
-        fingerNegateHalfSpread.connectPlugs(handCtrl['spread'], 'inAngleA')
-        fingerNegateHalfSpread.setAttr('inAngleB', -0.5)
+        fingerNegateHalfSpread = network.createNode('floatMath', name=fingerNegateHalfSpreadName)
+        network.setAttr(fingerNegateHalfSpread['operation'], 2)  # Multiply
+        network.connectPlugs(handCtrl['spread'], fingerNegateHalfSpread['inAngleA'])
+        network.setAttr(fingerNegateHalfSpread['inAngleB'], -0.5)
 
         fingerNegateSpreadName = self.formatName(subname='NegateSpread', type='floatMath')
-        fingerNegateSpread = self.scene.createNode('floatMath', name=fingerNegateSpreadName)
-        fingerNegateSpread.operation = 2  # Multiply
-        fingerNegateSpread.connectPlugs(handCtrl['spread'], 'inAngleA')
-        fingerNegateSpread.setAttr('inAngleB', -1.0)
+        fingerNegateSpread = network.createNode('floatMath', name=fingerNegateSpreadName)
+        network.setAttr(fingerNegateSpread['operation'], 2)  # Multiply
+        network.connectPlugs(handCtrl['spread'], fingerNegateSpread['inAngleA'])
+        network.setAttr(fingerNegateSpread['inAngleB'], -1.0)
 
         fingerNegateSplayName = self.formatName(subname='NegateSplay', type='floatMath')
-        fingerNegateSplay = self.scene.createNode('floatMath', name=fingerNegateSplayName)
-        fingerNegateSplay.operation = 2  # Multiply
-        fingerNegateSplay.connectPlugs(handCtrl['splay'], 'inAngleA')
-        fingerNegateSplay.setAttr('inAngleB', -1.0)
+        fingerNegateSplay = network.createNode('floatMath', name=fingerNegateSplayName)
+        network.setAttr(fingerNegateSplay['operation'], 2)  # Multiply
+        network.connectPlugs(handCtrl['splay'], fingerNegateSplay['inAngleA'])
+        network.setAttr(fingerNegateSplay['inAngleB'], -1.0)
 
         fingerNegateHalfSplayName = self.formatName(subname='NegateHalfSplay', type='floatMath')
-        fingerNegateHalfSplay = self.scene.createNode('floatMath', name=fingerNegateHalfSplayName)
-        fingerNegateHalfSplay.operation = 2  # Multiply
-        fingerNegateHalfSplay.connectPlugs(handCtrl['splay'], 'inAngleA')
-        fingerNegateHalfSplay.setAttr('inAngleB', -(1.0 / 3.0))
+        fingerNegateHalfSplay = network.createNode('floatMath', name=fingerNegateHalfSplayName)
+        network.setAttr(fingerNegateHalfSplay['operation'], 2)  # Multiply
+        network.connectPlugs(handCtrl['splay'], fingerNegateHalfSplay['inAngleA'])
+        network.setAttr(fingerNegateHalfSplay['inAngleB'], -(1.0 / 3.0))
 
         fingerHalfSplayName = self.formatName(subname='HalfSplay', type='floatMath')
-        fingerHalfSplay = self.scene.createNode('floatMath', name=fingerHalfSplayName)
-        fingerHalfSplay.operation = 2  # Multiply
-        fingerHalfSplay.connectPlugs(handCtrl['splay'], 'inAngleA')
-        fingerHalfSplay.setAttr('inAngleB', (1.0 / 3.0))
+        fingerHalfSplay = network.createNode('floatMath', name=fingerHalfSplayName)
+        network.setAttr(fingerHalfSplay['operation'], 2)  # Multiply
+        network.connectPlugs(handCtrl['splay'], fingerHalfSplay['inAngleA'])
+        network.setAttr(fingerHalfSplay['inAngleB'], (1.0 / 3.0))
 
         # Create roll controls
         #
@@ -658,11 +665,8 @@ class HandComponent(extremitycomponent.ExtremityComponent):
         handBlendJoint, handTipBlendJoint = handBlendJoints
 
         blender = switchCtrl['mode']
-        handBlender = setuputils.createTransformBlends(handFKJoint, handIKJoint, handBlendJoint, blender=blender)
-        handTipBlender = setuputils.createTransformBlends(handTipFKJoint, handTipIKJoint, handTipBlendJoint, blender=blender)
-
-        handBlender.setName(self.formatName(subname=jointTypes[0], type='blendTransform'))
-        handTipBlender.setName(self.formatName(subname=jointTypes[1], type='blendTransform'))
+        setuputils.describeTransformBlends(network, handFKJoint, handIKJoint, handBlendJoint, name=self.formatName(subname=jointTypes[0], type='blendTransform'), blender=blender)
+        setuputils.describeTransformBlends(network, handTipFKJoint, handTipIKJoint, handTipBlendJoint, name=self.formatName(subname=jointTypes[1], type='blendTransform'), blender=blender)
 
         # Constrain hand FK joint
         #
@@ -674,12 +678,47 @@ class HandComponent(extremitycomponent.ExtremityComponent):
         handIKJoint.addConstraint('aimConstraint', [knuckleRollCtrl], aimVector=(1.0, 0.0, 0.0), upVector=(0.0, 0.0, 1.0), worldUpType=2, worldUpVector=(0.0, 0.0, 1.0), worldUpObject=knuckleRollCtrl, maintainOffset=True)
         handIKJoint.addConstraint('scaleConstraint', [handCtrl])
 
-        # Create metacarpal/finger controls
+        # Create FK offset matrices
+        # These are shared by all right-side metacarpals so they are only created once!
         #
-        handOffsetFKComposeMatrix, handOffsetFKMultMatrix, handOffsetFKInverseMatrix = None, None, None
-        handTipOffsetFKComposeMatrix, handTipOffsetFKMultMatrix, handTipOffsetFKInverseMatrix = None, None, None
+        hasMetacarpals = any(bool(metacarpalSpec.enabled) and not bool(metacarpalSpec.passthrough) for metacarpalSpec in handSpec.children)
+        handOffsetFKInverseMatrix, handTipOffsetFKInverseMatrix = None, None
+
+        if componentSide == self.Side.RIGHT and hasMetacarpals:
+
+            handTipOffsetFKComposeMatrixName = self.formatName(subname='KnuckleOffset', kinemat='FK', type='composeMatrix')
+            handTipOffsetFKComposeMatrix = network.createNode('composeMatrix', name=handTipOffsetFKComposeMatrixName)
+            network.setAttr(handTipOffsetFKComposeMatrix['inputRotateZ'], 180.0)
+
+            handTipOffsetFKMultMatrixName = self.formatName(subname='KnuckleOffset', kinemat='FK', type='multMatrix')
+            handTipOffsetFKMultMatrix = network.createNode('multMatrix', name=handTipOffsetFKMultMatrixName)
+            network.connectPlugs(handTipOffsetFKComposeMatrix['outputMatrix'], handTipOffsetFKMultMatrix['matrixIn[0]'])
+            network.connectPlugs(handTipFKJoint[f'worldMatrix[{handTipFKJoint.instanceNumber()}]'], handTipOffsetFKMultMatrix['matrixIn[1]'])
+
+            handTipOffsetFKInverseMatrixName = self.formatName(subname='KnuckleOffset', kinemat='FK', type='inverseMatrix')
+            handTipOffsetFKInverseMatrix = network.createNode('inverseMatrix', name=handTipOffsetFKInverseMatrixName)
+            network.connectPlugs(handTipOffsetFKMultMatrix['matrixSum'], handTipOffsetFKInverseMatrix['inputMatrix'])
+
+            handOffsetFKComposeMatrixName = self.formatName(subname='WristOffset', kinemat='FK', type='composeMatrix')
+            handOffsetFKComposeMatrix = network.createNode('composeMatrix', name=handOffsetFKComposeMatrixName)
+            network.setAttr(handOffsetFKComposeMatrix['inputRotateZ'], 180.0)
 
+            handOffsetFKMultMatrixName = self.formatName(subname='WristOffset', kinemat='FK', type='multMatrix')
+            handOffsetFKMultMatrix = network.createNode('multMatrix', name=handOffsetFKMultMatrixName)
+            network.connectPlugs(handOffsetFKComposeMatrix['outputMatrix'], handOffsetFKMultMatrix['matrixIn[0]'])
+            network.connectPlugs(handFKJoint[f'worldMatrix[{handFKJoint.instanceNumber()}]'], handOffsetFKMultMatrix['matrixIn[1]'])
+
+            handOffsetFKInverseMatrixName = self.formatName(subname='WristOffset', kinemat='FK', type='inverseMatrix')
+            handOffsetFKInverseMatrix = network.createNode('inverseMatrix', name=handOffsetFKInverseMatrixName)
+            network.connectPlugs(handOffsetFKMultMatrix['matrixSum'], handOffsetFKInverseMatrix['inputMatrix'])
+
+        # Create metacarpal/finger controls
+        # Anything that depends on the evaluated network is collected and created once it has been committed!
+        #
         metacarpalCtrls = []
+        ikAimTargets = []
+        fingerOffsets = []
+        fingerTipTargets = []
 
         for (fingerType, metacarpalSpec) in enumerate(handSpec.children):
 
@@ -749,13 +788,9 @@ class HandComponent(extremitycomponent.ExtremityComponent):
                 metacarpalIKJoint, fingerIKJoint, fingerTipIKJoint = metacarpalIKJoints
                 metacarpalBlendJoint, fingerBlendJoint, fingerTipBlendJoint = metacarpalBlendJoints
 
-                metacarpalBlender = setuputils.createTransformBlends(metacarpalFKJoint, metacarpalIKJoint, metacarpalBlendJoint, blender=blender)
-                fingerBlender = setuputils.createTransformBlends(fingerFKJoint, fingerIKJoint, fingerBlendJoint, blender=blender)
-                fingerTipBlender = setuputils.createTransformBlends(fingerTipFKJoint, fingerTipIKJoint, fingerTipBlendJoint, blender=blender)
-
-                metacarpalBlender.setName(self.formatName(subname=jointTypes[0], type='blendTransform'))
-                fingerBlender.setName(self.formatName(subname=jointTypes[1], type='blendTransform'))
-                fingerTipBlender.setName(self.formatName(subname=jointTypes[2], type='blendTransform'))
+                setuputils.describeTransformBlends(network, metacarpalFKJoint, metacarpalIKJoint, metacarpalBlendJoint, name=self.formatName(subname=jointTypes[0], type='blendTransform'), blender=blender)
+                setuputils.describeTransformBlends(network, fingerFKJoint, fingerIKJoint, fingerBlendJoint, name=self.formatName(subname=jointTypes[1], type='blendTransform'), blender=blender)
+                setuputils.describeTransformBlends(network, fingerTipFKJoint, fingerTipIKJoint, fingerTipBlendJoint, name=self.formatName(subname=jointTypes[2], type='blendTransform'), blender=blender)
 
                 # Create metacarpal control
                 #
@@ -779,11 +814,6 @@ class HandComponent(extremitycomponent.ExtremityComponent):
                 #
                 metacarpalFKJoint.addConstraint('transformConstraint', [metacarpalCtrl], maintainOffset=requiresMirroring)
 
-                # Repurpose FK transform components for IK joints
-                #
-                metacarpalIKJoint.connectPlugs(metacarpalFKJoint['translate'], 'translate')
-                metacarpalIKJoint.connectPlugs(metacarpalFKJoint['scale'], 'scale')
-
                 # Create metacarpal-tip IK target
                 #
                 metacarpalTipIKTargetName = self.formatName(subname=f'{fullMetacarpalName}Tip', kinemat='IK', type='target')
@@ -792,39 +822,6 @@ class HandComponent(extremitycomponent.ExtremityComponent):
                 metacarpalTipIKTarget.visibility = False
                 metacarpalTipIKTarget.lock()
 
-                metacarpalTipIKMultMatrixName = self.formatName(subname=f'{fullMetacarpalName}Tip', kinemat='IK', type='multMatrix')
-                metacarpalTipIKMultMatrix = self.scene.createNode('multMatrix', name=metacarpalTipIKMultMatrixName)
-                metacarpalTipIKMultMatrix.connectPlugs(fingerFKJoint[f'worldMatrix[{fingerFKJoint.instanceNumber()}]'], 'matrixIn[0]')
-
-                if componentSide == self.Side.RIGHT:
-
-                    if handTipOffsetFKComposeMatrix is None:
-
-                        handTipOffsetFKComposeMatrixName = self.formatName(subname='KnuckleOffset', kinemat='FK', type='composeMatrix')
-                        handTipOffsetFKComposeMatrix = self.scene.createNode('composeMatrix', name=handTipOffsetFKComposeMatrixName)
-                        handTipOffsetFKComposeMatrix.setAttr('inputRotateZ', 180.0)
-
-                    if handTipOffsetFKMultMatrix is None:
-
-                        handTipOffsetFKMultMatrixName = self.formatName(subname='KnuckleOffset', kinemat='FK', type='multMatrix')
-                        handTipOffsetFKMultMatrix = self.scene.createNode('multMatrix', name=handTipOffsetFKMultMatrixName)
-                        handTipOffsetFKMultMatrix.connectPlugs(handTipOffsetFKComposeMatrix['outputMatrix'], 'matrixIn[0]')
-                        handTipOffsetFKMultMatrix.connectPlugs(handTipFKJoint[f'worldMatrix[{handTipFKJoint.instanceNumber()}]'], 'matrixIn[1]')
-
-                    if handTipOffsetFKInverseMatrix is None:
-
-                        handTipOffsetFKInverseMatrixName = self.formatName(subname='KnuckleOffset', kinemat='FK', type='inverseMatrix')
-                        handTipOffsetFKInverseMatrix = self.scene.createNode('inverseMatrix', name=handTipOffsetFKInverseMatrixName)
-                        handTipOffsetFKInverseMatrix.connectPlugs(handTipOffsetFKMultMatrix['matrixSum'], 'inputMatrix')
-
-                    metacarpalTipIKMultMatrix.connectPlugs(handTipOffsetFKInverseMatrix['outputMatrix'], 'matrixIn[1]')
-                    metacarpalTipIKMultMatrix.connectPlugs('matrixSum', metacarpalTipIKTarget['offsetParentMatrix'])
-
-                else:
-
-                    metacarpalTipIKMultMatrix.connectPlugs(handTipFKJoint[f'worldInverseMatrix[{handTipFKJoint.instanceNumber()}]'], 'matrixIn[1]')
-                    metacarpalTipIKMultMatrix.connectPlugs('matrixSum', metacarpalTipIKTarget['offsetParentMatrix'])
-
                 # Create finger-tip IK target
                 #
                 fingerTipIKTargetName = self.formatName(subname=f'{fullFingerName}Tip', kinemat='IK', type='target')
@@ -833,41 +830,37 @@ class HandComponent(extremitycomponent.ExtremityComponent):
                 fingerTipIKTarget.visibility = False
                 fingerTipIKTarget.lock()
 
-                fingerTipIKMultMatrixName = self.formatName(subname=f'{fullFingerName}Tip', kinemat='IK', type='multMatrix')
-                fingerTipIKMultMatrix = self.scene.createNode('multMatrix', name=fingerTipIKMultMatrixName)
-                fingerTipIKMultMatrix.connectPlugs(fingerTipFKJoint[f'worldMatrix[{fingerTipFKJoint.instanceNumber()}]'], 'matrixIn[0]')
-
-                if componentSide == self.Side.RIGHT:
-
-                    if handOffsetFKComposeMatrix is None:
-
-                        handOffsetFKComposeMatrixName = self.formatName(subname='WristOffset', kinemat='FK', type='composeMatrix')
-                        handOffsetFKComposeMatrix = self.scene.createNode('composeMatrix', name=handOffsetFKComposeMatrixName)
-                        handOffsetFKComposeMatrix.setAttr('inputRotateZ', 180.0)
-
-                    if handOffsetFKMultMatrix is None:
+                # Repurpose FK transform components for IK joints
+                #
+                network.connectPlugs(metacarpalFKJoint['translate'], metacarpalIKJoint['translate'])
+                network.connectPlugs(metacarpalFKJoint['scale'], metacarpalIKJoint['scale'])
 
-                        handOffsetFKMultMatrixName = self.formatName(subname='WristOffset', kinemat='FK', type='multMatrix')
-                        handOffsetFKMultMatrix = self.scene.createNode('multMatrix', name=handOffsetFKMultMatrixName)
-                        handOffsetFKMultMatrix.connectPlugs(handOffsetFKComposeMatrix['outputMatrix'], 'matrixIn[0]')
-                        handOffsetFKMultMatrix.connectPlugs(handFKJoint[f'worldMatrix[{handFKJoint.instanceNumber()}]'], 'matrixIn[1]')
+                # Drive IK targets from FK joints
+                #
+                metacarpalTipIKMultMatrixName = self.formatName(subname=f'{fullMetacarpalName}Tip', kinemat='IK', type='multMatrix')
+                metacarpalTipIKMultMatrix = network.createNode('multMatrix', name=metacarpalTipIKMultMatrixName)
+                network.connectPlugs(fingerFKJoint[f'worldMatrix[{fingerFKJoint.instanceNumber()}]'], metacarpalTipIKMultMatrix['matrixIn[0]'])
+                network.connectPlugs(metacarpalTipIKMultMatrix['matrixSum'], metacarpalTipIKTarget['offsetParentMatrix'])
 
-                    if handOffsetFKInverseMatrix is None:
+                fingerTipIKMultMatrixName = self.formatName(subname=f'{fullFingerName}Tip', kinemat='IK', type='multMatrix')
+                fingerTipIKMultMatrix = network.createNode('multMatrix', name=fingerTipIKMultMatrixName)
+                network.connectPlugs(fingerTipFKJoint[f'worldMatrix[{fingerTipFKJoint.instanceNumber()}]'], fingerTipIKMultMatrix['matrixIn[0]'])
+                network.connectPlugs(fingerTipIKMultMatrix['matrixSum'], fingerTipIKTarget['offsetParentMatrix'])
 
-                        handOffsetFKInverseMatrixName = self.formatName(subname='WristOffset', kinemat='FK', type='inverseMatrix')
-                        handOffsetFKInverseMatrix = self.scene.createNode('inverseMatrix', name=handOffsetFKInverseMatrixName)
-                        handOffsetFKInverseMatrix.connectPlugs(handOffsetFKMultMatrix['matrixSum'], 'inputMatrix')
+                if componentSide == self.Side.RIGHT:
 
-                    fingerTipIKMultMatrix.connectPlugs(handOffsetFKInverseMatrix['outputMatrix'], 'matrixIn[1]')
-                    fingerTipIKMultMatrix.connectPlugs('matrixSum', fingerTipIKTarget['offsetParentMatrix'])
+                    network.connectPlugs(handTipOffsetFKInverseMatrix['outputMatrix'], metacarpalTipIKMultMatrix['matrixIn[1]'])
+                    network.connectPlugs(handOffsetFKInverseMatrix['outputMatrix'], fingerTipIKMultMatrix['matrixIn[1]'])
 
                 else:
 
-                    fingerTipIKMultMatrix.connectPlugs(handFKJoint[f'worldInverseMatrix[{handFKJoint.instanceNumber()}]'], 'matrixIn[1]')
-                    fingerTipIKMultMatrix.connectPlugs('matrixSum', fingerTipIKTarget['offsetParentMatrix'])
+                    network.connectPlugs(handTipFKJoint[f'worldInverseMatrix[{handTipFKJoint.instanceNumber()}]'], metacarpalTipIKMultMatrix['matrixIn[1]'])
+                    network.connectPlugs(handFKJoint[f'worldInverseMatrix[{handFKJoint.instanceNumber()}]'], fingerTipIKMultMatrix['matrixIn[1]'])
 
-                metacarpalIKJoint.addConstraint('aimConstraint', [metacarpalTipIKTarget], aimVector=(1.0, 0.0, 0.0), upVector=(0.0, 0.0, 1.0), worldUpType=2, worldUpVector=(0.0, 0.0, 1.0), worldUpObject=metacarpalTipIKTarget, maintainOffset=True)
-                fingerIKJoint.addConstraint('aimConstraint', [fingerTipIKTarget], aimVector=(1.0, 0.0, 0.0), upVector=(0.0, 0.0, 1.0), worldUpType=2, worldUpVector=(0.0, 0.0, 1.0), worldUpObject=fingerTipIKTarget, maintainOffset=True)
+                # The IK aim constraints maintain their offsets so they can only be created once the IK targets are driven!
+                #
+                ikAimTargets.append((metacarpalIKJoint, metacarpalTipIKTarget))
+                ikAimTargets.append((fingerIKJoint, fingerTipIKTarget))
 
             else:
 
@@ -900,11 +893,8 @@ class HandComponent(extremitycomponent.ExtremityComponent):
                 fingerIKJoint, fingerTipIKJoint = fingerIKJoints
                 fingerBlendJoint, fingerTipBlendJoint = fingerBlendJoints
 
-                fingerBlender = setuputils.createTransformBlends(fingerFKJoint, fingerIKJoint, fingerBlendJoint, blender=blender)
-                fingerTipBlender = setuputils.createTransformBlends(fingerTipFKJoint, fingerTipIKJoint, fingerTipBlendJoint, blender=blender)
-
-                fingerBlender.setName(self.formatName(subname=jointTypes[0], type='blendTransform'))
-                fingerTipBlender.setName(self.formatName(subname=jointTypes[1], type='blendTransform'))
+                setuputils.describeTransformBlends(network, fingerFKJoint, fingerIKJoint, fingerBlendJoint, name=self.formatName(subname=jointTypes[0], type='blendTransform'), blender=blender)
+                setuputils.describeTransformBlends(network, fingerTipFKJoint, fingerTipIKJoint, fingerTipBlendJoint, name=self.formatName(subname=jointTypes[1], type='blendTransform'), blender=blender)
 
                 # Create finger-tip IK target
                 #
@@ -981,6 +971,7 @@ class HandComponent(extremitycomponent.ExtremityComponent):
             #
             numFingerLinks = len(fingerSpecs)
             fingerCtrls = [None] * numFingerLinks
+            fingerArrayMaths = [None] * numFingerLinks
 
             for (i, fingerSpec) in enumerate(fingerSpecs):
 
@@ -1001,52 +992,50 @@ class HandComponent(extremitycomponent.ExtremityComponent):
                 fingerCtrls[i] = fingerCtrl
 
                 # Connect additives to finger control
+                # The previous finger control is not offset until the network is committed, so its rest matrix is used instead!
                 #
-                fingerMatrix = (mirrorMatrix * fingerMatrix) * fingerCtrl.parentInverseMatrix()
+                parentInverseMatrix = (mirrorMatrix * fingerSpecs[i - 1].getNode().worldMatrix()).inverse() if (i > 0) else fingerCtrl.parentInverseMatrix()
+                fingerMatrix = (mirrorMatrix * fingerMatrix) * parentInverseMatrix
                 translation, eulerRotation, scale = transformutils.decomposeTransformMatrix(fingerMatrix)
 
                 fingerComposeMatrixName = self.formatName(subname=fullFingerName, index=fingerIndex, type='composeMatrix')
-                fingerComposeMatrix = self.scene.createNode('composeMatrix', name=fingerComposeMatrixName)
-                fingerComposeMatrix.setAttr('inputTranslate', translation)
-                fingerComposeMatrix.setAttr('inputRotate', eulerRotation, convertUnits=False)
+                fingerComposeMatrix = network.createNode('composeMatrix', name=fingerComposeMatrixName)
+                network.setAttr(fingerComposeMatrix['inputTranslate'], translation)
+                network.setAttr(fingerComposeMatrix['inputRotate'], eulerRotation, convertUnits=False)
 
                 fingerArrayMathName = self.formatName(subname=fullFingerName, index=fingerIndex, type='arrayMath')
-                fingerArrayMath = self.scene.createNode('arrayMath', name=fingerArrayMathName)
+                fingerArrayMath = network.createNode('arrayMath', name=fingerArrayMathName)
 
                 if i > 0:
 
-                    fingerArrayMath.connectPlugs(masterFingerCtrl['translateX'], 'inDistance[0].inDistanceX')
-                    fingerArrayMath.connectPlugs(masterFingerCtrl['rotate'], 'inAngle[0]')
+                    network.connectPlugs(masterFingerCtrl['translateX'], fingerArrayMath['inDistance[0].inDistanceX'])
+                    network.connectPlugs(masterFingerCtrl['rotate'], fingerArrayMath['inAngle[0]'])
 
                 fingerOffsetComposeMatrixName = self.formatName(subname=fullFingerName, index=fingerIndex, kinemat='Offset', type='composeMatrix')
-                fingerOffsetComposeMatrix = self.scene.createNode('composeMatrix', name=fingerOffsetComposeMatrixName)
-                fingerOffsetComposeMatrix.connectPlugs(fingerArrayMath['outDistance'], 'inputTranslate')
-                fingerOffsetComposeMatrix.connectPlugs(fingerArrayMath['outAngle'], 'inputRotate')
+                fingerOffsetComposeMatrix = network.createNode('composeMatrix', name=fingerOffsetComposeMatrixName)
+                network.connectPlugs(fingerArrayMath['outDistance'], fingerOffsetComposeMatrix['inputTranslate'])
+                network.connectPlugs(fingerArrayMath['outAngle'], fingerOffsetComposeMatrix['inputRotate'])
 
                 fingerMultMatrixName = self.formatName(subname=fullFingerName, index=fingerIndex, type='multMatrix')
-                fingerMultMatrix = self.scene.createNode('multMatrix', name=fingerMultMatrixName)
-                fingerMultMatrix.connectPlugs(fingerOffsetComposeMatrix['outputMatrix'], 'matrixIn[0]')
-                fingerMultMatrix.connectPlugs(fingerComposeMatrix['outputMatrix'], 'matrixIn[1]')
-                fingerMultMatrix.connectPlugs('matrixSum', fingerCtrl['offsetParentMatrix'])
+                fingerMultMatrix = network.createNode('multMatrix', name=fingerMultMatrixName)
+                network.connectPlugs(fingerOffsetComposeMatrix['outputMatrix'], fingerMultMatrix['matrixIn[0]'])
+                network.connectPlugs(fingerComposeMatrix['outputMatrix'], fingerMultMatrix['matrixIn[1]'])
+                network.connectPlugs(fingerMultMatrix['matrixSum'], fingerCtrl['offsetParentMatrix'])
+
+                fingerArrayMaths[i] = fingerArrayMath
+                fingerOffsets.append((fingerCtrl, fingerArrayMath))
 
                 fingerCtrl.userProperties['type'] = fingerType
-                fingerCtrl.userProperties['offset'] = fingerArrayMath.uuid()
 
-            fingerTipTargetName = self.formatName(subname=f'{fullFingerName}Tip', type='target')
-            fingerTipTarget = self.scene.createNode('transform', name=fingerTipTargetName, parent=fingerCtrls[-1])
-            fingerTipTarget.displayLocalAxis = True
-            fingerTipTarget.visibility = False
-            fingerTipTarget.copyTransform(fingerTipExportJoint)
-            fingerTipTarget.freezeTransform()
+            fingerTipTargets.append((fullFingerName, fingerCtrls[-1], fingerTipExportJoint))
 
             # Connect pose drivers to finger offsets
             #
-            for (i, fingerCtrl) in enumerate(fingerCtrls):
+            for (i, fingerArrayMath) in enumerate(fingerArrayMaths):
 
                 # Connect curl driver
                 #
-                fingerArrayMath = self.scene(fingerCtrl.userProperties['offset'])
-                fingerArrayMath.connectPlugs(handCtrl['curl'], 'inAngle[1].inAngleZ')
+                network.connectPlugs(handCtrl['curl'], fingerArrayMath['inAngle[1].inAngleZ'])
 
                 # Connect spread driver
                 #
@@ -1054,7 +1043,7 @@ class HandComponent(extremitycomponent.ExtremityComponent):
 
                     if fingerType == FingerType.INDEX:
 
-                        fingerHalfSpread.connectPlugs('outAngle', fingerArrayMath['inAngle[2].inAngleY'])
+                        network.connectPlugs(fingerHalfSpread['outAngle'], fingerArrayMath['inAngle[2].inAngleY'])
 
                     elif fingerType == FingerType.MIDDLE:
 
@@ -1062,11 +1051,11 @@ class HandComponent(extremitycomponent.ExtremityComponent):
 
                     elif fingerType == FingerType.RING:
 
-                        fingerNegateHalfSpread.connectPlugs('outAngle', fingerArrayMath['inAngle[2].inAngleY'])
+                        network.connectPlugs(fingerNegateHalfSpread['outAngle'], fingerArrayMath['inAngle[2].inAngleY'])
 
                     else:
 
-                        fingerNegateSpread.connectPlugs('outAngle', fingerArrayMath['inAngle[2].inAngleY'])
+                        network.connectPlugs(fingerNegateSpread['outAngle'], fingerArrayMath['inAngle[2].inAngleY'])
 
                 # Connect splay driver
                 #
@@ -1074,19 +1063,19 @@ class HandComponent(extremitycomponent.ExtremityComponent):
 
                     if fingerType == FingerType.INDEX:
 
-                        fingerNegateSplay.connectPlugs('outAngle', fingerArrayMath['inAngle[2].inAngleZ'])
+                        network.connectPlugs(fingerNegateSplay['outAngle'], fingerArrayMath['inAngle[2].inAngleZ'])
 
                     elif fingerType == FingerType.MIDDLE:
 
-                        fingerNegateHalfSplay.connectPlugs('outAngle', fingerArrayMath['inAngle[2].inAngleZ'])
+                        network.connectPlugs(fingerNegateHalfSplay['outAngle'], fingerArrayMath['inAngle[2].inAngleZ'])
 
                     elif fingerType == FingerType.RING:
 
-                        fingerHalfSplay.connectPlugs('outAngle', fingerArrayMath['inAngle[2].inAngleZ'])
+                        network.connectPlugs(fingerHalfSplay['outAngle'], fingerArrayMath['inAngle[2].inAngleZ'])
 
                     else:
 
-                        handCtrl.connectPlugs('splay', fingerArrayMath['inAngle[2].inAngleZ'])
+                        network.connectPlugs(handCtrl['splay'], fingerArrayMath['inAngle[2].inAngleZ'])
 
             # Tag finger controls
             #
@@ -1120,10 +1109,10 @@ class HandComponent(extremitycomponent.ExtremityComponent):
             inbetweenMetacarpalCtrls = fingerMetacarpalCtrls[1:-1]
 
             metacarpalScaleRemapName = self.formatName(subname='Metacarpal', kinemat='Scale', type='remapArray')
-            metacarpalScaleRemap = self.scene.createNode('remapArray', name=metacarpalScaleRemapName)
-            metacarpalScaleRemap.clamped = True
-            metacarpalScaleRemap.connectPlugs(firstMetacarpalCtrl['scale'], 'outputMin')
-            metacarpalScaleRemap.connectPlugs(lastMetacarpalCtrl['scale'], 'outputMax')
+            metacarpalScaleRemap = network.createNode('remapArray', name=metacarpalScaleRemapName)
+            network.setAttr(metacarpalScaleRemap['clamped'], True)
+            network.connectPlugs(firstMetacarpalCtrl['scale'], metacarpalScaleRemap['outputMin'])
+            network.connectPlugs(lastMetacarpalCtrl['scale'], metacarpalScaleRemap['outputMax'])
 
             for (i, metacarpalCtrl) in enumerate(inbetweenMetacarpalCtrls):
 
@@ -1144,8 +1133,35 @@ class HandComponent(extremitycomponent.ExtremityComponent):
                 orientConstraint.setAttr(orientTargets[1].driver(), weight)
                 orientConstraint.maintainOffset()
 
-                metacarpalScaleRemap.setAttr(f'parameter[{i}]', weight)
-                metacarpalScaleRemap.connectPlugs(f'outValue[{i}]', metacarpalSpace['scale'])
+                network.setAttr(metacarpalScaleRemap[f'parameter[{i}]'], weight)
+                network.connectPlugs(metacarpalScaleRemap[f'outValue[{i}]'], metacarpalSpace['scale'])
+
+        # Commit utility network
+        #
+        nodes = self.commitNetwork(network)
+
+        # Constrain IK joints to their now driven IK targets
+        #
+        for (ikJoint, ikTarget) in ikAimTargets:
+
+            ikJoint.addConstraint('aimConstraint', [ikTarget], aimVector=(1.0, 0.0, 0.0), upVector=(0.0, 0.0, 1.0), worldUpType=2, worldUpVector=(0.0, 0.0, 1.0), worldUpObject=ikTarget, maintainOffset=True)
+
+        # Cache finger offsets
+        #
+        for (fingerCtrl, fingerArrayMath) in fingerOffsets:
+
+            fingerCtrl.userProperties['offset'] = nodes[fingerArrayMath.index].uuid()
+
+        # Create finger-tip targets
+        #
+        for (fullFingerName, lastFingerCtrl, fingerTipExportJoint) in fingerTipTargets:
+
+            fingerTipTargetName = self.formatName(subname=f'{fullFingerName}Tip', type='target')
+            fingerTipTarget = self.scene.createNode('transform', name=fingerTipTargetName, parent=lastFingerCtrl)
+            fingerTipTarget.displayLocalAxis = True
+            fingerTipTarget.visibility = False
+            fingerTipTarget.copyTransform(fingerTipExportJoint)
+            fingerTipTarget.freezeTransform()
 
         # Tag remaining hand controls
         #
@@ -55,6 +55,7 @@ class LimbComponent(basecomponent.BaseComponent):
         :rtype: None
         """
 
+        self.componentHierarchy.invalidate(component=self)
         self.markSkeletonDirty()
     # endregion
 
@@ -169,6 +169,17 @@ class PropComponent(basecomponent.BaseComponent):
         oppositePropSpaceSwitch = self.scene(oppositePropCtrl.userProperties['spaceSwitch'])
         oppositePropSpaceSwitch.repair()
 
+    def findHandComponents(self, side):
+        """
+        Returns the hand components on the specified side that share this component's ID.
+
+        :type side: Side
+        :rtype: List[rigotron.components.handcomponent.HandComponent]
+        """
+
+        handEntries = self.specIndex().findSpecsByType(self, side, self.Type.HAND)
+        return [entry.component for entry in handEntries if entry.component.className.endswith('HandComponent') and entry.component.componentId == self.componentId]
+
     def finalizeRig(self):
         """
         Notifies the component that the rig requires finalizing.
@@ -192,13 +203,11 @@ class PropComponent(basecomponent.BaseComponent):
             chestCtrl = spineComponent.getPublishedNode('Chest')
 
         # Find hand space targets
+        # Hand specs are looked up by side and type from the rig-wide spec index!
         #
-        parentComponent = spineComponent if (spineComponent is not None) else rootComponent
-        handComponents = parentComponent.findComponentDescendants('HandComponent')
-
-        leftHandComponents = [component for component in handComponents if component.componentSide == self.Side.LEFT and component.componentId == self.componentId]
+        leftHandComponents = self.findHandComponents(self.Side.LEFT)
         leftHandComponent = leftHandComponents[0] if (len(leftHandComponents) > 0) else None
-        rightHandComponents = [component for component in handComponents if component.componentSide == self.Side.RIGHT and component.componentId == self.componentId]
+        rightHandComponents = self.findHandComponents(self.Side.RIGHT)
         rightHandComponent = rightHandComponents[0] if (len(rightHandComponents) > 0) else None
 
         hasLeftHand = getattr(leftHandComponent, 'componentStatus', self.Status.META) == self.Status.RIG
@@ -217,6 +217,7 @@ class SpineComponent(basecomponent.BaseComponent):
     def buildFullRig(self):
         """
         Builds the full spine rig for this component.
+        All utility nodes are described by a single node network that is committed before the spine controls are created!
 
         :rtype: None
         """
@@ -257,6 +258,11 @@ class SpineComponent(basecomponent.BaseComponent):
 
         neckEnabled = headComponents[0].neckEnabled if headExists else False
 
+        # Create utility network
+        # Everything described below is committed at once before the spine controls are created!
+        #
+        network = self.createNetwork()
+
         # Create COG controller
         #
         cogSpaceName = self.formatName(name='COG', type='space')
@@ -281,9 +287,9 @@ class SpineComponent(basecomponent.BaseComponent):
         self.publishNode(cogPivotCtrl, alias='COG_Pivot')
 
         cogPivotMatrixName = self.formatName(name='COG', subname='Pivot', type='composeMatrix')
-        cogPivotMatrix = self.scene.createNode('composeMatrix', name=cogPivotMatrixName)
-        cogPivotMatrix.connectPlugs(cogCtrl['translate'], 'inputTranslate')
-        cogPivotMatrix.connectPlugs('outputMatrix', cogPivotCtrl['offsetParentMatrix'])
+        cogPivotMatrix = network.createNode('composeMatrix', name=cogPivotMatrixName)
+        network.connectPlugs(cogCtrl['translate'], cogPivotMatrix['inputTranslate'])
+        network.connectPlugs(cogPivotMatrix['outputMatrix'], cogPivotCtrl['offsetParentMatrix'])
 
         cogCtrl.userProperties['space'] = cogSpace.uuid()
         cogCtrl.userProperties['pivot'] = cogPivotCtrl.uuid()
@@ -525,14 +531,14 @@ class SpineComponent(basecomponent.BaseComponent):
         firstSpineFKSpace = self.scene(firstSpineFKCtrl.userProperties['space'])
 
         spineFKGlobalVectorName = self.formatName(subname='FK', index=1, kinemat='Global', type='multiplyVectorByMatrix')
-        spineFKGlobalVector = self.scene.createNode('multiplyVectorByMatrix', name=spineFKGlobalVectorName)
-        spineFKGlobalVector.connectPlugs(firstSpineFKCtrl['translate'], 'input')
-        spineFKGlobalVector.connectPlugs(firstSpineFKCtrl[f'parentMatrix[{firstSpineFKCtrl.instanceNumber()}]'], 'matrix')
+        spineFKGlobalVector = network.createNode('multiplyVectorByMatrix', name=spineFKGlobalVectorName)
+        network.connectPlugs(firstSpineFKCtrl['translate'], spineFKGlobalVector['input'])
+        network.connectPlugs(firstSpineFKCtrl[f'parentMatrix[{firstSpineFKCtrl.instanceNumber()}]'], spineFKGlobalVector['matrix'])
 
         spineFKLocalVectorName = self.formatName(subname='FK', index=1, kinemat='Local', type='multiplyVectorByMatrix')
-        spineFKLocalVector = self.scene.createNode('multiplyVectorByMatrix', name=spineFKLocalVectorName)
-        spineFKLocalVector.connectPlugs(spineFKGlobalVector['output'], 'input')
-        spineFKLocalVector.connectPlugs(hipsCtrl[f'parentInverseMatrix[{hipsCtrl.instanceNumber()}]'], 'matrix')
+        spineFKLocalVector = network.createNode('multiplyVectorByMatrix', name=spineFKLocalVectorName)
+        network.connectPlugs(spineFKGlobalVector['output'], spineFKLocalVector['input'])
+        network.connectPlugs(hipsCtrl[f'parentInverseMatrix[{hipsCtrl.instanceNumber()}]'], spineFKLocalVector['matrix'])
 
         spineIKBaseJointName = self.formatName(subname='IK', kinemat='Base', type='joint')
         spineIKBaseJoint = self.scene.createNode('joint', name=spineIKBaseJointName, parent=jointsGroup)
@@ -540,7 +546,7 @@ class SpineComponent(basecomponent.BaseComponent):
 
         spineIKBaseSpaceSwitch = spineIKBaseJoint.addSpaceSwitch([hipsCtrl, firstSpineFKCtrl, firstSpineFKSpace], weighted=True, maintainOffset=True)
         spineIKBaseSpaceSwitch.setAttr('target', [{'targetWeight': (1.0, 1.0, 0.0)}, {'targetWeight': (0.0, 1.0, 0.0), 'targetReverse': (False, True, False)}, {'targetWeight': (0.0, 0.0, 1.0)}])
-        spineIKBaseSpaceSwitch.connectPlugs(spineFKLocalVector['output'], 'target[0].targetOffsetTranslate')
+        network.connectPlugs(spineFKLocalVector['output'], spineIKBaseSpaceSwitch['target[0].targetOffsetTranslate'])
         spineIKBaseSpaceSwitch.connectPlugs(hipsCtrl['spineInfluence'], 'target[0].targetRotateWeight')
         spineIKBaseSpaceSwitch.connectPlugs(hipsCtrl['spineInfluence'], 'target[1].targetRotateWeight')
 
@@ -612,9 +618,9 @@ class SpineComponent(basecomponent.BaseComponent):
         # Create remap for skin weights
         #
         weightRemapName = self.formatName(subname='Weights', type='remapArray')
-        weightRemap = self.scene.createNode('remapArray', name=weightRemapName)
-        weightRemap.clamp = True
-        weightRemap.setAttr('value', [{'value_FloatValue': 0.0, 'value_Interp': 2}, {'value_FloatValue': 1.0, 'value_Interp': 2}])
+        weightRemap = network.createNode('remapArray', name=weightRemapName)
+        network.setAttr(weightRemap['clamp'], True)
+        network.setAttr(weightRemap['value'], [{'value_FloatValue': 0.0, 'value_Interp': 2}, {'value_FloatValue': 1.0, 'value_Interp': 2}])
 
         parameters = [None] * numControlPoints
 
@@ -639,13 +645,13 @@ class SpineComponent(basecomponent.BaseComponent):
             #
             index = i + 1
 
-            weightRemap.connectPlugs(controlNode['parameter'], f'parameter[{i}]')
-            weightRemap.connectPlugs(f'outValue[{i}].outValueX', skinCluster[f'weightList[{i}].weights[1]'])
+            network.connectPlugs(controlNode['parameter'], weightRemap[f'parameter[{i}]'])
+            network.connectPlugs(weightRemap[f'outValue[{i}].outValueX'], skinCluster[f'weightList[{i}].weights[1]'])
 
             reverseWeightName = self.formatName(subname='Weights', index=index, type='revDoubleLinear')
-            reverseWeight = self.scene.createNode('revDoubleLinear', name=reverseWeightName)
-            reverseWeight.connectPlugs(weightRemap[f'outValue[{i}].outValueX'], 'input')
-            reverseWeight.connectPlugs('output', skinCluster[f'weightList[{i}].weights[0]'])
+            reverseWeight = network.createNode('revDoubleLinear', name=reverseWeightName)
+            network.connectPlugs(weightRemap[f'outValue[{i}].outValueX'], reverseWeight['input'])
+            network.connectPlugs(reverseWeight['output'], skinCluster[f'weightList[{i}].weights[0]'])
 
         self.userProperties['curve'] = curveShape.uuid()
         self.userProperties['intermediateCurve'] = intermediateCurve.uuid()
@@ -653,24 +659,25 @@ class SpineComponent(basecomponent.BaseComponent):
 
         # Override control-points on intermediate-object
         #
-        controlMultMatrices = [None] * numControlPoints  # type: List[mpynode.MPyNode]
-        controlMatrices = [None] * numControlPoints  # type: List[mpynode.MPyNode]
+        controlMultMatrices = [None] * len(controlNodes)
+        controlMatrices = [None] * len(controlNodes)
+        intermediateInverseMatrix = intermediateCurve[f'parentInverseMatrix[{intermediateCurve.instanceNumber()}]']
 
         for (i, controlNode) in enumerate(controlNodes):
 
             index = i + 1
 
             multMatrixName = self.formatName(subname='ControlPoint', index=index, type='multMatrix')
-            multMatrix = self.scene.createNode('multMatrix', name=multMatrixName)
-            multMatrix.connectPlugs(controlNode[f'worldMatrix[{controlNode.instanceNumber()}]'], 'matrixIn[0]')
-            multMatrix.connectPlugs(intermediateCurve[f'parentInverseMatrix[{intermediateCurve.instanceNumber()}]'], 'matrixIn[1]')
+            multMatrix = network.createNode('multMatrix', name=multMatrixName)
+            network.connectPlugs(controlNode[f'worldMatrix[{controlNode.instanceNumber()}]'], multMatrix['matrixIn[0]'])
+            network.connectPlugs(intermediateInverseMatrix, multMatrix['matrixIn[1]'])
 
             breakMatrixName = self.formatName(subname='ControlPoint', index=index, type='breakMatrix')
-            breakMatrix = self.scene.createNode('breakMatrix', name=breakMatrixName)
-            breakMatrix.connectPlugs(multMatrix['matrixSum'], 'inMatrix')
-            breakMatrix.connectPlugs('row4X', intermediateCurve[f'controlPoints[{i}].xValue'], force=True)
-            breakMatrix.connectPlugs('row4Y', intermediateCurve[f'controlPoints[{i}].yValue'], force=True)
-            breakMatrix.connectPlugs('row4Z', intermediateCurve[f'controlPoints[{i}].zValue'], force=True)
+            breakMatrix = network.createNode('breakMatrix', name=breakMatrixName)
+            network.connectPlugs(multMatrix['matrixSum'], breakMatrix['inMatrix'])
+            network.connectPlugs(breakMatrix['row4X'], intermediateCurve[f'controlPoints[{i}].xValue'], force=True)
+            network.connectPlugs(breakMatrix['row4Y'], intermediateCurve[f'controlPoints[{i}].yValue'], force=True)
+            network.connectPlugs(breakMatrix['row4Z'], intermediateCurve[f'controlPoints[{i}].zValue'], force=True)
 
             controlMultMatrices[i] = multMatrix
             controlMatrices[i] = breakMatrix
@@ -682,17 +689,14 @@ class SpineComponent(basecomponent.BaseComponent):
             lastMultMatrix, lastBreakMatrix = controlMultMatrices[-1], controlMatrices[-1]
 
             multMatrixName = self.formatName(name='Spine', subname='ControlPoint', index=numControlPoints, kinemat='Override', type='multMatrix')
-            multMatrix = self.scene.createNode('multMatrix', name=multMatrixName)
+            multMatrix = network.createNode('multMatrix', name=multMatrixName)
 
             blendTransformName = self.formatName(name='Spine', subname='ControlPoint', index=numControlPoints, kinemat='Override', type='blendTransform')
-            blendTransform = self.scene.createNode('blendTransform', name=blendTransformName)
-            blendTransform.setAttr('blender', 0.0)
-            blendTransform.connectPlugs(lastMultMatrix['matrixSum'], 'inMatrix1')
-            blendTransform.connectPlugs(multMatrix['matrixSum'], 'inMatrix2')
-
-            lastBreakMatrix.connectPlugs(blendTransform['outMatrix'], 'inMatrix', force=True)
-
-            self.userProperties['controlPointOverride'] = blendTransform.uuid()
+            blendTransform = network.createNode('blendTransform', name=blendTransformName)
+            network.setAttr(blendTransform['blender'], 0.0)
+            network.connectPlugs(lastMultMatrix['matrixSum'], blendTransform['inMatrix1'])
+            network.connectPlugs(multMatrix['matrixSum'], blendTransform['inMatrix2'])
+            network.connectPlugs(blendTransform['outMatrix'], lastBreakMatrix['inMatrix'], force=True)
 
         # Create spine IK joints
         #
@@ -767,12 +771,12 @@ class SpineComponent(basecomponent.BaseComponent):
         # Setup spline IK stretch
         #
         curveInfoName = self.formatName(type='curveInfo')
-        curveInfo = self.scene.createNode('curveInfo', name=curveInfoName)
-        curveInfo.connectPlugs(curveShape[f'worldSpace[{curveShape.instanceNumber()}]'], 'inputCurve')
+        curveInfo = network.createNode('curveInfo', name=curveInfoName)
+        network.connectPlugs(curveShape[f'worldSpace[{curveShape.instanceNumber()}]'], curveInfo['inputCurve'])
 
         intermediateInfoName = self.formatName(subname='Intermediate', type='curveInfo')
-        intermediateInfo = self.scene.createNode('curveInfo', name=intermediateInfoName)
-        intermediateInfo.connectPlugs(intermediateCurve[f'worldSpace[{intermediateCurve.instanceNumber()}]'], 'inputCurve')
+        intermediateInfo = network.createNode('curveInfo', name=intermediateInfoName)
+        network.connectPlugs(intermediateCurve[f'worldSpace[{intermediateCurve.instanceNumber()}]'], intermediateInfo['inputCurve'])
 
         for (i, (startJoint, endJoint)) in enumerate(zip(spineIKJoints[:-1], spineIKJoints[1:])):
 
@@ -781,32 +785,41 @@ class SpineComponent(basecomponent.BaseComponent):
             index = i + 1
 
             baseDistanceName = self.formatName(subname='Length', index=index, type='distanceBetween')
-            baseDistance = self.scene.createNode('distanceBetween', name=baseDistanceName)
-            baseDistance.connectPlugs(intermediateInfo[f'controlPoints[{i}]'], 'point1')
-            baseDistance.connectPlugs(intermediateInfo[f'controlPoints[{i + 1}]'], 'point2')
+            baseDistance = network.createNode('distanceBetween', name=baseDistanceName)
+            network.connectPlugs(intermediateInfo[f'controlPoints[{i}]'], baseDistance['point1'])
+            network.connectPlugs(intermediateInfo[f'controlPoints[{i + 1}]'], baseDistance['point2'])
 
             stretchDistanceName = self.formatName(subname='IntermediateLength', index=index, type='distanceBetween')
-            stretchDistance = self.scene.createNode('distanceBetween', name=stretchDistanceName)
-            stretchDistance.connectPlugs(curveInfo[f'controlPoints[{i}]'], 'point1')
-            stretchDistance.connectPlugs(curveInfo[f'controlPoints[{i + 1}]'], 'point2')
+            stretchDistance = network.createNode('distanceBetween', name=stretchDistanceName)
+            network.connectPlugs(curveInfo[f'controlPoints[{i}]'], stretchDistance['point1'])
+            network.connectPlugs(curveInfo[f'controlPoints[{i + 1}]'], stretchDistance['point2'])
 
             # Create spine-length multiplier
             #
             spineBlendName = self.formatName(subname='Length', index=index, type='blendTwoAttr')
-            spineBlend = self.scene.createNode('blendTwoAttr', name=spineBlendName)
-            spineBlend.connectPlugs(chestIKCtrl['stretch'], 'attributesBlender')
-            spineBlend.connectPlugs(baseDistance['distance'], 'input[0]')
-            spineBlend.connectPlugs(stretchDistance['distance'], 'input[1]')
-            spineBlend.connectPlugs('output', endJoint['translateX'])
+            spineBlend = network.createNode('blendTwoAttr', name=spineBlendName)
+            network.connectPlugs(chestIKCtrl['stretch'], spineBlend['attributesBlender'])
+            network.connectPlugs(baseDistance['distance'], spineBlend['input[0]'])
+            network.connectPlugs(stretchDistance['distance'], spineBlend['input[1]'])
+            network.connectPlugs(spineBlend['output'], endJoint['translateX'])
 
         # Setup scale remap
         #
         scaleRemapName = self.formatName(subname='Scale', type='remapArray')
-        scaleRemap = self.scene.createNode('remapArray', name=scaleRemapName)
-        scaleRemap.clamped = True
-        scaleRemap.setAttr('parameter', parameters)
-        scaleRemap.connectPlugs(hipsCtrl['scale'], 'outputMin')
-        scaleRemap.connectPlugs(chestIKCtrl['scale'], 'outputMax')
+        scaleRemap = network.createNode('remapArray', name=scaleRemapName)
+        network.setAttr(scaleRemap['clamped'], True)
+        network.setAttr(scaleRemap['parameter'], parameters)
+        network.connectPlugs(hipsCtrl['scale'], scaleRemap['outputMin'])
+        network.connectPlugs(chestIKCtrl['scale'], scaleRemap['outputMax'])
+
+        # Commit utility network
+        #
+        nodes = self.commitNetwork(network)
+        scaleRemap = nodes[scaleRemap.index]
+
+        if neckEnabled:
+
+            self.userProperties['controlPointOverride'] = nodes[blendTransform.index].uuid()
 
         # Create spine controls
         #
@@ -163,6 +163,8 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
     def buildRig(self):
         """
         Builds the control rig for this component.
+        All utility nodes are described by a single node network that is committed once the controls exist.
+        Any space switches and alignments that depend on the evaluated network are created afterwards!
 
         :rtype: None
         """
@@ -316,9 +318,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         limbCtrl.prepareChannelBoxForAnimation()
         self.publishNode(limbCtrl, alias=limbName)
 
-        clavicleComponents = self.findComponentAncestors('ClavicleComponent')
-        hasClavicleComponent = len(clavicleComponents) > 0
-
         limbSpaceSwitch = None
 
         if hasClavicleComponent:
@@ -354,28 +353,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
             limbSpaceSwitch.connectPlugs(limbCtrl['rotationSpaceW3'], 'target[3].targetRotateWeight')
             limbSpaceSwitch.connectPlugs(limbCtrl['rotationSpaceW4'], 'target[4].targetRotateWeight')
 
-            limbAimMatrixName = self.formatName(subname='FollowBody', type='aimMatrix')
-            limbAimMatrix = self.scene.createNode('aimMatrix', name=limbAimMatrixName)
-            limbAimMatrix.connectPlugs(limbCtrl['followBody'], 'envelope')
-            limbAimMatrix.connectPlugs(limbSpaceSwitch['outputWorldMatrix'], 'inputMatrix')
-            limbAimMatrix.setAttr('primary', {'primaryInputAxis': (0.0, 0.0, -1.0 * mirrorSign), 'primaryMode': 2, 'primaryTargetVector': (0.0, 0.0, 1.0)})  # Align
-            limbAimMatrix.connectPlugs(cogCtrl[f'worldMatrix[{cogCtrl.instanceNumber()}]'], 'primaryTargetMatrix')
-            limbAimMatrix.setAttr('secondary', {'secondaryInputAxis': (1.0, 0.0, 0.0), 'secondaryMode': 2, 'secondaryTargetVector': (0.0, 0.0, 1.0)})  # Align
-            limbAimMatrix.connectPlugs(spineCtrl[f'worldMatrix[{spineCtrl.instanceNumber()}]'], 'secondaryTargetMatrix')
-
-            limbAimMultMatrixName = self.formatName(subname='FollowBody', type='multMatrix')
-            limbAimMultMatrix = self.scene.createNode('multMatrix', name=limbAimMultMatrixName)
-            limbAimMultMatrix.connectPlugs(limbAimMatrix['outputMatrix'], 'matrixIn[0]')
-            limbAimMultMatrix.connectPlugs(limbSpace[f'parentInverseMatrix[{limbSpace.instanceNumber()}]'], 'matrixIn[1]')
-
-            limbAimDecomposeMatrixName = self.formatName(subname='FollowBody', type='decomposeMatrix')
-            limbAimDecomposeMatrix = self.scene.createNode('decomposeMatrix', name=limbAimDecomposeMatrixName)
-            limbAimDecomposeMatrix.connectPlugs(limbSpace['rotateOrder'], 'inputRotateOrder')
-            limbAimDecomposeMatrix.connectPlugs(limbAimMultMatrix['matrixSum'], 'inputMatrix')
-            limbAimDecomposeMatrix.connectPlugs('outputTranslate', limbSpace['translate'], force=True)
-            limbAimDecomposeMatrix.connectPlugs('outputRotate', limbSpace['rotate'], force=True)
-            limbAimDecomposeMatrix.connectPlugs('outputScale', limbSpace['scale'], force=True)
-
         else:
 
             limbCtrl.addDivider('Spaces')
@@ -403,49 +380,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         limbCtrl.userProperties['space'] = limbSpace.uuid()
         limbCtrl.userProperties['spaceSwitch'] = limbSpaceSwitch.uuid()
 
-        # Setup limb blends
-        #
-        blender = switchCtrl['mode']
-        upperBlender = setuputils.createTransformBlends(upperFKJoint, upperRIKJoint, upperBlendJoint, blender=blender)
-        lowerBlender = setuputils.createTransformBlends(lowerFKJoint, lowerRIKJoint, lowerBlendJoint, blender=blender)
-        extremityBlender = setuputils.createTransformBlends(extremityFKJoint, extremityRIKJoint, extremityBlendJoint, blender=blender)
-
-        upperBlender.setName(self.formatName(subname=upperLimbName, type='blendTransform'))
-        lowerBlender.setName(self.formatName(subname=lowerLimbName, type='blendTransform'))
-        extremityBlender.setName(self.formatName(subname=limbTipName, type='blendTransform'))
-
-        # Setup limb length nodes
-        #
-        upperLengthName = self.formatName(name=upperLimbName, subname='Length', type='plusMinusAverage')
-        upperLength = self.scene.createNode('plusMinusAverage', name=upperLengthName)
-        upperLength.setAttr('operation', 1)  # Addition
-        upperLength.connectPlugs(switchCtrl['length[0]'], 'input1D[0]')
-        upperLength.connectPlugs(switchCtrl[upperOffsetAttr], 'input1D[1]')
-
-        lowerLengthName = self.formatName(name=lowerLimbName, subname='Length', type='plusMinusAverage')
-        lowerLength = self.scene.createNode('plusMinusAverage', name=lowerLengthName)
-        lowerLength.setAttr('operation', 1)  # Addition
-        lowerLength.connectPlugs(switchCtrl['length[1]'], 'input1D[0]')
-        lowerLength.connectPlugs(switchCtrl[lowerOffsetAttr], 'input1D[1]')
-
-        limbLength = self.formatName(subname='Length', type='plusMinusAverage')
-        limbLength = self.scene.createNode('plusMinusAverage', name=limbLength)
-        limbLength.setAttr('operation', 1)  # Addition
-        limbLength.connectPlugs(upperLength['output1D'], 'input1D[0]')
-        limbLength.connectPlugs(lowerLength['output1D'], 'input1D[1]')
-
-        upperWeightName = self.formatName(name=upperLimbName, subname='Weight', type='floatMath')
-        upperWeight = self.scene.createNode('floatMath', name=upperWeightName)
-        upperWeight.operation = 3  # Divide
-        upperWeight.connectPlugs(upperLength['output1D'], 'inFloatA')
-        upperWeight.connectPlugs(limbLength['output1D'], 'inFloatB')
-
-        lowerWeightName = self.formatName(name=lowerLimbName, subname='Weight', type='floatMath')
-        lowerWeight = self.scene.createNode('floatMath', name=lowerWeightName)
-        lowerWeight.operation = 3  # Divide
-        lowerWeight.connectPlugs(lowerLength['output1D'], 'inFloatA')
-        lowerWeight.connectPlugs(limbLength['output1D'], 'inFloatB')
-
         # Create FK controls
         #
         upperFKMatrix = mirrorMatrix * upperLimbMatrix
@@ -462,12 +396,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         upperFKCtrl.prepareChannelBoxForAnimation()
         self.publishNode(upperFKCtrl, alias=f'{upperLimbName}_FK')
 
-        upperFKSpaceSwitch = upperFKSpace.addSpaceSwitch([limbCtrl, motionCtrl], maintainOffset=True)
-        upperFKSpaceSwitch.weighted = True
-        upperFKSpaceSwitch.setAttr('target', [{'targetWeight': (1.0, 1.0, 1.0), 'targetReverse': (False, True, False)}, {'targetWeight': (0.0, 0.0, 0.0)}])
-        upperFKSpaceSwitch.connectPlugs(upperFKCtrl['localOrGlobal'], 'target[0].targetRotateWeight')
-        upperFKSpaceSwitch.connectPlugs(upperFKCtrl['localOrGlobal'], 'target[1].targetRotateWeight')
-
         lowerFKMatrix = mirrorMatrix * lowerLimbMatrix
 
         lowerFKSpaceName = self.formatName(name=lowerLimbName, kinemat='FK', type='space')
@@ -475,14 +403,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         lowerFKSpace.setWorldMatrix(lowerFKMatrix)
         lowerFKSpace.freezeTransform()
 
-        translation, eulerRotation, scale = transformutils.decomposeTransformMatrix(lowerFKMatrix * upperFKMatrix.inverse())
-        lowerFKComposeMatrixName = self.formatName(name=lowerLimbName, kinemat='FK', type='composeMatrix')
-        lowerFKComposeMatrix = self.scene.createNode('composeMatrix', name=lowerFKComposeMatrixName)
-        lowerFKComposeMatrix.setAttr('inputTranslate', translation)
-        lowerFKComposeMatrix.setAttr('inputRotate', eulerRotation, convertUnits=False)
-        lowerFKComposeMatrix.connectPlugs(upperLength['output1D'], 'inputTranslateX')
-        lowerFKComposeMatrix.connectPlugs('outputMatrix', lowerFKSpace['offsetParentMatrix'])
-
         lowerFKCtrlName = self.formatName(name=lowerLimbName, kinemat='FK', type='control')
         lowerFKCtrl = self.scene.createNode('transform', name=lowerFKCtrlName, parent=lowerFKSpace)
         lowerFKCtrl.addDivider('Spaces')
@@ -490,103 +410,9 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         lowerFKCtrl.prepareChannelBoxForAnimation()
         self.publishNode(lowerFKCtrl, alias=f'{lowerLimbName}_FK')
 
-        lowerFKSpaceSwitch = lowerFKSpace.addSpaceSwitch([upperFKCtrl, motionCtrl], maintainOffset=True, skipRotateX=True, skipRotateY=True)
-        lowerFKSpaceSwitch.weighted = True
-        lowerFKSpaceSwitch.setAttr('target', [{'targetWeight': (1.0, 1.0, 1.0), 'targetReverse': (True, True, True)}, {'targetWeight': (0.0, 0.0, 0.0)}])
-        lowerFKSpaceSwitch.connectPlugs(lowerFKCtrl['localOrGlobal'], 'target[0].targetRotateWeight')
-        lowerFKSpaceSwitch.connectPlugs(lowerFKCtrl['localOrGlobal'], 'target[1].targetRotateWeight')
-        lowerFKSpaceSwitch.connectPlugs(upperLength['output1D'], 'target[0].targetOffsetTranslateX')
-
-        upperInverseLength = None
-
-        if requiresMirroring:
-
-            upperInverseLengthName = self.formatName(name=upperLimbName, subname='InverseLength', type='floatMath')
-            upperInverseLength = self.scene.createNode('floatMath', name=upperInverseLengthName)
-            upperInverseLength.operation = 5  # Negate
-            upperInverseLength.connectPlugs(upperLength['output1D'], 'inFloatA')
-            upperInverseLength.connectPlugs('outFloat', lowerFKComposeMatrix['inputTranslateX'], force=True)
-            upperInverseLength.connectPlugs('outFloat', lowerFKSpaceSwitch['target[0].targetOffsetTranslateX'], force=True)
-        
         extremityFKTargetName = self.formatName(name=limbTipName, kinemat='FK', type='target')
         extremityFKTarget = self.scene.createNode('transform', name=extremityFKTargetName, parent=lowerFKCtrl)
 
-        translation, eulerRotation, scale = transformutils.decomposeTransformMatrix(limbTipMatrix * lowerLimbMatrix.inverse())
-        extremityFKComposeMatrixName = self.formatName(name=limbTipName, kinemat='FK', type='composeMatrix')
-        extremityFKComposeMatrix = self.scene.createNode('composeMatrix', name=extremityFKComposeMatrixName)
-        extremityFKComposeMatrix.setAttr('inputTranslate', translation)
-        extremityFKComposeMatrix.setAttr('inputRotate', eulerRotation, convertUnits=False)
-        extremityFKComposeMatrix.connectPlugs(lowerLength['output1D'], 'inputTranslateX')
-        extremityFKComposeMatrix.connectPlugs('outputMatrix', extremityFKTarget['offsetParentMatrix'])
-
-        lowerInverseLength = None
-
-        if requiresMirroring:
-            
-            lowerInverseLengthName = self.formatName(name=lowerLimbName, subname='InverseLength', type='floatMath')
-            lowerInverseLength = self.scene.createNode('floatMath', name=lowerInverseLengthName)
-            lowerInverseLength.operation = 5  # Negate
-            lowerInverseLength.connectPlugs(lowerLength['output1D'], 'inFloatA')
-            lowerInverseLength.connectPlugs('outFloat', extremityFKComposeMatrix['inputTranslateX'], force=True)
-
-        upperFKJoint.addConstraint('transformConstraint', [upperFKCtrl], maintainOffset=requiresMirroring)
-        lowerFKJoint.addConstraint('transformConstraint', [lowerFKCtrl], maintainOffset=requiresMirroring)
-        extremityFKJoint.addConstraint('transformConstraint', [extremityFKTarget], maintainOffset=requiresMirroring)
-
-        # Add FK control shapes
-        #
-        upperFKShape = upperFKCtrl.addPointHelper('cylinder', size=(15.0 * rigScale), lineWidth=2.0, colorRGB=lightColorRGB)
-        upperFKShape.reorientAndScaleToFit(lowerFKCtrl)
-
-        lowerFKShape = lowerFKCtrl.addPointHelper('cylinder', size=(15.0 * rigScale), lineWidth=2.0, colorRGB=lightColorRGB)
-        lowerFKShape.reorientAndScaleToFit(extremityFKTarget)
-
-        supportsResizing = int(mc.about(version=True)) >= 2025
-
-        if supportsResizing:
-
-            # Setup upper FK shape resizing
-            #
-            upperHalfLengthName = self.formatName(name=upperLimbName, subname='HalfLength', type='floatMath')
-            upperHalfLength = self.scene.createNode('floatMath', name=upperHalfLengthName)
-            upperHalfLength.operation = 6  # Half
-            upperHalfLength.connectPlugs(upperLength['output1D'], 'inFloatA')
-            upperHalfLength.connectPlugs('outFloat', upperFKShape['localPositionX'])
-
-            if requiresMirroring:
-
-                upperInverseLength.connectPlugs('outFloat', upperHalfLength['inFloatA'], force=True)
-
-            upperScaleLengthName = self.formatName(name=upperLimbName, subname='ScaleLength', type='divDoubleLinear')
-            upperScaleLength = self.scene.createNode('divDoubleLinear', name=upperScaleLengthName)
-            upperScaleLength.connectPlugs(upperLength['output1D'], 'input1')
-            upperScaleLength.connectPlugs(upperFKShape['size'], 'input2')
-            upperScaleLength.connectPlugs('output', upperFKShape['localScaleX'])
-
-            # Setup lower FK shape resizing
-            #
-            lowerHalfLengthName = self.formatName(name=lowerLimbName, subname='HalfLength', type='floatMath')
-            lowerHalfLength = self.scene.createNode('floatMath', name=lowerHalfLengthName)
-            lowerHalfLength.operation = 6  # Half
-            lowerHalfLength.connectPlugs(lowerLength['output1D'], 'inFloatA')
-            lowerHalfLength.connectPlugs('outFloat', lowerFKShape['localPositionX'])
-
-            if requiresMirroring:
-
-                lowerInverseLength.connectPlugs('outFloat', lowerHalfLength['inFloatA'], force=True)
-
-            lowerScaleLengthName = self.formatName(name=lowerLimbName, subname='ScaleLength', type='divDoubleLinear')
-            lowerScaleLength = self.scene.createNode('divDoubleLinear', name=lowerScaleLengthName)
-            lowerScaleLength.connectPlugs(lowerLength['output1D'], 'input1')
-            lowerScaleLength.connectPlugs(lowerFKShape['size'], 'input2')
-            lowerScaleLength.connectPlugs('output', lowerFKShape['localScaleX'])
-
-        else:
-
-            log.debug('Skipping dynamic shape resizing...')
-
-        # Tag FK controls
-        #
         upperFKCtrl.tagAsController(parent=limbCtrl, children=[lowerFKCtrl])
         lowerFKCtrl.tagAsController(parent=upperFKCtrl)
 
@@ -639,28 +465,11 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         extremityIKOffsetCtrl.prepareChannelBoxForAnimation()
         self.publishNode(extremityIKOffsetCtrl, alias=f'{limbTipName}_IK_Offset')
 
-        extremityIKSpaceSwitch = extremityIKSpace.addSpaceSwitch([motionCtrl, cogCtrl, waistCtrl, spineCtrl, limbCtrl], maintainOffset=True)
-        extremityIKSpaceSwitch.weighted = True
-        extremityIKSpaceSwitch.setAttr('target', [{'targetWeight': (0.0, 0.0, 0.0)}, {'targetWeight': (0.0, 0.0, 0.0)}, {'targetWeight': (0.0, 0.0, 0.0)}, {'targetWeight': (0.0, 0.0, 0.0)}, {'targetWeight': (0.0, 0.0, 1.0)}])
-        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['positionSpaceW0'], 'target[0].targetTranslateWeight')
-        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['positionSpaceW1'], 'target[1].targetTranslateWeight')
-        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['positionSpaceW2'], 'target[2].targetTranslateWeight')
-        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['positionSpaceW3'], 'target[3].targetTranslateWeight')
-        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['positionSpaceW4'], 'target[4].targetTranslateWeight')
-        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['rotationSpaceW0'], 'target[0].targetRotateWeight')
-        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['rotationSpaceW1'], 'target[1].targetRotateWeight')
-        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['rotationSpaceW2'], 'target[2].targetRotateWeight')
-        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['rotationSpaceW3'], 'target[3].targetRotateWeight')
-        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['rotationSpaceW4'], 'target[4].targetRotateWeight')
-
-        extremityIKCtrl.userProperties['space'] = extremityIKSpace.uuid()
-        extremityIKCtrl.userProperties['spaceSwitch'] = extremityIKSpaceSwitch.uuid()
-        extremityIKCtrl.userProperties['offset'] = extremityIKOffsetCtrl.uuid()
-
         extremityIKCtrl.tagAsController(parent=limbCtrl, children=[extremityIKOffsetCtrl])
         extremityIKOffsetCtrl.tagAsController(parent=extremityIKCtrl)
 
         # Update preferred IK angles
+        # This has to be done before the IK joints are driven by the emulators!
         #
         lowerAngle = math.degrees(lowerIKJoint.eulerRotation().z)
         lowerAngleSign = math.copysign(1.0, lowerAngle)
@@ -669,121 +478,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         lowerIKJoint.preferredAngleZ = preferredAngle
         lowerRIKJoint.preferredAngleZ = preferredAngle
 
-        # Create IK emulators
-        #
-        limbDecomposeMatrixName = self.formatName(type='decomposeMatrix')
-        limbDecomposeMatrix = self.scene.createNode('decomposeMatrix', name=limbDecomposeMatrixName)
-        limbDecomposeMatrix.connectPlugs(limbCtrl[f'worldMatrix[{limbCtrl.instanceNumber()}]'], 'inputMatrix')
-
-        upperRestMatrixName = self.formatName(name=upperLimbName, subname='Rest', type='composeMatrix')
-        upperRestMatrix = self.scene.createNode('composeMatrix', name=upperRestMatrixName)
-        upperRestMatrix.connectPlugs(limbDecomposeMatrix['outputTranslate'], 'inputTranslate')
-        upperRestMatrix.useEulerRotation = True
-        upperRestMatrix.inputRotate = upperIKJoint.getAttr('rotate')
-        upperRestMatrix.connectPlugs(limbDecomposeMatrix['outputScale'], 'inputScale')
-
-        lowerRestMatrixName = self.formatName(name=lowerLimbName, subname='Rest', type='composeMatrix')
-        lowerRestMatrix = self.scene.createNode('composeMatrix', name=lowerRestMatrixName)
-        lowerRestMatrix.connectPlugs(upperLength['output1D'], 'inputTranslateX')
-        lowerRestMatrix.useEulerRotation = True
-        lowerRestMatrix.inputRotateZ = lowerIKJoint.getAttr('rotateZ')
-        lowerRestMatrix.connectPlugs(limbDecomposeMatrix['outputScale'], 'inputScale')
-
-        extremityRestMatrixName = self.formatName(name=limbTipName, subname='Rest', type='composeMatrix')
-        extremityRestMatrix = self.scene.createNode('composeMatrix', name=extremityRestMatrixName)
-        extremityRestMatrix.connectPlugs(lowerLength['output1D'], 'inputTranslateX')
-        extremityRestMatrix.connectPlugs(limbDecomposeMatrix['outputScale'], 'inputScale')
-
-        limbIKEmulatorName = self.formatName(type='ikEmulator')
-        limbIKEmulator = self.scene.createNode('ikEmulator', name=limbIKEmulatorName)
-        limbIKEmulator.forwardAxis = 0  # X
-        limbIKEmulator.forwardAxisFlip = False
-        limbIKEmulator.upAxis = 1  # Y
-        limbIKEmulator.upAxisFlip = True
-        limbIKEmulator.poleType = 2  # Matrix
-        limbIKEmulator.segmentScaleCompensate = True
-        limbIKEmulator.connectPlugs(upperRestMatrix['outputMatrix'], 'restMatrix[0]')
-        limbIKEmulator.connectPlugs(lowerRestMatrix['outputMatrix'], 'restMatrix[1]')
-        limbIKEmulator.connectPlugs(extremityRestMatrix['outputMatrix'], 'restMatrix[2]')
-        limbIKEmulator.connectPlugs(switchCtrl['stretch'], 'stretch')
-        limbIKEmulator.connectPlugs(switchCtrl['soften'], 'soften')
-        limbIKEmulator.connectPlugs(switchCtrl['twist'], 'twist')
-        limbIKEmulator.connectPlugs(extremityIKCtrl[f'worldMatrix[{extremityIKCtrl.instanceNumber()}]'], 'goal')
-
-        ikHandleTargetName = self.formatName(kinemat='IK', type='target')
-        ikHandleTarget = self.scene.createNode('transform', name=ikHandleTargetName, parent=privateGroup)
-        ikHandleTarget.displayLocalAxis = True
-        ikHandleTarget.inheritsTransform = False
-        ikHandleTarget.connectPlugs(limbIKEmulator['softGoal'], 'translate')
-
-        limbRIKEmulatorName = self.formatName(subname='Reverse', type='ikEmulator')
-        limbRIKEmulator = self.scene.createNode('ikEmulator', name=limbRIKEmulatorName)
-        limbRIKEmulator.forwardAxis = 0  # X
-        limbRIKEmulator.forwardAxisFlip = False
-        limbRIKEmulator.upAxis = 1  # Y
-        limbRIKEmulator.upAxisFlip = True
-        limbRIKEmulator.poleType = 2  # Matrix
-        limbRIKEmulator.connectPlugs(upperRestMatrix['outputMatrix'], 'restMatrix[0]')
-        limbRIKEmulator.connectPlugs(lowerRestMatrix['outputMatrix'], 'restMatrix[1]')
-        limbRIKEmulator.connectPlugs(extremityRestMatrix['outputMatrix'], 'restMatrix[2]')
-        limbRIKEmulator.connectPlugs(switchCtrl['pin'], 'pin')
-        limbRIKEmulator.connectPlugs(switchCtrl['stretch'], 'stretch')
-        limbRIKEmulator.connectPlugs(switchCtrl['soften'], 'soften')
-        limbRIKEmulator.connectPlugs(switchCtrl['twist'], 'twist')
-        limbRIKEmulator.connectPlugs(extremityIKCtrl[f'worldMatrix[{extremityIKCtrl.instanceNumber()}]'], 'goal')
-
-        # Connect emulators to IK joints
-        #
-        upperIKMatrixName = self.formatName(name=upperLimbName, subname='IK', type='decomposeMatrix')
-        upperIKMatrix = self.scene.createNode('decomposeMatrix', name=upperIKMatrixName)
-        upperIKMatrix.connectPlugs(limbIKEmulator['outMatrix[0]'], 'inputMatrix')
-        upperIKMatrix.connectPlugs(upperIKJoint['rotateOrder'], 'inputRotateOrder')
-        upperIKMatrix.connectPlugs('outputTranslate', upperIKJoint['translate'])
-        upperIKMatrix.connectPlugs('outputRotate', upperIKJoint['rotate'])
-        upperIKMatrix.connectPlugs('outputScale', upperIKJoint['scale'])
-
-        lowerIKMatrixName = self.formatName(name=lowerLimbName, subname='IK', type='decomposeMatrix')
-        lowerIKMatrix = self.scene.createNode('decomposeMatrix', name=lowerIKMatrixName)
-        lowerIKMatrix.connectPlugs(limbIKEmulator['outMatrix[1]'], 'inputMatrix')
-        lowerIKMatrix.connectPlugs(lowerIKJoint['rotateOrder'], 'inputRotateOrder')
-        lowerIKMatrix.connectPlugs('outputTranslate', lowerIKJoint['translate'])
-        lowerIKMatrix.connectPlugs('outputRotate', lowerIKJoint['rotate'])
-        lowerIKMatrix.connectPlugs('outputScale', lowerIKJoint['scale'])
-
-        extremityIKName = self.formatName(name=limbTipName, subname='IK', type='decomposeMatrix')
-        extremityIKMatrix = self.scene.createNode('decomposeMatrix', name=extremityIKName)
-        extremityIKMatrix.connectPlugs(limbIKEmulator['outMatrix[2]'], 'inputMatrix')
-        extremityIKMatrix.connectPlugs(extremityIKJoint['rotateOrder'], 'inputRotateOrder')
-        extremityIKMatrix.connectPlugs('outputTranslate', extremityIKJoint['translate'])
-        extremityIKMatrix.connectPlugs('outputRotate', extremityIKJoint['rotate'])
-        extremityIKMatrix.connectPlugs('outputScale', extremityIKJoint['scale'])
-
-        # Connect emulator to RIK joints
-        #
-        upperRIKMatrixName = self.formatName(name=upperLimbName, subname='RIK', type='decomposeMatrix')
-        upperRIKMatrix = self.scene.createNode('decomposeMatrix', name=upperRIKMatrixName)
-        upperRIKMatrix.connectPlugs(limbRIKEmulator['outMatrix[0]'], 'inputMatrix')
-        upperRIKMatrix.connectPlugs(upperRIKJoint['rotateOrder'], 'inputRotateOrder')
-        upperRIKMatrix.connectPlugs('outputTranslate', upperRIKJoint['translate'])
-        upperRIKMatrix.connectPlugs('outputRotate', upperRIKJoint['rotate'])
-        upperRIKMatrix.connectPlugs('outputScale', upperRIKJoint['scale'])
-
-        lowerRIKMatrixName = self.formatName(name=lowerLimbName, subname='RIK', type='decomposeMatrix')
-        lowerRIKMatrix = self.scene.createNode('decomposeMatrix', name=lowerRIKMatrixName)
-        lowerRIKMatrix.connectPlugs(limbRIKEmulator['outMatrix[1]'], 'inputMatrix')
-        lowerRIKMatrix.connectPlugs(lowerRIKJoint['rotateOrder'], 'inputRotateOrder')
-        lowerRIKMatrix.connectPlugs('outputTranslate', lowerRIKJoint['translate'])
-        lowerRIKMatrix.connectPlugs('outputRotate', lowerRIKJoint['rotate'])
-        lowerRIKMatrix.connectPlugs('outputScale', lowerRIKJoint['scale'])
-
-        extremityRIKName = self.formatName(name=limbTipName, subname='RIK', type='decomposeMatrix')
-        extremityRIKMatrix = self.scene.createNode('decomposeMatrix', name=extremityRIKName)
-        extremityRIKMatrix.connectPlugs(limbRIKEmulator['outMatrix[2]'], 'inputMatrix')
-        extremityRIKMatrix.connectPlugs(extremityRIKJoint['rotateOrder'], 'inputRotateOrder')
-        extremityRIKMatrix.connectPlugs('outputTranslate', extremityRIKJoint['translate'])
-        extremityRIKMatrix.connectPlugs('outputRotate', extremityRIKJoint['rotate'])
-        extremityRIKMatrix.connectPlugs('outputScale', extremityRIKJoint['scale'])
-
         # Calculate default PV matrix
         #
         upVector = -((transformutils.breakMatrix(upperLimbMatrix, normalize=True)[1] * 0.5) + (transformutils.breakMatrix(lowerLimbMatrix, normalize=True)[1] * 0.5)).normal()
@@ -798,7 +492,7 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         polePosition = poleOrigin + (poleVector * sum(limbLengths))
         poleMatrix = transformutils.createTranslateMatrix(polePosition)
 
-        # Create PV follow system
+        # Create PV follow joints
         #
         followJointName = self.formatName(subname='Follow', type='joint')
         followJoint = self.scene.createNode('joint', name=followJointName, parent=jointsGroup)
@@ -806,49 +500,18 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
 
         followTipJointName = self.formatName(subname='FollowTip', type='joint')
         followTipJoint = self.scene.createNode('joint', name=followTipJointName, parent=followJoint)
-        followTipJoint.connectPlugs(limbIKEmulator['softDistance'], followTipJoint['translateX'])
-        followTipJoint.connectPlugs(followJoint['scale'], 'scale')
-
-        followHalfLengthName = self.formatName(subname='HalfFollow', type='floatMath')
-        followHalfLength = self.scene.createNode('floatMath', name=followHalfLengthName)
-        followHalfLength.operation = 6  # Half
-        followHalfLength.connectPlugs(followTipJoint['translateX'], 'inDistanceA')
 
         followTargetName = self.formatName(subname='Follow', type='target')
         followTarget = self.scene.createNode('transform', name=followTargetName, parent=followJoint)
         followTarget.displayLocalAxis = True
-        followTarget.connectPlugs(followHalfLength['outDistance'], 'translateX')
-        followTarget.addConstraint('scaleConstraint', [limbCtrl])
-
-        forwardVectorMultMatrixName = self.formatName(subname='Forward', type='multiplyVectorByMatrix')
-        forwardVectorMultMatrix = self.scene.createNode('multiplyVectorByMatrix', name=forwardVectorMultMatrixName)
-        forwardVectorMultMatrix.connectPlugs(limbIKEmulator['softVector'], 'input')
-        forwardVectorMultMatrix.connectPlugs(waistCtrl[f'worldInverseMatrix[{waistCtrl.instanceNumber()}]'], 'matrix')
-
-        defaultSampleInput = forwardVector * waistCtrl.worldInverseMatrix()
-        defaultSampleOutput = -poleVector * waistCtrl.worldInverseMatrix()
-        followSamples = self.__default_rbf_samples__[componentSide]
-
-        followRBFSolverName = self.formatName(subname='Follow', type='rbfSolver')
-        followRBFSolver = self.scene.createNode('rbfSolver', name=followRBFSolverName)
-        followRBFSolver.inputType = 0  # Euclidean
-        followRBFSolver.function = 1  # Gaussian
-        followRBFSolver.setAttr('sample[0]', {'sampleName': 'Default', 'sampleInputTranslate': defaultSampleInput, 'sampleOutputTranslate': -defaultSampleOutput})
-        followRBFSolver.setAttr('sample[1]', followSamples[0])
-        followRBFSolver.setAttr('sample[2]', followSamples[1])
-        followRBFSolver.setAttr('sample[3]', followSamples[2])
-        followRBFSolver.setAttr('sample[4]', followSamples[3])
-        followRBFSolver.setAttr('sample[5]', followSamples[4])
-        followRBFSolver.setAttr('sample[6]', followSamples[5])
-        followRBFSolver.connectPlugs(forwardVectorMultMatrix['output'], 'inputTranslate')
 
-        followUpVectorMultMatrixName = self.formatName(subname='Follow', type='multiplyVectorByMatrix')
-        followUpVectorMultMatrix = self.scene.createNode('multiplyVectorByMatrix', name=followUpVectorMultMatrixName)
-        followUpVectorMultMatrix.connectPlugs(followRBFSolver['outputTranslate'], 'input')
-        followUpVectorMultMatrix.connectPlugs(waistCtrl[f'worldMatrix[{waistCtrl.instanceNumber()}]'], 'matrix')
+        ikHandleTargetName = self.formatName(kinemat='IK', type='target')
+        ikHandleTarget = self.scene.createNode('transform', name=ikHandleTargetName, parent=privateGroup)
+        ikHandleTarget.displayLocalAxis = True
+        ikHandleTarget.inheritsTransform = False
 
+        followTarget.addConstraint('scaleConstraint', [limbCtrl])
         followConstraint = followJoint.addConstraint('aimConstraint', [ikHandleTarget], aimVector=(1.0, 0.0, 0.0), upVector=(0.0, -1.0, 0.0), worldUpType=3, worldUpVector=(0.0, 1.0, 0.0))
-        followConstraint.connectPlugs(followUpVectorMultMatrix['output'], 'worldUpVector')
 
         # Create PV controller
         #
@@ -867,25 +530,12 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         limbPVCtrl.addAttr(longName='transformSpaceW4', niceName=f'Transform Space ({limbName})', attributeType='float', min=0.0, max=1.0, keyable=True)
         limbPVCtrl.addAttr(longName='transformSpaceW5', niceName='Transform Space (Auto)', attributeType='float', min=0.0, max=1.0, default=1.0, keyable=True)
         limbPVCtrl.addAttr(longName='transformSpaceW6', niceName=f'Transform Space ({limbTipName})', attributeType='float', min=0.0, max=1.0, keyable=True)
-        limbPVCtrl.connectPlugs(f'worldMatrix[{limbPVCtrl.instanceNumber()}]', limbIKEmulator['poleMatrix'])
-        limbPVCtrl.connectPlugs(f'worldMatrix[{limbPVCtrl.instanceNumber()}]', limbRIKEmulator['poleMatrix'])
         limbPVCtrl.prepareChannelBoxForAnimation()
         limbPVCtrl.tagAsController(parent=extremityIKCtrl)
         self.publishNode(limbPVCtrl, alias=f'{limbName}_PV')
 
-        limbPVSpaceSwitch = limbPVSpace.addSpaceSwitch([motionCtrl, cogCtrl, waistCtrl, spineCtrl, limbCtrl, followTarget, extremityIKCtrl], weighted=True, maintainOffset=True)
-        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW0'], 'target[0].targetWeight')
-        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW1'], 'target[1].targetWeight')
-        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW2'], 'target[2].targetWeight')
-        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW3'], 'target[3].targetWeight')
-        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW4'], 'target[4].targetWeight')
-        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW5'], 'target[5].targetWeight')
-        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW6'], 'target[6].targetWeight')
-
-        limbPVCtrl.userProperties['space'] = limbPVSpace.uuid()
-        limbPVCtrl.userProperties['spaceSwitch'] = limbPVSpaceSwitch.uuid()
-
         # Create hinge controls
+        # The hinge space is aligned once the network has been committed!
         #
         hingeBendTargetName = self.formatName(name=hingeName, subname='Bend', type='target')
         hingeBendTarget = self.scene.createNode('transform', name=hingeBendTargetName, parent=privateGroup)
@@ -902,15 +552,10 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         hingeStraightTarget.addConstraint('aimConstraint', [extremityBlendJoint], aimVector=(1.0, 0.0, 0.0), upVector=(0.0, 0.0, 1.0), worldUpType=2, worldUpVector=(0.0, 0.0, 1.0), worldUpObject=upperBlendJoint)
         hingeStraightTarget.addConstraint('scaleConstraint', [limbCtrl])
 
-        constraint = hingeStraightTarget.addConstraint('pointConstraint', [upperBlendJoint, extremityBlendJoint])
-        targets = constraint.targets()
-        constraint.connectPlugs(upperWeight['outFloat'], targets[1].driver())  # These are flipped for a reason!
-        constraint.connectPlugs(lowerWeight['outFloat'], targets[0].driver())  # These are flipped for a reason!
+        hingeStraightConstraint = hingeStraightTarget.addConstraint('pointConstraint', [upperBlendJoint, extremityBlendJoint])
 
         hingeSpaceName = self.formatName(name=hingeName, type='space')
         hingeSpace = self.scene.createNode('transform', name=hingeSpaceName, parent=controlsGroup)
-        hingeSpace.copyTransform(hingeBendTarget)
-        hingeSpace.freezeTransform()
 
         hingeCtrlName = self.formatName(name=hingeName, type='control')
         hingeCtrl = self.scene.createNode('transform', name=hingeCtrlName, parent=hingeSpace)
@@ -920,27 +565,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         hingeCtrl.prepareChannelBoxForAnimation()
         self.publishNode(hingeCtrl, alias=hingeName)
 
-        hingeSpaceSwitch = hingeSpace.addSpaceSwitch([hingeBendTarget, hingeStraightTarget])
-        hingeSpaceSwitch.weighted = True
-        hingeSpaceSwitch.setAttr('target', [{'targetWeight': (0.0, 0.0, 0.0), 'targetReverse': (True, True, True)}, {'targetWeight': (0.0, 0.0, 0.0)}])
-        hingeSpaceSwitch.connectPlugs(hingeCtrl['straighten'], 'target[0].targetWeight')
-        hingeSpaceSwitch.connectPlugs(hingeCtrl['straighten'], 'target[1].targetWeight')
-
-        hingeCtrl.userProperties['space'] = hingeSpace.uuid()
-        hingeCtrl.userProperties['spaceSwitch'] = hingeSpaceSwitch.uuid()
-
-        # Check if hinge was enabled
-        # If so, update bind pose on export joint!
-        #
-        hingeEnabled = bool(hingeSpec.enabled)
-
-        if hingeEnabled:
-
-            hingeExportJoint = hingeSpec.getNode()
-            hingeExportJoint.copyTransform(hingeCtrl, skipScale=True)
-
-            hingeSpec.cacheNode(delete=False)
-
         # Create PV handle curve
         #
         limbPVShapeName = self.formatName(kinemat='PV', subname='Handle', type='control')
@@ -949,14 +573,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         limbPVShape.useObjectColor = 2
         limbPVShape.wireColorRGB = lightColorRGB
 
-        limbPVCurveFromPointName = self.formatName(kinemat='PV', subname='Handle', type='curveFromPoint')
-        limbPVCurveFromPoint = self.scene.createNode('curveFromPoint', name=limbPVCurveFromPointName)
-        limbPVCurveFromPoint.degree = 1
-        limbPVCurveFromPoint.connectPlugs(limbPVShape[f'worldMatrix[{limbPVShape.instanceNumber()}]'], 'inputMatrix[0]')
-        limbPVCurveFromPoint.connectPlugs(hingeCtrl[f'worldMatrix[{hingeCtrl.instanceNumber()}]'], 'inputMatrix[1]')
-        limbPVCurveFromPoint.connectPlugs(limbPVShape[f'parentInverseMatrix[{limbPVShape.instanceNumber()}]'], 'parentInverseMatrix')
-        limbPVCurveFromPoint.connectPlugs('outputCurve', limbPVShape['create'])
-
         # Create target joints
         #
         upperJointName = self.formatName(name=upperLimbName, type='joint')
@@ -976,28 +592,16 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
         extremityJoint.addConstraint('pointConstraint', [extremityBlendJoint], skipTranslateY=True, skipTranslateZ=True)
         extremityJoint.connectPlugs(extremityBlendJoint['scale'], 'scale')
 
-        # Cache kinematic components
-        #
-        self.userProperties['switchControl'] = switchCtrl.uuid()
-
-        self.userProperties['fkJoints'] = (upperFKJoint.uuid(), lowerFKJoint.uuid(), extremityFKJoint.uuid())
-        self.userProperties['fkControls'] = (upperFKCtrl.uuid(), lowerFKCtrl.uuid(), extremityFKTarget.uuid())
-
-        self.userProperties['rikJoints'] = (upperRIKJoint.uuid(), lowerRIKJoint.uuid(), extremityRIKJoint.uuid())
-        self.userProperties['rikEmulator'] = limbRIKEmulator.uuid()
-        self.userProperties['ikJoints'] = (upperIKJoint.uuid(), lowerIKJoint.uuid(), extremityIKJoint.uuid())
-        self.userProperties['ikEmulator'] = limbIKEmulator.uuid()
-        self.userProperties['ikControls'] = (limbCtrl.uuid(), extremityIKCtrl.uuid())
-        self.userProperties['ikTarget'] = ikHandleTarget.uuid()
-        self.userProperties['pvControl'] = limbPVCtrl.uuid()
-        self.userProperties['hingeControls'] = (hingeCtrl.uuid(),)
-
-        self.userProperties['blendJoints'] = (upperBlendJoint.uuid(), lowerBlendJoint.uuid(), extremityBlendJoint.uuid())
-        self.userProperties['targetJoints'] = (upperJoint.uuid(), lowerJoint.uuid(), extremityJoint.uuid())
-
         # Check if twist is enabled
+        # If so, create the twist controls before describing the network
         #
-        if self.twistEnabled:
+        twistEnabled = bool(self.twistEnabled)
+        segmentNames = (upperLimbName, lowerLimbName)
+        segmentTwistSpecs = (upperTwistSpecs, lowerTwistSpecs)
+        segmentCurves = [None] * 2
+        segmentTwistCtrls = [[], []]
+
+        if twistEnabled:
 
             # Add extra hinge attributes
             #
@@ -1005,11 +609,10 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
             hingeCtrl.addAttr(longName='handleInset', attributeType='distance', min=0.0, keyable=True)
 
             # Create upper twist controller
+            # The upper twist space is aligned once the network has been committed!
             #
             upperLimbSpaceName = self.formatName(name=upperLimbName, type='space')
             upperLimbSpace = self.scene.createNode('transform', name=upperLimbSpaceName, parent=controlsGroup)
-            upperLimbSpace.copyTransform(upperJoint)
-            upperLimbSpace.freezeTransform()
 
             upperLimbCtrlName = self.formatName(name=upperLimbName, type='control')
             upperLimbCtrl = self.scene.createNode('transform', name=upperLimbCtrlName, parent=upperLimbSpace)
@@ -1019,26 +622,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
             upperLimbCtrl.prepareChannelBoxForAnimation()
             self.publishNode(upperLimbCtrl, alias=upperLimbName)
 
-            limbRollSolverName = self.formatName(name=upperLimbName, subname='Roll', type='twistSolver')
-            limbRollSolver = self.scene.createNode('twistSolver', name=limbRollSolverName)
-            limbRollSolver.forwardAxis = 0  # X
-            limbRollSolver.upAxis = 2  # Z
-            limbRollSolver.inverse = True
-            limbRollSolver.startOffsetMatrix = mirrorMatrix
-            limbRollSolver.connectPlugs(limbTarget[f'worldMatrix[{limbTarget.instanceNumber()}]'], 'startMatrix')
-            limbRollSolver.connectPlugs(upperJoint[f'worldMatrix[{upperJoint.instanceNumber()}]'], 'endMatrix')
-
-            limbRollEnvelopeName = self.formatName(name=upperLimbName, subname='RollEnvelope', type='floatMath')
-            limbRollEnvelope = self.scene.createNode('floatMath', name=limbRollEnvelopeName)
-            limbRollEnvelope.setAttr('operation', 2)  # Multiply
-            limbRollEnvelope.connectPlugs(limbRollSolver['roll'], 'inAngleA')
-            limbRollEnvelope.connectPlugs(upperLimbCtrl['inheritsTwist'], 'inAngleB')
-
-            limbRollConstraint = upperLimbSpace.addConstraint('transformConstraint', [upperJoint])
-            limbRollConstraint.connectPlugs(limbRollEnvelope['outAngle'], 'target[0].targetOffsetRotateX')
-
-            self.userProperties['rollSolver'] = limbRollSolver.uuid()
-
             # Create upper-limb out-handle control
             #
             upperLimbOutSpaceName = self.formatName(name=upperLimbName, subname='Out', type='space')
@@ -1072,17 +655,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
             upperLimbCurve.setAttr('cached', shapeutils.createCurveFromPoints([om.MPoint.kOrigin, om.MPoint.kOrigin], degree=1))
             upperLimbCurve.template = True
 
-            upperLimbCurveFromPointName = self.formatName(name=upperLimbName, subname='Handle', type='curveFromPoint')
-            upperLimbCurveFromPoint = self.scene.createNode('curveFromPoint', name=upperLimbCurveFromPointName)
-            upperLimbCurveFromPoint.degree = 1
-            upperLimbCurveFromPoint.connectPlugs(upperLimbCtrl[f'worldMatrix[{upperLimbCtrl.instanceNumber()}]'], 'inputMatrix[0]')
-            upperLimbCurveFromPoint.connectPlugs(upperLimbOutCtrl[f'worldMatrix[{upperLimbOutCtrl.instanceNumber()}]'], 'inputMatrix[1]')
-            upperLimbCurveFromPoint.connectPlugs(upperLimbCurve[f'parentInverseMatrix[{upperLimbCurve.instanceNumber()}]'], 'parentInverseMatrix')
-            upperLimbCurveFromPoint.connectPlugs('outputCurve', upperLimbCurve['create'])
-
-            upperLimbOutCtrl.userProperties['curve'] = upperLimbCurve.uuid()
-            upperLimbOutCtrl.userProperties['curveFromPoint'] = upperLimbCurveFromPoint.uuid()
-
             # Create hinge-in control
             #
             hingeInCtrlName = self.formatName(name=hingeName, subname='In', type='control')
@@ -1092,16 +664,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
             hingeInCtrl.prepareChannelBoxForAnimation()
             self.publishNode(hingeInCtrl, alias=f'{hingeName}_In')
 
-            hingeInNegateName = self.formatName(name=hingeName, subname='In', type='floatMath')
-            hingeInNegate = self.scene.createNode('floatMath', name=hingeInNegateName)
-            hingeInNegate.setAttr('operation', 5)  # Negate
-            hingeInNegate.connectPlugs(hingeCtrl['handleOffset'], 'inDistanceA')
-
-            hingeInMatrixName = self.formatName(name=hingeName, subname='In', type='composeMatrix')
-            hingeInMatrix = self.scene.createNode('composeMatrix', name=hingeInMatrixName)
-            hingeInMatrix.connectPlugs(hingeInNegate['outDistance'], 'inputTranslateX')
-            hingeInMatrix.connectPlugs('outputMatrix', hingeInCtrl['offsetParentMatrix'])
-
             # Create hinge-out control
             #
             hingeOutCtrlName = self.formatName(name=hingeName, subname='Out', type='control')
@@ -1114,11 +676,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
             hingeCtrl.userProperties['inHandle'] = hingeInCtrl.uuid()
             hingeCtrl.userProperties['outHandle'] = hingeOutCtrl.uuid()
 
-            hingeOutMatrixName = self.formatName(name=hingeName, subname='Out', type='composeMatrix')
-            hingeOutMatrix = self.scene.createNode('composeMatrix', name=hingeOutMatrixName)
-            hingeOutMatrix.connectPlugs(hingeCtrl['handleOffset'], 'inputTranslateX')
-            hingeOutMatrix.connectPlugs('outputMatrix', hingeOutCtrl['offsetParentMatrix'])
-
             # Create hinge proxy curve
             #
             hingeHandleCurveName = self.formatName(name=hingeName, subname='Handle', type='nurbsCurve')
@@ -1126,24 +683,11 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
             hingeHandleCurve.setAttr('cached', shapeutils.createCurveFromPoints([om.MPoint.kOrigin, om.MPoint.kOrigin, om.MPoint.kOrigin], degree=1))
             hingeHandleCurve.template = True
 
-            hingeHandleCurveFromPointName = self.formatName(name=hingeName, subname='Handle', type='curveFromPoint')
-            hingeHandleCurveFromPoint = self.scene.createNode('curveFromPoint', name=hingeHandleCurveFromPointName)
-            hingeHandleCurveFromPoint.degree = 1
-            hingeHandleCurveFromPoint.connectPlugs(hingeInCtrl[f'worldMatrix[{hingeInCtrl.instanceNumber()}]'], 'inputMatrix[0]')
-            hingeHandleCurveFromPoint.connectPlugs(hingeCtrl[f'worldMatrix[{hingeCtrl.instanceNumber()}]'], 'inputMatrix[1]')
-            hingeHandleCurveFromPoint.connectPlugs(hingeOutCtrl[f'worldMatrix[{hingeOutCtrl.instanceNumber()}]'], 'inputMatrix[2]')
-            hingeHandleCurveFromPoint.connectPlugs(hingeHandleCurve[f'parentInverseMatrix[{hingeHandleCurve.instanceNumber()}]'], 'parentInverseMatrix')
-            hingeHandleCurveFromPoint.connectPlugs('outputCurve', hingeHandleCurve['create'])
-
-            hingeCtrl.userProperties['curve'] = hingeHandleCurve.uuid()
-            hingeCtrl.userProperties['curveFromPoint'] = hingeHandleCurveFromPoint.uuid()
-
             # Create lower-limb in-handle control
+            # The lower-limb in-handle space is aligned once the network has been committed!
             #
             lowerLimbInSpaceName = self.formatName(name=limbTipName, subname='In', type='space')
             lowerLimbInSpace = self.scene.createNode('transform', name=lowerLimbInSpaceName, parent=controlsGroup)
-            lowerLimbInSpace.copyTransform(extremityJoint)
-            lowerLimbInSpace.freezeTransform()
 
             lowerLimbInCtrlName = self.formatName(name=limbTipName, subname='In', type='control')
             lowerLimbInCtrl = self.scene.createNode('transform', name=lowerLimbInCtrlName, parent=lowerLimbInSpace)
@@ -1153,21 +697,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
             lowerLimbInCtrl.prepareChannelBoxForAnimation()
             self.publishNode(lowerLimbInCtrl, alias=f'{limbTipName}_In')
 
-            lowerLimbInNegateName = self.formatName(name=limbTipName, subname='In', type='floatMath')
-            lowerLimbInNegate = self.scene.createNode('floatMath', name=lowerLimbInNegateName)
-            lowerLimbInNegate.setAttr('operation', 5)  # Negate
-            lowerLimbInNegate.connectPlugs(hingeCtrl['handleInset'], 'inDistanceA')
-
-            lowerLimbInSpaceSwitch = lowerLimbInSpace.addSpaceSwitch([extremityJoint], maintainOffset=False)
-            lowerLimbInSpaceSwitch.weighted = True
-            lowerLimbInSpaceSwitch.setAttr('target[0]', {'targetWeight': (1.0, 0.0, 1.0), 'targetReverse': (True, True, True)})
-            lowerLimbInSpaceSwitch.connectPlugs(lowerLimbInCtrl['localOrGlobal'], 'target[0].targetWeight')
-            lowerLimbInSpaceSwitch.connectPlugs(lowerLimbInNegate['outDistance'], 'target[0].targetOffsetTranslateX')
-
-            lowerLimbInCtrl.userProperties['negate'] = lowerLimbInNegate.uuid()
-            lowerLimbInCtrl.userProperties['space'] = lowerLimbInSpace.uuid()
-            lowerLimbInCtrl.userProperties['spaceSwitch'] = lowerLimbInSpaceSwitch.uuid()
-
             hingeCtrl.userProperties['otherHandles'] = (upperLimbOutCtrl.uuid(), lowerLimbInCtrl.uuid())
 
             # Create lower-out proxy curve handles
@@ -1177,30 +706,9 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
             lowerLimbCurve.setAttr('cached', shapeutils.createCurveFromPoints([om.MPoint.kOrigin, om.MPoint.kOrigin], degree=1))
             lowerLimbCurve.template = True
 
-            lowerLimbCurveFromPointName = self.formatName(name=lowerLimbName, subname='Handle', type='curveFromPoint')
-            lowerLimbCurveFromPoint = self.scene.createNode('curveFromPoint', name=lowerLimbCurveFromPointName)
-            lowerLimbCurveFromPoint.degree = 1
-            lowerLimbCurveFromPoint.connectPlugs(extremityJoint[f'worldMatrix[{extremityJoint.instanceNumber()}]'], 'inputMatrix[0]')
-            lowerLimbCurveFromPoint.connectPlugs(lowerLimbInCtrl[f'worldMatrix[{lowerLimbInCtrl.instanceNumber()}]'], 'inputMatrix[1]')
-            lowerLimbCurveFromPoint.connectPlugs(lowerLimbCurve[f'parentInverseMatrix[{lowerLimbCurve.instanceNumber()}]'], 'parentInverseMatrix')
-            lowerLimbCurveFromPoint.connectPlugs('outputCurve', lowerLimbCurve['create'])
-
-            lowerLimbCurve.userProperties['curve'] = lowerLimbCurve.uuid()
-            lowerLimbCurve.userProperties['curveFromPoint'] = lowerLimbCurveFromPoint.uuid()
-
-            # Create twist curve
+            # Create twist curves and controls
             #
-            segmentNames = (upperLimbName, lowerLimbName)
-            segmentSpecs = (upperLimbSpec, lowerLimbSpec)
-            segmentTwistSpecs = (upperTwistSpecs, lowerTwistSpecs)
-            segmentBones = ((upperJoint, lowerJoint), (lowerJoint, extremityJoint))
-            segmentCtrls = ((upperLimbCtrl, upperLimbOutCtrl, hingeInCtrl, hingeCtrl), (hingeCtrl, hingeOutCtrl, lowerLimbInCtrl, extremityJoint))
-            segmentScalers = ((upperLimbCtrl, hingeCtrl), (hingeCtrl, extremityIKCtrl))
-
-            twistSolvers = [None] * 2
-            scaleRemappers = [None] * 2
-
-            for (i, (segmentName, segmentSpec, segmentTwistSpecs, (startJoint, endJoint), (startCtrl, startOutCtrl, endInCtrl, endCtrl), (startScaler, endScaler))) in enumerate(zip(segmentNames, segmentSpecs, segmentTwistSpecs, segmentBones, segmentCtrls, segmentScalers)):
+            for (i, (segmentName, twistSpecs)) in enumerate(zip(segmentNames, segmentTwistSpecs)):
 
                 # Create curve segment
                 #
@@ -1213,46 +721,12 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
                 curveShape.setAttr('cached', shapeutils.createCurveFromPoints([om.MPoint.kOrigin, om.MPoint.kOrigin, om.MPoint.kOrigin, om.MPoint.kOrigin], degree=2))
                 curveShape.template = True
 
-                curveFromPointName = self.formatName(name=segmentName, subname='Twist', type='curveFromPoint')
-                curveFromPoint = self.scene.createNode('curveFromPoint', name=curveFromPointName)
-                curveFromPoint.degree = 3
-                curveFromPoint.connectPlugs(startCtrl[f'worldMatrix[{startCtrl.instanceNumber()}]'], 'inputMatrix[0]')
-                curveFromPoint.connectPlugs(startOutCtrl[f'worldMatrix[{startOutCtrl.instanceNumber()}]'], 'inputMatrix[1]')
-                curveFromPoint.connectPlugs(endInCtrl[f'worldMatrix[{endInCtrl.instanceNumber()}]'], 'inputMatrix[2]')
-                curveFromPoint.connectPlugs(endCtrl[f'worldMatrix[{endCtrl.instanceNumber()}]'], 'inputMatrix[3]')
-                curveFromPoint.connectPlugs(curveShape[f'parentInverseMatrix[{curveShape.instanceNumber()}]'], 'parentInverseMatrix')
-                curveFromPoint.connectPlugs('outputCurve', curveShape['create'])
-
-                # Create scale remapper
-                #
-                scaleRemapperName = self.formatName(name=segmentName, subname='Scale', type='remapArray')
-                scaleRemapper = self.scene.createNode('remapArray', name=scaleRemapperName)
-                scaleRemapper.setAttr('clamp', True)
-                scaleRemapper.connectPlugs(startScaler['scale'], 'outputMin')
-                scaleRemapper.connectPlugs(endScaler['scale'], 'outputMax')
-
-                scaleRemappers[i] = scaleRemapper.uuid()
-
-                # Create twist solver
-                #
-                twistSolverName = self.formatName(name=segmentName, subname='Twist', type='twistSolver')
-                twistSolver = self.scene.createNode('twistSolver', name=twistSolverName)
-                twistSolver.forwardAxis = 0  # X
-                twistSolver.upAxis = 2  # Z
-                twistSolver.segments = self.numTwistLinks
-                twistSolver.connectPlugs(startCtrl[f'worldMatrix[{startCtrl.instanceNumber()}]'], 'startMatrix')
-                twistSolver.connectPlugs(endCtrl[f'worldMatrix[{endCtrl.instanceNumber()}]'], 'endMatrix')
-
-                twistSolvers[i] = twistSolver.uuid()
+                segmentCurves[i] = curveShape
 
                 # Create twist controls
                 #
-                numTwistSpecs = len(segmentTwistSpecs)
+                for (j, twistSpec) in enumerate(twistSpecs):
 
-                for (j, twistSpec) in enumerate(segmentTwistSpecs):
-
-                    # Create twist controller
-                    #
                     twistIndex = j + 1
 
                     twistSpaceName = self.formatName(name=segmentName, subname='Twist', index=twistIndex, type='space')
@@ -1264,6 +738,592 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
                     twistCtrl.prepareChannelBoxForAnimation()
                     self.publishNode(twistCtrl, alias=f'{segmentName}_Twist{str(twistIndex).zfill(2)}')
 
+                    segmentTwistCtrls[i].append((twistSpace, twistCtrl))
+
+        # Describe utility network
+        # Everything below is committed at once by `commitNetwork`!
+        #
+        network = self.createNetwork()
+
+        # Describe follow-body nodes
+        #
+        if hasClavicleComponent:
+
+            limbAimMatrixName = self.formatName(subname='FollowBody', type='aimMatrix')
+            limbAimMatrix = network.createNode('aimMatrix', name=limbAimMatrixName)
+            network.connectPlugs(limbCtrl['followBody'], limbAimMatrix['envelope'])
+            network.connectPlugs(limbSpaceSwitch['outputWorldMatrix'], limbAimMatrix['inputMatrix'])
+            network.setAttr(limbAimMatrix['primary'], {'primaryInputAxis': (0.0, 0.0, -1.0 * mirrorSign), 'primaryMode': 2, 'primaryTargetVector': (0.0, 0.0, 1.0)})  # Align
+            network.connectPlugs(cogCtrl[f'worldMatrix[{cogCtrl.instanceNumber()}]'], limbAimMatrix['primaryTargetMatrix'])
+            network.setAttr(limbAimMatrix['secondary'], {'secondaryInputAxis': (1.0, 0.0, 0.0), 'secondaryMode': 2, 'secondaryTargetVector': (0.0, 0.0, 1.0)})  # Align
+            network.connectPlugs(spineCtrl[f'worldMatrix[{spineCtrl.instanceNumber()}]'], limbAimMatrix['secondaryTargetMatrix'])
+
+            limbAimMultMatrixName = self.formatName(subname='FollowBody', type='multMatrix')
+            limbAimMultMatrix = network.createNode('multMatrix', name=limbAimMultMatrixName)
+            network.connectPlugs(limbAimMatrix['outputMatrix'], limbAimMultMatrix['matrixIn[0]'])
+            network.connectPlugs(limbSpace[f'parentInverseMatrix[{limbSpace.instanceNumber()}]'], limbAimMultMatrix['matrixIn[1]'])
+
+            limbAimDecomposeMatrixName = self.formatName(subname='FollowBody', type='decomposeMatrix')
+            limbAimDecomposeMatrix = network.createNode('decomposeMatrix', name=limbAimDecomposeMatrixName)
+            network.connectPlugs(limbSpace['rotateOrder'], limbAimDecomposeMatrix['inputRotateOrder'])
+            network.connectPlugs(limbAimMultMatrix['matrixSum'], limbAimDecomposeMatrix['inputMatrix'])
+            network.connectPlugs(limbAimDecomposeMatrix['outputTranslate'], limbSpace['translate'], force=True)
+            network.connectPlugs(limbAimDecomposeMatrix['outputRotate'], limbSpace['rotate'], force=True)
+            network.connectPlugs(limbAimDecomposeMatrix['outputScale'], limbSpace['scale'], force=True)
+
+        # Describe limb blends
+        #
+        blender = switchCtrl['mode']
+        setuputils.describeTransformBlends(network, upperFKJoint, upperRIKJoint, upperBlendJoint, name=self.formatName(subname=upperLimbName, type='blendTransform'), blender=blender)
+        setuputils.describeTransformBlends(network, lowerFKJoint, lowerRIKJoint, lowerBlendJoint, name=self.formatName(subname=lowerLimbName, type='blendTransform'), blender=blender)
+        setuputils.describeTransformBlends(network, extremityFKJoint, extremityRIKJoint, extremityBlendJoint, name=self.formatName(subname=limbTipName, type='blendTransform'), blender=blender)
+
+        # Describe limb length nodes
+        #
+        upperLengthName = self.formatName(name=upperLimbName, subname='Length', type='plusMinusAverage')
+        upperLength = network.createNode('plusMinusAverage', name=upperLengthName)
+        network.setAttr(upperLength['operation'], 1)  # Addition
+        network.connectPlugs(switchCtrl['length[0]'], upperLength['input1D[0]'])
+        network.connectPlugs(switchCtrl[upperOffsetAttr], upperLength['input1D[1]'])
+
+        lowerLengthName = self.formatName(name=lowerLimbName, subname='Length', type='plusMinusAverage')
+        lowerLength = network.createNode('plusMinusAverage', name=lowerLengthName)
+        network.setAttr(lowerLength['operation'], 1)  # Addition
+        network.connectPlugs(switchCtrl['length[1]'], lowerLength['input1D[0]'])
+        network.connectPlugs(switchCtrl[lowerOffsetAttr], lowerLength['input1D[1]'])
+
+        limbLengthName = self.formatName(subname='Length', type='plusMinusAverage')
+        limbLength = network.createNode('plusMinusAverage', name=limbLengthName)
+        network.setAttr(limbLength['operation'], 1)  # Addition
+        network.connectPlugs(upperLength['output1D'], limbLength['input1D[0]'])
+        network.connectPlugs(lowerLength['output1D'], limbLength['input1D[1]'])
+
+        upperWeightName = self.formatName(name=upperLimbName, subname='Weight', type='floatMath')
+        upperWeight = network.createNode('floatMath', name=upperWeightName)
+        network.setAttr(upperWeight['operation'], 3)  # Divide
+        network.connectPlugs(upperLength['output1D'], upperWeight['inFloatA'])
+        network.connectPlugs(limbLength['output1D'], upperWeight['inFloatB'])
+
+        lowerWeightName = self.formatName(name=lowerLimbName, subname='Weight', type='floatMath')
+        lowerWeight = network.createNode('floatMath', name=lowerWeightName)
+        network.setAttr(lowerWeight['operation'], 3)  # Divide
+        network.connectPlugs(lowerLength['output1D'], lowerWeight['inFloatA'])
+        network.connectPlugs(limbLength['output1D'], lowerWeight['inFloatB'])
+
+        # Describe FK offset nodes
+        # The offsets are connected to the positive lengths so the FK space switch can be created against them!
+        #
+        translation, eulerRotation, scale = transformutils.decomposeTransformMatrix(lowerFKMatrix * upperFKMatrix.inverse())
+        lowerFKComposeMatrixName = self.formatName(name=lowerLimbName, kinemat='FK', type='composeMatrix')
+        lowerFKComposeMatrix = network.createNode('composeMatrix', name=lowerFKComposeMatrixName)
+        network.setAttr(lowerFKComposeMatrix['inputTranslate'], translation)
+        network.setAttr(lowerFKComposeMatrix['inputRotate'], eulerRotation, convertUnits=False)
+        network.connectPlugs(upperLength['output1D'], lowerFKComposeMatrix['inputTranslateX'])
+        network.connectPlugs(lowerFKComposeMatrix['outputMatrix'], lowerFKSpace['offsetParentMatrix'])
+
+        translation, eulerRotation, scale = transformutils.decomposeTransformMatrix(limbTipMatrix * lowerLimbMatrix.inverse())
+        extremityFKComposeMatrixName = self.formatName(name=limbTipName, kinemat='FK', type='composeMatrix')
+        extremityFKComposeMatrix = network.createNode('composeMatrix', name=extremityFKComposeMatrixName)
+        network.setAttr(extremityFKComposeMatrix['inputTranslate'], translation)
+        network.setAttr(extremityFKComposeMatrix['inputRotate'], eulerRotation, convertUnits=False)
+        network.connectPlugs(lowerLength['output1D'], extremityFKComposeMatrix['inputTranslateX'])
+        network.connectPlugs(extremityFKComposeMatrix['outputMatrix'], extremityFKTarget['offsetParentMatrix'])
+
+        upperInverseLength, lowerInverseLength = None, None
+        upperLengthOutput, lowerLengthOutput = upperLength['output1D'], lowerLength['output1D']
+
+        if requiresMirroring:
+
+            upperInverseLengthName = self.formatName(name=upperLimbName, subname='InverseLength', type='floatMath')
+            upperInverseLength = network.createNode('floatMath', name=upperInverseLengthName)
+            network.setAttr(upperInverseLength['operation'], 5)  # Negate
+            network.connectPlugs(upperLength['output1D'], upperInverseLength['inFloatA'])
+
+            lowerInverseLengthName = self.formatName(name=lowerLimbName, subname='InverseLength', type='floatMath')
+            lowerInverseLength = network.createNode('floatMath', name=lowerInverseLengthName)
+            network.setAttr(lowerInverseLength['operation'], 5)  # Negate
+            network.connectPlugs(lowerLength['output1D'], lowerInverseLength['inFloatA'])
+
+            upperLengthOutput, lowerLengthOutput = upperInverseLength['outFloat'], lowerInverseLength['outFloat']
+
+        # Describe FK shape resizing nodes
+        # The outputs are connected once the FK shapes have been fitted!
+        #
+        supportsResizing = int(mc.about(version=True)) >= 2025
+        upperHalfLength, upperScaleLength, lowerHalfLength, lowerScaleLength = None, None, None, None
+
+        if supportsResizing:
+
+            upperHalfLengthName = self.formatName(name=upperLimbName, subname='HalfLength', type='floatMath')
+            upperHalfLength = network.createNode('floatMath', name=upperHalfLengthName)
+            network.setAttr(upperHalfLength['operation'], 6)  # Half
+            network.connectPlugs(upperLengthOutput, upperHalfLength['inFloatA'])
+
+            upperScaleLengthName = self.formatName(name=upperLimbName, subname='ScaleLength', type='divDoubleLinear')
+            upperScaleLength = network.createNode('divDoubleLinear', name=upperScaleLengthName)
+            network.connectPlugs(upperLength['output1D'], upperScaleLength['input1'])
+
+            lowerHalfLengthName = self.formatName(name=lowerLimbName, subname='HalfLength', type='floatMath')
+            lowerHalfLength = network.createNode('floatMath', name=lowerHalfLengthName)
+            network.setAttr(lowerHalfLength['operation'], 6)  # Half
+            network.connectPlugs(lowerLengthOutput, lowerHalfLength['inFloatA'])
+
+            lowerScaleLengthName = self.formatName(name=lowerLimbName, subname='ScaleLength', type='divDoubleLinear')
+            lowerScaleLength = network.createNode('divDoubleLinear', name=lowerScaleLengthName)
+            network.connectPlugs(lowerLength['output1D'], lowerScaleLength['input1'])
+
+        else:
+
+            log.debug('Skipping dynamic shape resizing...')
+
+        # Describe IK emulators
+        #
+        limbDecomposeMatrixName = self.formatName(type='decomposeMatrix')
+        limbDecomposeMatrix = network.createNode('decomposeMatrix', name=limbDecomposeMatrixName)
+        network.connectPlugs(limbCtrl[f'worldMatrix[{limbCtrl.instanceNumber()}]'], limbDecomposeMatrix['inputMatrix'])
+
+        upperRestMatrixName = self.formatName(name=upperLimbName, subname='Rest', type='composeMatrix')
+        upperRestMatrix = network.createNode('composeMatrix', name=upperRestMatrixName)
+        network.connectPlugs(limbDecomposeMatrix['outputTranslate'], upperRestMatrix['inputTranslate'])
+        network.setAttr(upperRestMatrix['useEulerRotation'], True)
+        network.setAttr(upperRestMatrix['inputRotate'], upperIKJoint.getAttr('rotate'))
+        network.connectPlugs(limbDecomposeMatrix['outputScale'], upperRestMatrix['inputScale'])
+
+        lowerRestMatrixName = self.formatName(name=lowerLimbName, subname='Rest', type='composeMatrix')
+        lowerRestMatrix = network.createNode('composeMatrix', name=lowerRestMatrixName)
+        network.connectPlugs(upperLength['output1D'], lowerRestMatrix['inputTranslateX'])
+        network.setAttr(lowerRestMatrix['useEulerRotation'], True)
+        network.setAttr(lowerRestMatrix['inputRotateZ'], lowerIKJoint.getAttr('rotateZ'))
+        network.connectPlugs(limbDecomposeMatrix['outputScale'], lowerRestMatrix['inputScale'])
+
+        extremityRestMatrixName = self.formatName(name=limbTipName, subname='Rest', type='composeMatrix')
+        extremityRestMatrix = network.createNode('composeMatrix', name=extremityRestMatrixName)
+        network.connectPlugs(lowerLength['output1D'], extremityRestMatrix['inputTranslateX'])
+        network.connectPlugs(limbDecomposeMatrix['outputScale'], extremityRestMatrix['inputScale'])
+
+        limbIKEmulatorName = self.formatName(type='ikEmulator')
+        limbIKEmulator = network.createNode('ikEmulator', name=limbIKEmulatorName)
+        network.setAttr(limbIKEmulator['forwardAxis'], 0)  # X
+        network.setAttr(limbIKEmulator['forwardAxisFlip'], False)
+        network.setAttr(limbIKEmulator['upAxis'], 1)  # Y
+        network.setAttr(limbIKEmulator['upAxisFlip'], True)
+        network.setAttr(limbIKEmulator['poleType'], 2)  # Matrix
+        network.setAttr(limbIKEmulator['segmentScaleCompensate'], True)
+        network.connectPlugs(upperRestMatrix['outputMatrix'], limbIKEmulator['restMatrix[0]'])
+        network.connectPlugs(lowerRestMatrix['outputMatrix'], limbIKEmulator['restMatrix[1]'])
+        network.connectPlugs(extremityRestMatrix['outputMatrix'], limbIKEmulator['restMatrix[2]'])
+        network.connectPlugs(switchCtrl['stretch'], limbIKEmulator['stretch'])
+        network.connectPlugs(switchCtrl['soften'], limbIKEmulator['soften'])
+        network.connectPlugs(switchCtrl['twist'], limbIKEmulator['twist'])
+        network.connectPlugs(extremityIKCtrl[f'worldMatrix[{extremityIKCtrl.instanceNumber()}]'], limbIKEmulator['goal'])
+        network.connectPlugs(limbPVCtrl[f'worldMatrix[{limbPVCtrl.instanceNumber()}]'], limbIKEmulator['poleMatrix'])
+        network.connectPlugs(limbIKEmulator['softGoal'], ikHandleTarget['translate'])
+
+        limbRIKEmulatorName = self.formatName(subname='Reverse', type='ikEmulator')
+        limbRIKEmulator = network.createNode('ikEmulator', name=limbRIKEmulatorName)
+        network.setAttr(limbRIKEmulator['forwardAxis'], 0)  # X
+        network.setAttr(limbRIKEmulator['forwardAxisFlip'], False)
+        network.setAttr(limbRIKEmulator['upAxis'], 1)  # Y
+        network.setAttr(limbRIKEmulator['upAxisFlip'], True)
+        network.setAttr(limbRIKEmulator['poleType'], 2)  # Matrix
+        network.connectPlugs(upperRestMatrix['outputMatrix'], limbRIKEmulator['restMatrix[0]'])
+        network.connectPlugs(lowerRestMatrix['outputMatrix'], limbRIKEmulator['restMatrix[1]'])
+        network.connectPlugs(extremityRestMatrix['outputMatrix'], limbRIKEmulator['restMatrix[2]'])
+        network.connectPlugs(switchCtrl['pin'], limbRIKEmulator['pin'])
+        network.connectPlugs(switchCtrl['stretch'], limbRIKEmulator['stretch'])
+        network.connectPlugs(switchCtrl['soften'], limbRIKEmulator['soften'])
+        network.connectPlugs(switchCtrl['twist'], limbRIKEmulator['twist'])
+        network.connectPlugs(extremityIKCtrl[f'worldMatrix[{extremityIKCtrl.instanceNumber()}]'], limbRIKEmulator['goal'])
+        network.connectPlugs(limbPVCtrl[f'worldMatrix[{limbPVCtrl.instanceNumber()}]'], limbRIKEmulator['poleMatrix'])
+
+        # Describe emulator outputs for the IK and RIK joints
+        #
+        emulatorJoints = ((limbIKEmulator, 'IK', limbIKJoints), (limbRIKEmulator, 'RIK', limbRIKJoints))
+
+        for (emulator, kinematicType, joints) in emulatorJoints:
+
+            for (i, (jointType, joint)) in enumerate(zip(jointTypes, joints)):
+
+                decomposeMatrixName = self.formatName(name=jointType, subname=kinematicType, type='decomposeMatrix')
+                decomposeMatrix = network.createNode('decomposeMatrix', name=decomposeMatrixName)
+                network.connectPlugs(emulator[f'outMatrix[{i}]'], decomposeMatrix['inputMatrix'])
+                network.connectPlugs(joint['rotateOrder'], decomposeMatrix['inputRotateOrder'])
+                network.connectPlugs(decomposeMatrix['outputTranslate'], joint['translate'])
+                network.connectPlugs(decomposeMatrix['outputRotate'], joint['rotate'])
+                network.connectPlugs(decomposeMatrix['outputScale'], joint['scale'])
+
+        # Describe PV follow system
+        #
+        network.connectPlugs(limbIKEmulator['softDistance'], followTipJoint['translateX'])
+        network.connectPlugs(followJoint['scale'], followTipJoint['scale'])
+
+        followHalfLengthName = self.formatName(subname='HalfFollow', type='floatMath')
+        followHalfLength = network.createNode('floatMath', name=followHalfLengthName)
+        network.setAttr(followHalfLength['operation'], 6)  # Half
+        network.connectPlugs(followTipJoint['translateX'], followHalfLength['inDistanceA'])
+        network.connectPlugs(followHalfLength['outDistance'], followTarget['translateX'])
+
+        forwardVectorMultMatrixName = self.formatName(subname='Forward', type='multiplyVectorByMatrix')
+        forwardVectorMultMatrix = network.createNode('multiplyVectorByMatrix', name=forwardVectorMultMatrixName)
+        network.connectPlugs(limbIKEmulator['softVector'], forwardVectorMultMatrix['input'])
+        network.connectPlugs(waistCtrl[f'worldInverseMatrix[{waistCtrl.instanceNumber()}]'], forwardVectorMultMatrix['matrix'])
+
+        defaultSampleInput = forwardVector * waistCtrl.worldInverseMatrix()
+        defaultSampleOutput = -poleVector * waistCtrl.worldInverseMatrix()
+        followSamples = self.__default_rbf_samples__[componentSide]
+
+        followRBFSolverName = self.formatName(subname='Follow', type='rbfSolver')
+        followRBFSolver = network.createNode('rbfSolver', name=followRBFSolverName)
+        network.setAttr(followRBFSolver['inputType'], 0)  # Euclidean
+        network.setAttr(followRBFSolver['function'], 1)  # Gaussian
+        network.setAttr(followRBFSolver['sample[0]'], {'sampleName': 'Default', 'sampleInputTranslate': defaultSampleInput, 'sampleOutputTranslate': -defaultSampleOutput})
+        network.setAttr(followRBFSolver['sample[1]'], followSamples[0])
+        network.setAttr(followRBFSolver['sample[2]'], followSamples[1])
+        network.setAttr(followRBFSolver['sample[3]'], followSamples[2])
+        network.setAttr(followRBFSolver['sample[4]'], followSamples[3])
+        network.setAttr(followRBFSolver['sample[5]'], followSamples[4])
+        network.setAttr(followRBFSolver['sample[6]'], followSamples[5])
+        network.connectPlugs(forwardVectorMultMatrix['output'], followRBFSolver['inputTranslate'])
+
+        followUpVectorMultMatrixName = self.formatName(subname='Follow', type='multiplyVectorByMatrix')
+        followUpVectorMultMatrix = network.createNode('multiplyVectorByMatrix', name=followUpVectorMultMatrixName)
+        network.connectPlugs(followRBFSolver['outputTranslate'], followUpVectorMultMatrix['input'])
+        network.connectPlugs(waistCtrl[f'worldMatrix[{waistCtrl.instanceNumber()}]'], followUpVectorMultMatrix['matrix'])
+        network.connectPlugs(followUpVectorMultMatrix['output'], followConstraint['worldUpVector'])
+
+        # Describe PV handle curve
+        #
+        limbPVCurveFromPointName = self.formatName(kinemat='PV', subname='Handle', type='curveFromPoint')
+        limbPVCurveFromPoint = network.createNode('curveFromPoint', name=limbPVCurveFromPointName)
+        network.setAttr(limbPVCurveFromPoint['degree'], 1)
+        network.connectPlugs(limbPVShape[f'worldMatrix[{limbPVShape.instanceNumber()}]'], limbPVCurveFromPoint['inputMatrix[0]'])
+        network.connectPlugs(hingeCtrl[f'worldMatrix[{hingeCtrl.instanceNumber()}]'], limbPVCurveFromPoint['inputMatrix[1]'])
+        network.connectPlugs(limbPVShape[f'parentInverseMatrix[{limbPVShape.instanceNumber()}]'], limbPVCurveFromPoint['parentInverseMatrix'])
+        network.connectPlugs(limbPVCurveFromPoint['outputCurve'], limbPVShape['create'])
+
+        # Describe twist nodes
+        #
+        segmentTwistSolvers = [None] * 2
+        segmentScaleRemappers = [None] * 2
+
+        if twistEnabled:
+
+            # Describe upper roll nodes
+            # The roll envelope is connected once the upper twist space has been aligned!
+            #
+            limbRollSolverName = self.formatName(name=upperLimbName, subname='Roll', type='twistSolver')
+            limbRollSolver = network.createNode('twistSolver', name=limbRollSolverName)
+            network.setAttr(limbRollSolver['forwardAxis'], 0)  # X
+            network.setAttr(limbRollSolver['upAxis'], 2)  # Z
+            network.setAttr(limbRollSolver['inverse'], True)
+            network.setAttr(limbRollSolver['startOffsetMatrix'], mirrorMatrix)
+            network.connectPlugs(limbTarget[f'worldMatrix[{limbTarget.instanceNumber()}]'], limbRollSolver['startMatrix'])
+            network.connectPlugs(upperJoint[f'worldMatrix[{upperJoint.instanceNumber()}]'], limbRollSolver['endMatrix'])
+
+            limbRollEnvelopeName = self.formatName(name=upperLimbName, subname='RollEnvelope', type='floatMath')
+            limbRollEnvelope = network.createNode('floatMath', name=limbRollEnvelopeName)
+            network.setAttr(limbRollEnvelope['operation'], 2)  # Multiply
+            network.connectPlugs(limbRollSolver['roll'], limbRollEnvelope['inAngleA'])
+            network.connectPlugs(upperLimbCtrl['inheritsTwist'], limbRollEnvelope['inAngleB'])
+
+            # Describe upper-limb out-handle curve
+            #
+            upperLimbCurveFromPointName = self.formatName(name=upperLimbName, subname='Handle', type='curveFromPoint')
+            upperLimbCurveFromPoint = network.createNode('curveFromPoint', name=upperLimbCurveFromPointName)
+            network.setAttr(upperLimbCurveFromPoint['degree'], 1)
+            network.connectPlugs(upperLimbCtrl[f'worldMatrix[{upperLimbCtrl.instanceNumber()}]'], upperLimbCurveFromPoint['inputMatrix[0]'])
+            network.connectPlugs(upperLimbOutCtrl[f'worldMatrix[{upperLimbOutCtrl.instanceNumber()}]'], upperLimbCurveFromPoint['inputMatrix[1]'])
+            network.connectPlugs(upperLimbCurve[f'parentInverseMatrix[{upperLimbCurve.instanceNumber()}]'], upperLimbCurveFromPoint['parentInverseMatrix'])
+            network.connectPlugs(upperLimbCurveFromPoint['outputCurve'], upperLimbCurve['create'])
+
+            # Describe hinge-in and hinge-out offsets
+            #
+            hingeInNegateName = self.formatName(name=hingeName, subname='In', type='floatMath')
+            hingeInNegate = network.createNode('floatMath', name=hingeInNegateName)
+            network.setAttr(hingeInNegate['operation'], 5)  # Negate
+            network.connectPlugs(hingeCtrl['handleOffset'], hingeInNegate['inDistanceA'])
+
+            hingeInMatrixName = self.formatName(name=hingeName, subname='In', type='composeMatrix')
+            hingeInMatrix = network.createNode('composeMatrix', name=hingeInMatrixName)
+            network.connectPlugs(hingeInNegate['outDistance'], hingeInMatrix['inputTranslateX'])
+            network.connectPlugs(hingeInMatrix['outputMatrix'], hingeInCtrl['offsetParentMatrix'])
+
+            hingeOutMatrixName = self.formatName(name=hingeName, subname='Out', type='composeMatrix')
+            hingeOutMatrix = network.createNode('composeMatrix', name=hingeOutMatrixName)
+            network.connectPlugs(hingeCtrl['handleOffset'], hingeOutMatrix['inputTranslateX'])
+            network.connectPlugs(hingeOutMatrix['outputMatrix'], hingeOutCtrl['offsetParentMatrix'])
+
+            # Describe hinge handle curve
+            #
+            hingeHandleCurveFromPointName = self.formatName(name=hingeName, subname='Handle', type='curveFromPoint')
+            hingeHandleCurveFromPoint = network.createNode('curveFromPoint', name=hingeHandleCurveFromPointName)
+            network.setAttr(hingeHandleCurveFromPoint['degree'], 1)
+            network.connectPlugs(hingeInCtrl[f'worldMatrix[{hingeInCtrl.instanceNumber()}]'], hingeHandleCurveFromPoint['inputMatrix[0]'])
+            network.connectPlugs(hingeCtrl[f'worldMatrix[{hingeCtrl.instanceNumber()}]'], hingeHandleCurveFromPoint['inputMatrix[1]'])
+            network.connectPlugs(hingeOutCtrl[f'worldMatrix[{hingeOutCtrl.instanceNumber()}]'], hingeHandleCurveFromPoint['inputMatrix[2]'])
+            network.connectPlugs(hingeHandleCurve[f'parentInverseMatrix[{hingeHandleCurve.instanceNumber()}]'], hingeHandleCurveFromPoint['parentInverseMatrix'])
+            network.connectPlugs(hingeHandleCurveFromPoint['outputCurve'], hingeHandleCurve['create'])
+
+            # Describe lower-limb in-handle offset
+            # The negated inset is connected once the lower-limb in-handle space has been aligned!
+            #
+            lowerLimbInNegateName = self.formatName(name=limbTipName, subname='In', type='floatMath')
+            lowerLimbInNegate = network.createNode('floatMath', name=lowerLimbInNegateName)
+            network.setAttr(lowerLimbInNegate['operation'], 5)  # Negate
+            network.connectPlugs(hingeCtrl['handleInset'], lowerLimbInNegate['inDistanceA'])
+
+            # Describe lower-limb in-handle curve
+            #
+            lowerLimbCurveFromPointName = self.formatName(name=lowerLimbName, subname='Handle', type='curveFromPoint')
+            lowerLimbCurveFromPoint = network.createNode('curveFromPoint', name=lowerLimbCurveFromPointName)
+            network.setAttr(lowerLimbCurveFromPoint['degree'], 1)
+            network.connectPlugs(extremityJoint[f'worldMatrix[{extremityJoint.instanceNumber()}]'], lowerLimbCurveFromPoint['inputMatrix[0]'])
+            network.connectPlugs(lowerLimbInCtrl[f'worldMatrix[{lowerLimbInCtrl.instanceNumber()}]'], lowerLimbCurveFromPoint['inputMatrix[1]'])
+            network.connectPlugs(lowerLimbCurve[f'parentInverseMatrix[{lowerLimbCurve.instanceNumber()}]'], lowerLimbCurveFromPoint['parentInverseMatrix'])
+            network.connectPlugs(lowerLimbCurveFromPoint['outputCurve'], lowerLimbCurve['create'])
+
+            # Describe twist curves, solvers and scale remappers
+            #
+            segmentCtrls = ((upperLimbCtrl, upperLimbOutCtrl, hingeInCtrl, hingeCtrl), (hingeCtrl, hingeOutCtrl, lowerLimbInCtrl, extremityJoint))
+            segmentScalers = ((upperLimbCtrl, hingeCtrl), (hingeCtrl, extremityIKCtrl))
+
+            for (i, (segmentName, twistSpecs, curveShape, (startCtrl, startOutCtrl, endInCtrl, endCtrl), (startScaler, endScaler))) in enumerate(zip(segmentNames, segmentTwistSpecs, segmentCurves, segmentCtrls, segmentScalers)):
+
+                curveFromPointName = self.formatName(name=segmentName, subname='Twist', type='curveFromPoint')
+                curveFromPoint = network.createNode('curveFromPoint', name=curveFromPointName)
+                network.setAttr(curveFromPoint['degree'], 3)
+                network.connectPlugs(startCtrl[f'worldMatrix[{startCtrl.instanceNumber()}]'], curveFromPoint['inputMatrix[0]'])
+                network.connectPlugs(startOutCtrl[f'worldMatrix[{startOutCtrl.instanceNumber()}]'], curveFromPoint['inputMatrix[1]'])
+                network.connectPlugs(endInCtrl[f'worldMatrix[{endInCtrl.instanceNumber()}]'], curveFromPoint['inputMatrix[2]'])
+                network.connectPlugs(endCtrl[f'worldMatrix[{endCtrl.instanceNumber()}]'], curveFromPoint['inputMatrix[3]'])
+                network.connectPlugs(curveShape[f'parentInverseMatrix[{curveShape.instanceNumber()}]'], curveFromPoint['parentInverseMatrix'])
+                network.connectPlugs(curveFromPoint['outputCurve'], curveShape['create'])
+
+                scaleRemapperName = self.formatName(name=segmentName, subname='Scale', type='remapArray')
+                scaleRemapper = network.createNode('remapArray', name=scaleRemapperName)
+                network.setAttr(scaleRemapper['clamp'], True)
+                network.connectPlugs(startScaler['scale'], scaleRemapper['outputMin'])
+                network.connectPlugs(endScaler['scale'], scaleRemapper['outputMax'])
+
+                twistSolverName = self.formatName(name=segmentName, subname='Twist', type='twistSolver')
+                twistSolver = network.createNode('twistSolver', name=twistSolverName)
+                network.setAttr(twistSolver['forwardAxis'], 0)  # X
+                network.setAttr(twistSolver['upAxis'], 2)  # Z
+                network.setAttr(twistSolver['segments'], self.numTwistLinks)
+                network.connectPlugs(startCtrl[f'worldMatrix[{startCtrl.instanceNumber()}]'], twistSolver['startMatrix'])
+                network.connectPlugs(endCtrl[f'worldMatrix[{endCtrl.instanceNumber()}]'], twistSolver['endMatrix'])
+
+                numTwistSpecs = len(twistSpecs)
+
+                for j in range(numTwistSpecs):
+
+                    parameter = float(j) * (1.0 / (float(numTwistSpecs) - 1.0))
+                    network.setAttr(scaleRemapper[f'parameter[{j}]'], parameter)
+
+                segmentScaleRemappers[i] = scaleRemapper
+                segmentTwistSolvers[i] = twistSolver
+
+        # Commit utility network
+        #
+        nodes = self.commitNetwork(network)
+
+        upperLength, lowerLength = nodes[upperLength.index], nodes[lowerLength.index]
+        upperWeight, lowerWeight = nodes[upperWeight.index], nodes[lowerWeight.index]
+        lowerFKComposeMatrix, extremityFKComposeMatrix = nodes[lowerFKComposeMatrix.index], nodes[extremityFKComposeMatrix.index]
+        limbIKEmulator, limbRIKEmulator = nodes[limbIKEmulator.index], nodes[limbRIKEmulator.index]
+
+        # Create FK space switches
+        # Mirrored limbs are switched over to the inverse lengths afterwards!
+        #
+        upperFKSpaceSwitch = upperFKSpace.addSpaceSwitch([limbCtrl, motionCtrl], maintainOffset=True)
+        upperFKSpaceSwitch.weighted = True
+        upperFKSpaceSwitch.setAttr('target', [{'targetWeight': (1.0, 1.0, 1.0), 'targetReverse': (False, True, False)}, {'targetWeight': (0.0, 0.0, 0.0)}])
+        upperFKSpaceSwitch.connectPlugs(upperFKCtrl['localOrGlobal'], 'target[0].targetRotateWeight')
+        upperFKSpaceSwitch.connectPlugs(upperFKCtrl['localOrGlobal'], 'target[1].targetRotateWeight')
+
+        lowerFKSpaceSwitch = lowerFKSpace.addSpaceSwitch([upperFKCtrl, motionCtrl], maintainOffset=True, skipRotateX=True, skipRotateY=True)
+        lowerFKSpaceSwitch.weighted = True
+        lowerFKSpaceSwitch.setAttr('target', [{'targetWeight': (1.0, 1.0, 1.0), 'targetReverse': (True, True, True)}, {'targetWeight': (0.0, 0.0, 0.0)}])
+        lowerFKSpaceSwitch.connectPlugs(lowerFKCtrl['localOrGlobal'], 'target[0].targetRotateWeight')
+        lowerFKSpaceSwitch.connectPlugs(lowerFKCtrl['localOrGlobal'], 'target[1].targetRotateWeight')
+        lowerFKSpaceSwitch.connectPlugs(upperLength['output1D'], 'target[0].targetOffsetTranslateX')
+
+        if requiresMirroring:
+
+            upperInverseLength, lowerInverseLength = nodes[upperInverseLength.index], nodes[lowerInverseLength.index]
+            upperInverseLength.connectPlugs('outFloat', lowerFKComposeMatrix['inputTranslateX'], force=True)
+            upperInverseLength.connectPlugs('outFloat', lowerFKSpaceSwitch['target[0].targetOffsetTranslateX'], force=True)
+            lowerInverseLength.connectPlugs('outFloat', extremityFKComposeMatrix['inputTranslateX'], force=True)
+
+        upperFKJoint.addConstraint('transformConstraint', [upperFKCtrl], maintainOffset=requiresMirroring)
+        lowerFKJoint.addConstraint('transformConstraint', [lowerFKCtrl], maintainOffset=requiresMirroring)
+        extremityFKJoint.addConstraint('transformConstraint', [extremityFKTarget], maintainOffset=requiresMirroring)
+
+        # Add FK control shapes
+        #
+        upperFKShape = upperFKCtrl.addPointHelper('cylinder', size=(15.0 * rigScale), lineWidth=2.0, colorRGB=lightColorRGB)
+        upperFKShape.reorientAndScaleToFit(lowerFKCtrl)
+
+        lowerFKShape = lowerFKCtrl.addPointHelper('cylinder', size=(15.0 * rigScale), lineWidth=2.0, colorRGB=lightColorRGB)
+        lowerFKShape.reorientAndScaleToFit(extremityFKTarget)
+
+        if supportsResizing:
+
+            upperHalfLength, upperScaleLength = nodes[upperHalfLength.index], nodes[upperScaleLength.index]
+            upperHalfLength.connectPlugs('outFloat', upperFKShape['localPositionX'])
+            upperScaleLength.connectPlugs(upperFKShape['size'], 'input2')
+            upperScaleLength.connectPlugs('output', upperFKShape['localScaleX'])
+
+            lowerHalfLength, lowerScaleLength = nodes[lowerHalfLength.index], nodes[lowerScaleLength.index]
+            lowerHalfLength.connectPlugs('outFloat', lowerFKShape['localPositionX'])
+            lowerScaleLength.connectPlugs(lowerFKShape['size'], 'input2')
+            lowerScaleLength.connectPlugs('output', lowerFKShape['localScaleX'])
+
+        # Create IK extremity space switch
+        #
+        extremityIKSpaceSwitch = extremityIKSpace.addSpaceSwitch([motionCtrl, cogCtrl, waistCtrl, spineCtrl, limbCtrl], maintainOffset=True)
+        extremityIKSpaceSwitch.weighted = True
+        extremityIKSpaceSwitch.setAttr('target', [{'targetWeight': (0.0, 0.0, 0.0)}, {'targetWeight': (0.0, 0.0, 0.0)}, {'targetWeight': (0.0, 0.0, 0.0)}, {'targetWeight': (0.0, 0.0, 0.0)}, {'targetWeight': (0.0, 0.0, 1.0)}])
+        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['positionSpaceW0'], 'target[0].targetTranslateWeight')
+        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['positionSpaceW1'], 'target[1].targetTranslateWeight')
+        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['positionSpaceW2'], 'target[2].targetTranslateWeight')
+        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['positionSpaceW3'], 'target[3].targetTranslateWeight')
+        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['positionSpaceW4'], 'target[4].targetTranslateWeight')
+        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['rotationSpaceW0'], 'target[0].targetRotateWeight')
+        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['rotationSpaceW1'], 'target[1].targetRotateWeight')
+        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['rotationSpaceW2'], 'target[2].targetRotateWeight')
+        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['rotationSpaceW3'], 'target[3].targetRotateWeight')
+        extremityIKSpaceSwitch.connectPlugs(extremityIKCtrl['rotationSpaceW4'], 'target[4].targetRotateWeight')
+
+        extremityIKCtrl.userProperties['space'] = extremityIKSpace.uuid()
+        extremityIKCtrl.userProperties['spaceSwitch'] = extremityIKSpaceSwitch.uuid()
+        extremityIKCtrl.userProperties['offset'] = extremityIKOffsetCtrl.uuid()
+
+        # Create PV space switch
+        #
+        limbPVSpaceSwitch = limbPVSpace.addSpaceSwitch([motionCtrl, cogCtrl, waistCtrl, spineCtrl, limbCtrl, followTarget, extremityIKCtrl], weighted=True, maintainOffset=True)
+        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW0'], 'target[0].targetWeight')
+        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW1'], 'target[1].targetWeight')
+        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW2'], 'target[2].targetWeight')
+        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW3'], 'target[3].targetWeight')
+        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW4'], 'target[4].targetWeight')
+        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW5'], 'target[5].targetWeight')
+        limbPVSpaceSwitch.connectPlugs(limbPVCtrl['transformSpaceW6'], 'target[6].targetWeight')
+
+        limbPVCtrl.userProperties['space'] = limbPVSpace.uuid()
+        limbPVCtrl.userProperties['spaceSwitch'] = limbPVSpaceSwitch.uuid()
+
+        # Align hinge space
+        #
+        targets = hingeStraightConstraint.targets()
+        hingeStraightConstraint.connectPlugs(upperWeight['outFloat'], targets[1].driver())  # These are flipped for a reason!
+        hingeStraightConstraint.connectPlugs(lowerWeight['outFloat'], targets[0].driver())  # These are flipped for a reason!
+
+        hingeSpace.copyTransform(hingeBendTarget)
+        hingeSpace.freezeTransform()
+
+        hingeSpaceSwitch = hingeSpace.addSpaceSwitch([hingeBendTarget, hingeStraightTarget])
+        hingeSpaceSwitch.weighted = True
+        hingeSpaceSwitch.setAttr('target', [{'targetWeight': (0.0, 0.0, 0.0), 'targetReverse': (True, True, True)}, {'targetWeight': (0.0, 0.0, 0.0)}])
+        hingeSpaceSwitch.connectPlugs(hingeCtrl['straighten'], 'target[0].targetWeight')
+        hingeSpaceSwitch.connectPlugs(hingeCtrl['straighten'], 'target[1].targetWeight')
+
+        hingeCtrl.userProperties['space'] = hingeSpace.uuid()
+        hingeCtrl.userProperties['spaceSwitch'] = hingeSpaceSwitch.uuid()
+
+        # Check if hinge was enabled
+        # If so, update bind pose on export joint!
+        #
+        hingeEnabled = bool(hingeSpec.enabled)
+
+        if hingeEnabled:
+
+            hingeExportJoint = hingeSpec.getNode()
+            hingeExportJoint.copyTransform(hingeCtrl, skipScale=True)
+
+            hingeSpec.cacheNode(delete=False)
+
+        # Cache kinematic components
+        #
+        self.userProperties['switchControl'] = switchCtrl.uuid()
+
+        self.userProperties['fkJoints'] = (upperFKJoint.uuid(), lowerFKJoint.uuid(), extremityFKJoint.uuid())
+        self.userProperties['fkControls'] = (upperFKCtrl.uuid(), lowerFKCtrl.uuid(), extremityFKTarget.uuid())
+
+        self.userProperties['rikJoints'] = (upperRIKJoint.uuid(), lowerRIKJoint.uuid(), extremityRIKJoint.uuid())
+        self.userProperties['rikEmulator'] = limbRIKEmulator.uuid()
+        self.userProperties['ikJoints'] = (upperIKJoint.uuid(), lowerIKJoint.uuid(), extremityIKJoint.uuid())
+        self.userProperties['ikEmulator'] = limbIKEmulator.uuid()
+        self.userProperties['ikControls'] = (limbCtrl.uuid(), extremityIKCtrl.uuid())
+        self.userProperties['ikTarget'] = ikHandleTarget.uuid()
+        self.userProperties['pvControl'] = limbPVCtrl.uuid()
+        self.userProperties['hingeControls'] = (hingeCtrl.uuid(),)
+
+        self.userProperties['blendJoints'] = (upperBlendJoint.uuid(), lowerBlendJoint.uuid(), extremityBlendJoint.uuid())
+        self.userProperties['targetJoints'] = (upperJoint.uuid(), lowerJoint.uuid(), extremityJoint.uuid())
+
+        # Check if twist is enabled
+        #
+        if twistEnabled:
+
+            # Align upper twist controller
+            #
+            upperLimbSpace.copyTransform(upperJoint)
+            upperLimbSpace.freezeTransform()
+
+            limbRollSolver, limbRollEnvelope = nodes[limbRollSolver.index], nodes[limbRollEnvelope.index]
+
+            limbRollConstraint = upperLimbSpace.addConstraint('transformConstraint', [upperJoint])
+            limbRollConstraint.connectPlugs(limbRollEnvelope['outAngle'], 'target[0].targetOffsetRotateX')
+
+            self.userProperties['rollSolver'] = limbRollSolver.uuid()
+
+            upperLimbCurveFromPoint = nodes[upperLimbCurveFromPoint.index]
+            upperLimbOutCtrl.userProperties['curve'] = upperLimbCurve.uuid()
+            upperLimbOutCtrl.userProperties['curveFromPoint'] = upperLimbCurveFromPoint.uuid()
+
+            hingeHandleCurveFromPoint = nodes[hingeHandleCurveFromPoint.index]
+            hingeCtrl.userProperties['curve'] = hingeHandleCurve.uuid()
+            hingeCtrl.userProperties['curveFromPoint'] = hingeHandleCurveFromPoint.uuid()
+
+            # Align lower-limb in-handle control
+            #
+            lowerLimbInSpace.copyTransform(extremityJoint)
+            lowerLimbInSpace.freezeTransform()
+
+            lowerLimbInNegate = nodes[lowerLimbInNegate.index]
+
+            lowerLimbInSpaceSwitch = lowerLimbInSpace.addSpaceSwitch([extremityJoint], maintainOffset=False)
+            lowerLimbInSpaceSwitch.weighted = True
+            lowerLimbInSpaceSwitch.setAttr('target[0]', {'targetWeight': (1.0, 0.0, 1.0), 'targetReverse': (True, True, True)})
+            lowerLimbInSpaceSwitch.connectPlugs(lowerLimbInCtrl['localOrGlobal'], 'target[0].targetWeight')
+            lowerLimbInSpaceSwitch.connectPlugs(lowerLimbInNegate['outDistance'], 'target[0].targetOffsetTranslateX')
+
+            lowerLimbInCtrl.userProperties['negate'] = lowerLimbInNegate.uuid()
+            lowerLimbInCtrl.userProperties['space'] = lowerLimbInSpace.uuid()
+            lowerLimbInCtrl.userProperties['spaceSwitch'] = lowerLimbInSpaceSwitch.uuid()
+
+            lowerLimbCurveFromPoint = nodes[lowerLimbCurveFromPoint.index]
+            lowerLimbCurve.userProperties['curve'] = lowerLimbCurve.uuid()
+            lowerLimbCurve.userProperties['curveFromPoint'] = lowerLimbCurveFromPoint.uuid()
+
+            # Constrain twist controls to curves
+            #
+            twistSolvers = [None] * 2
+            scaleRemappers = [None] * 2
+
+            for (i, (segmentName, twistSpecs, curveShape, twistCtrls, startCtrl)) in enumerate(zip(segmentNames, segmentTwistSpecs, segmentCurves, segmentTwistCtrls, (upperLimbCtrl, hingeCtrl))):
+
+                twistSolver = nodes[segmentTwistSolvers[i].index]
+                scaleRemapper = nodes[segmentScaleRemappers[i].index]
+
+                twistSolvers[i] = twistSolver.uuid()
+                scaleRemappers[i] = scaleRemapper.uuid()
+
+                numTwistSpecs = len(twistSpecs)
+
+                for (j, (twistSpec, (twistSpace, twistCtrl))) in enumerate(zip(twistSpecs, twistCtrls)):
+
                     # Add point-on-curve constraint
                     #
                     parameter = float(j) * (1.0 / (float(numTwistSpecs) - 1.0))
@@ -1281,8 +1341,6 @@ class TwoBoneLimbComponent(limbcomponent.LimbComponent):
                     # Connect scale remapper
                     #
                     scaleConstraint = twistSpace.addConstraint('scaleConstraint', [limbCtrl])
-
-                    scaleRemapper.setAttr(f'parameter[{j}]', parameter)
                     scaleRemapper.connectPlugs(f'outValue[{j}]', scaleConstraint['offset'])
 
                     # Finally, re-align export joint to control
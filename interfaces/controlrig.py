@@ -6,7 +6,7 @@ from dcc.naming import namingutils
 from dcc.python import stringutils
 from collections import deque
 from ..abstract import abstractinterface, abstractcomponent
-from ..libs import Status, skeletonmanager, setuputils
+from ..libs import Status, skeletonmanager, setuputils, transformtable, driverspec
 
 import logging
 logging.basicConfig()
@@ -21,10 +21,26 @@ class ControlRig(abstractinterface.AbstractInterface):
 
     # region Enums
     Status = Status
+    DriverPolicy = driverspec.DriverPolicy
     # endregion
 
     # region Dunderscores
     __version__ = 1.0
+
+    def __init__(self, *args, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(ControlRig, self).__init__(*args, **kwargs)
+
+        # Declare private variables
+        #
+        self._skeletonManager = None
     # endregion
 
     # region Attributes
@@ -44,6 +60,7 @@ class ControlRig(abstractinterface.AbstractInterface):
     meshesGroup = mpyattribute.MPyAttribute('meshesGroup', attributeType='message')
     skeletonReference = mpyattribute.MPyAttribute('skeletonReference', attributeType='message')
     skinReference = mpyattribute.MPyAttribute('skinReference', attributeType='message', array=True)
+    driverPolicy = mpyattribute.MPyAttribute('driverPolicy', attributeType='enum', fields=driverspec.DriverPolicy, default=driverspec.DriverPolicy.DEFAULT)
 
     @rigName.changed
     def rigName(self, rigName):
@@ -155,6 +172,7 @@ class ControlRig(abstractinterface.AbstractInterface):
     def getRigBounds(self):
         """
         Returns the bounding box for this rig.
+        If no bounds have been cached then the mesh bounds are expanded by the skeleton bounds from the transform table!
 
         :rtype: om.MBoundingBox
         """
@@ -166,6 +184,8 @@ class ControlRig(abstractinterface.AbstractInterface):
         if difference.isEquivalent(om.MVector.kZeroVector, tolerance=1e-3):
 
             rigBoundingBox = setuputils.getBoundingBoxByTypeName(typeName='mesh')
+            rigBoundingBox.expand(self.getSkeletonBounds())
+
             self.rigBoundingBoxMin = rigBoundingBox.min
             self.rigBoundingBoxMax = rigBoundingBox.max
 
@@ -175,6 +195,48 @@ class ControlRig(abstractinterface.AbstractInterface):
 
             return om.MBoundingBox(rigBoundingBoxMin, rigBoundingBoxMax)
 
+    def getTransformTable(self):
+        """
+        Returns a transform table containing the skeleton specs from every component.
+        Passthrough specs are omitted since they have no export joint, if numpy is unavailable then none is returned!
+
+        :rtype: Union[transformtable.TransformTable, None]
+        """
+
+        # Check if numpy is available
+        #
+        if not transformtable.isAvailable():
+
+            log.warning('Transform tables require numpy!')
+            return None
+
+        # Collect skeleton specs in pre-order
+        #
+        skeletonSpecs = []
+
+        for component in self.walkComponents():
+
+            skeletonSpecs.extend(component.skeleton(flatten=True, skipDisabled=False, skipPassthrough=True))
+
+        return transformtable.TransformTable.fromSpecs(skeletonSpecs)
+
+    def getSkeletonBounds(self):
+        """
+        Returns the bounding box for the skeleton specs.
+        Unlike `getRigBounds`, this does not require any meshes to exist!
+
+        :rtype: om.MBoundingBox
+        """
+
+        table = self.getTransformTable()
+
+        if table is None or len(table) == 0:
+
+            return om.MBoundingBox()
+
+        minimum, maximum = table.bounds()
+        return om.MBoundingBox(om.MPoint(minimum.tolist()), om.MPoint(maximum.tolist()))
+
     def getRigWidthAndHeight(self):
         """
         Returns the width and height for this rig.
@@ -223,7 +285,18 @@ class ControlRig(abstractinterface.AbstractInterface):
         :rtype: skeletonmanager.SkeletonManager
         """
 
-        return skeletonmanager.SkeletonManager(self, referenceNode=self.getSkeletonReference())
+        # Check if cached manager is still valid
+        # The manager persists between calls so that any transactions or caches can be shared between components!
+        #
+        referenceNode = self.getSkeletonReference()
+        manager = self._skeletonManager
+
+        if manager is None or manager.referenceNode != referenceNode:
+
+            manager = skeletonmanager.SkeletonManager(self, referenceNode=referenceNode)
+            self._skeletonManager = manager
+
+        return manager
 
     def hasReferencedSkeleton(self):
         """
@@ -0,0 +1,400 @@
+import os
+import json
+import time
+
+from maya.api import OpenMaya as om
+from dcc.maya.standalone import rpc
+from collections import defaultdict
+from contextlib import contextmanager
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class RPCCounter(object):
+    """
+    Base class used to count any calls made to the standalone client.
+    Batched calls are counted as a single round trip!
+    """
+
+    # region Dunderscores
+    __slots__ = ('_client', '_callback')
+
+    def __init__(self, client, callback):
+        """
+        Private method called after a new instance is created.
+
+        :type client: rpc.RPCClient
+        :type callback: Callable
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(RPCCounter, self).__init__()
+
+        # Declare private variables
+        #
+        self._client = client
+        self._callback = callback
+
+    def __getattr__(self, item):
+        """
+        Private method that returns a counting wrapper for the requested client attribute.
+
+        :type item: str
+        :rtype: Any
+        """
+
+        attribute = getattr(self._client, item)
+
+        if not callable(attribute):
+
+            return attribute
+
+        def wrapper(*args, **kwargs):
+
+            self._callback(item)
+            return attribute(*args, **kwargs)
+
+        return wrapper
+    # endregion
+
+    # region Properties
+    @property
+    def client(self):
+        """
+        Getter method that returns the wrapped client.
+
+        :rtype: rpc.RPCClient
+        """
+
+        return self._client
+    # endregion
+
+
+class BuildProfiler(object):
+    """
+    Base class used to profile each component phase during a state change.
+    Each phase records its duration, the number of nodes it created and the number of RPC calls it made.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_entries', '_stack', '_startTime', '_callbackId', '_client')
+
+    def __init__(self):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(BuildProfiler, self).__init__()
+
+        # Declare private variables
+        #
+        self._entries = []
+        self._stack = []
+        self._startTime = time.perf_counter()
+        self._callbackId = None
+        self._client = None
+
+    def __enter__(self):
+        """
+        Private method called upon entering a `with` statement.
+
+        :rtype: BuildProfiler
+        """
+
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method called upon exiting a `with` statement.
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        self.stop()
+    # endregion
+
+    # region Properties
+    @property
+    def entries(self):
+        """
+        Getter method that returns the recorded entries.
+        Each entry consists of the owner type, owner name, phase, start time, duration, node count and RPC count.
+
+        :rtype: List[Dict[str, Any]]
+        """
+
+        return self._entries
+
+    @property
+    def isActive(self):
+        """
+        Getter method that evaluates if this profiler is currently listening.
+
+        :rtype: bool
+        """
+
+        return self._callbackId is not None
+    # endregion
+
+    # region Callbacks
+    def nodeAdded(self, dependNode, clientData=None):
+        """
+        Callback method that counts any nodes created by the active phases.
+
+        :type dependNode: om.MObject
+        :type clientData: object
+        :rtype: None
+        """
+
+        for frame in self._stack:
+
+            frame['nodes'] += 1
+
+    def rpcCalled(self, name):
+        """
+        Callback method that counts any RPC calls made by the active phases.
+
+        :type name: str
+        :rtype: None
+        """
+
+        for frame in self._stack:
+
+            frame['rpc'] += 1
+    # endregion
+
+    # region Methods
+    def start(self):
+        """
+        Starts listening for node and RPC activity.
+
+        :rtype: None
+        """
+
+        # Check for redundancy
+        #
+        if self.isActive:
+
+            return
+
+        # Register node added callback
+        #
+        self._startTime = time.perf_counter()
+        self._callbackId = om.MDGMessage.addNodeAddedCallback(self.nodeAdded, 'dependNode')
+
+        # Wrap standalone client
+        #
+        client = getattr(rpc, '__client__', None)
+
+        if client is not None and not isinstance(client, RPCCounter):
+
+            self._client = client
+            rpc.__client__ = RPCCounter(client, self.rpcCalled)
+
+    def stop(self):
+        """
+        Stops listening for node and RPC activity.
+
+        :rtype: None
+        """
+
+        # Remove node added callback
+        #
+        if self._callbackId is not None:
+
+            try:
+
+                om.MDGMessage.removeCallback(self._callbackId)
+
+            except RuntimeError as exception:
+
+                log.debug(exception)
+
+            finally:
+
+                self._callbackId = None
+
+        # Restore standalone client
+        #
+        if self._client is not None:
+
+            rpc.__client__ = self._client
+            self._client = None
+
+    @contextmanager
+    def measure(self, owner, phase):
+        """
+        Returns a context manager that records the duration of the supplied phase.
+
+        :type owner: Any
+        :type phase: str
+        :rtype: Iterator[Dict[str, Any]]
+        """
+
+        # Push new frame onto stack
+        #
+        frame = {
+            'type': type(owner).__name__,
+            'name': owner.name() if hasattr(owner, 'name') else str(owner),
+            'phase': phase,
+            'start': time.perf_counter() - self._startTime,
+            'duration': 0.0,
+            'nodes': 0,
+            'rpc': 0,
+            'depth': len(self._stack)
+        }
+
+        self._stack.append(frame)
+
+        try:
+
+            yield frame
+
+        finally:
+
+            frame['duration'] = (time.perf_counter() - self._startTime) - frame['start']
+
+            self._stack.pop()
+            self._entries.append(frame)
+
+    def profile(self, owner, phase, *args, **kwargs):
+        """
+        Calls the supplied phase on the owner and records its duration.
+
+        :type owner: Any
+        :type phase: str
+        :rtype: Any
+        """
+
+        with self.measure(owner, phase):
+
+            return getattr(owner, phase)(*args, **kwargs)
+
+    def summarize(self):
+        """
+        Returns the recorded entries grouped by owner type and phase.
+        Only top-level entries are summarized to prevent durations from being counted twice!
+
+        :rtype: List[Dict[str, Any]]
+        """
+
+        # Group top-level entries
+        #
+        groups = defaultdict(lambda: {'calls': 0, 'duration': 0.0, 'nodes': 0, 'rpc': 0})
+
+        for entry in self._entries:
+
+            if entry['depth'] > 0:
+
+                continue
+
+            group = groups[(entry['type'], entry['phase'])]
+            group['calls'] += 1
+            group['duration'] += entry['duration']
+            group['nodes'] += entry['nodes']
+            group['rpc'] += entry['rpc']
+
+        # Sort groups by total duration
+        #
+        summary = [dict(type=typeName, phase=phase, **group) for ((typeName, phase), group) in groups.items()]
+        summary.sort(key=lambda group: group['duration'], reverse=True)
+
+        return summary
+
+    def report(self, limit=20):
+        """
+        Returns a text report sorted by total duration.
+        The report consists of a summary by component type and phase followed by the slowest individual phases.
+
+        :type limit: int
+        :rtype: str
+        """
+
+        # Compose summary
+        #
+        summary = self.summarize()
+        total = sum([group['duration'] for group in summary])
+
+        lines = [
+            f'Total: {total:.3f}s',
+            '',
+            f'{"Type":<28}{"Phase":<24}{"Calls":>7}{"Seconds":>11}{"%":>7}{"Nodes":>9}{"RPC":>8}'
+        ]
+
+        for group in summary:
+
+            percentage = (group['duration'] / total * 100.0) if total > 0.0 else 0.0
+            lines.append(f'{group["type"]:<28}{group["phase"]:<24}{group["calls"]:>7}{group["duration"]:>11.3f}{percentage:>7.1f}{group["nodes"]:>9}{group["rpc"]:>8}')
+
+        # Compose slowest entries
+        #
+        entries = sorted([entry for entry in self._entries if entry['depth'] == 0], key=lambda entry: entry['duration'], reverse=True)[:limit]
+
+        lines.extend(['', f'{"Name":<40}{"Phase":<24}{"Seconds":>11}{"Nodes":>9}{"RPC":>8}'])
+
+        for entry in entries:
+
+            lines.append(f'{entry["name"]:<40}{entry["phase"]:<24}{entry["duration"]:>11.3f}{entry["nodes"]:>9}{entry["rpc"]:>8}')
+
+        return '\n'.join(lines)
+
+    def trace(self):
+        """
+        Returns the recorded entries in the Chrome trace event format.
+
+        :rtype: Dict[str, Any]
+        """
+
+        events = []
+
+        for entry in sorted(self._entries, key=lambda entry: entry['start']):
+
+            events.append(
+                {
+                    'name': entry['phase'],
+                    'cat': entry['type'],
+                    'ph': 'X',
+                    'ts': int(entry['start'] * 1e6),
+                    'dur': int(entry['duration'] * 1e6),
+                    'pid': 1,
+                    'tid': 1,
+                    'args': {'name': entry['name'], 'nodes': entry['nodes'], 'rpc': entry['rpc']}
+                }
+            )
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def saveTrace(self, filePath):
+        """
+        Saves the recorded entries to the supplied path in the Chrome trace event format.
+        These files can be opened from `chrome://tracing` or https://ui.perfetto.dev!
+
+        :type filePath: str
+        :rtype: None
+        """
+
+        directory = os.path.dirname(filePath)
+
+        if directory and not os.path.isdir(directory):
+
+            os.makedirs(directory)
+
+        with open(filePath, 'w') as jsonFile:
+
+            json.dump(self.trace(), jsonFile, indent=4)
+
+        log.info(f'Saving build trace to: {filePath}')
+    # endregion
@@ -0,0 +1,198 @@
+from contextlib import contextmanager
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+__session__ = None
+
+
+class BuildSession(object):
+    """
+    Base class used to memoize reorganized spec lists for the duration of a state change.
+    Entries are keyed by component hash code, spec key and the options used to reorganize the specs.
+    Each entry also stores the spec list it was derived from so any pulled user properties are never served stale!
+    """
+
+    # region Dunderscores
+    __slots__ = ('_entries', '_hits', '_misses')
+
+    def __init__(self):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(BuildSession, self).__init__()
+
+        # Declare private variables
+        #
+        self._entries = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        """
+        Private method that returns the number of components with memoized specs.
+
+        :rtype: int
+        """
+
+        return len(self._entries)
+    # endregion
+
+    # region Properties
+    @property
+    def hits(self):
+        """
+        Getter method that returns the number of lookups that were answered from memory.
+
+        :rtype: int
+        """
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Getter method that returns the number of lookups that required reorganizing the specs.
+
+        :rtype: int
+        """
+
+        return self._misses
+    # endregion
+
+    # region Methods
+    def get(self, component, key, specs, options):
+        """
+        Returns the memoized specs for the supplied component.
+        If no specs have been memoized, or they were derived from a different spec list, then none is returned!
+
+        :type component: rigotron.components.basecomponent.BaseComponent
+        :type key: str
+        :type specs: List[rigotron.abstract.abstractspec.AbstractSpec]
+        :type options: Tuple[Any, ...]
+        :rtype: Union[List[rigotron.abstract.abstractspec.AbstractSpec], None]
+        """
+
+        entries = self._entries.get(component.hashCode(), {})
+        source, derived = entries.get((key, options), (None, None))
+
+        if source is specs:
+
+            self._hits += 1
+            return derived
+
+        else:
+
+            self._misses += 1
+            return None
+
+    def set(self, component, key, specs, options, derived):
+        """
+        Memoizes the reorganized specs for the supplied component.
+
+        :type component: rigotron.components.basecomponent.BaseComponent
+        :type key: str
+        :type specs: List[rigotron.abstract.abstractspec.AbstractSpec]
+        :type options: Tuple[Any, ...]
+        :type derived: List[rigotron.abstract.abstractspec.AbstractSpec]
+        :rtype: None
+        """
+
+        self._entries.setdefault(component.hashCode(), {})[(key, options)] = (specs, derived)
+
+    def invalidate(self, component, key=None):
+        """
+        Removes any memoized specs for the supplied component.
+        If no key is supplied then all memoized specs are removed!
+
+        :type component: rigotron.components.basecomponent.BaseComponent
+        :type key: Union[str, None]
+        :rtype: None
+        """
+
+        hashCode = component.hashCode()
+
+        if key is None:
+
+            self._entries.pop(hashCode, None)
+            return
+
+        entries = self._entries.get(hashCode, {})
+
+        for entryKey in [entryKey for entryKey in entries.keys() if entryKey[0] == key]:
+
+            del entries[entryKey]
+
+    def clear(self):
+        """
+        Removes all memoized specs.
+
+        :rtype: None
+        """
+
+        self._entries.clear()
+    # endregion
+
+
+def getSession():
+    """
+    Returns the active build session.
+
+    :rtype: Union[BuildSession, None]
+    """
+
+    return __session__
+
+
+def invalidate(component, key=None):
+    """
+    Removes any memoized specs for the supplied component from the active build session.
+
+    :type component: Union[rigotron.components.basecomponent.BaseComponent, None]
+    :type key: Union[str, None]
+    :rtype: None
+    """
+
+    if __session__ is not None and component is not None:
+
+        __session__.invalidate(component, key=key)
+
+
+@contextmanager
+def session():
+    """
+    Returns a context manager that memoizes reorganized spec lists until the outermost scope exits.
+    Nested scopes share the outermost session!
+
+    :rtype: Iterator[BuildSession]
+    """
+
+    global __session__
+
+    # Check if a session is already active
+    #
+    if __session__ is not None:
+
+        yield __session__
+        return
+
+    # Open new session
+    #
+    __session__ = BuildSession()
+
+    try:
+
+        yield __session__
+
+    finally:
+
+        log.debug(f'Build session answered {__session__.hits} of {__session__.hits + __session__.misses} spec lookup(s) from memory.')
+        __session__ = None
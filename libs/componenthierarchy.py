@@ -0,0 +1,856 @@
+import re
+import weakref
+
+from maya.api import OpenMaya as om
+from collections import deque
+from mpy import mpyscene
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def onSceneOpening(*args, **kwargs):
+    """
+    Callback method that invalidates the shared component hierarchy before a scene is replaced.
+
+    :rtype: None
+    """
+
+    instance = ComponentHierarchy.__instance__
+
+    if instance is not None:
+
+        instance.invalidate()
+
+
+def onSceneChanged(*args, **kwargs):
+    """
+    Callback method that invalidates the shared component hierarchy after nodes are imported or references are changed.
+
+    :rtype: None
+    """
+
+    instance = ComponentHierarchy.__instance__
+
+    if instance is not None:
+
+        instance.invalidate()
+
+
+class ComponentHierarchy(object):
+    """
+    Base class used to index component parent/child relationships.
+    Each rig is indexed in a single pass from its root component, keyed by component hash code.
+    Components are also indexed by the names of their base classes so type lookups only require dictionary hits.
+    Any connection changes to `componentChildren`, including those from undo and redo, only invalidate the children of that component.
+    The entire index is invalidated whenever a scene is created, opened or imported, any references change, or an indexed component is found to be deleted.
+    """
+
+    # region Dunderscores
+    __slots__ = ('__scene__', '_components', '_parents', '_children', '_order', '_types', '_matches', '_callbacks', '_changedCallbacks', '_callbackIds', '_nodeCallbackIds', '_dirty', '_generation')
+
+    __instance__ = None
+    __child_pattern__ = re.compile(r'^componentChildren\[[0-9]+]$')
+
+    def __init__(self):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(ComponentHierarchy, self).__init__()
+
+        # Declare private variables
+        #
+        self.__scene__ = mpyscene.MPyScene.getInstance(asWeakReference=True)
+        self._components = {}
+        self._parents = {}
+        self._children = {}
+        self._order = {}
+        self._types = {}
+        self._matches = {}
+        self._callbacks = []
+        self._changedCallbacks = []
+        self._callbackIds = []
+        self._nodeCallbackIds = {}
+        self._dirty = set()
+        self._generation = 0
+
+        # Add scene callbacks
+        #
+        self.addSceneCallbacks()
+
+    def __del__(self):
+        """
+        Private method called before this instance is deleted.
+
+        :rtype: None
+        """
+
+        self.removeSceneCallbacks()
+        self.removeNodeCallbacks()
+
+    def __len__(self):
+        """
+        Private method that returns the number of indexed components.
+
+        :rtype: int
+        """
+
+        return len(self._components)
+    # endregion
+
+    # region Properties
+    @property
+    def scene(self):
+        """
+        Getter method that returns the scene interface.
+
+        :rtype: mpyscene.MPyScene
+        """
+
+        return self.__scene__()
+
+    @property
+    def generation(self):
+        """
+        Getter method that returns the number of times this index has been invalidated.
+        Other indices can compare this value to detect any changes to the component hierarchy!
+
+        :rtype: int
+        """
+
+        return self._generation
+    # endregion
+
+    # region Methods
+    @classmethod
+    def getInstance(cls):
+        """
+        Returns the shared component hierarchy instance.
+
+        :rtype: ComponentHierarchy
+        """
+
+        if cls.__instance__ is None:
+
+            cls.__instance__ = cls()
+
+        return cls.__instance__
+
+    @classmethod
+    def scanComponentParent(cls, component):
+        """
+        Returns the parent of the supplied component by scanning its message plug.
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: Union[rigotron.abstract.abstractcomponent.AbstractComponent, None]
+        """
+
+        # Iterate through message destinations
+        #
+        plug = component.findPlug('message')
+        otherPlugs = plug.destinations()
+
+        for otherPlug in otherPlugs:
+
+            # Check if this a rig component
+            #
+            plugName = otherPlug.partialName(
+                includeNodeName=False,
+                useLongNames=True,
+                includeNonMandatoryIndices=True,
+                useFullAttributePath=True
+            )
+
+            isComponent = cls.__child_pattern__.fullmatch(plugName)
+
+            if isComponent:
+
+                return component.scene(otherPlug.node())
+
+            else:
+
+                continue
+
+        return None
+
+    @staticmethod
+    def scanComponentChildren(component):
+        """
+        Returns the children of the supplied component by scanning its connected elements.
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: List[rigotron.abstract.abstractcomponent.AbstractComponent]
+        """
+
+        plug = component.findPlug('componentChildren')
+        elementCount = plug.numConnectedElements()
+
+        return [component.scene(plug.connectionByPhysicalIndex(i).source().node()) for i in range(elementCount)]
+
+    def isIndexed(self, component):
+        """
+        Evaluates if the supplied component is indexed.
+        Any entries for deleted components are considered stale and will invalidate the entire index!
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: bool
+        """
+
+        indexed = self._components.get(component.hashCode(), None)
+
+        if indexed is None:
+
+            return False
+
+        elif not indexed.isAlive():
+
+            self.invalidate()
+            return False
+
+        else:
+
+            return True
+
+    @staticmethod
+    def isAlive(components):
+        """
+        Evaluates if all the supplied indexed components still exist.
+
+        :type components: List[rigotron.abstract.abstractcomponent.AbstractComponent]
+        :rtype: bool
+        """
+
+        return all(component.isAlive() for component in components)
+
+    def addSceneCallbacks(self):
+        """
+        Adds the scene callbacks that invalidate this index before a scene is replaced.
+
+        :rtype: None
+        """
+
+        hasCallbacks = len(self._callbackIds) > 0
+
+        if not hasCallbacks:
+
+            callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeNew, onSceneOpening)
+            self._callbackIds.append(callbackId)
+
+            callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeOpen, onSceneOpening)
+            self._callbackIds.append(callbackId)
+
+            for message in (om.MSceneMessage.kAfterImport, om.MSceneMessage.kAfterCreateReference, om.MSceneMessage.kAfterRemoveReference, om.MSceneMessage.kAfterLoadReference, om.MSceneMessage.kAfterUnloadReference):
+
+                callbackId = om.MSceneMessage.addCallback(message, onSceneChanged)
+                self._callbackIds.append(callbackId)
+
+    def removeSceneCallbacks(self):
+        """
+        Removes the scene callbacks created by this index.
+
+        :rtype: None
+        """
+
+        hasCallbacks = len(self._callbackIds) > 0
+
+        if hasCallbacks:
+
+            om.MMessage.removeCallbacks(self._callbackIds)
+            self._callbackIds.clear()
+
+    def addNodeCallback(self, component):
+        """
+        Adds a callback that invalidates the children of the supplied component whenever its `componentChildren` connections change.
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: None
+        """
+
+        key = component.hashCode()
+
+        if key not in self._nodeCallbackIds:
+
+            self._nodeCallbackIds[key] = om.MNodeMessage.addAttributeChangedCallback(component.object(), self.componentAttributeChanged, key)
+
+    def removeNodeCallback(self, key):
+        """
+        Removes the connection callback for the supplied indexed key.
+        Callbacks for nodes that have since been deleted are simply discarded!
+
+        :type key: int
+        :rtype: None
+        """
+
+        callbackId = self._nodeCallbackIds.pop(key, None)
+
+        if callbackId is None:
+
+            return
+
+        try:
+
+            om.MMessage.removeCallback(callbackId)
+
+        except RuntimeError:
+
+            pass
+
+    def removeNodeCallbacks(self):
+        """
+        Removes all the connection callbacks created by this index.
+
+        :rtype: None
+        """
+
+        for key in list(self._nodeCallbackIds.keys()):
+
+            self.removeNodeCallback(key)
+
+    def componentAttributeChanged(self, message, plug, otherPlug, key):
+        """
+        Callback method that invalidates the children of an indexed component whenever a `componentChildren` element is connected or disconnected.
+
+        :type message: int
+        :type plug: om.MPlug
+        :type otherPlug: om.MPlug
+        :type key: int
+        :rtype: None
+        """
+
+        # Check if this is a child connection change
+        #
+        isConnectionChange = bool(message & (om.MNodeMessage.kConnectionMade | om.MNodeMessage.kConnectionBroken))
+
+        if not (isConnectionChange and plug.isElement):
+
+            return
+
+        attributeName = plug.array().partialName(useLongNames=True)
+
+        if attributeName != 'componentChildren':
+
+            return
+
+        # Invalidate children of indexed component
+        #
+        component = self._components.get(key, None)
+
+        if component is not None:
+
+            self.invalidate(component=component)
+
+    @staticmethod
+    def weakCallback(callback):
+        """
+        Returns a weak reference to the supplied callback.
+        Bound methods are referenced via their instance so any listeners can be deleted without removing their callbacks first!
+
+        :type callback: Callable
+        :rtype: Union[weakref.WeakMethod, weakref.ref]
+        """
+
+        return weakref.WeakMethod(callback) if hasattr(callback, '__self__') else weakref.ref(callback)
+
+    @staticmethod
+    def invokeCallbacks(references, *args):
+        """
+        Invokes the supplied weakly referenced callbacks and returns the references that are still alive.
+
+        :type references: List[Union[weakref.WeakMethod, weakref.ref]]
+        :rtype: List[Union[weakref.WeakMethod, weakref.ref]]
+        """
+
+        callbacks = [reference() for reference in references]
+
+        for callback in callbacks:
+
+            if callback is not None:
+
+                callback(*args)
+
+        return [reference for (reference, callback) in zip(references, callbacks) if callback is not None]
+
+    def addCallback(self, callback):
+        """
+        Adds a callback that is notified whenever this index is invalidated.
+        The callback receives the component whose children changed, or none if the entire rig has changed!
+
+        :type callback: Callable[[Union[rigotron.abstract.abstractcomponent.AbstractComponent, None]], None]
+        :rtype: None
+        """
+
+        self._callbacks.append(self.weakCallback(callback))
+
+    def removeCallback(self, callback):
+        """
+        Removes a callback that was previously added.
+
+        :type callback: Callable[[Union[rigotron.abstract.abstractcomponent.AbstractComponent, None]], None]
+        :rtype: None
+        """
+
+        self._callbacks = [reference for reference in self._callbacks if reference() not in (None, callback)]
+
+    def notifyCallbacks(self, component=None):
+        """
+        Notifies all callbacks that the children of the supplied component have changed.
+
+        :type component: Union[rigotron.abstract.abstractcomponent.AbstractComponent, None]
+        :rtype: None
+        """
+
+        self._callbacks = self.invokeCallbacks(self._callbacks, component)
+
+    def addChangedCallback(self, callback):
+        """
+        Adds a callback that is notified whenever a component attribute, such as its name or status, changes.
+        The callback receives the component along with the name of the attribute that changed.
+
+        :type callback: Callable[[rigotron.abstract.abstractcomponent.AbstractComponent, str], None]
+        :rtype: None
+        """
+
+        self._changedCallbacks.append(self.weakCallback(callback))
+
+    def removeChangedCallback(self, callback):
+        """
+        Removes a changed callback that was previously added.
+
+        :type callback: Callable[[rigotron.abstract.abstractcomponent.AbstractComponent, str], None]
+        :rtype: None
+        """
+
+        self._changedCallbacks = [reference for reference in self._changedCallbacks if reference() not in (None, callback)]
+
+    def notifyChanged(self, component, attributeName):
+        """
+        Notifies all changed callbacks that the specified attribute has changed on the supplied component.
+        Attribute changes do not affect the hierarchy so this index remains valid!
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :type attributeName: str
+        :rtype: None
+        """
+
+        self._changedCallbacks = self.invokeCallbacks(self._changedCallbacks, component, attributeName)
+
+    def invalidate(self, component=None):
+        """
+        Invalidates this index and notifies any callbacks.
+        If a component is supplied then only its children are re-indexed upon the next lookup, otherwise all indexed components are removed!
+
+        :type component: Union[rigotron.abstract.abstractcomponent.AbstractComponent, None]
+        :rtype: None
+        """
+
+        # Check if only the supplied component's children have changed
+        #
+        if component is not None:
+
+            key = component.hashCode()
+
+            if key in self._components:
+
+                self._dirty.add(key)
+
+        else:
+
+            self.removeNodeCallbacks()
+
+            self._components.clear()
+            self._parents.clear()
+            self._children.clear()
+            self._order.clear()
+            self._types.clear()
+            self._matches.clear()
+            self._dirty.clear()
+
+        self._generation += 1
+        self.notifyCallbacks(component)
+
+    def indexComponent(self, component, parentKey):
+        """
+        Adds the supplied component to this index under the supplied parent key.
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :type parentKey: Union[int, None]
+        :rtype: int
+        """
+
+        key = component.hashCode()
+
+        self._components[key] = component
+        self._parents[key] = parentKey
+
+        for cls in component.iterBases():
+
+            self._types.setdefault(cls.__name__, []).append(key)
+
+        self.addNodeCallback(component)
+
+        return key
+
+    def indexChildren(self, component):
+        """
+        Indexes all the descendants of the supplied indexed component in a single breadth-first pass.
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: None
+        """
+
+        queue = deque([component])
+
+        while len(queue) > 0:
+
+            current = queue.popleft()
+            currentKey = current.hashCode()
+
+            children = self.scanComponentChildren(current)
+            self._children[currentKey] = [self.indexComponent(child, currentKey) for child in children]
+
+            queue.extend(children)
+
+    def reorder(self, rootKey):
+        """
+        Updates the breadth-first order of all indexed components below the supplied root key.
+
+        :type rootKey: int
+        :rtype: None
+        """
+
+        order = len(self._order)
+        queue = deque([rootKey])
+
+        while len(queue) > 0:
+
+            key = queue.popleft()
+
+            self._order[key] = order
+            order += 1
+
+            queue.extend(self._children.get(key, []))
+
+    def iterDescendantKeys(self, key):
+        """
+        Returns a generator that yields the indexed descendant keys of the supplied key.
+
+        :type key: int
+        :rtype: Iterator[int]
+        """
+
+        queue = deque(self._children.get(key, []))
+
+        while len(queue) > 0:
+
+            childKey = queue.popleft()
+            yield childKey
+
+            queue.extend(self._children.get(childKey, []))
+
+    def refresh(self):
+        """
+        Re-indexes the children of any invalidated components.
+        Only the affected subtrees are re-scanned, the rest of the rig remains indexed!
+
+        :rtype: None
+        """
+
+        # Check if there are any invalidated components
+        #
+        dirty, self._dirty = self._dirty, set()
+
+        if len(dirty) == 0:
+
+            return
+
+        rootKeys = set()
+
+        for key in dirty:
+
+            # Check if component is still indexed
+            # Invalidated descendants of another invalidated component will already have been removed!
+            # Deleted components are skipped since their parents are invalidated once they are disconnected.
+            #
+            component = self._components.get(key, None)
+
+            if component is None or not component.isAlive():
+
+                continue
+
+            # Remove stale descendants
+            #
+            staleKeys = set(self.iterDescendantKeys(key))
+
+            for staleKey in staleKeys:
+
+                self._components.pop(staleKey, None)
+                self._parents.pop(staleKey, None)
+                self._children.pop(staleKey, None)
+                self._order.pop(staleKey, None)
+                self.removeNodeCallback(staleKey)
+
+            for classKeys in self._types.values():
+
+                classKeys[:] = [classKey for classKey in classKeys if classKey not in staleKeys]
+
+            # Re-scan descendants
+            #
+            self.indexChildren(component)
+            rootKeys.add(self.rootKey(key))
+
+        # Update breadth-first order of affected rigs
+        #
+        self._matches.clear()
+
+        for rootKey in rootKeys:
+
+            self.reorder(rootKey)
+
+        log.debug(f'Re-indexed the children of {len(dirty)} component(s)')
+
+    def index(self, component):
+        """
+        Indexes the rig that the supplied component belongs to.
+        The root component is located by scanning upstream, after which the hierarchy is indexed in a single pass!
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: None
+        """
+
+        # Find root component
+        #
+        root = component
+        parent = self.scanComponentParent(root)
+
+        while parent is not None:
+
+            root = parent
+            parent = self.scanComponentParent(root)
+
+        # Index hierarchy from root
+        #
+        rootKey = self.indexComponent(root, None)
+        self._matches.clear()
+
+        self.indexChildren(root)
+        self.reorder(rootKey)
+
+        log.debug(f'Indexed {len(self._components)} component(s) from "{root}"')
+
+    def ensureIndexed(self, component):
+        """
+        Indexes the rig that the supplied component belongs to, if it is not already indexed.
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: None
+        """
+
+        self.refresh()
+
+        if not self.isIndexed(component):
+
+            self.index(component)
+
+    def reindex(self, component):
+        """
+        Invalidates this index and re-indexes the rig that the supplied component belongs to.
+        This is used whenever an indexed component is found to have been deleted without any notification!
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: None
+        """
+
+        log.debug(f'Re-indexing stale hierarchy from "{component}"')
+
+        self.invalidate()
+        self.index(component)
+
+    def componentParent(self, component):
+        """
+        Returns the indexed parent of the supplied component.
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: Union[rigotron.abstract.abstractcomponent.AbstractComponent, None]
+        """
+
+        self.ensureIndexed(component)
+
+        parentKey = self._parents.get(component.hashCode(), None)
+        parent = self._components.get(parentKey, None)
+
+        if parent is not None and not parent.isAlive():
+
+            self.reindex(component)
+
+            parentKey = self._parents.get(component.hashCode(), None)
+            parent = self._components.get(parentKey, None)
+
+        return parent
+
+    def componentChildren(self, component):
+        """
+        Returns the indexed children of the supplied component.
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: List[rigotron.abstract.abstractcomponent.AbstractComponent]
+        """
+
+        self.ensureIndexed(component)
+
+        childKeys = self._children.get(component.hashCode(), [])
+        children = [self._components[childKey] for childKey in childKeys]
+
+        if not self.isAlive(children):
+
+            self.reindex(component)
+
+            childKeys = self._children.get(component.hashCode(), [])
+            children = [self._components[childKey] for childKey in childKeys]
+
+        return children
+
+    def rootComponent(self, component):
+        """
+        Returns the indexed root of the supplied component.
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: rigotron.abstract.abstractcomponent.AbstractComponent
+        """
+
+        self.ensureIndexed(component)
+
+        root = self._components[self.rootKey(component.hashCode())]
+
+        if not root.isAlive():
+
+            self.reindex(component)
+            root = self._components[self.rootKey(component.hashCode())]
+
+        return root
+
+    def rootKey(self, key):
+        """
+        Returns the root key of the supplied indexed key.
+
+        :type key: int
+        :rtype: int
+        """
+
+        parentKey = self._parents.get(key, None)
+
+        while parentKey is not None:
+
+            key, parentKey = parentKey, self._parents.get(parentKey, None)
+
+        return key
+
+    def typeKeys(self, typeName):
+        """
+        Returns the keys of all indexed components derived from the specified type name.
+        Type names are matched against the end of each base class name, the results are cached until the next invalidation!
+
+        :type typeName: str
+        :rtype: Set[int]
+        """
+
+        keys = self._matches.get(typeName, None)
+
+        if keys is None:
+
+            keys = set()
+
+            for (className, classKeys) in self._types.items():
+
+                if className.endswith(typeName):
+
+                    keys.update(classKeys)
+
+            self._matches[typeName] = keys
+
+        return keys
+
+    def isDescendantKey(self, key, ancestorKey):
+        """
+        Evaluates if the supplied key is descended from the specified ancestor key.
+
+        :type key: int
+        :type ancestorKey: int
+        :rtype: bool
+        """
+
+        parentKey = self._parents.get(key, None)
+
+        while parentKey is not None:
+
+            if parentKey == ancestorKey:
+
+                return True
+
+            parentKey = self._parents.get(parentKey, None)
+
+        return False
+
+    def findComponentAncestors(self, component, typeName):
+        """
+        Returns a list of ancestor components derived from the specified type name.
+        Ancestors are ordered from the nearest parent up to the root!
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :type typeName: str
+        :rtype: List[rigotron.abstract.abstractcomponent.AbstractComponent]
+        """
+
+        self.ensureIndexed(component)
+
+        keys = self.typeKeys(typeName)
+        ancestors = []
+
+        parentKey = self._parents.get(component.hashCode(), None)
+
+        while parentKey is not None:
+
+            if parentKey in keys:
+
+                ancestors.append(self._components[parentKey])
+
+            parentKey = self._parents.get(parentKey, None)
+
+        if not self.isAlive(ancestors):
+
+            self.reindex(component)
+            return self.findComponentAncestors(component, typeName)
+
+        return ancestors
+
+    def findComponentDescendants(self, component, typeName):
+        """
+        Returns a list of descendant components derived from the specified type name.
+        Descendants are ordered breadth-first, the same as `AbstractComponent.iterComponentDescendants`!
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :type typeName: str
+        :rtype: List[rigotron.abstract.abstractcomponent.AbstractComponent]
+        """
+
+        self.ensureIndexed(component)
+
+        key = component.hashCode()
+        descendantKeys = [otherKey for otherKey in self.typeKeys(typeName) if self.isDescendantKey(otherKey, key)]
+        descendantKeys.sort(key=self._order.get)
+
+        descendants = [self._components[descendantKey] for descendantKey in descendantKeys]
+
+        if not self.isAlive(descendants):
+
+            self.reindex(component)
+            return self.findComponentDescendants(component, typeName)
+
+        return descendants
+    # endregion
@@ -1,7 +1,10 @@
 from maya.api import OpenMaya as om
 from mpy import mpyscene, mpynode
+from types import FunctionType, MethodType
+from collections import deque
 from dcc.maya.json import melsonobject
 from enum import IntEnum
+from . import specindex
 from ..abstract import abstractspec
 
 import logging
@@ -21,6 +24,113 @@ class DriverType(IntEnum):
     OFFSET_PARENT_MATRIX = 2
 
 
+class DriverPolicy(IntEnum):
+    """
+    Enum class of all available rig-wide driver policies.
+    """
+
+    DEFAULT = 0
+    MATRIX = 1
+
+
+class BindReport(object):
+    """
+    Base class used to record how each export joint was bound under a driver policy.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_matrix', '_composed', '_constrained', '_failed')
+
+    def __init__(self):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(BindReport, self).__init__()
+
+        # Declare private variables
+        #
+        self._matrix = []
+        self._composed = []
+        self._constrained = []
+        self._failed = []
+
+    def __len__(self):
+        """
+        Private method that returns the number of recorded joints.
+
+        :rtype: int
+        """
+
+        return len(self._matrix) + len(self._composed) + len(self._constrained) + len(self._failed)
+    # endregion
+
+    # region Properties
+    @property
+    def matrix(self):
+        """
+        Getter method that returns the joints driven by a single `multMatrix` node.
+
+        :rtype: List[str]
+        """
+
+        return self._matrix
+
+    @property
+    def composed(self):
+        """
+        Getter method that returns the joints driven by a decompose-and-compose network, due to their skip flags.
+
+        :rtype: List[str]
+        """
+
+        return self._composed
+
+    @property
+    def constrained(self):
+        """
+        Getter method that returns the joints, and reasons, that fell back to a constraint.
+
+        :rtype: List[Tuple[str, str]]
+        """
+
+        return self._constrained
+
+    @property
+    def failed(self):
+        """
+        Getter method that returns the joints, and reasons, that could not be bound.
+
+        :rtype: List[Tuple[str, str]]
+        """
+
+        return self._failed
+    # endregion
+
+    # region Methods
+    def log(self):
+        """
+        Logs a summary of this report along with any joints that could not be converted.
+
+        :rtype: None
+        """
+
+        log.info(f'Bound {len(self._matrix)} joint(s) by matrix, {len(self._composed)} by composed matrix and {len(self._constrained)} by constraint.')
+
+        for (name, reason) in self._constrained:
+
+            log.warning(f'Unable to convert "{name}" to a matrix driver, {reason}!')
+
+        for (name, reason) in self._failed:
+
+            log.warning(f'Unable to bind "{name}", {reason}!')
+    # endregion
+
+
 class DriverSpec(melsonobject.MELSONObject):
     """
     Overload of `MELSONObject` that interfaces with export skeleton drivers.
@@ -28,6 +138,7 @@ class DriverSpec(melsonobject.MELSONObject):
 
     # region Enums
     Type = DriverType
+    Policy = DriverPolicy
     # endregion
 
     # region Dunderscores
@@ -44,6 +155,10 @@ class DriverSpec(melsonobject.MELSONObject):
         '_skipScale'
     )
 
+    __default__ = None
+    __network_types__ = ('multMatrix', 'decomposeMatrix', 'composeMatrix')
+    __network_tag__ = 'driverNetwork'
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance is created.
@@ -66,6 +181,21 @@ class DriverSpec(melsonobject.MELSONObject):
         self._skipTranslate = [False, False, False]
         self._skipRotate = [False, False, False]
         self._skipScale = [False, False, False]
+
+    @classmethod
+    def getDefault(cls):
+        """
+        Returns the shared default driver.
+        This instance is never written to, any writes made through a `DriverProxy` allocate a new driver instead!
+
+        :rtype: DriverSpec
+        """
+
+        if cls.__default__ is None:
+
+            cls.__default__ = cls()
+
+        return cls.__default__
     # endregion
 
     # region Properties
@@ -109,6 +239,7 @@ class DriverSpec(melsonobject.MELSONObject):
         """
 
         self._name = name
+        self.markDirty()
 
     @property
     def namespace(self):
@@ -130,6 +261,7 @@ class DriverSpec(melsonobject.MELSONObject):
         """
 
         self._namespace = namespace
+        self.markDirty()
 
     @property
     def type(self):
@@ -151,6 +283,7 @@ class DriverSpec(melsonobject.MELSONObject):
         """
 
         self._type = self.Type(type)
+        self.markDirty()
 
     @property
     def maintainOffset(self):
@@ -172,16 +305,18 @@ class DriverSpec(melsonobject.MELSONObject):
         """
 
         self._maintainOffset = maintainOffset
+        self.markDirty()
     
     @property
     def skipTranslate(self):
         """
         Getter method that returns the `skipTranslate` flags.
+        A tuple is returned so the flags cannot be modified without invoking the setter!
 
-        :rtype: bool
+        :rtype: Tuple[bool, bool, bool]
         """
 
-        return self._skipTranslate
+        return tuple(self._skipTranslate)
 
     @skipTranslate.setter
     def skipTranslate(self, skipTranslate):
@@ -213,16 +348,19 @@ class DriverSpec(melsonobject.MELSONObject):
         else:
             
             raise TypeError(f'skipTranslate.setter() expects a boolean ({type(skipTranslate).__name__} given)!')
+
+        self.markDirty()
     
     @property
     def skipRotate(self):
         """
         Getter method that returns the `skipRotate` flags.
+        A tuple is returned so the flags cannot be modified without invoking the setter!
 
-        :rtype: bool
+        :rtype: Tuple[bool, bool, bool]
         """
 
-        return self._skipRotate
+        return tuple(self._skipRotate)
 
     @skipRotate.setter
     def skipRotate(self, skipRotate):
@@ -254,16 +392,19 @@ class DriverSpec(melsonobject.MELSONObject):
         else:
             
             raise TypeError(f'skipRotate.setter() expects a boolean ({type(skipRotate).__name__} given)!')
+
+        self.markDirty()
     
     @property
     def skipScale(self):
         """
         Getter method that returns the `skipScale` flags.
+        A tuple is returned so the flags cannot be modified without invoking the setter!
 
-        :rtype: bool
+        :rtype: Tuple[bool, bool, bool]
         """
 
-        return self._skipScale
+        return tuple(self._skipScale)
 
     @skipScale.setter
     def skipScale(self, skipScale):
@@ -295,9 +436,33 @@ class DriverSpec(melsonobject.MELSONObject):
         else:
             
             raise TypeError(f'skipScale.setter() expects a boolean ({type(skipScale).__name__} given)!')
+
+        self.markDirty()
     # endregion
 
     # region Methods
+    def markDirty(self):
+        """
+        Marks the driven spec as dirty.
+
+        :rtype: None
+        """
+
+        driven = self._driven() if hasattr(self, '_driven') else None  # Drivers that are still initializing have no driven spec!
+
+        if driven is not None:
+
+            driven.markDirty()
+
+    def hasSkipFlags(self):
+        """
+        Evaluates if any of the skip flags are enabled.
+
+        :rtype: bool
+        """
+
+        return any(self.skipTranslate) or any(self.skipRotate) or any(self.skipScale)
+
     def getDriven(self, **kwargs):
         """
         Returns the node associated with the driver.
@@ -316,14 +481,40 @@ class DriverSpec(melsonobject.MELSONObject):
 
             return None
 
-    def getDriver(self):
+    def getDriver(self, drivers=None):
         """
         Returns the node associated with this driver.
+        Drivers are resolved through the shared spec index's node cache.
+        If a dictionary is supplied then any previously resolved drivers are reused!
 
+        :type drivers: Union[Dict[str, mpynode.MPyNode], None]
         :rtype: Union[mpynode.MPyNode, None]
         """
 
-        return self.scene.getNodeByName(f'{self.namespace}:{self.name}')
+        name = f'{self.namespace}:{self.name}'
+
+        if drivers is None:
+
+            return specindex.findNodeByName(self.scene, name)
+
+        driver = drivers.get(name, None)
+
+        if driver is None:
+
+            driver = drivers[name] = specindex.findNodeByName(self.scene, name)
+
+        return driver
+
+    def resolve(self, referenceNode=None, drivers=None):
+        """
+        Returns the driven and driver nodes for this driver.
+
+        :type referenceNode: Union[mpynode.MPyNode, None]
+        :type drivers: Union[Dict[str, mpynode.MPyNode], None]
+        :rtype: Tuple[Union[mpynode.MPyNode, None], Union[mpynode.MPyNode, None]]
+        """
+
+        return self.getDriven(referenceNode=referenceNode), self.getDriver(drivers=drivers)
 
     def bind(self, referenceNode=None):
         """
@@ -333,11 +524,22 @@ class DriverSpec(melsonobject.MELSONObject):
         :rtype: None
         """
 
+        driven, driver = self.resolve(referenceNode=referenceNode)
+        return self.bindNodes(driven, driver)
+
+    def bindNodes(self, driven, driver, modifier=None):
+        """
+        Binds the supplied driven node to the supplied driver node.
+        If a modifier is supplied then any connections are deferred until the modifier is executed!
+
+        :type driven: Union[mpynode.MPyNode, None]
+        :type driver: Union[mpynode.MPyNode, None]
+        :type modifier: Union[om.MDGModifier, None]
+        :rtype: None
+        """
+
         # Check if driver and driven exist
         #
-        driven = self.getDriven(referenceNode=referenceNode)
-        driver = self.getDriver()
-
         if not (isinstance(driven, mpynode.MPyNode) and isinstance(driver, mpynode.MPyNode)):
 
             log.warning(f'Unable to bind "{self.namespace}:{self.name}" > {getattr(self.driven, "name", "")}!')
@@ -352,28 +554,9 @@ class DriverSpec(melsonobject.MELSONObject):
             driven.removeConstraints()
             driven.unfreezePivots()
 
-            skipTranslateX, skipTranslateY, skipTranslateZ = self.skipTranslate
-            skipRotateX, skipRotateY, skipRotateZ = self.skipRotate
-            skipScaleX, skipScaleY, skipScaleZ = self.skipScale
-
-            log.info(f'Constraining "{driver}" > "{driven}"')
-            constraint = driven.addConstraint(
-                'transformConstraint',
-                [driver],
-                maintainOffset=self.maintainOffset,
-                skipTranslateX=skipTranslateX,
-                skipTranslateY=skipTranslateY,
-                skipTranslateZ=skipTranslateZ,
-                skipRotateX=skipRotateX,
-                skipRotateY=skipRotateY,
-                skipRotateZ=skipRotateZ,
-                skipScaleX=skipScaleX,
-                skipScaleY=skipScaleY,
-                skipScaleZ=skipScaleZ
-            )
-            constraint.hiddenInOutliner = True
-
-            return constraint
+            self.removeMatrixNetwork(driven)
+
+            return self.constrainNode(driven, driver)
 
         elif self.type == self.Type.PARENT:
 
@@ -387,12 +570,167 @@ class DriverSpec(melsonobject.MELSONObject):
             # Override driven `offsetParentMatrix` connection
             #
             log.info(f'Connecting "{driver}.worldMatrix[0]" > "{driven}.offsetParentMatrix"')
-            driven.connectPlugs(driver[f'worldMatrix[{driver.instanceNumber()}]'], 'offsetParentMatrix', force=True)
+
+            if modifier is not None:
+
+                source = driver.findPlug('worldMatrix').elementByLogicalIndex(driver.instanceNumber())
+                destination = driven.findPlug('offsetParentMatrix')
+
+                self.disconnectPlug(destination, modifier)
+                modifier.connect(source, destination)
+
+            else:
+
+                driven.connectPlugs(driver[f'worldMatrix[{driver.instanceNumber()}]'], 'offsetParentMatrix', force=True)
 
         else:
 
             pass
 
+    def constrainNode(self, driven, driver):
+        """
+        Constrains the supplied driven node to the supplied driver node.
+        Any existing constraints or matrix networks should be removed beforehand, see `bindNodes`!
+
+        :type driven: mpynode.MPyNode
+        :type driver: mpynode.MPyNode
+        :rtype: mpynode.MPyNode
+        """
+
+        skipTranslateX, skipTranslateY, skipTranslateZ = self.skipTranslate
+        skipRotateX, skipRotateY, skipRotateZ = self.skipRotate
+        skipScaleX, skipScaleY, skipScaleZ = self.skipScale
+
+        log.info(f'Constraining "{driver}" > "{driven}"')
+        constraint = driven.addConstraint(
+            'transformConstraint',
+            [driver],
+            maintainOffset=self.maintainOffset,
+            skipTranslateX=skipTranslateX,
+            skipTranslateY=skipTranslateY,
+            skipTranslateZ=skipTranslateZ,
+            skipRotateX=skipRotateX,
+            skipRotateY=skipRotateY,
+            skipRotateZ=skipRotateZ,
+            skipScaleX=skipScaleX,
+            skipScaleY=skipScaleY,
+            skipScaleZ=skipScaleZ
+        )
+        constraint.hiddenInOutliner = True
+
+        return constraint
+
+    def describeMatrixNetwork(self, network, driven, driver):
+        """
+        Describes a network that drives the `offsetParentMatrix` on the supplied driven node, in place of a constraint.
+        The driven node's inverse local matrix is pre-multiplied so its own channels, including any joint orients, are cancelled out!
+        If any skip flags are enabled then the driven matrix is decomposed and any skipped channels are recomposed from the driven node's local matrix.
+        Once committed, the created nodes should be passed to `tagMatrixNetwork` so they can be removed later on.
+        Returns true if a decompose-and-compose network was required.
+
+        :type network: rigotron.libs.nodenetwork.NodeNetwork
+        :type driven: mpynode.MPyNode
+        :type driver: mpynode.MPyNode
+        :rtype: bool
+        """
+
+        # Evaluate driver offset
+        #
+        offset = (driven.worldMatrix() * driver.worldMatrix().inverse()) if self.maintainOffset else None
+
+        worldMatrix = driver.findPlug('worldMatrix').elementByLogicalIndex(driver.instanceNumber())
+        parentInverseMatrix = driven.findPlug('parentInverseMatrix').elementByLogicalIndex(driven.instanceNumber())
+        inverseMatrix = driven.findPlug('inverseMatrix')
+        offsetParentMatrix = driven.findPlug('offsetParentMatrix')
+
+        name = getattr(self.driven, 'name', driven.name())
+
+        # Check if any skip flags are enabled
+        #
+        if not self.hasSkipFlags():
+
+            multMatrix = network.createNode('multMatrix', name=f'{name}_Driver_multMatrix')
+            self.connectMatrices(network, multMatrix, [inverseMatrix, offset, worldMatrix, parentInverseMatrix])
+            network.connectPlugs(multMatrix['matrixSum'], offsetParentMatrix, force=True)
+
+            return False
+
+        # Decompose driven and rest matrices
+        #
+        rotateOrder = driven.findPlug('rotateOrder')
+
+        multMatrix = network.createNode('multMatrix', name=f'{name}_Driver_multMatrix')
+        self.connectMatrices(network, multMatrix, [offset, worldMatrix, parentInverseMatrix])
+
+        decomposeMatrix = network.createNode('decomposeMatrix', name=f'{name}_Driver_decomposeMatrix')
+        network.connectPlugs(multMatrix['matrixSum'], decomposeMatrix['inputMatrix'])
+        network.connectPlugs(rotateOrder, decomposeMatrix['inputRotateOrder'])
+
+        restDecomposeMatrix = network.createNode('decomposeMatrix', name=f'{name}_Rest_decomposeMatrix')
+        network.connectPlugs(driven.findPlug('matrix'), restDecomposeMatrix['inputMatrix'])
+        network.connectPlugs(rotateOrder, restDecomposeMatrix['inputRotateOrder'])
+
+        # Recompose matrix from non-skipped channels
+        #
+        composeMatrix = network.createNode('composeMatrix', name=f'{name}_Driver_composeMatrix')
+        network.connectPlugs(rotateOrder, composeMatrix['inputRotateOrder'])
+        network.connectPlugs(decomposeMatrix['outputShear'], composeMatrix['inputShear'])
+
+        for (attribute, skipFlags) in (('Translate', self.skipTranslate), ('Rotate', self.skipRotate), ('Scale', self.skipScale)):
+
+            for (axis, skip) in zip('XYZ', skipFlags):
+
+                source = restDecomposeMatrix if skip else decomposeMatrix
+                network.connectPlugs(source[f'output{attribute}{axis}'], composeMatrix[f'input{attribute}{axis}'])
+
+        # Cancel out driven matrix
+        #
+        offsetMatrix = network.createNode('multMatrix', name=f'{name}_Offset_multMatrix')
+        self.connectMatrices(network, offsetMatrix, [inverseMatrix, composeMatrix['outputMatrix']])
+        network.connectPlugs(offsetMatrix['matrixSum'], offsetParentMatrix, force=True)
+
+        return True
+
+    @classmethod
+    def tagMatrixNetwork(cls, nodes):
+        """
+        Tags the supplied nodes, committed from `describeMatrixNetwork`, as part of a driver network.
+        Only tagged nodes are deleted by `removeMatrixNetwork`, any user-made matrix nodes are left untouched!
+
+        :type nodes: List[mpynode.MPyNode]
+        :rtype: None
+        """
+
+        for node in nodes:
+
+            if not node.hasAttr(cls.__network_tag__):
+
+                node.addAttr(longName=cls.__network_tag__, attributeType='bool', default=True, hidden=True)
+
+    @staticmethod
+    def connectMatrices(network, multMatrix, matrices):
+        """
+        Describes the supplied matrices as consecutive inputs on the supplied `multMatrix` node.
+        Static matrices are assigned, plugs are connected and any null matrices are skipped!
+
+        :type network: rigotron.libs.nodenetwork.NodeNetwork
+        :type multMatrix: rigotron.libs.nodenetwork.NetworkNode
+        :type matrices: List[Union[om.MMatrix, om.MPlug, rigotron.libs.nodenetwork.NetworkPlug, None]]
+        :rtype: None
+        """
+
+        matrices = [matrix for matrix in matrices if matrix is not None]
+
+        for (i, matrix) in enumerate(matrices):
+
+            if isinstance(matrix, om.MMatrix):
+
+                network.setAttr(multMatrix[f'matrixIn[{i}]'], matrix)
+
+            else:
+
+                network.connectPlugs(matrix, multMatrix[f'matrixIn[{i}]'])
+
     def unbind(self, referenceNode=None):
         """
         Unbinds the driven node from this driver.
@@ -401,10 +739,26 @@ class DriverSpec(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        # Check if driven exists
-        #
         driven = self.getDriven(referenceNode=referenceNode)
+        self.unbindNode(driven)
+
+        if isinstance(driven, mpynode.MPyNode):
+
+            self.resetNode(driven)
+
+    def unbindNode(self, driven, modifier=None):
+        """
+        Unbinds the supplied driven node from this driver.
+        If a modifier is supplied then any disconnections are deferred until the modifier is executed!
+        Afterward, the driven matrix should be reassigned via `resetNode`.
+
+        :type driven: Union[mpynode.MPyNode, None]
+        :type modifier: Union[om.MDGModifier, None]
+        :rtype: None
+        """
 
+        # Check if driven exists
+        #
         if not isinstance(driven, mpynode.MPyNode):
 
             log.warning(f'Unable to unbind {self.name} driver!')
@@ -415,6 +769,7 @@ class DriverSpec(melsonobject.MELSONObject):
         if self.type == self.Type.CONSTRAINT:
 
             driven.removeConstraints()
+            self.removeMatrixNetwork(driven, modifier=modifier)
 
         elif self.type == self.Type.PARENT:
 
@@ -422,13 +777,199 @@ class DriverSpec(melsonobject.MELSONObject):
 
         elif self.type == self.Type.OFFSET_PARENT_MATRIX:
 
-            driven.breakConnections('offsetParentMatrix', source=True, destination=False)
+            if modifier is not None:
+
+                self.disconnectPlug(driven.findPlug('offsetParentMatrix'), modifier)
+
+            else:
+
+                driven.breakConnections('offsetParentMatrix', source=True, destination=False)
 
         else:
 
             pass
 
-        # Reassign driven matrix
-        #
+    def resetNode(self, driven):
+        """
+        Reassigns the driven matrix on the supplied node.
+
+        :type driven: mpynode.MPyNode
+        :rtype: None
+        """
+
         driven.setMatrix(self.driven.matrix, skipScale=False)
+
+    @staticmethod
+    def disconnectPlug(plug, modifier):
+        """
+        Disconnects the source from the supplied plug using the supplied modifier.
+
+        :type plug: om.MPlug
+        :type modifier: om.MDGModifier
+        :rtype: None
+        """
+
+        source = plug.source()
+
+        if not source.isNull:
+
+            modifier.disconnect(source, plug)
+
+    @classmethod
+    def removeMatrixNetwork(cls, driven, modifier=None):
+        """
+        Removes any matrix network, created via `describeMatrixNetwork`, from the supplied driven node.
+        Only nodes tagged via `tagMatrixNetwork` are deleted.
+        The `offsetParentMatrix` is reset to identity since disconnected plugs retain their last value!
+        Returns true if a network was removed.
+
+        :type driven: mpynode.MPyNode
+        :type modifier: Union[om.MDGModifier, None]
+        :rtype: bool
+        """
+
+        # Check if offset parent matrix is connected
+        #
+        if not driven.hasAttr('offsetParentMatrix'):
+
+            return False
+
+        plug = driven.findPlug('offsetParentMatrix')
+        source = plug.source()
+
+        if source.isNull:
+
+            return False
+
+        # Collect upstream network nodes
+        # Traversal stops at any node that is not a tagged matrix node, such as the driver or driven nodes!
+        #
+        nodes = {}
+        queue = deque([source.node()])
+
+        while len(queue) > 0:
+
+            node = queue.popleft()
+            hashCode = om.MObjectHandle(node).hashCode()
+
+            if hashCode in nodes:
+
+                continue
+
+            fnNode = om.MFnDependencyNode(node)
+
+            if fnNode.typeName not in cls.__network_types__ or not fnNode.hasAttribute(cls.__network_tag__):
+
+                continue
+
+            nodes[hashCode] = node
+            queue.extend([otherPlug.source().node() for otherPlug in fnNode.getConnections() if otherPlug.isDestination])
+
+        if len(nodes) == 0:
+
+            return False
+
+        # Delete network and reset offset parent matrix
+        #
+        isDeferred = modifier is not None
+        modifier = modifier if isDeferred else om.MDGModifier()
+
+        for node in nodes.values():
+
+            modifier.deleteNode(node)
+
+        modifier.newPlugValue(plug, om.MFnMatrixData().create(om.MMatrix.kIdentity))
+
+        if not isDeferred:
+
+            modifier.doIt()
+
+        return True
+    # endregion
+
+
+class DriverProxy(object):
+    """
+    Base class used to expose the shared default driver on behalf of a spec.
+    Reads are answered by the shared default, with any methods and properties evaluated against this proxy.
+    The first write of a non-default value allocates a `DriverSpec` on the driven spec and forwards the write to it!
+    """
+
+    # region Dunderscores
+    __slots__ = ('_driven',)
+
+    def __init__(self, driven):
+        """
+        Private method called after a new instance is created.
+
+        :type driven: abstractspec.AbstractSpec
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(DriverProxy, self).__init__()
+
+        # Declare private variables
+        #
+        object.__setattr__(self, '_driven', driven.weakReference())
+
+    def __getattr__(self, item):
+        """
+        Private method that returns the requested attribute from the shared default driver.
+
+        :type item: str
+        :rtype: Any
+        """
+
+        # Find class attribute without invoking any descriptors
+        #
+        attribute = None
+
+        for cls in DriverSpec.__mro__:
+
+            if item in cls.__dict__:
+
+                attribute = cls.__dict__[item]
+                break
+
+        # Evaluate attribute type
+        #
+        if isinstance(attribute, property):
+
+            return attribute.fget(self)
+
+        elif isinstance(attribute, (staticmethod, classmethod)):
+
+            return attribute.__get__(self, DriverSpec)
+
+        elif isinstance(attribute, FunctionType):
+
+            return MethodType(attribute, self)
+
+        else:
+
+            return getattr(DriverSpec.getDefault(), item)
+
+    def __setattr__(self, key, value):
+        """
+        Private method that forwards the supplied value to the driven spec's driver.
+        Writing a default value does not allocate a driver!
+
+        :type key: str
+        :type value: Any
+        :rtype: None
+        """
+
+        if getattr(self, key) == (tuple(value) if isinstance(value, list) else value):
+
+            return
+
+        driven = self._driven()
+
+        if driven is None:
+
+            raise RuntimeError(f'__setattr__() cannot write "{key}" to a driver without a driven spec!')
+
+        setattr(driven.ensureDriver(), key, value)
     # endregion
@@ -0,0 +1,321 @@
+from collections import namedtuple
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+NetworkPlug = namedtuple('NetworkPlug', ('node', 'path'))
+
+
+class NetworkNode(object):
+    """
+    Base class used to describe a node that has yet to be created.
+    Indexing a network node returns a `NetworkPlug` that can be used to describe attribute values and connections!
+    """
+
+    # region Dunderscores
+    __slots__ = ('_index', '_typeName', '_name', '_parent')
+
+    def __init__(self, index, typeName, name='', parent=None):
+        """
+        Private method called after a new instance is created.
+
+        :type index: int
+        :type typeName: str
+        :type name: str
+        :type parent: Any
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NetworkNode, self).__init__()
+
+        # Declare private variables
+        #
+        self._index = index
+        self._typeName = typeName
+        self._name = name
+        self._parent = parent
+
+    def __getitem__(self, path):
+        """
+        Private method that returns a plug description for the supplied attribute path.
+
+        :type path: str
+        :rtype: NetworkPlug
+        """
+
+        return NetworkPlug(self, path)
+
+    def __repr__(self):
+        """
+        Private method that returns a string representation of this instance.
+
+        :rtype: str
+        """
+
+        return f'<{self.__class__.__name__}:{self._typeName} "{self._name}" at {self._index}>'
+    # endregion
+
+    # region Properties
+    @property
+    def index(self):
+        """
+        Getter method that returns the creation index.
+
+        :rtype: int
+        """
+
+        return self._index
+
+    @property
+    def typeName(self):
+        """
+        Getter method that returns the node type name.
+
+        :rtype: str
+        """
+
+        return self._typeName
+
+    @property
+    def name(self):
+        """
+        Getter method that returns the node name.
+
+        :rtype: str
+        """
+
+        return self._name
+
+    @property
+    def parent(self):
+        """
+        Getter method that returns the parent.
+        This can either be another network node or an existing node!
+
+        :rtype: Any
+        """
+
+        return self._parent
+    # endregion
+
+
+class NodeNetwork(object):
+    """
+    Base class used to describe a network of nodes, attribute values and connections.
+    The description is pure python so it can be assembled and inspected outside of Maya.
+    Networks are committed by `BaseComponent.commitNetwork` using a small number of modifiers!
+    """
+
+    # region Dunderscores
+    __slots__ = ('_nodes', '_values', '_connections')
+
+    def __init__(self):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NodeNetwork, self).__init__()
+
+        # Declare private variables
+        #
+        self._nodes = []
+        self._values = []
+        self._connections = []
+
+    def __len__(self):
+        """
+        Private method that returns the number of described nodes.
+
+        :rtype: int
+        """
+
+        return len(self._nodes)
+
+    def __iter__(self):
+        """
+        Private method that returns a generator that yields the described nodes in creation order.
+
+        :rtype: Iterator[NetworkNode]
+        """
+
+        return iter(self._nodes)
+    # endregion
+
+    # region Properties
+    @property
+    def nodes(self):
+        """
+        Getter method that returns the described nodes.
+
+        :rtype: List[NetworkNode]
+        """
+
+        return self._nodes
+
+    @property
+    def values(self):
+        """
+        Getter method that returns the described attribute values.
+
+        :rtype: List[Tuple[Any, Any, bool]]
+        """
+
+        return self._values
+
+    @property
+    def connections(self):
+        """
+        Getter method that returns the described connections.
+
+        :rtype: List[Tuple[Any, Any, bool]]
+        """
+
+        return self._connections
+    # endregion
+
+    # region Methods
+    def isMember(self, node):
+        """
+        Evaluates if the supplied node was described by this network.
+
+        :type node: Any
+        :rtype: bool
+        """
+
+        return isinstance(node, NetworkNode) and 0 <= node.index < len(self._nodes) and self._nodes[node.index] is node
+
+    def createNode(self, typeName, name='', parent=None):
+        """
+        Describes a new node of the specified type.
+        Parents can either be other network nodes or existing nodes!
+
+        :type typeName: str
+        :type name: str
+        :type parent: Any
+        :rtype: NetworkNode
+        """
+
+        # Check if parent belongs to another network
+        #
+        if isinstance(parent, NetworkNode) and not self.isMember(parent):
+
+            raise TypeError(f'createNode() expects a parent from the same network ({parent} given)!')
+
+        # Append node description
+        #
+        node = NetworkNode(len(self._nodes), typeName, name=name, parent=parent)
+        self._nodes.append(node)
+
+        return node
+
+    def setAttr(self, plug, value, convertUnits=True):
+        """
+        Describes an attribute value.
+        Plugs can either be network plugs or existing plugs!
+        If `convertUnits` is disabled then any unit values are expected in internal units, such as radians.
+
+        :type plug: Union[NetworkPlug, Any]
+        :type value: Any
+        :type convertUnits: bool
+        :rtype: None
+        """
+
+        self._values.append((plug, value, convertUnits))
+
+    def findConnection(self, destination):
+        """
+        Returns the index of the connection described for the supplied destination.
+        If no connection has been described then -1 is returned!
+
+        :type destination: Union[NetworkPlug, Any]
+        :rtype: int
+        """
+
+        for (i, (otherSource, otherDestination, otherForce)) in enumerate(self._connections):
+
+            if type(otherDestination) is type(destination) and otherDestination == destination:
+
+                return i
+
+        return -1
+
+    def connectPlugs(self, source, destination, force=False):
+        """
+        Describes a connection between the supplied plugs.
+        Plugs can either be network plugs or existing plugs!
+        Since all connections are committed at once, forcing a connection replaces any connection already described for the destination.
+
+        :type source: Union[NetworkPlug, Any]
+        :type destination: Union[NetworkPlug, Any]
+        :type force: bool
+        :rtype: None
+        """
+
+        # Check if destination has already been described
+        #
+        index = self.findConnection(destination)
+
+        if index == -1:
+
+            self._connections.append((source, destination, force))
+
+        elif force:
+
+            self._connections[index] = (source, destination, force)
+
+        else:
+
+            log.warning(f'Skipping {source} > {destination} connection, destination has already been described!')
+
+    def describe(self):
+        """
+        Returns a serializable description of this network.
+        Existing nodes and plugs are represented by their string representation!
+
+        :rtype: Dict[str, List[Any]]
+        """
+
+        def encode(item):
+
+            if isinstance(item, NetworkNode):
+
+                return item.index
+
+            elif isinstance(item, NetworkPlug):
+
+                return [item.node.index, item.path]
+
+            elif item is None:
+
+                return None
+
+            else:
+
+                return str(item)
+
+        return {
+            'nodes': [{'typeName': node.typeName, 'name': node.name, 'parent': encode(node.parent)} for node in self._nodes],
+            'values': [[encode(plug), value, convertUnits] for (plug, value, convertUnits) in self._values],
+            'connections': [[encode(source), encode(destination), force] for (source, destination, force) in self._connections]
+        }
+
+    def clear(self):
+        """
+        Removes all descriptions from this network.
+
+        :rtype: None
+        """
+
+        self._nodes.clear()
+        self._values.clear()
+        self._connections.clear()
+    # endregion
@@ -0,0 +1,347 @@
+import os
+import time
+import threading
+
+from dcc.maya.standalone import rpc
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+__request__ = None
+__opened__ = None
+__generation__ = 0
+
+
+def getFileKey(path):
+    """
+    Returns the key used to detect changes to the supplied file.
+    Files that cannot be found have no key!
+
+    :type path: str
+    :rtype: Union[Tuple[str, float], None]
+    """
+
+    path = os.path.abspath(path)
+
+    try:
+
+        return path, os.path.getmtime(path)
+
+    except OSError:
+
+        return None
+
+
+class OpenRequest(object):
+    """
+    Base class used to open a scene file inside the remote standalone process without blocking the UI thread.
+    The RPC call is made from a background thread, the result is only read once the request is waited on!
+    """
+
+    # region Dunderscores
+    __slots__ = ('_path', '_key', '_thread', '_finished', '_success', '_exception', '_startTime', '_endTime')
+
+    def __init__(self, path, key=None):
+        """
+        Private method called after a new instance is created.
+
+        :type path: str
+        :type key: Union[Tuple[str, float], None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(OpenRequest, self).__init__()
+
+        # Declare private variables
+        #
+        self._path = path
+        self._key = key
+        self._thread = None
+        self._finished = threading.Event()
+        self._success = False
+        self._exception = None
+        self._startTime = 0.0
+        self._endTime = 0.0
+    # endregion
+
+    # region Properties
+    @property
+    def path(self):
+        """
+        Getter method that returns the path being opened.
+
+        :rtype: str
+        """
+
+        return self._path
+
+    @property
+    def key(self):
+        """
+        Getter method that returns the file key captured when this request was made.
+
+        :rtype: Union[Tuple[str, float], None]
+        """
+
+        return self._key
+
+    @property
+    def success(self):
+        """
+        Getter method that evaluates if the file was opened successfully.
+
+        :rtype: bool
+        """
+
+        return self._success
+
+    @property
+    def exception(self):
+        """
+        Getter method that returns the exception raised while opening the file.
+
+        :rtype: Union[Exception, None]
+        """
+
+        return self._exception
+
+    @property
+    def elapsed(self):
+        """
+        Getter method that returns the number of seconds this request has been running for.
+
+        :rtype: float
+        """
+
+        endTime = self._endTime if self.isDone() else time.perf_counter()
+        return endTime - self._startTime
+    # endregion
+
+    # region Methods
+    def start(self):
+        """
+        Starts opening the file from a background thread.
+
+        :rtype: None
+        """
+
+        self._startTime = time.perf_counter()
+
+        self._thread = threading.Thread(target=self.run, name=f'OpenRequest({os.path.basename(self._path)})', daemon=True)
+        self._thread.start()
+
+    def run(self):
+        """
+        Opens the file inside the remote standalone process.
+        This method is executed by the background thread!
+
+        :rtype: None
+        """
+
+        try:
+
+            rpc.__client__.open(self._path)
+            self._success = True
+
+        except Exception as exception:
+
+            self._exception = exception
+
+        finally:
+
+            self._endTime = time.perf_counter()
+            self._finished.set()
+
+    def isDone(self):
+        """
+        Evaluates if this request has finished.
+
+        :rtype: bool
+        """
+
+        return self._finished.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Blocks until this request has finished or the timeout has expired.
+        Returns true if the request has finished.
+
+        :type timeout: Union[float, None]
+        :rtype: bool
+        """
+
+        return self._finished.wait(timeout)
+    # endregion
+
+
+def getRequest():
+    """
+    Returns the pending open request.
+
+    :rtype: Union[OpenRequest, None]
+    """
+
+    return __request__
+
+
+def getGeneration():
+    """
+    Returns the number of times the standalone scene has been replaced.
+    Any caches derived from the standalone scene can compare this value to detect a new scene!
+
+    :rtype: int
+    """
+
+    return __generation__
+
+
+def isPending():
+    """
+    Evaluates if an open request is still running.
+
+    :rtype: bool
+    """
+
+    return __request__ is not None and not __request__.isDone()
+
+
+def isOpened(path):
+    """
+    Evaluates if the supplied file is open inside the standalone process and has not changed on disk since.
+
+    :type path: str
+    :rtype: bool
+    """
+
+    key = getFileKey(path)
+    return key is not None and key == __opened__
+
+
+def markOpened(path):
+    """
+    Records that the supplied file has been opened inside the standalone process.
+
+    :type path: str
+    :rtype: None
+    """
+
+    global __opened__, __generation__
+
+    __opened__ = getFileKey(path)
+    __generation__ += 1
+
+
+def markSaved(path):
+    """
+    Records that the supplied file has been saved by the standalone process.
+    The file's new modification time should not cause the same scene to be reopened!
+
+    :type path: str
+    :rtype: None
+    """
+
+    global __opened__
+
+    if __opened__ is not None and __opened__[0] == os.path.abspath(path):
+
+        __opened__ = getFileKey(path)
+
+
+def invalidate():
+    """
+    Records that the standalone scene has been replaced by something other than an open request.
+
+    :rtype: None
+    """
+
+    global __opened__, __generation__
+
+    __opened__ = None
+    __generation__ += 1
+
+
+def openAsync(path, force=False):
+    """
+    Opens the supplied file inside the standalone process from a background thread.
+    If the file's path and modification time have not changed since it was last opened then no request is made!
+
+    :type path: str
+    :type force: bool
+    :rtype: Union[OpenRequest, None]
+    """
+
+    global __request__
+
+    # Check if file is already open
+    #
+    key = getFileKey(path)
+
+    if not force and key is not None and key == __opened__:
+
+        log.debug(f'Standalone scene is already up-to-date: {path}')
+        return None
+
+    # Check if file is already being opened
+    #
+    request = __request__
+
+    if not force and request is not None and not request.isDone() and request.key == key:
+
+        return request
+
+    # Wait for any previous request
+    # The standalone process can only open one scene at a time!
+    #
+    wait()
+
+    log.info(f'Opening standalone scene: {path}')
+    request = __request__ = OpenRequest(path, key=key)
+    request.start()
+
+    return request
+
+
+def wait(timeout=None):
+    """
+    Blocks until the pending open request has finished and records its result.
+    Returns true if there was no pending request or it opened successfully.
+
+    :type timeout: Union[float, None]
+    :rtype: bool
+    """
+
+    global __request__, __opened__, __generation__
+
+    # Check if there is a pending request
+    #
+    request = __request__
+
+    if request is None:
+
+        return True
+
+    if not request.wait(timeout):
+
+        return False
+
+    # Record request result
+    #
+    __request__ = None
+    __generation__ += 1
+
+    if request.success:
+
+        log.info(f'Opened standalone scene in {request.elapsed:.2f}s: {request.path}')
+        __opened__ = request.key
+
+    else:
+
+        log.error(f'Unable to open standalone scene: {request.path} ({request.exception})')
+        __opened__ = None
+
+    return request.success
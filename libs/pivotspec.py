@@ -54,6 +54,7 @@ class PivotSpec(abstractspec.AbstractSpec):
         """
 
         self._parentMatrix = parentMatrix
+        self.markDirty()
 
     @property
     def worldMatrix(self):
@@ -85,6 +86,7 @@ class PivotSpec(abstractspec.AbstractSpec):
         """
 
         self._shapes = shapes
+        self.markDirty()
     # endregion
 
     # region Methods
@@ -76,3 +76,55 @@ def createTransformBlends(fkJoint, ikJoint, blendJoint, name=None, blender=None)
         transformBlend.connectPlugs(blender, 'blender')
 
     return transformBlend
+
+
+def describeTransformBlends(network, fkJoint, ikJoint, blendJoint, name='', blender=None):
+    """
+    Describes the nodes needed to blend two kinematic chains inside the supplied node network.
+    See `createTransformBlends` for the equivalent method that creates the nodes immediately!
+
+    :type network: nodenetwork.NodeNetwork
+    :type fkJoint: Union[mpynode.MPyNode, None]
+    :type ikJoint: Union[mpynode.MPyNode, None]
+    :type blendJoint: mpynode.MPyNode
+    :type name: str
+    :type blender: om.MPlug
+    :rtype: nodenetwork.NetworkNode
+    """
+
+    # Describe transform blend
+    #
+    transformBlend = network.createNode('blendTransform', name=name)
+
+    # Check if FK joint is valid
+    #
+    if fkJoint is not None:
+
+        network.connectPlugs(fkJoint['translate'], transformBlend['inTranslate1'])
+        network.connectPlugs(fkJoint['rotateOrder'], transformBlend['inRotateOrder1'])
+        network.connectPlugs(fkJoint['rotate'], transformBlend['inRotate1'])
+        network.connectPlugs(fkJoint['scale'], transformBlend['inScale1'])
+
+    # Check if IK joint is valid
+    #
+    if ikJoint is not None:
+
+        network.connectPlugs(ikJoint['translate'], transformBlend['inTranslate2'])
+        network.connectPlugs(ikJoint['rotateOrder'], transformBlend['inRotateOrder2'])
+        network.connectPlugs(ikJoint['rotate'], transformBlend['inRotate2'])
+        network.connectPlugs(ikJoint['scale'], transformBlend['inScale2'])
+
+    # Connect output
+    #
+    network.connectPlugs(transformBlend['outTranslate'], blendJoint['translate'])
+    network.connectPlugs(blendJoint['rotateOrder'], transformBlend['outRotateOrder'])
+    network.connectPlugs(transformBlend['outRotate'], blendJoint['rotate'])
+    network.connectPlugs(transformBlend['outScale'], blendJoint['scale'])
+
+    # Check if blend plug was supplied
+    #
+    if isinstance(blender, om.MPlug):
+
+        network.connectPlugs(blender, transformBlend['blender'])
+
+    return transformBlend
@@ -0,0 +1,166 @@
+from enum import IntEnum
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class Operation(IntEnum):
+    """
+    Enum class of all the available skeleton edits.
+    """
+
+    CREATE = 0
+    RENAME = 1
+    REPARENT = 2
+    SET_ATTR = 3
+    DELETE = 4
+
+
+__display_attributes__ = ('side', 'type', 'otherType', 'drawStyle', 'displayLocalAxis')
+__transform_attributes__ = ('translate', 'rotate')
+
+
+def isClose(value, otherValue, tolerance=1e-3):
+    """
+    Evaluates if the supplied values are equivalent.
+    Sequences are compared element-wise!
+
+    :type value: Any
+    :type otherValue: Any
+    :type tolerance: float
+    :rtype: bool
+    """
+
+    # Evaluate value types
+    #
+    if isinstance(value, (list, tuple)) and isinstance(otherValue, (list, tuple)):
+
+        return len(value) == len(otherValue) and all(isClose(item, otherItem, tolerance=tolerance) for (item, otherItem) in zip(value, otherValue))
+
+    elif isinstance(value, float) or isinstance(otherValue, float):
+
+        try:
+
+            return abs(float(value) - float(otherValue)) <= tolerance
+
+        except (TypeError, ValueError):
+
+            return False
+
+    else:
+
+        return value == otherValue
+
+
+def expectedParentUUID(joint, joints):
+    """
+    Returns the expected parent UUID for the supplied joint description.
+
+    :type joint: Dict[str, Any]
+    :type joints: Dict[Hashable, Dict[str, Any]]
+    :rtype: str
+    """
+
+    parentKey = joint.get('parent', None)
+    parent = joints.get(parentKey, None)
+
+    if parent is not None:
+
+        return parent.get('uuid', '')
+
+    else:
+
+        return joint.get('parentUUID', '')
+
+
+def diffSkeleton(joints, snapshot, tolerance=1e-3):
+    """
+    Returns the minimal list of edits required to make the supplied snapshot match the supplied joint descriptions.
+    Joint descriptions are keyed by any hashable and consist of the following:
+        `uuid`: The UUID string of the associated export joint, or an empty string if one does not exist.
+        `enabled`: Whether the export joint should exist.
+        `name`: The expected joint name.
+        `parent`: The key of the parent description, or None if the parent is not being described.
+        `parentUUID`: The UUID string of the expected parent, or an empty string for the world.
+        Any display or transform attributes such as `side`, `type`, `translate` and `rotate`.
+    Snapshots are keyed by UUID string and consist of the `name` and `parent` UUID string plus the same attributes.
+    Each edit is returned as an `(Operation, key, value)` tuple in the same order as the supplied descriptions.
+
+    :type joints: Dict[Hashable, Dict[str, Any]]
+    :type snapshot: Dict[str, Dict[str, Any]]
+    :type tolerance: float
+    :rtype: List[Tuple[Operation, Hashable, Any]]
+    """
+
+    operations = []
+
+    for (key, joint) in joints.items():
+
+        # Check if export joint exists
+        #
+        uuid = joint.get('uuid', '')
+        current = snapshot.get(uuid, None) if uuid else None
+        exists = current is not None
+
+        if not joint.get('enabled', True):
+
+            if exists:
+
+                operations.append((Operation.DELETE, key, None))
+
+            continue
+
+        # Check if export joint requires creating
+        # If so, go ahead and emit every attribute since there is nothing to compare against!
+        #
+        if not exists:
+
+            parentKey = joint.get('parent', None)
+            operations.append((Operation.CREATE, key, parentKey if parentKey in joints else joint.get('parentUUID', '')))
+
+            for attribute in __display_attributes__ + __transform_attributes__:
+
+                if attribute in joint:
+
+                    operations.append((Operation.SET_ATTR, key, (attribute, joint[attribute])))
+
+            continue
+
+        # Check if export joint requires renaming
+        #
+        name = joint.get('name', '')
+
+        if name and name != current.get('name', ''):
+
+            operations.append((Operation.RENAME, key, name))
+
+        # Check if export joint requires reparenting
+        # Parents that have yet to be created will never match the current parent!
+        #
+        parentKey = joint.get('parent', None)
+        parentUUID = expectedParentUUID(joint, joints)
+        isPending = parentKey in joints and joints[parentKey].get('enabled', True) and not parentUUID
+        isReparented = isPending or (parentUUID != current.get('parent', ''))
+
+        if isReparented:
+
+            operations.append((Operation.REPARENT, key, parentKey if parentKey in joints else parentUUID))
+
+        # Check if any attributes require updating
+        # Reparenting will always require the local transform to be reasserted!
+        #
+        for attribute in __display_attributes__:
+
+            if attribute in joint and not isClose(joint[attribute], current.get(attribute, None), tolerance=tolerance):
+
+                operations.append((Operation.SET_ATTR, key, (attribute, joint[attribute])))
+
+        for attribute in __transform_attributes__:
+
+            if attribute in joint and (isReparented or not isClose(joint[attribute], current.get(attribute, None), tolerance=tolerance)):
+
+                operations.append((Operation.SET_ATTR, key, (attribute, joint[attribute])))
+
+    return operations
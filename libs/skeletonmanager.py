@@ -1,12 +1,16 @@
 import os
 import math
+import xmlrpc.client
 
-from mpy import mpyscene, mpynode
+from contextlib import contextmanager
+from maya import cmds as mc
 from maya.api import OpenMaya as om
+from mpy import mpyscene, mpynode
 from dcc.maya.libs import dagutils
 from dcc.maya.standalone import rpc
 from dcc.python import stringutils
 from dcc.decorators.classproperty import classproperty
+from . import skeletontransaction, skeletondiff, nodenetwork, driverspec, openrequest
 
 import logging
 logging.basicConfig()
@@ -20,7 +24,8 @@ class SkeletonManager(object):
     """
 
     # region Dunderscores
-    __slots__ = ('_scene', '_controlRig', '_referenceNode',)
+    __slots__ = ('__weakref__', '_scene', '_controlRig', '_referenceNode', '_transaction', '_nodePaths', '_saveDepth', '_isSavePending', '_sceneGeneration', '_unbatchedClient')
+    __attribute_types__ = {'otherType': 'string'}
 
     def __init__(self, controlRig, referenceNode=None):
         """
@@ -38,6 +43,12 @@ class SkeletonManager(object):
         self._scene = mpyscene.MPyScene.getInstance(asWeakReference=True)
         self._controlRig = controlRig.weakReference()
         self._referenceNode = self.nullWeakReference
+        self._transaction = None
+        self._nodePaths = None
+        self._saveDepth = 0
+        self._isSavePending = False
+        self._sceneGeneration = openrequest.getGeneration()
+        self._unbatchedClient = None
 
         # Check if a reference node was supplied
         #
@@ -101,14 +112,124 @@ class SkeletonManager(object):
     def referencedScene(self):
         """
         Getter method that returns the referenced scene interface.
+        Any pending open request is waited on first, the client cannot be shared with the background thread!
 
         :rtype: rpc.RPCClient
         """
 
+        openrequest.wait()
+
         return rpc.__client__
+
+    @property
+    def isInTransaction(self):
+        """
+        Getter method that evaluates if referenced skeleton edits are currently being batched.
+
+        :rtype: bool
+        """
+
+        return self.isFromReferencedFile and self._transaction is not None and self._transaction.isActive
+
+    @property
+    def isSaveDeferred(self):
+        """
+        Getter method that evaluates if save requests are currently being deferred.
+
+        :rtype: bool
+        """
+
+        return self._saveDepth > 0
     # endregion
 
     # region Methods
+    @staticmethod
+    def decomposeMatrix(matrix):
+        """
+        Returns the translation and euler rotation, in degrees, from the supplied transformation matrix.
+
+        :type matrix: om.MTransformationMatrix
+        :rtype: Tuple[Tuple[float, float, float], Tuple[float, float, float]]
+        """
+
+        translation = matrix.translation(om.MSpace.kTransform)
+        rotateOrder = matrix.rotationOrder() - 1
+        eulerRotation = matrix.rotation(asQuaternion=False)
+        eulerRotation.reorderIt(rotateOrder)
+
+        return tuple(translation), tuple(map(math.degrees, eulerRotation))
+
+    def transaction(self):
+        """
+        Returns a context manager that batches any referenced skeleton edits until the outermost scope exits.
+        Transactions are re-entrant so nested scopes will only commit once!
+
+        :rtype: skeletontransaction.SkeletonTransaction
+        """
+
+        if self._transaction is None:
+
+            self._transaction = skeletontransaction.SkeletonTransaction(self)
+
+        return self._transaction
+
+    def executeBatch(self, commands):
+        """
+        Executes the supplied commands inside the standalone process and returns their results in order.
+        The commands are sent as a single `system.multicall` payload, XML-RPC has no keyword arguments so these are appended as a trailing struct!
+        If the standalone server does not support multicalls then the commands are sent individually until the client is replaced.
+
+        :type commands: List[Tuple[str, Tuple[Any], Dict[str, Any]]]
+        :rtype: List[Any]
+        """
+
+        # Check if there are any commands
+        #
+        numCommands = len(commands)
+
+        if numCommands == 0:
+
+            return []
+
+        # Check if batched commands are supported by this client
+        #
+        client = self.referencedScene
+
+        if client is not self._unbatchedClient:
+
+            multicall = xmlrpc.client.MultiCall(client)
+
+            for (name, args, kwargs) in commands:
+
+                if len(kwargs) > 0:
+
+                    getattr(multicall, name)(*args, kwargs)
+
+                else:
+
+                    getattr(multicall, name)(*args)
+
+            try:
+
+                results = multicall()
+
+            except xmlrpc.client.Fault as exception:
+
+                if 'multicall' not in exception.faultString:
+
+                    raise
+
+                log.warning('Standalone server does not support batched commands, reverting to individual calls!')
+                self._unbatchedClient = client
+
+            else:
+
+                return list(results)  # Any failed commands are raised as faults while iterating!
+
+        # Execute commands individually
+        #
+        return [getattr(client, name)(*args, **kwargs) for (name, args, kwargs) in commands]
+
     def prepare(self):
         """
         Notifies the manager to prepare to build joints.
@@ -122,22 +243,36 @@ class SkeletonManager(object):
 
             return
 
-        # Check if referenced skeleton is already open
+        # Wait for any pending open request
         #
         referencePath = os.path.abspath(self.referenceNode.filePath())
-        currentPath = os.path.abspath(self.referencedScene.file(query=True, sceneName=True))
+        openrequest.wait()
 
-        isOpen = (referencePath == currentPath)
+        # Check if referenced skeleton is already open
+        # The path and modification time are compared so no queries are sent to the standalone process!
+        #
+        isOpen = openrequest.isOpened(referencePath)
 
         if not isOpen:
 
             log.info(f'Opening referenced skeleton: {referencePath}')
             self.referencedScene.open(referencePath)
 
+            openrequest.markOpened(referencePath)
+
         else:
 
             log.debug(f'Referenced skeleton is already open...')
 
+        # Check if the standalone scene has been replaced
+        #
+        generation = openrequest.getGeneration()
+
+        if generation != self._sceneGeneration:
+
+            self.invalidateNodePaths()
+            self._sceneGeneration = generation
+
     def load(self, clearEdits=False, force=False):
         """
         Loads the referenced skeleton.
@@ -193,17 +328,221 @@ class SkeletonManager(object):
 
             self.referenceNode.clearEdits()
 
+    def clearJointEdits(self, skeletonSpecs, editCommand='setAttr'):
+        """
+        Removes any reference edits, of the supplied command type, from the joints associated with the supplied skeleton specs.
+        Unlike `clearEdits`, edits on any other referenced nodes are left untouched!
+        Edits can only be removed while the reference is unloaded so the skeleton should be reloaded afterward.
+
+        :type skeletonSpecs: List[skeletonspec.SkeletonSpec]
+        :type editCommand: str
+        :rtype: None
+        """
+
+        # Check if skeleton was referenced
+        #
+        if not self.isFromReferencedFile:
+
+            return
+
+        # Collect edited joints
+        # Edit targets are compared by their short names since they are stored as namespaced paths!
+        #
+        referenceNodeName = self.referenceNode.name()
+        jointNames = set([skeletonSpec.name for skeletonSpec in skeletonSpecs])
+
+        editNodes = mc.referenceQuery(referenceNodeName, editNodes=True, editCommand=editCommand, failedEdits=True, successfulEdits=True) or []
+        editNodes = [editNode for editNode in set(editNodes) if editNode.split('|')[-1].split(':')[-1] in jointNames]
+
+        if len(editNodes) == 0:
+
+            return
+
+        # Remove edits from unloaded reference
+        #
+        if self.referenceNode.isLoaded():
+
+            self.referenceNode.unload()
+
+        for editNode in editNodes:
+
+            mc.referenceEdit(editNode, editCommand=editCommand, failedEdits=True, successfulEdits=True, removeEdits=True)
+
+        log.debug(f'Removed "{editCommand}" edits from {len(editNodes)} joint(s).')
+
+    @contextmanager
+    def deferSave(self):
+        """
+        Returns a context manager that collects any save requests until the outermost scope exits.
+        The referenced skeleton is then saved once, and only if a save was requested!
+
+        :rtype: Iterator[None]
+        """
+
+        self._saveDepth += 1
+
+        try:
+
+            yield
+
+        finally:
+
+            self._saveDepth -= 1
+
+            if self._saveDepth == 0 and self._isSavePending:
+
+                self._isSavePending = False
+                self.save()
+
     def save(self):
         """
         Saves any changes made by the manager.
+        Any requests made inside a deferred save scope, or an open transaction, are postponed!
 
         :rtype: None
         """
 
-        if self.isFromReferencedFile:
+        # Check if skeleton was referenced
+        #
+        if not self.isFromReferencedFile:
+
+            return
+
+        # Check if save should be postponed
+        #
+        if self.isInTransaction:
+
+            self._transaction.requestSave()
 
+        elif self.isSaveDeferred:
+
+            log.debug('Deferring referenced skeleton save...')
+            self._isSavePending = True
+
+        else:
+
+            log.info('Saving referenced skeleton...')
             self.referencedScene.save()
 
+            openrequest.markSaved(self.referenceNode.filePath())
+
+    def invalidateNodePaths(self):
+        """
+        Invalidates the internal UUID to path cache.
+        The cache will be rebuilt upon the next lookup!
+
+        :rtype: None
+        """
+
+        self._nodePaths = None
+
+    def cacheNodePaths(self, force=False):
+        """
+        Returns the internal UUID to path cache for the referenced skeleton.
+        If the cache is empty then all the joints are collected in a single batch!
+
+        :type force: bool
+        :rtype: Dict[str, str]
+        """
+
+        # Check if cache already exists
+        #
+        if self._nodePaths is not None and not force:
+
+            return self._nodePaths
+
+        # Check if skeleton was referenced
+        #
+        if not self.isFromReferencedFile:
+
+            return {}
+
+        # Collect paths and UUIDs from referenced joints
+        # Both queries share the same filters so their results are returned in the same order!
+        #
+        paths, uuids = self.executeBatch(
+            [
+                ('ls', (), {'type': 'joint', 'long': True}),
+                ('ls', (), {'type': 'joint', 'uuid': True})
+            ]
+        )
+
+        paths = paths if not stringutils.isNullOrEmpty(paths) else []
+        uuids = uuids if not stringutils.isNullOrEmpty(uuids) else []
+
+        self._nodePaths = dict(zip(uuids, paths))
+
+        return self._nodePaths
+
+    def getCachedPath(self, uuid):
+        """
+        Returns the cached path for the supplied UUID string.
+
+        :type uuid: str
+        :rtype: str
+        """
+
+        return self.cacheNodePaths().get(uuid, '')
+
+    def addCachedPath(self, uuid, path):
+        """
+        Adds the supplied UUID string and path to the internal cache.
+
+        :type uuid: str
+        :type path: str
+        :rtype: None
+        """
+
+        self.cacheNodePaths()[uuid] = path
+
+    def updateCachedPath(self, oldPath, newPath):
+        """
+        Updates the supplied path, and any descendants, inside the internal cache.
+        Supplying an empty path will remove the node and its descendants from the cache!
+
+        :type oldPath: str
+        :type newPath: str
+        :rtype: None
+        """
+
+        # Check if paths are different
+        #
+        if oldPath == newPath or stringutils.isNullOrEmpty(oldPath):
+
+            return
+
+        # Iterate through cached paths
+        #
+        nodePaths = self.cacheNodePaths()
+        prefix = f'{oldPath}|'
+        isRemoved = stringutils.isNullOrEmpty(newPath)
+
+        for (uuid, path) in tuple(nodePaths.items()):
+
+            # Check if path is derived from old path
+            #
+            if path == oldPath:
+
+                suffix = ''
+
+            elif path.startswith(prefix):
+
+                suffix = path[len(oldPath):]
+
+            else:
+
+                continue
+
+            # Update cached path
+            #
+            if isRemoved:
+
+                del nodePaths[uuid]
+
+            else:
+
+                nodePaths[uuid] = f'{newPath}{suffix}'
+
     def getNodeNameByUUID(self, uuid, long=False):
         """
         Returns the name of the node associated with the supplied UUID.
@@ -225,15 +564,15 @@ class SkeletonManager(object):
         #
         if self.isFromReferencedFile:
 
-            nodes = self.referencedScene.ls(uuid.asString(), long=long)
+            path = self.getCachedPath(uuid.asString())
 
-            if not stringutils.isNullOrEmpty(nodes):
+            if long:
 
-                return nodes[0]
+                return path
 
             else:
 
-                return ''
+                return path.rpartition('|')[-1]
 
         else:
 
@@ -267,7 +606,7 @@ class SkeletonManager(object):
         #
         if self.isFromReferencedFile:
 
-            return self.referencedScene.doesNodeExist(uuid.asString())
+            return not stringutils.isNullOrEmpty(self.getCachedPath(uuid.asString()))
 
         else:
 
@@ -292,15 +631,19 @@ class SkeletonManager(object):
 
                 kwargs['name'] = name
 
-            if parent.valid():
+            parentPath = self.getNodeNameByUUID(parent, long=True)
+
+            if not stringutils.isNullOrEmpty(parentPath):
 
-                kwargs['parent'] = self.getNodeNameByUUID(parent, long=True)
+                kwargs['parent'] = parentPath
 
             # Create new export joint
             #
             log.info(f'Creating "{name}" export joint!')
             name, uuid = self.referencedScene.createNode('joint', **kwargs)
 
+            self.addCachedPath(uuid, f'{parentPath}|{name}')
+
             return name, uuid
 
         else:
@@ -321,14 +664,22 @@ class SkeletonManager(object):
         :rtype: str
         """
 
-        if self.isFromReferencedFile:
+        if self.isInTransaction:
+
+            self._transaction.rename(uuid, name)
+            return name
+
+        elif self.isFromReferencedFile:
 
             fullPathName = self.getNodeNameByUUID(uuid, long=True)
             currentName = dagutils.stripAll(fullPathName)
 
             if currentName != name and not stringutils.isNullOrEmpty(name):
 
-                return self.referencedScene.renameNode(currentName, name)
+                newName = self.referencedScene.renameNode(fullPathName, name)
+                self.updateCachedPath(fullPathName, f'{fullPathName.rpartition("|")[0]}|{newName}')
+
+                return newName
 
             else:
 
@@ -357,13 +708,16 @@ class SkeletonManager(object):
         :rtype: None
         """
 
-        if self.isFromReferencedFile:
+        if self.isInTransaction:
+
+            self._transaction.reparent(childUUID, parentUUID, absolute=absolute)
+
+        elif self.isFromReferencedFile:
 
             child = self.getNodeNameByUUID(childUUID, long=True)
             parent = self.getNodeNameByUUID(parentUUID, long=True)
 
-            currentParents = self.referencedScene.listRelatives(child, parent=True, fullPath=True)
-            currentParent = currentParents[0] if not stringutils.isNullOrEmpty(currentParents) else ''
+            currentParent = child.rpartition('|')[0]
 
             if currentParent == parent:
 
@@ -379,6 +733,8 @@ class SkeletonManager(object):
 
                 self.referencedScene.parentNode(child, parent, relative=True)
 
+            self.updateCachedPath(child, f'{parent}|{child.rpartition("|")[-1]}')
+
             child = self.getNodeNameByUUID(childUUID, long=True)
             self.referencedScene.xform(child, matrix=matrix, worldSpace=True)
 
@@ -400,19 +756,29 @@ class SkeletonManager(object):
         :rtype: None
         """
 
-        if self.isFromReferencedFile:
+        if self.isInTransaction:
+
+            self._transaction.delete(uuid, absolute=absolute)
+
+        elif self.isFromReferencedFile:
 
             fullPathName = self.getNodeNameByUUID(uuid, long=True)
             name = dagutils.stripAll(fullPathName)
-            children = self.referencedScene.listRelatives(fullPathName, children=True, path=True)
+            children = self.referencedScene.listRelatives(fullPathName, children=True, fullPath=True)
 
             if not stringutils.isNullOrEmpty(children):
 
                 self.referencedScene.parentNode(*children, world=True, absolute=absolute)
 
+                for child in children:
+
+                    self.updateCachedPath(child, f'|{child.rpartition("|")[-1]}')
+
             log.info(f'Deleting "{name}" export joint!')
             self.referencedScene.deleteNode(fullPathName)
 
+            self.updateCachedPath(fullPathName, '')
+
         else:
 
             joint = self.scene(uuid)
@@ -434,6 +800,14 @@ class SkeletonManager(object):
         :rtype: None
         """
 
+        # Check if edits are being batched
+        # If so, go ahead and defer the synchronization until the transaction is committed
+        #
+        if self.isInTransaction:
+
+            self._transaction.sync(skeletonSpec, **kwargs)
+            return skeletonSpec
+
         # Check if skeleton spec is enabled
         #
         if skeletonSpec.enabled:
@@ -482,13 +856,10 @@ class SkeletonManager(object):
 
                 # Update transformation matrix
                 #
-                translation = skeletonSpec.matrix.translation(om.MSpace.kTransform)
-                rotateOrder = skeletonSpec.matrix.rotationOrder() - 1
-                eulerRotation = skeletonSpec.matrix.rotation(asQuaternion=False)
-                eulerRotation.reorderIt(rotateOrder)
+                translation, rotation = self.decomposeMatrix(skeletonSpec.matrix)
 
-                self.referencedScene.setAttr(f'{name}.translate', *tuple(translation), type='double3')
-                self.referencedScene.setAttr(f'{name}.rotate', *tuple(map(math.degrees, eulerRotation)), type='double3')
+                self.referencedScene.setAttr(f'{fullPathName}.translate', *translation, type='double3')
+                self.referencedScene.setAttr(f'{fullPathName}.rotate', *rotation, type='double3')
 
             else:
 
@@ -520,6 +891,273 @@ class SkeletonManager(object):
 
         return skeletonSpec
 
+    def snapshotJoints(self, uuids=None):
+        """
+        Returns a snapshot of the export joints associated with the supplied UUIDs.
+        If no UUIDs are supplied then every joint is included.
+        Referenced joints are collected in a single batch!
+
+        :type uuids: Union[List[om.MUuid], None]
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+
+        # Evaluate skeleton type
+        #
+        snapshot = {}
+
+        if self.isFromReferencedFile:
+
+            # Collect paths from UUIDs
+            #
+            nodePaths = self.cacheNodePaths()
+            uuids = [uuid.asString() for uuid in uuids if uuid.valid()] if uuids is not None else list(nodePaths.keys())
+            uuids = [uuid for uuid in uuids if not stringutils.isNullOrEmpty(nodePaths.get(uuid, ''))]
+            parents = {path: uuid for (uuid, path) in nodePaths.items()}
+
+            # Query attributes from paths
+            #
+            attributes = skeletondiff.__display_attributes__ + skeletondiff.__transform_attributes__
+            commands = [('getAttr', (f'{nodePaths[uuid]}.{attribute}',), {}) for uuid in uuids for attribute in attributes]
+            results = iter(self.executeBatch(commands))
+
+            for uuid in uuids:
+
+                path = nodePaths[uuid]
+                joint = {'name': path.rpartition('|')[-1], 'parent': parents.get(path.rpartition('|')[0], '')}
+
+                for attribute in attributes:
+
+                    value = next(results)
+
+                    if isinstance(value, (list, tuple)):
+
+                        value = tuple(value[0]) if (len(value) == 1 and isinstance(value[0], (list, tuple))) else tuple(value)
+
+                    joint[attribute] = value
+
+                snapshot[uuid] = joint
+
+        else:
+
+            # Iterate through UUIDs
+            #
+            uuids = uuids if uuids is not None else [joint.uuid() for joint in self.scene.iterNodesByApiType(om.MFn.kJoint)]
+
+            for uuid in uuids:
+
+                # Check if node exists
+                #
+                if not self.scene.doesNodeExist(uuid):
+
+                    continue
+
+                # Collect node properties
+                #
+                node = self.scene.getNodeByUuid(uuid)
+                parent = node.parent()
+                translation, rotation = self.decomposeMatrix(node.matrix(asTransformationMatrix=True))
+
+                snapshot[uuid.asString()] = {
+                    'name': node.name(),
+                    'parent': parent.uuid().asString() if parent is not None else '',
+                    'side': node.getAttr('side'),
+                    'type': node.getAttr('type'),
+                    'otherType': node.getAttr('otherType'),
+                    'drawStyle': node.getAttr('drawStyle'),
+                    'displayLocalAxis': node.getAttr('displayLocalAxis'),
+                    'translate': translation,
+                    'rotate': rotation
+                }
+
+        return snapshot
+
+    def describeJoints(self, skeletonSpecs, **kwargs):
+        """
+        Returns a dictionary of joint descriptions from the supplied skeleton specs.
+        Each description is keyed by the spec's index!
+
+        :type skeletonSpecs: List[skeletonspec.SkeletonSpec]
+        :key displayLocalAxis: bool
+        :rtype: Dict[int, Dict[str, Any]]
+        """
+
+        indices = {id(skeletonSpec): i for (i, skeletonSpec) in enumerate(skeletonSpecs)}
+        joints = {}
+
+        for (i, skeletonSpec) in enumerate(skeletonSpecs):
+
+            parent = skeletonSpec.parent
+            parentUUID = getattr(parent, 'uuid', om.MUuid())
+            translation, rotation = self.decomposeMatrix(skeletonSpec.matrix)
+
+            joints[i] = {
+                'uuid': skeletonSpec.uuid.asString() if skeletonSpec.uuid.valid() else '',
+                'enabled': skeletonSpec.enabled,
+                'name': skeletonSpec.name,
+                'parent': indices.get(id(parent), None),
+                'parentUUID': parentUUID.asString() if parentUUID.valid() else '',
+                'side': skeletonSpec.side.value,
+                'type': skeletonSpec.type.value,
+                'otherType': skeletonSpec.otherType,
+                'drawStyle': skeletonSpec.drawStyle.value,
+                'displayLocalAxis': kwargs.get('displayLocalAxis', True),
+                'translate': translation,
+                'rotate': rotation
+            }
+
+        return joints
+
+    def syncJoints(self, skeletonSpecs, **kwargs):
+        """
+        Synchronizes the joints associated with the supplied skeleton specs.
+        Unlike `syncJoint`, only the edits required to match the current export skeleton are made!
+
+        :type skeletonSpecs: List[skeletonspec.SkeletonSpec]
+        :key displayLocalAxis: bool
+        :rtype: List[Tuple[skeletondiff.Operation, int, Any]]
+        """
+
+        # Compare skeleton specs against the current export skeleton
+        #
+        snapshot = self.snapshotJoints([skeletonSpec.uuid for skeletonSpec in skeletonSpecs])
+        joints = self.describeJoints(skeletonSpecs, **kwargs)
+        operations = skeletondiff.diffSkeleton(joints, snapshot)
+
+        numOperations = len(operations)
+
+        if numOperations == 0:
+
+            log.debug('Export skeleton is already up-to-date!')
+            return operations
+
+        # Apply edits
+        #
+        if self.isFromReferencedFile:
+
+            with self.transaction() as transaction:
+
+                self.applyJointOperations(operations, skeletonSpecs, transaction=transaction)
+
+        else:
+
+            self.applyJointOperations(operations, skeletonSpecs)
+
+        return operations
+
+    def applyJointOperations(self, operations, skeletonSpecs, transaction=None):
+        """
+        Applies the supplied edits to the joints associated with the supplied skeleton specs.
+        If a transaction is supplied then the edits are queued instead!
+
+        :type operations: List[Tuple[skeletondiff.Operation, int, Any]]
+        :type skeletonSpecs: List[skeletonspec.SkeletonSpec]
+        :type transaction: Union[skeletontransaction.SkeletonTransaction, None]
+        :rtype: None
+        """
+
+        transformed = set()
+
+        for (operation, key, value) in operations:
+
+            # Evaluate operation target
+            #
+            skeletonSpec = skeletonSpecs[key]
+
+            if operation in (skeletondiff.Operation.CREATE, skeletondiff.Operation.REPARENT):
+
+                if isinstance(value, int):
+
+                    value = skeletonSpecs[value] if transaction is not None else skeletonSpecs[value].uuid
+
+                else:
+
+                    value = value if transaction is not None else om.MUuid(value) if not stringutils.isNullOrEmpty(value) else om.MUuid()
+
+            # Evaluate operation type
+            #
+            if operation == skeletondiff.Operation.CREATE:
+
+                if transaction is not None:
+
+                    transaction.create(skeletonSpec, parent=value or None)
+
+                else:
+
+                    skeletonSpec.name, skeletonSpec.uuid = self.createJoint(skeletonSpec.name, parent=value)
+
+            elif operation == skeletondiff.Operation.RENAME:
+
+                if transaction is not None:
+
+                    transaction.rename(skeletonSpec, value)
+
+                else:
+
+                    skeletonSpec.name = self.renameJoint(skeletonSpec.uuid, value)
+
+            elif operation == skeletondiff.Operation.REPARENT:
+
+                if transaction is not None:
+
+                    transaction.reparent(skeletonSpec, value or None, absolute=True)
+
+                else:
+
+                    self.parentJoint(skeletonSpec.uuid, value, absolute=True)
+
+            elif operation == skeletondiff.Operation.SET_ATTR:
+
+                attribute, value = value
+
+                if attribute in skeletondiff.__transform_attributes__:
+
+                    # Check if the local transform has already been written
+                    # The spec matrix contains both the translation and rotation so each joint only requires a single write!
+                    #
+                    if key in transformed:
+
+                        continue
+
+                    transformed.add(key)
+
+                    if transaction is not None:
+
+                        translation, rotation = self.decomposeMatrix(skeletonSpec.matrix)
+                        transaction.setTransform(skeletonSpec, translation, rotation)
+
+                    else:
+
+                        self.scene.getNodeByUuid(skeletonSpec.uuid).setMatrix(skeletonSpec.matrix, skipScale=True)
+
+                else:
+
+                    attributeType = self.__attribute_types__.get(attribute, None)
+                    args = value if isinstance(value, tuple) else (value,)
+                    kwargs = {'type': attributeType} if attributeType is not None else {}
+
+                    if transaction is not None:
+
+                        transaction.setAttr(skeletonSpec, attribute, *args, **kwargs)
+
+                    else:
+
+                        self.scene.getNodeByUuid(skeletonSpec.uuid).setAttr(attribute, value)
+
+            elif operation == skeletondiff.Operation.DELETE:
+
+                if transaction is not None:
+
+                    transaction.delete(skeletonSpec, absolute=True)
+
+                else:
+
+                    self.deleteJoint(skeletonSpec.uuid)
+                    del skeletonSpec.uuid
+
+            else:
+
+                continue
+
     def cacheJoint(self, skeletonSpec, **kwargs):
         """
         Caches the transformation matrix for the supplied skeleton spec.
@@ -548,6 +1186,22 @@ class SkeletonManager(object):
 
             return True
 
+        # Check if edits are being batched
+        # If so, go ahead and defer the transform update until the transaction is committed
+        #
+        if self.isInTransaction:
+
+            translation, rotation = self.decomposeMatrix(skeletonSpec.matrix)
+
+            self._transaction.setAttr(skeletonSpec, 'translate', *translation, type='double3')
+            self._transaction.setAttr(skeletonSpec, 'rotate', *rotation, type='double3')
+
+            if kwargs.get('save', False):
+
+                self._transaction.requestSave()
+
+            return True
+
         # Check if referenced export joint exists
         #
         fullPathName = self.getNodeNameByUUID(skeletonSpec.uuid, long=True)
@@ -556,13 +1210,10 @@ class SkeletonManager(object):
 
             # Update transform attributes
             #
-            translation = skeletonSpec.matrix.translation(om.MSpace.kTransform)
-            rotateOrder = skeletonSpec.matrix.rotationOrder() - 1
-            eulerRotation = skeletonSpec.matrix.rotation(asQuaternion=False)
-            eulerRotation.reorderIt(rotateOrder)
+            translation, rotation = self.decomposeMatrix(skeletonSpec.matrix)
 
-            self.referencedScene.setAttr(f'{fullPathName}.translate', *tuple(translation), type='double3')
-            self.referencedScene.setAttr(f'{fullPathName}.rotate', *tuple(map(math.degrees, eulerRotation)), type='double3')
+            self.referencedScene.setAttr(f'{fullPathName}.translate', *translation, type='double3')
+            self.referencedScene.setAttr(f'{fullPathName}.rotate', *rotation, type='double3')
 
             # Check if changes require saving
             #
@@ -588,6 +1239,25 @@ class SkeletonManager(object):
         :rtype: None
         """
 
+        # Check if edits are being batched
+        # If so, go ahead and defer the deletions until the transaction is committed
+        #
+        if self.isInTransaction:
+
+            while len(queue) > 0:
+
+                skeletonSpec = queue.pop()
+
+                if skeletonSpec.uuid.valid():
+
+                    self._transaction.delete(skeletonSpec, absolute=True)
+
+            if save:
+
+                self._transaction.requestSave()
+
+            return
+
         # Iterate through queue
         #
         while len(queue) > 0:
@@ -616,9 +1286,9 @@ class SkeletonManager(object):
 
         # Check if changes require saving
         #
-        if save and self.isFromReferencedFile:
+        if save:
 
-            self.referencedScene.save()
+            self.save()
 
     def bindJoint(self, skeletonSpec):
         """
@@ -645,6 +1315,157 @@ class SkeletonManager(object):
 
             self.resetJoint(skeletonSpec)
 
+    def getDriverPolicy(self):
+        """
+        Returns the driver policy from the associated control rig.
+        Control rigs that predate driver policies use the default policy!
+
+        :rtype: driverspec.DriverPolicy
+        """
+
+        controlRig = self.controlRig
+
+        if controlRig is not None and controlRig.hasAttr('driverPolicy'):
+
+            return driverspec.DriverPolicy(controlRig.driverPolicy)
+
+        else:
+
+            return driverspec.DriverPolicy.DEFAULT
+
+    def bindJoints(self, skeletonSpecs, policy=None):
+        """
+        Binds the export joints, associated with the supplied skeleton specs, to their drivers in a single pass.
+        Drivers are resolved once and any matrix connections are committed using a single modifier!
+        Constraint drivers have their matrix networks removed via the same modifier, after which all constraints are added in one pass.
+        This is the only rig-wide binding path, `BaseComponent.bindSkeleton` forwards here as well.
+        Under the matrix policy, any constraint drivers are replaced by a matrix network that drives the `offsetParentMatrix` instead.
+        If no policy is supplied then the control rig's policy is used.
+
+        :type skeletonSpecs: List[skeletonspec.SkeletonSpec]
+        :type policy: Union[driverspec.DriverPolicy, None]
+        :rtype: driverspec.BindReport
+        """
+
+        # Resolve driver/driven pairs
+        #
+        drivers = {}
+        pairs = [(skeletonSpec.driver, *skeletonSpec.driver.resolve(referenceNode=self.referenceNode, drivers=drivers)) for skeletonSpec in skeletonSpecs]
+
+        policy = self.getDriverPolicy() if policy is None else driverspec.DriverPolicy(policy)
+        isMatrixPolicy = policy == driverspec.DriverPolicy.MATRIX
+
+        # Bind driven nodes
+        #
+        modifier = om.MDGModifier()
+        network = nodenetwork.NodeNetwork()
+        report = driverspec.BindReport()
+        constraints = []
+
+        for (driver, drivenNode, driverNode) in pairs:
+
+            # Check if driver and driven exist
+            #
+            name = getattr(driver.driven, 'name', driver.name)
+
+            if not (isinstance(drivenNode, mpynode.MPyNode) and isinstance(driverNode, mpynode.MPyNode)):
+
+                report.failed.append((name, f'unable to resolve "{driver.namespace}:{driver.name}"'))
+                continue
+
+            # Evaluate driver policy
+            #
+            isEligible = isMatrixPolicy and driver.type == driver.Type.CONSTRAINT
+
+            if isEligible and drivenNode.hasAttr('offsetParentMatrix'):
+
+                drivenNode.removeConstraints()
+                driver.removeMatrixNetwork(drivenNode, modifier=modifier)
+
+                isComposed = driver.describeMatrixNetwork(network, drivenNode, driverNode)
+                (report.composed if isComposed else report.matrix).append(name)
+
+            else:
+
+                if isEligible:
+
+                    report.constrained.append((name, f'"{drivenNode.name()}" has no offsetParentMatrix'))
+
+                if driver.type == driver.Type.CONSTRAINT:
+
+                    # Defer constraint until any matrix networks are removed
+                    #
+                    drivenNode.removeConstraints()
+                    drivenNode.unfreezePivots()
+                    driver.removeMatrixNetwork(drivenNode, modifier=modifier)
+
+                    constraints.append((driver, drivenNode, driverNode))
+
+                else:
+
+                    driver.bindNodes(drivenNode, driverNode, modifier=modifier)
+
+        modifier.doIt()
+
+        # Add deferred constraints
+        # The offset parent matrices have been reset by now so any maintained offsets are evaluated correctly!
+        #
+        for (driver, drivenNode, driverNode) in constraints:
+
+            driver.constrainNode(drivenNode, driverNode)
+
+        # Commit matrix networks
+        #
+        if len(network) > 0:
+
+            nodes = self.controlRig.findRootComponent().commitNetwork(network)
+            driverspec.DriverSpec.tagMatrixNetwork(nodes)
+
+        if isMatrixPolicy or len(report.failed) > 0:
+
+            report.log()
+
+        log.debug(f'Bound {len(pairs)} export joint(s) to {len(drivers)} driver(s).')
+        return report
+
+    def unbindJoints(self, skeletonSpecs, reset=False):
+        """
+        Unbinds the export joints, associated with the supplied skeleton specs, from their drivers in a single pass.
+        Any matrix connections are broken using a single modifier before the driven matrices are reassigned!
+
+        :type skeletonSpecs: List[skeletonspec.SkeletonSpec]
+        :type reset: bool
+        :rtype: None
+        """
+
+        # Resolve driven nodes
+        #
+        pairs = [(skeletonSpec, skeletonSpec.driver.getDriven(referenceNode=self.referenceNode)) for skeletonSpec in skeletonSpecs]
+
+        # Unbind driven nodes
+        #
+        modifier = om.MDGModifier()
+
+        for (skeletonSpec, drivenNode) in pairs:
+
+            skeletonSpec.driver.unbindNode(drivenNode, modifier=modifier)
+
+        modifier.doIt()
+
+        # Reassign driven matrices
+        #
+        for (skeletonSpec, drivenNode) in pairs:
+
+            if drivenNode is None:
+
+                continue
+
+            skeletonSpec.driver.resetNode(drivenNode)
+
+            if reset:
+
+                self.resetJoint(skeletonSpec)
+
     def resetJoint(self, skeletonSpec):
         """
         Resets the transformation matrix on the joint associated with the supplied skeleton spec.
@@ -1,6 +1,6 @@
 from maya.api import OpenMaya as om
 from dcc.vendor.six import string_types
-from . import Side, Type, Style
+from . import Side, Type, Style, buildsession, specindex
 from ..abstract import abstractspec
 
 import logging
@@ -93,6 +93,10 @@ class SkeletonSpec(abstractspec.AbstractSpec):
         """
 
         self._passthrough = passthrough
+        self.markDirty()
+        self.invalidateFlattened()
+
+        buildsession.invalidate(self.component)
 
     @property
     def side(self):
@@ -114,7 +118,10 @@ class SkeletonSpec(abstractspec.AbstractSpec):
         """
 
         self._side = Side(side)
-        self._driver.maintainOffset = (self._side == Side.RIGHT)
+        self.markDirty()
+        self.driver.maintainOffset = (self._side == Side.RIGHT)  # Only right-side specs need to allocate a driver!
+
+        specindex.invalidate(self.component)
 
     @property
     def type(self):
@@ -136,6 +143,9 @@ class SkeletonSpec(abstractspec.AbstractSpec):
         """
 
         self._type = Type(type)
+        self.markDirty()
+
+        specindex.invalidate(self.component)
 
     @property
     def otherType(self):
@@ -157,6 +167,7 @@ class SkeletonSpec(abstractspec.AbstractSpec):
         """
 
         self._otherType = otherType
+        self.markDirty()
 
     @property
     def drawStyle(self):
@@ -178,4 +189,5 @@ class SkeletonSpec(abstractspec.AbstractSpec):
         """
 
         self._drawStyle = Style(drawStyle)
+        self.markDirty()
     # endregion
@@ -0,0 +1,738 @@
+import weakref
+
+from maya.api import OpenMaya as om
+from dcc.maya.libs import dagutils
+from dcc.python import stringutils
+from dcc.vendor.six import string_types
+from ..abstract import abstractspec
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class SkeletonTransaction(object):
+    """
+    Base class for batching referenced skeleton edits into a minimal number of RPC payloads.
+    Edits are queued while the transaction is open and committed in phases once the outermost scope exits:
+    sync > create > rename > reparent > setAttr/setTransform > delete
+    Each phase is sent to the standalone process as a single batch regardless of the number of joints!
+    """
+
+    # region Dunderscores
+    __slots__ = (
+        '_manager',
+        '_depth',
+        '_save',
+        '_syncs',
+        '_creates',
+        '_renames',
+        '_reparents',
+        '_setAttrs',
+        '_transforms',
+        '_deletes'
+    )
+
+    def __init__(self, manager):
+        """
+        Private method called after a new instance is created.
+
+        :type manager: rigotron.libs.skeletonmanager.SkeletonManager
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SkeletonTransaction, self).__init__()
+
+        # Declare private variables
+        #
+        self._manager = weakref.ref(manager)
+        self._depth = 0
+        self._save = False
+        self._syncs = []
+        self._creates = []
+        self._renames = []
+        self._reparents = []
+        self._setAttrs = []
+        self._transforms = []
+        self._deletes = []
+
+    def __enter__(self):
+        """
+        Private method called upon entering a `with` statement.
+
+        :rtype: SkeletonTransaction
+        """
+
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method called upon exiting a `with` statement.
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        # Check if this is the outermost scope
+        #
+        self._depth -= 1
+
+        if self._depth > 0:
+
+            return
+
+        # Check if an exception was raised
+        # If so, go ahead and discard any pending edits
+        #
+        if exc_type is None:
+
+            self.commit()
+
+        else:
+
+            log.warning('Discarding pending skeleton edits!')
+            self.clear()
+    # endregion
+
+    # region Properties
+    @property
+    def manager(self):
+        """
+        Getter method that returns the associated skeleton manager.
+
+        :rtype: rigotron.libs.skeletonmanager.SkeletonManager
+        """
+
+        return self._manager()
+
+    @property
+    def isActive(self):
+        """
+        Getter method that returns the active state.
+
+        :rtype: bool
+        """
+
+        return self._depth > 0
+
+    @property
+    def isEmpty(self):
+        """
+        Getter method that evaluates if there are any pending edits.
+
+        :rtype: bool
+        """
+
+        return not any([self._syncs, self._creates, self._renames, self._reparents, self._setAttrs, self._transforms, self._deletes])
+    # endregion
+
+    # region Methods
+    @staticmethod
+    def getUUIDString(target):
+        """
+        Returns the UUID string associated with the supplied target.
+        Specs are resolved lazily since their UUIDs may not exist until their create phase has been committed!
+
+        :type target: Union[abstractspec.AbstractSpec, om.MUuid, str, None]
+        :rtype: str
+        """
+
+        # Evaluate target type
+        #
+        uuid = None
+
+        if isinstance(target, abstractspec.AbstractSpec):
+
+            uuid = target.uuid
+
+        elif isinstance(target, om.MUuid):
+
+            uuid = target
+
+        elif isinstance(target, string_types) and not stringutils.isNullOrEmpty(target):
+
+            uuid = om.MUuid(target)
+
+        else:
+
+            return ''
+
+        # Check if UUID is valid
+        #
+        if uuid.valid():
+
+            return uuid.asString()
+
+        else:
+
+            return ''
+
+    @staticmethod
+    def getPathDepth(path):
+        """
+        Returns the depth of the supplied DAG path.
+
+        :type path: str
+        :rtype: int
+        """
+
+        return path.count('|')
+
+    @staticmethod
+    def isPathDescendantOf(path, ancestors):
+        """
+        Evaluates if the supplied DAG path is derived from any of the supplied ancestors.
+
+        :type path: str
+        :type ancestors: List[str]
+        :rtype: bool
+        """
+
+        return any([path == ancestor or path.startswith(f'{ancestor}|') for ancestor in ancestors])
+
+    def sync(self, skeletonSpec, **kwargs):
+        """
+        Queues a synchronization for the supplied skeleton spec.
+        Existence is evaluated at commit time so no queries are made while queueing!
+
+        :type skeletonSpec: skeletonspec.SkeletonSpec
+        :key displayLocalAxis: bool
+        :rtype: None
+        """
+
+        self._syncs.append((skeletonSpec, kwargs))
+
+    def create(self, skeletonSpec, parent=None):
+        """
+        Queues a new export joint for the supplied skeleton spec.
+        The resulting name and UUID are written back to the spec once committed!
+
+        :type skeletonSpec: skeletonspec.SkeletonSpec
+        :type parent: Union[abstractspec.AbstractSpec, om.MUuid, str, None]
+        :rtype: None
+        """
+
+        self._creates.append((skeletonSpec, parent))
+
+    def rename(self, target, name):
+        """
+        Queues a rename for the supplied target.
+
+        :type target: Union[abstractspec.AbstractSpec, om.MUuid, str]
+        :type name: str
+        :rtype: None
+        """
+
+        self._renames.append((target, name))
+
+    def reparent(self, child, parent, absolute=False):
+        """
+        Queues a reparent for the supplied child.
+        Enabling `absolute` will preserve the child's world matrix!
+
+        :type child: Union[abstractspec.AbstractSpec, om.MUuid, str]
+        :type parent: Union[abstractspec.AbstractSpec, om.MUuid, str, None]
+        :type absolute: bool
+        :rtype: None
+        """
+
+        self._reparents.append((child, parent, absolute))
+
+    def setAttr(self, target, attribute, *args, **kwargs):
+        """
+        Queues an attribute change for the supplied target.
+
+        :type target: Union[abstractspec.AbstractSpec, om.MUuid, str]
+        :type attribute: str
+        :rtype: None
+        """
+
+        self._setAttrs.append((target, attribute, args, kwargs))
+
+    def setTransform(self, target, translation, rotation):
+        """
+        Queues a local translation and rotation change, in degrees, for the supplied target.
+        Both are written by a single `xform` command rather than a `setAttr` command for each attribute!
+
+        :type target: Union[abstractspec.AbstractSpec, om.MUuid, str]
+        :type translation: Tuple[float, float, float]
+        :type rotation: Tuple[float, float, float]
+        :rtype: None
+        """
+
+        self._transforms.append((target, translation, rotation))
+
+    def delete(self, target, absolute=True):
+        """
+        Queues a deletion for the supplied target.
+        Any children not marked for deletion are moved to the world!
+
+        :type target: Union[abstractspec.AbstractSpec, om.MUuid, str]
+        :type absolute: bool
+        :rtype: None
+        """
+
+        self._deletes.append((target, absolute))
+
+    def requestSave(self):
+        """
+        Notifies the transaction to save the referenced skeleton once committed.
+
+        :rtype: None
+        """
+
+        self._save = True
+
+    def clear(self):
+        """
+        Discards all pending edits.
+
+        :rtype: None
+        """
+
+        self._save = False
+        self._syncs.clear()
+        self._creates.clear()
+        self._renames.clear()
+        self._reparents.clear()
+        self._setAttrs.clear()
+        self._transforms.clear()
+        self._deletes.clear()
+
+    def resolve(self, targets):
+        """
+        Returns a dictionary of UUID strings and their current DAG paths.
+        Paths are sourced from the manager's cache, missing nodes are mapped to empty strings!
+
+        :type targets: List[Union[abstractspec.AbstractSpec, om.MUuid, str, None]]
+        :rtype: Dict[str, str]
+        """
+
+        manager = self.manager
+        uuids = dict.fromkeys(filter(None, map(self.getUUIDString, targets)))
+
+        return {uuid: manager.getCachedPath(uuid) for uuid in uuids}
+
+    def commitSyncs(self):
+        """
+        Expands any pending synchronizations into their primitive edits.
+
+        :rtype: None
+        """
+
+        # Check if there are any pending synchronizations
+        #
+        syncs, self._syncs = self._syncs, []
+
+        if len(syncs) == 0:
+
+            return
+
+        # Iterate through synchronizations
+        #
+        manager = self.manager
+        paths = self.resolve([skeletonSpec for (skeletonSpec, kwargs) in syncs])
+
+        for (skeletonSpec, kwargs) in syncs:
+
+            # Check if associated export joint exists
+            #
+            uuid = self.getUUIDString(skeletonSpec)
+            exists = not stringutils.isNullOrEmpty(paths.get(uuid, ''))
+
+            if skeletonSpec.enabled:
+
+                # Evaluate if export joint requires creating
+                #
+                parent = skeletonSpec.parent
+
+                if exists:
+
+                    self.rename(skeletonSpec, skeletonSpec.name)
+                    self.reparent(skeletonSpec, parent, absolute=True)
+
+                else:
+
+                    self.create(skeletonSpec, parent=parent)
+
+                # Update display properties
+                #
+                self.setAttr(skeletonSpec, 'side', skeletonSpec.side.value)
+                self.setAttr(skeletonSpec, 'type', skeletonSpec.type.value)
+                self.setAttr(skeletonSpec, 'otherType', skeletonSpec.otherType, type='string')
+                self.setAttr(skeletonSpec, 'drawStyle', skeletonSpec.drawStyle.value)
+                self.setAttr(skeletonSpec, 'displayLocalAxis', kwargs.get('displayLocalAxis', True))
+
+                # Update transformation matrix
+                #
+                translation, rotation = manager.decomposeMatrix(skeletonSpec.matrix)
+                self.setTransform(skeletonSpec, translation, rotation)
+
+            elif exists:
+
+                self.delete(skeletonSpec, absolute=True)
+
+            else:
+
+                continue
+
+    def commitCreates(self):
+        """
+        Commits any pending export joints.
+        Any requested parents are deferred to the reparent phase!
+
+        :rtype: None
+        """
+
+        # Check if there are any pending creations
+        #
+        creates, self._creates = self._creates, []
+
+        if len(creates) == 0:
+
+            return
+
+        # Compose create commands
+        #
+        commands = []
+
+        for (skeletonSpec, parent) in creates:
+
+            kwargs = {'asNameAndUUID': True}
+
+            if not stringutils.isNullOrEmpty(skeletonSpec.name):
+
+                kwargs['name'] = skeletonSpec.name
+
+            log.info(f'Creating "{skeletonSpec.name}" export joint!')
+            commands.append(('createNode', ('joint',), kwargs))
+
+        # Update skeleton specs from results
+        #
+        manager = self.manager
+        results = manager.executeBatch(commands)
+
+        for ((skeletonSpec, parent), (name, uuid)) in zip(creates, results):
+
+            skeletonSpec.name = name
+            skeletonSpec.uuid = uuid
+
+            manager.addCachedPath(uuid, f'|{name}')
+
+            if parent is not None:
+
+                self.reparent(skeletonSpec, parent, absolute=False)
+
+    def commitRenames(self):
+        """
+        Commits any pending renames.
+        Renames are sorted deepest first so that each command's path remains valid!
+
+        :rtype: None
+        """
+
+        # Check if there are any pending renames
+        #
+        renames, self._renames = self._renames, []
+
+        if len(renames) == 0:
+
+            return
+
+        # Collect renames that are actually required
+        #
+        paths = self.resolve([target for (target, name) in renames])
+        pending = []
+
+        for (target, name) in renames:
+
+            # Check if node exists
+            #
+            path = paths.get(self.getUUIDString(target), '')
+
+            if stringutils.isNullOrEmpty(path):
+
+                log.warning(f'Unable to locate "{name}" export joint to rename!')
+                continue
+
+            # Check if name has changed
+            #
+            currentName = dagutils.stripAll(path)
+
+            if currentName != name and not stringutils.isNullOrEmpty(name):
+
+                pending.append((target, path, name))
+
+            elif isinstance(target, abstractspec.AbstractSpec):
+
+                target.name = currentName
+
+            else:
+
+                continue
+
+        # Rename nodes and update any specs
+        #
+        pending.sort(key=lambda item: self.getPathDepth(item[1]), reverse=True)
+
+        manager = self.manager
+
+        commands = [('renameNode', (path, name), {}) for (target, path, name) in pending]
+        results = manager.executeBatch(commands)
+
+        for ((target, path, name), newName) in zip(pending, results):
+
+            manager.updateCachedPath(path, f'{path.rpartition("|")[0]}|{newName}')
+
+            if isinstance(target, abstractspec.AbstractSpec):
+
+                target.name = newName
+
+    def commitReparents(self):
+        """
+        Commits any pending reparents.
+        Reparents are sorted deepest first, any reparent whose new parent was moved in the same batch is deferred to the next batch!
+
+        :rtype: None
+        """
+
+        reparents, self._reparents = self._reparents, []
+
+        while len(reparents) > 0:
+
+            # Resolve current paths
+            #
+            targets = [child for (child, parent, absolute) in reparents] + [parent for (child, parent, absolute) in reparents]
+            paths = self.resolve(targets)
+
+            # Collect reparents that are actually required
+            #
+            pending = []
+
+            for (child, parent, absolute) in reparents:
+
+                childPath = paths.get(self.getUUIDString(child), '')
+                parentPath = paths.get(self.getUUIDString(parent), '')
+
+                if stringutils.isNullOrEmpty(childPath):
+
+                    log.warning(f'Unable to locate {child} export joint to reparent!')
+                    continue
+
+                currentParentPath = childPath.rpartition('|')[0]
+
+                if currentParentPath == parentPath:
+
+                    continue
+
+                pending.append((child, parent, childPath, parentPath, absolute))
+
+            pending.sort(key=lambda item: self.getPathDepth(item[2]), reverse=True)
+
+            # Compose parent commands
+            # Any parent that has moved in this batch will have an outdated path!
+            #
+            commands = []
+            absolutes = []
+            moved = []
+            deferred = []
+
+            for (child, parent, childPath, parentPath, absolute) in pending:
+
+                if self.isPathDescendantOf(parentPath, moved):
+
+                    deferred.append((child, parent, absolute))
+                    continue
+
+                if stringutils.isNullOrEmpty(parentPath):
+
+                    commands.append(('parentNode', (childPath,), {'world': True, 'relative': True}))
+
+                else:
+
+                    commands.append(('parentNode', (childPath, parentPath), {'relative': True}))
+
+                if absolute:
+
+                    absolutes.append((child, childPath))
+
+                moved.append(childPath)
+
+            # Check if any world matrices require preserving
+            #
+            manager = self.manager
+            matrices = manager.executeBatch([('xform', (childPath,), {'query': True, 'matrix': True, 'worldSpace': True}) for (child, childPath) in absolutes])
+
+            manager.executeBatch(commands)
+
+            for (child, parent, childPath, parentPath, absolute) in pending:
+
+                if childPath in moved:
+
+                    manager.updateCachedPath(childPath, f'{parentPath}|{childPath.rpartition("|")[-1]}')
+
+            if len(absolutes) > 0:
+
+                paths = self.resolve([child for (child, childPath) in absolutes])
+                commands = [('xform', (paths.get(self.getUUIDString(child), ''),), {'matrix': matrix, 'worldSpace': True}) for ((child, childPath), matrix) in zip(absolutes, matrices)]
+
+                manager.executeBatch(commands)
+
+            reparents = deferred
+
+    def commitSetAttrs(self):
+        """
+        Commits any pending attribute and transform changes.
+        Transform changes are sent in the same batch as the attribute changes!
+
+        :rtype: None
+        """
+
+        # Check if there are any pending attribute changes
+        #
+        setAttrs, self._setAttrs = self._setAttrs, []
+        transforms, self._transforms = self._transforms, []
+
+        if len(setAttrs) == 0 and len(transforms) == 0:
+
+            return
+
+        # Compose attribute commands
+        #
+        paths = self.resolve([target for (target, attribute, args, kwargs) in setAttrs] + [target for (target, translation, rotation) in transforms])
+        commands = []
+
+        for (target, attribute, args, kwargs) in setAttrs:
+
+            path = paths.get(self.getUUIDString(target), '')
+
+            if stringutils.isNullOrEmpty(path):
+
+                log.error(f'Unable to locate export joint to update @ <{self.getUUIDString(target)}>!')
+                continue
+
+            commands.append(('setAttr', (f'{path}.{attribute}', *args), kwargs))
+
+        # Compose transform commands
+        #
+        for (target, translation, rotation) in transforms:
+
+            path = paths.get(self.getUUIDString(target), '')
+
+            if stringutils.isNullOrEmpty(path):
+
+                log.error(f'Unable to locate export joint to transform @ <{self.getUUIDString(target)}>!')
+                continue
+
+            commands.append(('xform', (path,), {'translation': translation, 'rotation': rotation, 'objectSpace': True}))
+
+        self.manager.executeBatch(commands)
+
+    def commitDeletes(self):
+        """
+        Commits any pending deletions.
+
+        :rtype: None
+        """
+
+        # Check if there are any pending deletions
+        #
+        deletes, self._deletes = self._deletes, []
+
+        if len(deletes) == 0:
+
+            return
+
+        # Collect nodes that still exist
+        #
+        manager = self.manager
+        paths = self.resolve([target for (target, absolute) in deletes])
+        pending = [(target, paths.get(self.getUUIDString(target), ''), absolute) for (target, absolute) in deletes]
+        pending = [(target, path, absolute) for (target, path, absolute) in pending if not stringutils.isNullOrEmpty(path)]
+
+        # Move any surviving children to the world
+        #
+        deletedPaths = set([path for (target, path, absolute) in pending])
+        results = manager.executeBatch([('listRelatives', (path,), {'children': True, 'fullPath': True}) for (target, path, absolute) in pending])
+
+        unparents = []
+
+        for ((target, path, absolute), children) in zip(pending, results):
+
+            children = children if not stringutils.isNullOrEmpty(children) else []
+            unparents.extend([(child, absolute) for child in children if child not in deletedPaths])
+
+        unparents.sort(key=lambda item: self.getPathDepth(item[0]), reverse=True)
+        manager.executeBatch([('parentNode', (child,), {'world': True, 'absolute': absolute}) for (child, absolute) in unparents])
+
+        for (child, absolute) in unparents:
+
+            manager.updateCachedPath(child, f'|{child.rpartition("|")[-1]}')
+
+        # Delete nodes deepest first
+        #
+        if len(unparents) > 0:
+
+            paths = self.resolve([target for (target, path, absolute) in pending])
+            pending = [(target, paths.get(self.getUUIDString(target), ''), absolute) for (target, path, absolute) in pending]
+
+        pending.sort(key=lambda item: self.getPathDepth(item[1]), reverse=True)
+
+        for (target, path, absolute) in pending:
+
+            log.info(f'Deleting "{dagutils.stripAll(path)}" export joint!')
+
+        manager.executeBatch([('deleteNode', (path,), {}) for (target, path, absolute) in pending])
+
+        # Reset any deleted specs
+        #
+        for (target, path, absolute) in pending:
+
+            manager.updateCachedPath(path, '')
+
+            if isinstance(target, abstractspec.AbstractSpec):
+
+                del target.uuid
+
+    def commit(self):
+        """
+        Commits all pending edits to the referenced skeleton.
+
+        :rtype: None
+        """
+
+        # Check if there are any pending edits
+        #
+        if self.isEmpty and not self._save:
+
+            return
+
+        # Commit phases in order
+        #
+        save = self._save
+
+        try:
+
+            self.commitSyncs()
+            self.commitCreates()
+            self.commitRenames()
+            self.commitReparents()
+            self.commitSetAttrs()
+            self.commitDeletes()
+
+        finally:
+
+            self.clear()
+
+        # Check if changes require saving
+        #
+        if save:
+
+            self.manager.save()
+    # endregion
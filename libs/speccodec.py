@@ -0,0 +1,657 @@
+import json
+import time
+import uuid
+import struct
+import base64
+import importlib
+
+from maya.api import OpenMaya as om
+from dcc.maya.json import melson
+from enum import IntEnum
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+__magic__ = 'RSPC:'
+__version__ = 2
+__lazy_key__ = 'children'
+
+
+class Tag(IntEnum):
+    """
+    Enum class of all the available value tags.
+    """
+
+    NONE = 0
+    FALSE = 1
+    TRUE = 2
+    BYTE = 3
+    INT = 4
+    FLOAT = 5
+    STRING = 6
+    UUID = 7
+    MATRIX = 8
+    TRANSFORM = 9
+    LIST = 10
+    OBJECT = 11
+    JSON = 12
+
+
+__byte__ = struct.Struct('<B')
+__int__ = struct.Struct('<q')
+__uint__ = struct.Struct('<I')
+__float__ = struct.Struct('<d')
+__matrix__ = struct.Struct('<16d')
+__null_uuid__ = bytes(16)
+
+
+def isEncoded(value):
+    """
+    Evaluates if the supplied value is a compact spec encoding.
+
+    :type value: Any
+    :rtype: bool
+    """
+
+    return isinstance(value, str) and value.startswith(__magic__)
+
+
+def getClassPath(cls):
+    """
+    Returns the import path for the supplied class.
+
+    :type cls: type
+    :rtype: str
+    """
+
+    return f'{cls.__module__}.{cls.__name__}'
+
+
+class SpecEncoder(object):
+    """
+    Base class used to encode spec trees into a compact binary format.
+    Matrices are stored as 16 fixed-width doubles, UUIDs as 16 raw bytes, small integers as single bytes and strings are interned!
+    Encoders are reusable, the string table only ever grows so any clean specs can reuse their previously encoded fragments.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_token', '_strings', '_indices')
+
+    def __init__(self):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SpecEncoder, self).__init__()
+
+        # Declare private variables
+        #
+        self._token = object()
+        self._strings = []
+        self._indices = {}
+    # endregion
+
+    # region Properties
+    @property
+    def token(self):
+        """
+        Getter method that returns the token used to identify fragments cached by this encoder.
+
+        :rtype: object
+        """
+
+        return self._token
+    # endregion
+
+    # region Methods
+    def intern(self, string):
+        """
+        Returns the string table index for the supplied string.
+
+        :type string: str
+        :rtype: int
+        """
+
+        index = self._indices.get(string, None)
+
+        if index is None:
+
+            index = len(self._strings)
+
+            self._strings.append(string)
+            self._indices[string] = index
+
+        return index
+
+    def encodeValue(self, value):
+        """
+        Returns the encoded bytes for the supplied value.
+
+        :type value: Any
+        :rtype: bytes
+        """
+
+        if value is None:
+
+            return __byte__.pack(Tag.NONE)
+
+        elif isinstance(value, bool):
+
+            return __byte__.pack(Tag.TRUE if value else Tag.FALSE)
+
+        elif isinstance(value, int):
+
+            if 0 <= value <= 255:
+
+                return __byte__.pack(Tag.BYTE) + __byte__.pack(int(value))
+
+            else:
+
+                return __byte__.pack(Tag.INT) + __int__.pack(int(value))
+
+        elif isinstance(value, float):
+
+            return __byte__.pack(Tag.FLOAT) + __float__.pack(value)
+
+        elif isinstance(value, str):
+
+            return __byte__.pack(Tag.STRING) + __uint__.pack(self.intern(value))
+
+        elif isinstance(value, om.MUuid):
+
+            raw = uuid.UUID(value.asString()).bytes if value.valid() else __null_uuid__
+            return __byte__.pack(Tag.UUID) + raw
+
+        elif isinstance(value, om.MTransformationMatrix):
+
+            # Transform matrices do not store their rotation order
+            # So the order is appended as an extra byte after the matrix!
+            #
+            matrix = value.asMatrix()
+            return __byte__.pack(Tag.TRANSFORM) + __matrix__.pack(*[matrix.getElement(row, column) for row in range(4) for column in range(4)]) + __byte__.pack(value.rotationOrder())
+
+        elif isinstance(value, om.MMatrix):
+
+            return __byte__.pack(Tag.MATRIX) + __matrix__.pack(*[value.getElement(row, column) for row in range(4) for column in range(4)])
+
+        elif isinstance(value, (list, tuple)):
+
+            items = b''.join([self.encodeValue(item) for item in value])
+            return __byte__.pack(Tag.LIST) + __uint__.pack(len(value)) + __uint__.pack(len(items)) + items
+
+        elif hasattr(value, '__getstate__') and hasattr(value, '__setstate__') and not isinstance(value, dict):
+
+            return self.encodeObject(value)
+
+        else:
+
+            string = json.dumps(value, cls=melson.MELSONEncoder)
+            return __byte__.pack(Tag.JSON) + __uint__.pack(self.intern(string))
+
+    def encodeObject(self, obj):
+        """
+        Returns the encoded bytes for the supplied object.
+        The byte length is stored upfront so decoders can skip over entire subtrees!
+
+        :type obj: Any
+        :rtype: bytes
+        """
+
+        # Check if a previously encoded fragment can be reused
+        #
+        isTracked = callable(getattr(obj, 'isDirty', None))
+
+        if isTracked and not obj.isDirty():
+
+            fragment = obj.cachedFragment(self._token)
+
+            if fragment is not None:
+
+                return fragment
+
+        # Encode object state
+        #
+        state = obj.__getstate__()
+        fields = [(key, value) for (key, value) in state.items() if not key.startswith('__')]
+
+        body = __uint__.pack(len(fields)) + b''.join([__uint__.pack(self.intern(key)) + self.encodeValue(value) for (key, value) in fields])
+        fragment = __byte__.pack(Tag.OBJECT) + __uint__.pack(self.intern(getClassPath(type(obj)))) + __uint__.pack(len(body)) + body
+
+        if isTracked:
+
+            obj.cacheFragment(self._token, fragment)
+            obj.markClean()
+
+        return fragment
+
+    def encode(self, specs):
+        """
+        Returns the encoded bytes for the supplied specs.
+
+        :type specs: List[rigotron.abstract.abstractspec.AbstractSpec]
+        :rtype: bytes
+        """
+
+        body = self.encodeValue(list(specs))
+        table = __uint__.pack(len(self._strings)) + b''.join([__uint__.pack(len(encoded)) + encoded for encoded in (string.encode('utf-8') for string in self._strings)])
+
+        return __byte__.pack(__version__) + table + body
+
+    def dumps(self, specs):
+        """
+        Returns a compact string representation of the supplied specs.
+        The binary encoding is base64 encoded so it can be stored inside string attributes!
+
+        :type specs: List[rigotron.abstract.abstractspec.AbstractSpec]
+        :rtype: str
+        """
+
+        return __magic__ + base64.b64encode(self.encode(specs)).decode('ascii')
+    # endregion
+
+
+class SpecDecoder(object):
+    """
+    Base class used to decode spec trees from the compact binary format.
+    The optional object hook is called on every decoded object, the same as `userProperties.object_init_hook`!
+    When lazy, child specs are only decoded once they are first accessed via `AbstractSpec.children`.
+    Decoded specs are marked clean and cache their original bytes so the paired encoder can reuse them.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_data', '_view', '_strings', '_objectHook', '_classes', '_lazy', '_encoder')
+
+    def __init__(self, objectHook=None, lazy=True):
+        """
+        Private method called after a new instance is created.
+
+        :type objectHook: Union[Callable, None]
+        :type lazy: bool
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SpecDecoder, self).__init__()
+
+        # Declare private variables
+        #
+        self._data = b''
+        self._view = memoryview(b'')
+        self._strings = []
+        self._objectHook = objectHook
+        self._classes = {}
+        self._lazy = lazy
+        self._encoder = SpecEncoder()
+    # endregion
+
+    # region Properties
+    @property
+    def encoder(self):
+        """
+        Getter method that returns the encoder that shares this decoder's string table.
+        Any decoded specs that remain clean can be re-encoded by this encoder without any work!
+
+        :rtype: SpecEncoder
+        """
+
+        return self._encoder
+    # endregion
+
+    # region Methods
+    def getClass(self, classPath):
+        """
+        Returns the class associated with the supplied import path.
+
+        :type classPath: str
+        :rtype: type
+        """
+
+        cls = self._classes.get(classPath, None)
+
+        if cls is None:
+
+            moduleName, className = classPath.rsplit('.', 1)
+            cls = getattr(importlib.import_module(moduleName), className)
+
+            self._classes[classPath] = cls
+
+        return cls
+
+    def decodeValue(self, offset):
+        """
+        Returns the value decoded at the supplied offset along with the offset that follows it.
+
+        :type offset: int
+        :rtype: Tuple[Any, int]
+        """
+
+        data = self._data
+        tag = data[offset]
+        offset += 1
+
+        if tag == Tag.NONE:
+
+            return None, offset
+
+        elif tag == Tag.FALSE:
+
+            return False, offset
+
+        elif tag == Tag.TRUE:
+
+            return True, offset
+
+        elif tag == Tag.BYTE:
+
+            return data[offset], offset + 1
+
+        elif tag == Tag.INT:
+
+            return __int__.unpack_from(data, offset)[0], offset + __int__.size
+
+        elif tag == Tag.FLOAT:
+
+            return __float__.unpack_from(data, offset)[0], offset + __float__.size
+
+        elif tag == Tag.STRING:
+
+            return self._strings[__uint__.unpack_from(data, offset)[0]], offset + __uint__.size
+
+        elif tag == Tag.UUID:
+
+            raw = data[offset:offset + 16]
+            value = om.MUuid(str(uuid.UUID(bytes=raw))) if raw != __null_uuid__ else om.MUuid()
+
+            return value, offset + 16
+
+        elif tag == Tag.TRANSFORM:
+
+            value = om.MTransformationMatrix(om.MMatrix(__matrix__.unpack_from(data, offset)))
+            offset += __matrix__.size
+
+            rotateOrder = __byte__.unpack_from(data, offset)[0]
+            value.reorderRotation(rotateOrder)
+
+            return value, offset + __byte__.size
+
+        elif tag == Tag.MATRIX:
+
+            return om.MMatrix(__matrix__.unpack_from(data, offset)), offset + __matrix__.size
+
+        elif tag == Tag.LIST:
+
+            count = __uint__.unpack_from(data, offset)[0]
+            offset += __uint__.size * 2
+
+            items = [None] * count
+
+            for i in range(count):
+
+                items[i], offset = self.decodeValue(offset)
+
+            return items, offset
+
+        elif tag == Tag.OBJECT:
+
+            return self.decodeObject(offset)
+
+        elif tag == Tag.JSON:
+
+            string = self._strings[__uint__.unpack_from(data, offset)[0]]
+            return json.loads(string, cls=melson.MELSONDecoder), offset + __uint__.size
+
+        else:
+
+            raise TypeError(f'decodeValue() expects a valid tag ({tag} given)!')
+
+    def decodeObject(self, offset):
+        """
+        Returns the object decoded at the supplied offset along with the offset that follows it.
+        The supplied offset is expected to follow the object tag!
+
+        :type offset: int
+        :rtype: Tuple[Any, int]
+        """
+
+        # Decode object header
+        #
+        data = self._data
+        start = offset - 1
+        classIndex, size = struct.unpack_from('<2I', data, offset)
+        offset += __uint__.size * 2
+        end = offset + size
+
+        fieldCount = __uint__.unpack_from(data, offset)[0]
+        offset += __uint__.size
+
+        # Decode object state
+        # Lazy children are skipped over using the list's byte length!
+        #
+        cls = self.getClass(self._strings[classIndex])
+        isLazy = self._lazy and hasattr(cls, 'deferChildren')
+
+        state = {}
+        pending = None
+
+        for i in range(fieldCount):
+
+            key = self._strings[__uint__.unpack_from(data, offset)[0]]
+            offset += __uint__.size
+
+            if isLazy and key == __lazy_key__ and data[offset] == Tag.LIST:
+
+                count, listSize = struct.unpack_from('<2I', data, offset + 1)
+                pending = self.deferValue(offset) if count > 0 else None
+                offset += 1 + (__uint__.size * 2) + listSize
+
+            else:
+
+                state[key], offset = self.decodeValue(offset)
+
+        # Create object from state
+        #
+        obj = cls.__new__(cls)
+        obj.__init__()
+        obj.__setstate__(state)
+
+        if pending is not None:
+
+            obj.deferChildren(pending)
+
+        if callable(self._objectHook):
+
+            self._objectHook(obj)
+
+        # Cache original bytes for encoder
+        #
+        if callable(getattr(obj, 'cacheFragment', None)):
+
+            obj.cacheFragment(self._encoder.token, self._view[start:end])
+            obj.markClean()
+
+        return obj, end
+
+    def deferValue(self, offset):
+        """
+        Returns a callable that decodes the value at the supplied offset on demand.
+
+        :type offset: int
+        :rtype: Callable
+        """
+
+        def decode():
+
+            return self.decodeValue(offset)[0]
+
+        return decode
+
+    def decode(self, data):
+        """
+        Returns the specs decoded from the supplied bytes.
+
+        :type data: bytes
+        :rtype: List[rigotron.abstract.abstractspec.AbstractSpec]
+        """
+
+        # Check encoding version
+        #
+        version = data[0]
+
+        if version != __version__:
+
+            raise TypeError(f'decode() expects version {__version__} ({version} given)!')
+
+        # Decode string table
+        #
+        offset = 1
+        count = __uint__.unpack_from(data, offset)[0]
+        offset += __uint__.size
+
+        strings = [None] * count
+
+        for i in range(count):
+
+            size = __uint__.unpack_from(data, offset)[0]
+            offset += __uint__.size
+
+            strings[i] = bytes(data[offset:offset + size]).decode('utf-8')
+            offset += size
+
+        # Decode specs
+        #
+        self._data = data
+        self._view = memoryview(data)
+        self._strings = strings
+
+        self._encoder = SpecEncoder()
+
+        for string in strings:
+
+            self._encoder.intern(string)
+
+        specs, offset = self.decodeValue(offset)
+        return specs
+    # endregion
+
+
+def dumps(specs):
+    """
+    Returns a compact string representation of the supplied specs.
+    The binary encoding is base64 encoded so it can be stored inside string attributes!
+
+    :type specs: List[rigotron.abstract.abstractspec.AbstractSpec]
+    :rtype: str
+    """
+
+    encoder = SpecEncoder()
+    return encoder.dumps(specs)
+
+
+def loads(string, objectHook=None, lazy=False):
+    """
+    Returns the specs from the supplied string representation.
+    Any specs that were not compact encoded are expected to have already been decoded from JSON!
+
+    :type string: Union[str, List[rigotron.abstract.abstractspec.AbstractSpec]]
+    :type objectHook: Union[Callable, None]
+    :type lazy: bool
+    :rtype: List[rigotron.abstract.abstractspec.AbstractSpec]
+    """
+
+    if isEncoded(string):
+
+        decoder = SpecDecoder(objectHook=objectHook, lazy=lazy)
+        return decoder.decode(base64.b64decode(string[len(__magic__):]))
+
+    elif isinstance(string, str):
+
+        return json.loads(string, cls=melson.MELSONDecoder) if string else []
+
+    else:
+
+        return string
+
+
+def benchmark(specs, iterations=10):
+    """
+    Compares the size and encode/decode times between the MELSON and compact encodings for the supplied specs.
+    Times are averaged in milliseconds over the specified number of iterations!
+
+    :type specs: List[rigotron.abstract.abstractspec.AbstractSpec]
+    :type iterations: int
+    :rtype: Dict[str, Dict[str, float]]
+    """
+
+    results = {}
+
+    encoders = {
+        'json': (lambda: json.dumps(specs, cls=melson.MELSONEncoder), lambda string: json.loads(string, cls=melson.MELSONDecoder)),
+        'compact': (lambda: dumps(specs), lambda string: loads(string))
+    }
+
+    for (name, (encode, decode)) in encoders.items():
+
+        startTime = time.perf_counter()
+
+        for i in range(iterations):
+
+            string = encode()
+
+        encodeTime = (time.perf_counter() - startTime) / iterations * 1e3
+        startTime = time.perf_counter()
+
+        for i in range(iterations):
+
+            decode(string)
+
+        decodeTime = (time.perf_counter() - startTime) / iterations * 1e3
+
+        results[name] = {'size': len(string), 'encode': encodeTime, 'decode': decodeTime}
+
+    return results
+
+
+def benchmarkComponents(components, iterations=10):
+    """
+    Benchmarks the skeleton and pivot specs for each of the supplied components.
+    The report is logged and the accumulated results are returned, for example from every face component in a rig!
+
+    :type components: List[rigotron.components.basecomponent.BaseComponent]
+    :type iterations: int
+    :rtype: Dict[str, Dict[str, float]]
+    """
+
+    totals = {name: {'size': 0, 'encode': 0.0, 'decode': 0.0} for name in ('json', 'compact')}
+
+    for component in components:
+
+        for key in (component.SKELETON_KEY, component.PIVOTS_KEY):
+
+            results = benchmark(component.loadSpecs(key), iterations=iterations)
+
+            for (name, result) in results.items():
+
+                for (field, value) in result.items():
+
+                    totals[name][field] += value
+
+    jsonTotals, compactTotals = totals['json'], totals['compact']
+    ratio = (compactTotals['size'] / jsonTotals['size']) if jsonTotals['size'] > 0 else 0.0
+
+    log.info(
+        f'Spec encoding benchmark ({len(components)} component(s), {iterations} iteration(s)):\n'
+        f'{"Encoding":<12}{"Bytes":>12}{"Encode ms":>12}{"Decode ms":>12}\n'
+        f'{"json":<12}{jsonTotals["size"]:>12}{jsonTotals["encode"]:>12.3f}{jsonTotals["decode"]:>12.3f}\n'
+        f'{"compact":<12}{compactTotals["size"]:>12}{compactTotals["encode"]:>12.3f}{compactTotals["decode"]:>12.3f}\n'
+        f'Compact size is {ratio * 100.0:.1f}% of json'
+    )
+
+    return totals
@@ -0,0 +1,377 @@
+from maya.api import OpenMaya as om
+from collections import namedtuple
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+SpecEntry = namedtuple('SpecEntry', ('spec', 'component'))
+
+
+class SpecIndex(object):
+    """
+    Base class used to index skeleton specs by name, UUID and (Side, Type) across an entire rig.
+    Components are re-indexed lazily, any spec setters that change these keys only mark their component as stale!
+    Components that are added or removed are detected via the `ComponentHierarchy` generation.
+    Scene nodes resolved by name are also cached so repeated name lookups, such as export joints and drivers, only require dictionary hits.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_root', '_generation', '_components', '_sources', '_entries', '_names', '_uuids', '_types', '_stale', '_nodes', '_primed')
+
+    __instance__ = None
+
+    def __init__(self):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SpecIndex, self).__init__()
+
+        # Declare private variables
+        #
+        self._root = None
+        self._generation = -1
+        self._components = {}
+        self._sources = {}
+        self._entries = {}
+        self._names = {}
+        self._uuids = {}
+        self._types = {}
+        self._stale = set()
+        self._nodes = {}
+        self._primed = False
+
+    def __len__(self):
+        """
+        Private method that returns the number of indexed specs.
+
+        :rtype: int
+        """
+
+        return sum(map(len, self._names.values()))
+    # endregion
+
+    # region Methods
+    @classmethod
+    def getInstance(cls):
+        """
+        Returns the shared spec index instance.
+
+        :rtype: SpecIndex
+        """
+
+        if cls.__instance__ is None:
+
+            cls.__instance__ = cls()
+
+        return cls.__instance__
+
+    @staticmethod
+    def uuidKey(uuid):
+        """
+        Returns the key for the supplied UUID.
+        Invalid UUIDs have no key!
+
+        :type uuid: om.MUuid
+        :rtype: Union[str, None]
+        """
+
+        return uuid.asString() if uuid.valid() else None
+
+    def clear(self):
+        """
+        Removes all indexed specs.
+
+        :rtype: None
+        """
+
+        self._root = None
+        self._generation = -1
+        self._components.clear()
+        self._sources.clear()
+        self._entries.clear()
+        self._names.clear()
+        self._uuids.clear()
+        self._types.clear()
+        self._stale.clear()
+
+    def clearNodes(self):
+        """
+        Removes all cached scene nodes.
+
+        :rtype: None
+        """
+
+        self._nodes.clear()
+        self._primed = False
+
+    def invalidate(self, component):
+        """
+        Marks the supplied component as stale so it is re-indexed before the next lookup.
+
+        :type component: rigotron.components.basecomponent.BaseComponent
+        :rtype: None
+        """
+
+        hashCode = component.hashCode()
+
+        if hashCode in self._components:
+
+            self._stale.add(hashCode)
+
+    def removeComponent(self, hashCode):
+        """
+        Removes the specs owned by the supplied component hash code.
+
+        :type hashCode: int
+        :rtype: None
+        """
+
+        # Remove entries from lookup tables
+        # The keys recorded at index time are used since the specs may have changed since!
+        #
+        for (table, key, entry) in self._entries.pop(hashCode, []):
+
+            entries = [otherEntry for otherEntry in table.get(key, []) if otherEntry is not entry]
+
+            if len(entries) > 0:
+
+                table[key] = entries
+
+            else:
+
+                table.pop(key, None)
+
+        self._sources.pop(hashCode, None)
+        self._stale.discard(hashCode)
+
+    def indexComponent(self, component):
+        """
+        Indexes the skeleton specs owned by the supplied component.
+        The specs are read directly from the user properties so indexing never invalidates any specs!
+
+        :type component: rigotron.components.basecomponent.BaseComponent
+        :rtype: None
+        """
+
+        # Remove any previous entries
+        #
+        hashCode = component.hashCode()
+        self.removeComponent(hashCode)
+
+        self._components[hashCode] = component
+
+        # Iterate through skeleton specs
+        #
+        skeletonSpecs = component.loadSpecs(component.SKELETON_KEY)
+        entries = []
+
+        for skeletonSpec in component.flattenSpecs(skeletonSpecs, skipDisabled=False, skipPassthrough=False):
+
+            entry = SpecEntry(skeletonSpec, component)
+            keys = [(self._names, skeletonSpec.name), (self._types, (skeletonSpec.side, skeletonSpec.type))]
+
+            uuidKey = self.uuidKey(skeletonSpec.uuid)
+
+            if uuidKey is not None:
+
+                keys.append((self._uuids, uuidKey))
+
+            for (table, key) in keys:
+
+                table.setdefault(key, []).append(entry)
+                entries.append((table, key, entry))
+
+        self._sources[hashCode] = skeletonSpecs
+        self._entries[hashCode] = entries
+        self._stale.discard(hashCode)  # Decoding any lazy children will have marked this component as stale!
+
+    def ensureIndexed(self, component):
+        """
+        Indexes the rig that the supplied component belongs to.
+        Only components that are new, stale or whose user properties have been pulled are re-indexed!
+
+        :type component: rigotron.components.basecomponent.BaseComponent
+        :rtype: None
+        """
+
+        # Check if the rig has changed
+        #
+        hierarchy = component.componentHierarchy
+        root = hierarchy.rootComponent(component)
+        rootKey = root.hashCode()
+
+        if rootKey != self._root:
+
+            self.clear()
+            self._root = rootKey
+
+        # Check if any components were added or removed
+        #
+        if hierarchy.generation != self._generation:
+
+            components = [childComponent for childComponent in root.walkComponents() if hasattr(childComponent, 'loadSpecs')]
+            hashCodes = set()
+
+            for childComponent in components:
+
+                hashCode = childComponent.hashCode()
+                hashCodes.add(hashCode)
+
+                if hashCode not in self._components:
+
+                    self._components[hashCode] = childComponent
+                    self._stale.add(hashCode)
+
+            for hashCode in [hashCode for hashCode in self._components.keys() if hashCode not in hashCodes]:
+
+                self.removeComponent(hashCode)
+                del self._components[hashCode]
+
+            self._generation = hierarchy.generation
+
+        # Check if any user properties have been pulled
+        #
+        for (hashCode, childComponent) in self._components.items():
+
+            if childComponent.userProperties.get(childComponent.SKELETON_KEY, None) is not self._sources.get(hashCode, None):
+
+                self._stale.add(hashCode)
+
+        # Re-index stale components
+        #
+        for hashCode in list(self._stale):
+
+            self.indexComponent(self._components[hashCode])
+
+    def primeNodes(self, scene):
+        """
+        Caches every transform node in the scene by name in a single pass.
+
+        :type scene: mpy.mpyscene.MPyScene
+        :rtype: None
+        """
+
+        for node in scene.iterNodesByApiType(om.MFn.kTransform):
+
+            obj = node.object()
+            self._nodes[om.MFnDependencyNode(obj).name()] = om.MObjectHandle(obj)
+
+        self._primed = True
+
+    def findNodeByName(self, scene, name):
+        """
+        Returns the scene node with the specified name.
+        Cached nodes are only returned if they still exist and have not been renamed since, otherwise the scene is queried instead!
+
+        :type scene: mpy.mpyscene.MPyScene
+        :type name: str
+        :rtype: Union[mpy.mpynode.MPyNode, None]
+        """
+
+        # Check if nodes have been cached
+        #
+        if not self._primed:
+
+            self.primeNodes(scene)
+
+        # Check if cached node is still valid
+        # Node names never include the root namespace so it is stripped from the key!
+        #
+        key = name.lstrip(':')
+        handle = self._nodes.get(key, None)
+
+        if handle is not None and handle.isAlive() and handle.isValid():
+
+            obj = handle.object()
+
+            if om.MFnDependencyNode(obj).name() == key:
+
+                return scene(obj)
+
+        # Query scene and update cache
+        #
+        node = scene.getNodeByName(name)
+
+        if node is not None:
+
+            self._nodes[key] = om.MObjectHandle(node.object())
+
+        else:
+
+            self._nodes.pop(key, None)
+
+        return node
+
+    def findSpecsByName(self, component, name):
+        """
+        Returns the skeleton specs, and their owning components, with the specified name.
+
+        :type component: rigotron.components.basecomponent.BaseComponent
+        :type name: str
+        :rtype: List[SpecEntry]
+        """
+
+        self.ensureIndexed(component)
+
+        return list(self._names.get(name, []))
+
+    def findSpecsByUuid(self, component, uuid):
+        """
+        Returns the skeleton specs, and their owning components, with the specified UUID.
+
+        :type component: rigotron.components.basecomponent.BaseComponent
+        :type uuid: om.MUuid
+        :rtype: List[SpecEntry]
+        """
+
+        self.ensureIndexed(component)
+
+        return list(self._uuids.get(self.uuidKey(uuid), []))
+
+    def findSpecsByType(self, component, side, type):
+        """
+        Returns the skeleton specs, and their owning components, with the specified side and type.
+
+        :type component: rigotron.components.basecomponent.BaseComponent
+        :type side: rigotron.libs.Side
+        :type type: rigotron.libs.Type
+        :rtype: List[SpecEntry]
+        """
+
+        self.ensureIndexed(component)
+
+        return list(self._types.get((side, type), []))
+    # endregion
+
+
+def invalidate(component):
+    """
+    Marks the supplied component as stale inside the shared spec index.
+
+    :type component: Union[rigotron.components.basecomponent.BaseComponent, None]
+    :rtype: None
+    """
+
+    if SpecIndex.__instance__ is not None and component is not None:
+
+        SpecIndex.__instance__.invalidate(component)
+
+
+def findNodeByName(scene, name):
+    """
+    Returns the scene node with the specified name from the shared spec index.
+
+    :type scene: mpy.mpyscene.MPyScene
+    :type name: str
+    :rtype: Union[mpy.mpynode.MPyNode, None]
+    """
+
+    return SpecIndex.getInstance().findNodeByName(scene, name)
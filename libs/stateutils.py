@@ -1,4 +1,5 @@
-from . import Side, Status
+from contextlib import contextmanager
+from . import Side, Status, buildprofiler, buildsession
 from ..components import basecomponent
 from dcc.maya.decorators import undo, animate
 
@@ -8,6 +9,183 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+__profiler__ = None
+
+
+def invoke(obj, phase, *args, **kwargs):
+    """
+    Calls the specified phase on the supplied object.
+    If a profiler is active then the phase is recorded!
+
+    :type obj: Union[basecomponent.BaseComponent, rigotron.interfaces.controlrig.ControlRig]
+    :type phase: str
+    :rtype: Any
+    """
+
+    if __profiler__ is not None:
+
+        return __profiler__.profile(obj, phase, *args, **kwargs)
+
+    else:
+
+        return getattr(obj, phase)(*args, **kwargs)
+
+
+@contextmanager
+def deferSave(controlRig):
+    """
+    Returns a context manager that coalesces any referenced skeleton saves into a single save.
+    The save is committed once the outermost scope exits so any reference reloads must happen afterward!
+
+    :type controlRig: rigotron.interfaces.controlrig.ControlRig
+    :rtype: Iterator[None]
+    """
+
+    manager = controlRig.getSkeletonManager()
+
+    with manager.deferSave():
+
+        yield
+
+
+def iterFingerprints(component):
+    """
+    Returns a generator that yields the fingerprint for each component in the supplied hierarchy.
+    Parent fingerprints are reused as the hierarchy is walked to avoid recomputing them!
+
+    :type component: basecomponent.BaseComponent
+    :rtype: Iterator[Tuple[basecomponent.BaseComponent, str]]
+    """
+
+    fingerprints = {}
+
+    for childComponent in component.walkComponents():
+
+        componentParent = childComponent.componentParent()
+        parentFingerprint = fingerprints.get(componentParent.hashCode(), None) if componentParent is not None else ''
+
+        fingerprint = childComponent.fingerprint(parentFingerprint=parentFingerprint)
+        fingerprints[childComponent.hashCode()] = fingerprint
+
+        yield childComponent, fingerprint
+
+
+def markFingerprints(component):
+    """
+    Records the current fingerprint for each component in the supplied hierarchy.
+
+    :type component: basecomponent.BaseComponent
+    :rtype: None
+    """
+
+    for (childComponent, fingerprint) in iterFingerprints(component):
+
+        childComponent.markFingerprint(fingerprint)
+
+
+def markComponentFingerprints(components, fingerprints):
+    """
+    Records the current fingerprint for each of the supplied components.
+    Components are expected in hierarchy order, the supplied fingerprints are reused for any parents so only these components are re-hashed!
+
+    :type components: List[basecomponent.BaseComponent]
+    :type fingerprints: Dict[int, str]
+    :rtype: None
+    """
+
+    for childComponent in components:
+
+        componentParent = childComponent.componentParent()
+        parentFingerprint = fingerprints.get(componentParent.hashCode(), None) if componentParent is not None else ''
+
+        fingerprint = childComponent.fingerprint(parentFingerprint=parentFingerprint)
+        fingerprints[childComponent.hashCode()] = fingerprint
+
+        childComponent.markFingerprint(fingerprint)
+
+
+def collectDependents(component, components):
+    """
+    Returns the components, from the supplied hierarchy, that require finalizing once the supplied components are rebuilt.
+    Ancestors are only included if their class opts into re-finalizing since most finalizers cannot safely run twice!
+
+    :type component: basecomponent.BaseComponent
+    :type components: List[basecomponent.BaseComponent]
+    :rtype: List[basecomponent.BaseComponent]
+    """
+
+    hashCodes = set()
+
+    for childComponent in components:
+
+        hashCodes.add(childComponent.hashCode())
+        hashCodes.update([ancestor.hashCode() for ancestor in childComponent.iterComponentAncestors() if ancestor.__refinalize__])
+
+    return [childComponent for childComponent in component.walkComponents() if childComponent.hashCode() in hashCodes]
+
+
+def bindSkeletons(components):
+    """
+    Binds the export skeleton for the supplied components in a single rig-wide pass.
+    Every component is parented first, after which all the drivers are resolved and bound at once!
+    Returns a report describing how each export joint was bound.
+
+    :type components: List[basecomponent.BaseComponent]
+    :rtype: Union[rigotron.libs.driverspec.BindReport, None]
+    """
+
+    # Check if there are any components
+    #
+    components = list(components)
+
+    if len(components) == 0:
+
+        return None
+
+    # Parent export skeleton
+    #
+    for childComponent in components:
+
+        invoke(childComponent, 'parentSkeleton')
+
+    # Bind export skeleton
+    #
+    skeletonSpecs = [skeletonSpec for childComponent in components for skeletonSpec in childComponent.skeleton(flatten=True)]
+
+    manager = components[0].skeletonManager()
+    return invoke(manager, 'bindJoints', skeletonSpecs)
+
+
+def unbindSkeletons(components):
+    """
+    Unbinds the export skeleton for the supplied components in a single rig-wide pass.
+
+    :type components: List[basecomponent.BaseComponent]
+    :rtype: None
+    """
+
+    # Check if there are any components
+    #
+    components = list(components)
+
+    if len(components) == 0:
+
+        return
+
+    # Un-parent export skeleton
+    #
+    for childComponent in components:
+
+        invoke(childComponent, 'unparentSkeleton')
+
+    # Unbind export skeleton
+    #
+    skeletonSpecs = [skeletonSpec for childComponent in components for skeletonSpec in childComponent.skeleton(flatten=True)]
+
+    manager = components[0].skeletonManager()
+    invoke(manager, 'unbindJoints', skeletonSpecs, reset=True)
+
+
 def metaToSkeleton(component):
     """
     Changes the supplied rig's state from meta to skeleton.
@@ -18,20 +196,23 @@ def metaToSkeleton(component):
 
     controlRig = component.findControlRig()
 
-    for childComponent in component.walkComponents():
+    with deferSave(controlRig):
+
+        for childComponent in component.walkComponents():
 
-        childComponent.prepareToBuildSkeleton()
-        childComponent.buildSkeleton()
-        childComponent.skeletonCompleted()
+            invoke(childComponent, 'prepareToBuildSkeleton')
+            invoke(childComponent, 'buildSkeleton')
+            invoke(childComponent, 'skeletonCompleted')
 
-    controlRig.saveSkeleton()
-    controlRig.loadSkeleton(clearEdits=True)
+        invoke(controlRig, 'saveSkeleton')
+
+    invoke(controlRig, 'loadSkeleton', clearEdits=True)
 
     for childComponent in component.walkComponents():
 
-        childComponent.prepareToBuildPivots()
-        childComponent.buildPivots()
-        childComponent.pivotsCompleted()
+        invoke(childComponent, 'prepareToBuildPivots')
+        invoke(childComponent, 'buildPivots')
+        invoke(childComponent, 'pivotsCompleted')
 
         childComponent.componentStatus = Status.SKELETON  # Setting this too early prevents pivot specs from invalidating!
 
@@ -46,24 +227,192 @@ def skeletonToRig(component):
     
     controlRig = component.findControlRig()
 
+    with deferSave(controlRig):
+
+        for childComponent in component.walkComponents():
+
+            invoke(childComponent, 'cachePivots', delete=True)
+            invoke(childComponent, 'cacheSkeleton', delete=False, push=True, save=False)
+
+            invoke(childComponent, 'prepareToBuildRig')
+            invoke(childComponent, 'buildRig')
+            invoke(childComponent, 'rigCompleted')
+
+            childComponent.componentStatus = Status.RIG  # Setting this too late prevents components from finalizing!
+
+        for childComponent in component.walkComponents():
+
+            invoke(childComponent, 'finalizeRig')
+
+        bindSkeletons(component.walkComponents())
+
+        invoke(controlRig, 'saveSkeleton')
+
+    invoke(controlRig, 'loadSkeleton', clearEdits=False, force=True)
+
+    markFingerprints(component)
+
+
+def metaToRig(component):
+    """
+    Changes the supplied rig's state from meta to rig.
+    Unlike calling `metaToSkeleton` followed by `skeletonToRig`, the referenced skeleton is only saved and reloaded once!
+    This is achieved by parenting the export skeleton before the reload, the skeleton specs do not require caching since they were just synchronized.
+
+    :type component: basecomponent.BaseComponent
+    :rtype: None
+    """
+
+    controlRig = component.findControlRig()
+
+    with deferSave(controlRig):
+
+        for childComponent in component.walkComponents():
+
+            invoke(childComponent, 'prepareToBuildSkeleton')
+            invoke(childComponent, 'buildSkeleton')
+            invoke(childComponent, 'skeletonCompleted')
+
+        for childComponent in component.walkComponents():
+
+            invoke(childComponent, 'parentSkeleton')
+
+        invoke(controlRig, 'saveSkeleton')
+
+    invoke(controlRig, 'loadSkeleton', clearEdits=True)
+
     for childComponent in component.walkComponents():
 
-        childComponent.cachePivots(delete=True)
-        childComponent.cacheSkeleton(delete=False, push=True, save=False)
+        invoke(childComponent, 'prepareToBuildPivots')
+        invoke(childComponent, 'buildPivots')
+        invoke(childComponent, 'pivotsCompleted')
+
+        childComponent.componentStatus = Status.SKELETON  # Setting this too early prevents pivot specs from invalidating!
 
-        childComponent.prepareToBuildRig()
-        childComponent.buildRig()
-        childComponent.rigCompleted()
+    for childComponent in component.walkComponents():
+
+        invoke(childComponent, 'cachePivots', delete=True)
+
+        invoke(childComponent, 'prepareToBuildRig')
+        invoke(childComponent, 'buildRig')
+        invoke(childComponent, 'rigCompleted')
 
         childComponent.componentStatus = Status.RIG  # Setting this too late prevents components from finalizing!
 
     for childComponent in component.walkComponents():
 
-        childComponent.finalizeRig()
-        childComponent.bindSkeleton()
+        invoke(childComponent, 'finalizeRig')
+
+    bindSkeletons(component.walkComponents())  # The export skeleton has already been parented so this will only bind the drivers!
+
+    markFingerprints(component)
+
+
+def rebuildRig(component):
+    """
+    Rebuilds only the components whose fingerprint has changed since the rig was last built.
+    Since fingerprints include the parent fingerprint, any descendants of a changed component are rebuilt as well.
+    Any ancestors that opt into re-finalizing are finalized again since they may depend on their children!
+
+    :type component: basecomponent.BaseComponent
+    :rtype: None
+    """
+
+    # Collect outdated components
+    # The fingerprints are kept so the unchanged parents do not need re-hashing afterwards!
+    #
+    fingerprints = {}
+    components = []
+
+    for (childComponent, fingerprint) in iterFingerprints(component):
+
+        fingerprints[childComponent.hashCode()] = fingerprint
+
+        if childComponent.isFingerprintOutdated(fingerprint):
+
+            components.append(childComponent)
+
+    numComponents = len(components)
+
+    if numComponents == 0:
+
+        log.info(f'"{component}" rig is already up-to-date!')
+        return
+
+    log.info(f'Rebuilding {numComponents} outdated component(s)...')
+
+    # Collect dependent components
+    #
+    dependents = collectDependents(component, components)
+
+    # Rebuild skeleton for outdated components
+    #
+    controlRig = component.findControlRig()
+    manager = controlRig.getSkeletonManager()
+
+    with deferSave(controlRig):
+
+        skeletonSpecs = [skeletonSpec for childComponent in components for skeletonSpec in childComponent.skeleton(flatten=True)]
+        unbindSkeletons(reversed(components))
+
+        for childComponent in reversed(components):
+
+            invoke(childComponent, 'deleteRig', unbind=False)
+
+            childComponent.componentStatus = Status.META  # Reverting the status allows the skeleton specs to invalidate!
+
+        for childComponent in components:
+
+            invoke(childComponent, 'prepareToBuildSkeleton')
+            invoke(childComponent, 'buildSkeleton')
+            invoke(childComponent, 'skeletonCompleted')
+
+        for childComponent in components:
+
+            invoke(childComponent, 'parentSkeleton')
 
-    controlRig.saveSkeleton()
-    controlRig.loadSkeleton(clearEdits=False, force=True)
+        invoke(controlRig, 'saveSkeleton')
+
+    # Clear attribute edits on rebuilt joints
+    # Any stale edits would otherwise override the rebuilt skeleton once it is reloaded, both the old and new joint names are cleared!
+    #
+    skeletonSpecs.extend([skeletonSpec for childComponent in components for skeletonSpec in childComponent.skeleton(flatten=True)])
+    invoke(manager, 'clearJointEdits', skeletonSpecs, editCommand='setAttr')
+
+    invoke(controlRig, 'loadSkeleton', clearEdits=False, force=True)
+
+    # Rebuild rig for outdated components
+    #
+    for childComponent in components:
+
+        invoke(childComponent, 'prepareToBuildPivots')
+        invoke(childComponent, 'buildPivots')
+        invoke(childComponent, 'pivotsCompleted')
+
+        childComponent.componentStatus = Status.SKELETON
+
+    for childComponent in components:
+
+        invoke(childComponent, 'cachePivots', delete=True)
+
+        invoke(childComponent, 'prepareToBuildRig')
+        invoke(childComponent, 'buildRig')
+        invoke(childComponent, 'rigCompleted')
+
+        childComponent.componentStatus = Status.RIG
+
+    # Finalize dependent components
+    #
+    for childComponent in dependents:
+
+        invoke(childComponent, 'finalizeRig')
+
+    bindSkeletons(components)
+
+    # Record fingerprints for rebuilt components
+    # These are re-hashed since building updates their specs!
+    #
+    markComponentFingerprints(components, fingerprints)
 
 
 def rigToSkeleton(component):
@@ -76,18 +425,23 @@ def rigToSkeleton(component):
 
     controlRig = component.findControlRig()
 
-    for childComponent in reversed(list(component.walkComponents())):
+    with deferSave(controlRig):
 
-        childComponent.deleteRig()
+        unbindSkeletons(reversed(list(component.walkComponents())))
 
-        childComponent.prepareToBuildPivots()
-        childComponent.buildPivots()
-        childComponent.pivotsCompleted()
+        for childComponent in reversed(list(component.walkComponents())):
 
-        childComponent.componentStatus = Status.SKELETON
+            invoke(childComponent, 'deleteRig', unbind=False)
+
+            invoke(childComponent, 'prepareToBuildPivots')
+            invoke(childComponent, 'buildPivots')
+            invoke(childComponent, 'pivotsCompleted')
+
+            childComponent.componentStatus = Status.SKELETON
 
-    controlRig.saveSkeleton()
-    controlRig.loadSkeleton(clearEdits=True, force=True)
+        invoke(controlRig, 'saveSkeleton')
+
+    invoke(controlRig, 'loadSkeleton', clearEdits=True, force=True)
 
 
 def skeletonToMeta(component):
@@ -100,24 +454,79 @@ def skeletonToMeta(component):
 
     controlRig = component.findControlRig()
 
-    for childComponent in reversed(list(component.walkComponents())):
+    with deferSave(controlRig):
+
+        for childComponent in reversed(list(component.walkComponents())):
+
+            invoke(childComponent, 'cachePivots', delete=True)
+            invoke(childComponent, 'cacheSkeleton', delete=True)
 
-        childComponent.cachePivots(delete=True)
-        childComponent.cacheSkeleton(delete=True)
+            childComponent.componentStatus = Status.META
 
-        childComponent.componentStatus = Status.META
+        invoke(controlRig, 'unloadSkeleton')
+        invoke(controlRig, 'saveSkeleton')
 
-    controlRig.unloadSkeleton()
-    controlRig.saveSkeleton()
+
+@contextmanager
+def profile(profiler):
+    """
+    Returns a context manager that records every component phase with the supplied profiler.
+
+    :type profiler: buildprofiler.BuildProfiler
+    :rtype: Iterator[buildprofiler.BuildProfiler]
+    """
+
+    global __profiler__
+
+    previous, __profiler__ = __profiler__, profiler
+
+    try:
+
+        with profiler:
+
+            yield profiler
+
+    finally:
+
+        __profiler__ = previous
+
+
+def profileState(component, state, filePath=None, incremental=False):
+    """
+    Changes the state on the supplied control rig while profiling each component phase.
+    The sorted report is logged and, if a file path is supplied, a Chrome trace is saved!
+
+    :type component: basecomponent.BaseComponent
+    :type state: Status
+    :type filePath: Union[str, None]
+    :type incremental: bool
+    :rtype: buildprofiler.BuildProfiler
+    """
+
+    profiler = buildprofiler.BuildProfiler()
+
+    with profile(profiler):
+
+        changeState(component, state, incremental=incremental)
+
+    log.info(f'Build profile:\n{profiler.report()}')
+
+    if filePath is not None:
+
+        profiler.saveTrace(filePath)
+
+    return profiler
 
 
 @undo.Undo(state=False)
-def changeState(component, state):
+def changeState(component, state, incremental=False):
     """
     Changes the state on the supplied control rig.
+    Enabling `incremental` will only rebuild the rig components whose fingerprint has changed!
 
     :type component: basecomponent.BaseComponent
     :type state: Status
+    :type incremental: bool
     :rtype: bool
     """
 
@@ -138,8 +547,9 @@ def changeState(component, state):
         return False
 
     # Process state change
+    # Any reorganized specs are memoized until the state change is complete!
     #
-    with animate.Animate(state=False):
+    with animate.Animate(state=False), buildsession.session():
 
         if currentState == Status.META:
 
@@ -155,8 +565,7 @@ def changeState(component, state):
 
             else:
 
-                metaToSkeleton(component)
-                skeletonToRig(component)
+                metaToRig(component)
 
             return True
 
@@ -191,6 +600,10 @@ def changeState(component, state):
 
                 rigToSkeleton(component)
 
+            elif incremental:
+
+                rebuildRig(component)
+
             else:
 
                 pass
@@ -0,0 +1,398 @@
+import time
+
+try:
+
+    import numpy as np
+
+except ImportError:
+
+    np = None
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def isAvailable():
+    """
+    Evaluates if NumPy is available.
+
+    :rtype: bool
+    """
+
+    return np is not None
+
+
+class TransformTable(object):
+    """
+    Base class used to store a rig's spec transforms as a structure of arrays.
+    Matrices are stored as an (N, 4, 4) float64 array alongside an array of parent row indices, -1 denotes no parent.
+    Matrices follow Maya's row-vector convention so world matrices are composed as `local * parentWorld`!
+    Parents must precede their children, the same as the pre-order returned by `BaseComponent.flattenSpecs`.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_matrices', '_parents', '_depths', '_levels', '_specs', '_rows', '_worldMatrices')
+
+    def __init__(self, matrices, parents, specs=None):
+        """
+        Private method called after a new instance is created.
+
+        :type matrices: Union[np.ndarray, List[List[float]]]
+        :type parents: Union[np.ndarray, List[int]]
+        :type specs: Union[List[rigotron.abstract.abstractspec.AbstractSpec], None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(TransformTable, self).__init__()
+
+        # Check if numpy is available
+        #
+        if not isAvailable():
+
+            raise ImportError('TransformTable() requires numpy!')
+
+        # Evaluate supplied arrays
+        #
+        matrices = np.array(matrices, dtype=np.float64).reshape(-1, 4, 4)
+        parents = np.array(parents, dtype=np.int64).reshape(-1)
+
+        if len(matrices) != len(parents):
+
+            raise TypeError(f'TransformTable() expects the same number of matrices and parents ({len(matrices)} and {len(parents)} given)!')
+
+        if np.any(parents >= np.arange(len(parents))):
+
+            raise TypeError('TransformTable() expects parents to precede their children!')
+
+        # Declare private variables
+        #
+        self._matrices = matrices
+        self._parents = parents
+        self._depths = None
+        self._levels = None
+        self._specs = list(specs) if specs is not None else []
+        self._rows = {id(spec): row for (row, spec) in enumerate(self._specs)}
+        self._worldMatrices = None
+
+    def __len__(self):
+        """
+        Private method that returns the number of rows.
+
+        :rtype: int
+        """
+
+        return len(self._matrices)
+    # endregion
+
+    # region Properties
+    @property
+    def matrices(self):
+        """
+        Getter method that returns the local matrices.
+        Any changes made to this array require `invalidate` to be called!
+
+        :rtype: np.ndarray
+        """
+
+        return self._matrices
+
+    @property
+    def parents(self):
+        """
+        Getter method that returns the parent row indices.
+
+        :rtype: np.ndarray
+        """
+
+        return self._parents
+
+    @property
+    def specs(self):
+        """
+        Getter method that returns the specs associated with each row.
+
+        :rtype: List[rigotron.abstract.abstractspec.AbstractSpec]
+        """
+
+        return self._specs
+    # endregion
+
+    # region Methods
+    @classmethod
+    def fromSpecs(cls, specs):
+        """
+        Returns a new table from the supplied pre-ordered specs.
+        Any spec whose parent is not in the supplied list is considered to be in world space!
+
+        :type specs: List[rigotron.abstract.abstractspec.AbstractSpec]
+        :rtype: TransformTable
+        """
+
+        rows = {}
+        matrices = []
+        parents = []
+
+        for (row, spec) in enumerate(specs):
+
+            rows[id(spec)] = row
+            matrices.append(list(spec.matrix.asMatrix()))
+            parents.append(rows.get(id(spec.parent), -1))
+
+        return cls(matrices, parents, specs=specs)
+
+    @classmethod
+    def random(cls, size, chainLength=8, seed=None):
+        """
+        Returns a new table populated with random chains of transforms.
+        This is intended for benchmarking outside of Maya!
+
+        :type size: int
+        :type chainLength: int
+        :type seed: Union[int, None]
+        :rtype: TransformTable
+        """
+
+        generator = np.random.default_rng(seed)
+
+        matrices = np.tile(np.eye(4), (size, 1, 1))
+        matrices[:, :3, :3] += generator.normal(scale=0.1, size=(size, 3, 3))
+        matrices[:, 3, :3] = generator.normal(scale=10.0, size=(size, 3))
+
+        parents = np.arange(-1, size - 1)
+        parents[::chainLength] = -1
+
+        return cls(matrices, parents)
+
+    def rowOf(self, spec):
+        """
+        Returns the row associated with the supplied spec.
+
+        :type spec: rigotron.abstract.abstractspec.AbstractSpec
+        :rtype: int
+        """
+
+        return self._rows.get(id(spec), -1)
+
+    def invalidate(self):
+        """
+        Removes any cached world matrices.
+
+        :rtype: None
+        """
+
+        self._worldMatrices = None
+
+    def depths(self):
+        """
+        Returns the hierarchical depth of each row.
+
+        :rtype: np.ndarray
+        """
+
+        if self._depths is None:
+
+            depths = np.zeros(len(self._parents), dtype=np.int64)
+
+            for (row, parent) in enumerate(self._parents.tolist()):
+
+                if parent >= 0:
+
+                    depths[row] = depths[parent] + 1
+
+            self._depths = depths
+
+        return self._depths
+
+    def levels(self):
+        """
+        Returns the rows grouped by hierarchical depth.
+        Each level only depends on the levels above it so it can be composed in a single batch!
+
+        :rtype: List[np.ndarray]
+        """
+
+        if self._levels is None:
+
+            depths = self.depths()
+            maxDepth = int(depths.max()) if len(depths) > 0 else -1
+
+            self._levels = [np.flatnonzero(depths == depth) for depth in range(maxDepth + 1)]
+
+        return self._levels
+
+    def worldMatrices(self):
+        """
+        Returns the world matrices for every row.
+        World matrices are composed one hierarchical level at a time, the results are cached until invalidated!
+
+        :rtype: np.ndarray
+        """
+
+        if self._worldMatrices is not None:
+
+            return self._worldMatrices
+
+        worldMatrices = self._matrices.copy()
+
+        for rows in self.levels()[1:]:
+
+            worldMatrices[rows] = np.matmul(self._matrices[rows], worldMatrices[self._parents[rows]])
+
+        self._worldMatrices = worldMatrices
+        return worldMatrices
+
+    def localMatrices(self, worldMatrices):
+        """
+        Returns the local matrices for the supplied world matrices.
+
+        :type worldMatrices: np.ndarray
+        :rtype: np.ndarray
+        """
+
+        worldMatrices = np.asarray(worldMatrices, dtype=np.float64).reshape(-1, 4, 4)
+        localMatrices = worldMatrices.copy()
+
+        rows = np.flatnonzero(self._parents >= 0)
+        localMatrices[rows] = np.matmul(worldMatrices[rows], np.linalg.inv(worldMatrices[self._parents[rows]]))
+
+        return localMatrices
+
+    def bounds(self):
+        """
+        Returns the minimum and maximum world positions.
+
+        :rtype: Tuple[np.ndarray, np.ndarray]
+        """
+
+        if len(self) == 0:
+
+            return np.zeros(3), np.zeros(3)
+
+        positions = self.worldMatrices()[:, 3, :3]
+        return positions.min(axis=0), positions.max(axis=0)
+
+    def mirrorMatrices(self, axis=0, behavior=True):
+        """
+        Returns the world matrices mirrored across the specified world axis.
+        Enabling `behavior` negates the axis vectors to preserve a right-handed coordinate system!
+
+        :type axis: int
+        :type behavior: bool
+        :rtype: np.ndarray
+        """
+
+        return mirrorMatrices(self.worldMatrices(), axis=axis, negateAxes=(0, 1, 2) if behavior else ())
+
+    def apply(self, matrices=None):
+        """
+        Updates the associated specs from the supplied local matrices.
+        If no matrices are supplied then the table's local matrices are used instead!
+
+        :type matrices: Union[np.ndarray, None]
+        :rtype: None
+        """
+
+        from maya.api import OpenMaya as om  # Deferred so the table can be used outside of Maya!
+
+        matrices = self._matrices if matrices is None else np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+
+        for (spec, matrix) in zip(self._specs, matrices):
+
+            spec.matrix = om.MMatrix(matrix.ravel().tolist())
+    # endregion
+
+
+def mirrorMatrices(matrices, axis=0, negateAxes=(0, 1, 2)):
+    """
+    Returns a copy of the supplied matrices mirrored across the specified world axis.
+    Any of the specified axis vectors are negated afterward, negating all of them preserves a right-handed coordinate system!
+
+    :type matrices: Union[np.ndarray, List[List[float]]]
+    :type axis: int
+    :type negateAxes: Tuple[int]
+    :rtype: np.ndarray
+    """
+
+    mirroredMatrices = np.array(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    mirroredMatrices[:, :, axis] *= -1.0
+
+    for negateAxis in negateAxes:
+
+        mirroredMatrices[:, negateAxis, :3] *= -1.0
+
+    return mirroredMatrices
+
+
+def composeWorldMatrices(matrices, parents):
+    """
+    Returns the world matrices for the supplied local matrices using pure python.
+    This is the per-spec loop that `TransformTable.worldMatrices` replaces!
+
+    :type matrices: List[List[List[float]]]
+    :type parents: List[int]
+    :rtype: List[List[List[float]]]
+    """
+
+    worldMatrices = []
+
+    for (matrix, parent) in zip(matrices, parents):
+
+        if parent < 0:
+
+            worldMatrices.append(matrix)
+            continue
+
+        parentMatrix = worldMatrices[parent]
+        worldMatrices.append([[sum(row[k] * parentMatrix[k][j] for k in range(4)) for j in range(4)] for row in matrix])
+
+    return worldMatrices
+
+
+def benchmark(size=1000, iterations=10, seed=None):
+    """
+    Compares the vectorized world matrix composition against the pure python loop.
+    This benchmark does not require Maya!
+
+    :type size: int
+    :type iterations: int
+    :type seed: Union[int, None]
+    :rtype: Dict[str, float]
+    """
+
+    # Build random table
+    #
+    table = TransformTable.random(size, seed=seed)
+    matrices = table.matrices.tolist()
+    parents = table.parents.tolist()
+
+    # Time pure python composition
+    #
+    startTime = time.perf_counter()
+
+    for i in range(iterations):
+
+        composeWorldMatrices(matrices, parents)
+
+    loopTime = (time.perf_counter() - startTime) / iterations
+
+    # Time vectorized composition
+    #
+    startTime = time.perf_counter()
+
+    for i in range(iterations):
+
+        table.invalidate()
+        table.worldMatrices()
+
+    tableTime = (time.perf_counter() - startTime) / iterations
+
+    # Verify results match
+    #
+    isEquivalent = np.allclose(np.array(composeWorldMatrices(matrices, parents)), table.worldMatrices())
+
+    log.info(f'Composed {size} world matrices: loop={loopTime * 1e3:.3f}ms, table={tableTime * 1e3:.3f}ms ({loopTime / max(tableTime, 1e-9):.1f}x), equivalent={isEquivalent}')
+    return {'size': size, 'loop': loopTime, 'table': tableTime, 'equivalent': isEquivalent}
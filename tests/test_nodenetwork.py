@@ -0,0 +1,140 @@
+import unittest
+
+from ..libs import nodenetwork
+
+
+class TestNodeNetwork(unittest.TestCase):
+    """
+    Test case for the pure python node network descriptions.
+    """
+
+    # region Tests
+    def test_describeNetwork(self):
+        """
+        Tests that nodes, values and connections are described in the order they were added.
+
+        :rtype: None
+        """
+
+        network = nodenetwork.NodeNetwork()
+
+        upperLength = network.createNode('plusMinusAverage', name='L_Arm_Length')
+        network.setAttr(upperLength['operation'], 1)
+
+        composeMatrix = network.createNode('composeMatrix', name='L_Arm_composeMatrix')
+        network.setAttr(composeMatrix['inputRotate'], (0.0, 0.0, 1.5), convertUnits=False)
+        network.connectPlugs(upperLength['output1D'], composeMatrix['inputTranslateX'])
+
+        target = network.createNode('transform', name='L_Arm_target', parent='L_Arm_Private')
+        child = network.createNode('transform', name='L_Arm_child', parent=target)
+        network.connectPlugs(composeMatrix['outputMatrix'], target['offsetParentMatrix'])
+
+        self.assertEqual(len(network), 4)
+        self.assertEqual([node.index for node in network], [0, 1, 2, 3])
+        self.assertEqual([node.typeName for node in network.nodes], ['plusMinusAverage', 'composeMatrix', 'transform', 'transform'])
+        self.assertIs(child.parent, target)
+
+        self.assertEqual(
+            network.values,
+            [
+                (nodenetwork.NetworkPlug(upperLength, 'operation'), 1, True),
+                (nodenetwork.NetworkPlug(composeMatrix, 'inputRotate'), (0.0, 0.0, 1.5), False)
+            ]
+        )
+
+        self.assertEqual(
+            network.connections,
+            [
+                (upperLength['output1D'], composeMatrix['inputTranslateX'], False),
+                (composeMatrix['outputMatrix'], target['offsetParentMatrix'], False)
+            ]
+        )
+
+        self.assertEqual(
+            network.describe(),
+            {
+                'nodes': [
+                    {'typeName': 'plusMinusAverage', 'name': 'L_Arm_Length', 'parent': None},
+                    {'typeName': 'composeMatrix', 'name': 'L_Arm_composeMatrix', 'parent': None},
+                    {'typeName': 'transform', 'name': 'L_Arm_target', 'parent': 'L_Arm_Private'},
+                    {'typeName': 'transform', 'name': 'L_Arm_child', 'parent': 2}
+                ],
+                'values': [
+                    [[0, 'operation'], 1, True],
+                    [[1, 'inputRotate'], (0.0, 0.0, 1.5), False]
+                ],
+                'connections': [
+                    [[0, 'output1D'], [1, 'inputTranslateX'], False],
+                    [[1, 'outputMatrix'], [2, 'offsetParentMatrix'], False]
+                ]
+            }
+        )
+
+    def test_connectPlugs(self):
+        """
+        Tests that duplicate destinations are skipped unless the connection is forced.
+
+        :rtype: None
+        """
+
+        network = nodenetwork.NodeNetwork()
+
+        upperLength = network.createNode('plusMinusAverage')
+        upperInverseLength = network.createNode('floatMath')
+        composeMatrix = network.createNode('composeMatrix')
+
+        network.connectPlugs(upperLength['output1D'], composeMatrix['inputTranslateX'])
+
+        with self.assertLogs(nodenetwork.log, level='WARNING'):
+
+            network.connectPlugs(upperInverseLength['outFloat'], composeMatrix['inputTranslateX'])
+
+        self.assertEqual(network.connections, [(upperLength['output1D'], composeMatrix['inputTranslateX'], False)])
+
+        network.connectPlugs(upperInverseLength['outFloat'], composeMatrix['inputTranslateX'], force=True)
+
+        self.assertEqual(network.connections, [(upperInverseLength['outFloat'], composeMatrix['inputTranslateX'], True)])
+        self.assertEqual(network.findConnection(composeMatrix['inputTranslateX']), 0)
+        self.assertEqual(network.findConnection(composeMatrix['inputTranslateY']), -1)
+
+    def test_foreignParent(self):
+        """
+        Tests that nodes cannot be parented to nodes from another network.
+
+        :rtype: None
+        """
+
+        network = nodenetwork.NodeNetwork()
+        otherNetwork = nodenetwork.NodeNetwork()
+
+        parent = otherNetwork.createNode('transform')
+
+        self.assertFalse(network.isMember(parent))
+        self.assertTrue(otherNetwork.isMember(parent))
+
+        with self.assertRaises(TypeError):
+
+            network.createNode('transform', parent=parent)
+
+    def test_clear(self):
+        """
+        Tests that clearing a network removes all descriptions.
+
+        :rtype: None
+        """
+
+        network = nodenetwork.NodeNetwork()
+
+        node = network.createNode('floatMath')
+        network.setAttr(node['operation'], 5)
+        network.connectPlugs(node['outFloat'], node['inFloatA'])
+        network.clear()
+
+        self.assertEqual(len(network), 0)
+        self.assertEqual(network.describe(), {'nodes': [], 'values': [], 'connections': []})
+    # endregion
+
+
+if __name__ == '__main__':
+
+    unittest.main()
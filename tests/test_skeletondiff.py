@@ -0,0 +1,202 @@
+import unittest
+
+from ..libs import skeletondiff
+from ..libs.skeletondiff import Operation
+
+
+ROOT_UUID = '00000000-0000-0000-0000-000000000001'
+SPINE_UUID = '00000000-0000-0000-0000-000000000002'
+HEAD_UUID = '00000000-0000-0000-0000-000000000003'
+
+
+def createSnapshot():
+    """
+    Returns a snapshot of a small export skeleton.
+
+    :rtype: Dict[str, Dict[str, Any]]
+    """
+
+    return {
+        ROOT_UUID: {'name': 'root', 'parent': '', 'side': 0, 'translate': (0.0, 0.0, 0.0), 'rotate': (0.0, 0.0, 0.0)},
+        SPINE_UUID: {'name': 'spine_01', 'parent': ROOT_UUID, 'side': 0, 'translate': (0.0, 0.0, 100.0), 'rotate': (0.0, -90.0, 0.0)},
+        HEAD_UUID: {'name': 'head', 'parent': SPINE_UUID, 'side': 0, 'translate': (50.0, 0.0, 0.0), 'rotate': (0.0, 0.0, 0.0)}
+    }
+
+
+def createJoints():
+    """
+    Returns the joint descriptions that match the snapshot from `createSnapshot`.
+
+    :rtype: Dict[int, Dict[str, Any]]
+    """
+
+    return {
+        0: {'uuid': ROOT_UUID, 'enabled': True, 'name': 'root', 'parent': None, 'parentUUID': '', 'side': 0, 'translate': (0.0, 0.0, 0.0), 'rotate': (0.0, 0.0, 0.0)},
+        1: {'uuid': SPINE_UUID, 'enabled': True, 'name': 'spine_01', 'parent': 0, 'parentUUID': ROOT_UUID, 'side': 0, 'translate': (0.0, 0.0, 100.0), 'rotate': (0.0, -90.0, 0.0)},
+        2: {'uuid': HEAD_UUID, 'enabled': True, 'name': 'head', 'parent': 1, 'parentUUID': SPINE_UUID, 'side': 0, 'translate': (50.0, 0.0, 0.0), 'rotate': (0.0, 0.0, 0.0)}
+    }
+
+
+def noEdit(joints):
+    """
+    Leaves the supplied joint descriptions untouched.
+
+    :type joints: Dict[int, Dict[str, Any]]
+    :rtype: None
+    """
+
+    pass
+
+
+def renameHead(joints):
+    """
+    Renames the head joint description.
+
+    :type joints: Dict[int, Dict[str, Any]]
+    :rtype: None
+    """
+
+    joints[2]['name'] = 'head_01'
+
+
+def reparentHead(joints):
+    """
+    Reparents the head joint description to the root.
+
+    :type joints: Dict[int, Dict[str, Any]]
+    :rtype: None
+    """
+
+    joints[2].update({'parent': 0, 'parentUUID': ROOT_UUID})
+
+
+def nudgeHead(joints):
+    """
+    Moves the head joint description by less than the default tolerance.
+
+    :type joints: Dict[int, Dict[str, Any]]
+    :rtype: None
+    """
+
+    joints[2]['translate'] = (50.0005, 0.0, 0.0)
+
+
+def moveHead(joints):
+    """
+    Moves the head joint description by more than the default tolerance.
+
+    :type joints: Dict[int, Dict[str, Any]]
+    :rtype: None
+    """
+
+    joints[2]['translate'] = (55.0, 0.0, 0.0)
+
+
+def insertNeck(joints):
+    """
+    Inserts a new neck joint description between the spine and head.
+
+    :type joints: Dict[int, Dict[str, Any]]
+    :rtype: None
+    """
+
+    joints[3] = {'uuid': '', 'enabled': True, 'name': 'neck_01', 'parent': 1, 'parentUUID': SPINE_UUID, 'side': 0, 'translate': (40.0, 0.0, 0.0), 'rotate': (0.0, 0.0, 0.0)}
+    joints[2].update({'parent': 3, 'parentUUID': '', 'translate': (10.0, 0.0, 0.0)})
+
+    joints[2] = joints.pop(2)  # Children must come after their parents!
+
+
+def disableHead(joints):
+    """
+    Disables the head joint description.
+
+    :type joints: Dict[int, Dict[str, Any]]
+    :rtype: None
+    """
+
+    joints[2]['enabled'] = False
+
+
+class TestSkeletonDiff(unittest.TestCase):
+    """
+    Test case for diffing joint descriptions against export skeleton snapshots.
+    """
+
+    # region Tests
+    def test_diffSkeleton(self):
+        """
+        Tests that only the minimal edits are emitted for each kind of skeleton change.
+
+        :rtype: None
+        """
+
+        table = [
+            ('noOp', noEdit, 1e-3, []),
+            ('rename', renameHead, 1e-3, [(Operation.RENAME, 2, 'head_01')]),
+            (
+                'reparent',
+                reparentHead,
+                1e-3,
+                [
+                    (Operation.REPARENT, 2, 0),
+                    (Operation.SET_ATTR, 2, ('translate', (50.0, 0.0, 0.0))),
+                    (Operation.SET_ATTR, 2, ('rotate', (0.0, 0.0, 0.0)))
+                ]
+            ),
+            ('withinTolerance', nudgeHead, 1e-3, []),
+            ('outsideTolerance', nudgeHead, 1e-6, [(Operation.SET_ATTR, 2, ('translate', (50.0005, 0.0, 0.0)))]),
+            ('attributeChange', moveHead, 1e-3, [(Operation.SET_ATTR, 2, ('translate', (55.0, 0.0, 0.0)))]),
+            (
+                'createUnderPendingParent',
+                insertNeck,
+                1e-3,
+                [
+                    (Operation.CREATE, 3, 1),
+                    (Operation.SET_ATTR, 3, ('side', 0)),
+                    (Operation.SET_ATTR, 3, ('translate', (40.0, 0.0, 0.0))),
+                    (Operation.SET_ATTR, 3, ('rotate', (0.0, 0.0, 0.0))),
+                    (Operation.REPARENT, 2, 3),
+                    (Operation.SET_ATTR, 2, ('translate', (10.0, 0.0, 0.0))),
+                    (Operation.SET_ATTR, 2, ('rotate', (0.0, 0.0, 0.0)))
+                ]
+            ),
+            ('delete', disableHead, 1e-3, [(Operation.DELETE, 2, None)])
+        ]
+
+        for (name, edit, tolerance, expected) in table:
+
+            with self.subTest(name=name):
+
+                joints = createJoints()
+                edit(joints)
+
+                operations = skeletondiff.diffSkeleton(joints, createSnapshot(), tolerance=tolerance)
+                self.assertEqual(operations, expected)
+
+    def test_isClose(self):
+        """
+        Tests that sequences are compared element-wise and that mismatched types are never equivalent.
+
+        :rtype: None
+        """
+
+        table = [
+            ((1.0, 2.0, 3.0), (1.0, 2.0, 3.0005), 1e-3, True),
+            ((1.0, 2.0, 3.0), (1.0, 2.0, 3.0005), 1e-6, False),
+            ((1.0, 2.0), (1.0, 2.0, 3.0), 1e-3, False),
+            (1.0, 'joint', 1e-3, False),
+            ('joint', 'joint', 1e-3, True),
+            (0, 0.0, 1e-3, True)
+        ]
+
+        for (value, otherValue, tolerance, expected) in table:
+
+            with self.subTest(value=value, otherValue=otherValue, tolerance=tolerance):
+
+                self.assertEqual(skeletondiff.isClose(value, otherValue, tolerance=tolerance), expected)
+    # endregion
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,144 @@
+import math
+import unittest
+
+try:
+
+    from maya.api import OpenMaya as om
+
+except ImportError:
+
+    om = None
+
+
+@unittest.skipIf(om is None, 'speccodec requires the Maya python API!')
+class TestSpecCodec(unittest.TestCase):
+    """
+    Test case for the compact spec encoding.
+    """
+
+    # region Tests
+    def test_transformRoundTrip(self):
+        """
+        Tests that transform matrices keep their rotation order and rotation after a round trip.
+
+        :rtype: None
+        """
+
+        from ..libs import speccodec
+
+        for rotateOrder in range(om.MTransformationMatrix.kXYZ, om.MTransformationMatrix.kZYX + 1):
+
+            transform = om.MTransformationMatrix()
+            transform.reorderRotation(rotateOrder)
+            transform.setTranslation(om.MVector(1.0, 2.0, 3.0), om.MSpace.kTransform)
+            transform.setRotation(om.MEulerRotation(math.radians(10.0), math.radians(20.0), math.radians(30.0), rotateOrder - 1))
+
+            decoded = speccodec.loads(speccodec.dumps([transform]))[0]
+
+            self.assertIsInstance(decoded, om.MTransformationMatrix)
+            self.assertEqual(decoded.rotationOrder(), transform.rotationOrder())
+            self.assertTrue(decoded.rotation().isEquivalent(transform.rotation(), 1e-6))
+            self.assertTrue(decoded.asMatrix().isEquivalent(transform.asMatrix(), 1e-6))
+
+    def test_cleanRepushReusesFragments(self):
+        """
+        Tests that re-encoding clean specs reuses their cached fragments, and that only dirty specs are re-encoded.
+
+        :rtype: None
+        """
+
+        from ..libs import speccodec, skeletonspec
+
+        rootSpec = skeletonspec.SkeletonSpec()
+        rootSpec.name = 'Hand'
+
+        childSpec = skeletonspec.SkeletonSpec()
+        childSpec.name = 'Index'
+        rootSpec.children.append(childSpec)
+
+        # Encode specs twice with the same encoder
+        #
+        encoder = speccodec.SpecEncoder()
+        data = encoder.encode([rootSpec])
+
+        fragment = rootSpec.cachedFragment(encoder.token)
+        childFragment = childSpec.cachedFragment(encoder.token)
+
+        self.assertIsNotNone(fragment)
+        self.assertFalse(rootSpec.isDirty())
+        self.assertFalse(childSpec.isDirty())
+
+        self.assertIs(encoder.encodeObject(rootSpec), fragment)
+        self.assertEqual(encoder.encode([rootSpec]), data)
+
+        # Edit child spec and re-encode
+        #
+        childSpec.name = 'Middle'
+
+        self.assertTrue(rootSpec.isDirty())
+        self.assertNotEqual(encoder.encode([rootSpec]), data)
+        self.assertIsNot(rootSpec.cachedFragment(encoder.token), fragment)
+        self.assertIsNot(childSpec.cachedFragment(encoder.token), childFragment)
+
+    def test_decodedRepushReusesBytes(self):
+        """
+        Tests that decoded specs which remain clean are re-encoded to the exact same bytes by the paired encoder.
+
+        :rtype: None
+        """
+
+        from ..libs import speccodec, skeletonspec
+
+        rootSpec = skeletonspec.SkeletonSpec()
+        rootSpec.name = 'Face'
+        rootSpec.children.extend([skeletonspec.SkeletonSpec(), skeletonspec.SkeletonSpec()])
+
+        data = speccodec.SpecEncoder().encode([rootSpec])
+
+        decoder = speccodec.SpecDecoder(lazy=False)
+        specs = decoder.decode(data)
+
+        self.assertFalse(specs[0].isDirty())
+        self.assertIsNotNone(specs[0].cachedFragment(decoder.encoder.token))
+        self.assertEqual(decoder.encoder.encode(specs), data)
+
+    def test_lazyChildrenStayClean(self):
+        """
+        Tests that materializing lazily decoded children leaves the specs clean and their fragments reusable.
+
+        :rtype: None
+        """
+
+        from ..libs import speccodec, skeletonspec
+
+        rootSpec = skeletonspec.SkeletonSpec()
+        rootSpec.name = 'Face'
+
+        childSpec = skeletonspec.SkeletonSpec()
+        childSpec.name = 'Jaw'
+        childSpec.children.append(skeletonspec.SkeletonSpec())
+        rootSpec.children.append(childSpec)
+
+        data = speccodec.SpecEncoder().encode([rootSpec])
+
+        decoder = speccodec.SpecDecoder(lazy=True)
+        specs = decoder.decode(data)
+
+        children = specs[0].children
+
+        self.assertEqual(len(children), 1)
+        self.assertIs(children[0].parent, specs[0])
+        self.assertFalse(specs[0].isDirty())
+        self.assertFalse(children[0].isDirty())
+        self.assertEqual(decoder.encoder.encode(specs), data)
+
+        # Check that edits are still tracked
+        #
+        children[0].children.append(skeletonspec.SkeletonSpec())
+        self.assertTrue(specs[0].isDirty())
+    # endregion
+
+
+if __name__ == '__main__':
+
+    unittest.main()
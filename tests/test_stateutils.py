@@ -0,0 +1,135 @@
+import unittest
+
+try:
+
+    from maya.api import OpenMaya as om
+
+except ImportError:
+
+    om = None
+
+
+class FakeComponent(object):
+    """
+    Minimal stand-in for components that only exposes the hierarchy used to collect dependents.
+    """
+
+    # region Dunderscores
+    __refinalize__ = False
+
+    def __init__(self, name, parent=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type name: str
+        :type parent: Union[FakeComponent, None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(FakeComponent, self).__init__()
+
+        # Declare private variables
+        #
+        self.name = name
+        self.parent = parent
+        self.children = []
+
+        if parent is not None:
+
+            parent.children.append(self)
+    # endregion
+
+    # region Methods
+    def hashCode(self):
+        """
+        Returns a hashable code for this component.
+
+        :rtype: int
+        """
+
+        return id(self)
+
+    def iterComponentAncestors(self):
+        """
+        Returns a generator that yields the ancestors of this component.
+
+        :rtype: Iterator[FakeComponent]
+        """
+
+        ancestor = self.parent
+
+        while ancestor is not None:
+
+            yield ancestor
+            ancestor = ancestor.parent
+
+    def walkComponents(self):
+        """
+        Returns a generator that yields this component and its descendants in hierarchy order.
+
+        :rtype: Iterator[FakeComponent]
+        """
+
+        yield self
+
+        for child in self.children:
+
+            yield from child.walkComponents()
+    # endregion
+
+
+class FakeRefinalizeComponent(FakeComponent):
+    """
+    Overload of `FakeComponent` that opts into re-finalizing.
+    """
+
+    # region Dunderscores
+    __refinalize__ = True
+    # endregion
+
+
+@unittest.skipIf(om is None, 'stateutils requires the Maya python API!')
+class TestStateUtils(unittest.TestCase):
+    """
+    Test case for the incremental rebuild state helpers.
+    """
+
+    # region Tests
+    def test_collectDependents(self):
+        """
+        Tests that only rebuilt components, and any ancestors that opt into re-finalizing, are collected in hierarchy order.
+
+        :rtype: None
+        """
+
+        from ..libs import stateutils
+
+        root = FakeComponent('Root')
+        spine = FakeComponent('Spine', parent=root)
+        collar = FakeComponent('Collar', parent=spine)
+        arm = FakeRefinalizeComponent('Arm', parent=collar)
+        hand = FakeComponent('Hand', parent=arm)
+        head = FakeComponent('Head', parent=spine)
+
+        table = [
+            ([], []),
+            ([hand], [arm, hand]),
+            ([head], [head]),
+            ([arm, hand], [arm, hand]),
+            ([hand, head], [arm, hand, head])
+        ]
+
+        for (components, expected) in table:
+
+            with self.subTest(components=[component.name for component in components]):
+
+                dependents = stateutils.collectDependents(root, components)
+                self.assertEqual([component.name for component in dependents], [component.name for component in expected])
+    # endregion
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+
+from ..libs import transformtable
+
+try:
+
+    import numpy as np
+
+except ImportError:
+
+    np = None
+
+
+@unittest.skipIf(np is None, 'transformtable requires numpy!')
+class TestTransformTable(unittest.TestCase):
+    """
+    Test case for the vectorized spec transform table.
+    """
+
+    # region Tests
+    def test_worldLocalRoundTrip(self):
+        """
+        Tests that world matrices match the pure python composition and convert back into the original local matrices.
+
+        :rtype: None
+        """
+
+        table = transformtable.TransformTable.random(64, chainLength=8, seed=0)
+
+        worldMatrices = table.worldMatrices()
+        expected = transformtable.composeWorldMatrices(table.matrices.tolist(), table.parents.tolist())
+
+        self.assertTrue(np.allclose(worldMatrices, np.array(expected)))
+        self.assertTrue(np.allclose(table.localMatrices(worldMatrices), table.matrices))
+
+    def test_bounds(self):
+        """
+        Tests that bounds are computed from the composed world positions rather than the local positions.
+
+        :rtype: None
+        """
+
+        matrices = np.tile(np.eye(4), (3, 1, 1))
+        matrices[0, 3, :3] = (0.0, 0.0, 100.0)
+        matrices[1, 3, :3] = (10.0, -5.0, 20.0)
+        matrices[2, 3, :3] = (0.0, 30.0, -150.0)
+
+        table = transformtable.TransformTable(matrices, [-1, 0, 1])
+        minimum, maximum = table.bounds()
+
+        self.assertTrue(np.allclose(minimum, (0.0, -5.0, -30.0)))
+        self.assertTrue(np.allclose(maximum, (10.0, 25.0, 120.0)))
+
+        minimum, maximum = transformtable.TransformTable(np.zeros((0, 4, 4)), []).bounds()
+
+        self.assertTrue(np.allclose(minimum, 0.0))
+        self.assertTrue(np.allclose(maximum, 0.0))
+
+    def test_mirrorMatrices(self):
+        """
+        Tests that mirrored matrices are reflected, remain right-handed and that mirroring twice restores the original matrices.
+
+        :rtype: None
+        """
+
+        transformTable = transformtable.TransformTable.random(16, chainLength=4, seed=1)
+        worldMatrices = transformTable.worldMatrices()
+
+        table = [
+            ((0, 1, 2), 1.0),
+            ((2,), 1.0),
+            ((), -1.0)
+        ]
+
+        for (negateAxes, sign) in table:
+
+            with self.subTest(negateAxes=negateAxes):
+
+                mirrorMatrices = transformtable.mirrorMatrices(worldMatrices, axis=0, negateAxes=negateAxes)
+
+                self.assertTrue(np.allclose(mirrorMatrices[:, 3, :3], worldMatrices[:, 3, :3] * (-1.0, 1.0, 1.0)))
+                self.assertTrue(np.allclose(np.sign(np.linalg.det(mirrorMatrices[:, :3, :3])), np.sign(np.linalg.det(worldMatrices[:, :3, :3])) * sign))
+                self.assertTrue(np.allclose(transformtable.mirrorMatrices(mirrorMatrices, axis=0, negateAxes=negateAxes), worldMatrices))
+
+        # Check that only the Z axis is negated, the same as mirroring joints from the rig tab
+        #
+        mirrorMatrices = transformtable.mirrorMatrices(worldMatrices, axis=0, negateAxes=(2,))
+
+        self.assertTrue(np.allclose(mirrorMatrices[:, 0, :3], worldMatrices[:, 0, :3] * (-1.0, 1.0, 1.0)))
+        self.assertTrue(np.allclose(mirrorMatrices[:, 2, :3], worldMatrices[:, 2, :3] * (1.0, -1.0, -1.0)))
+
+    def test_mirrorBehavior(self):
+        """
+        Tests that the table's behavior mirroring negates every axis vector of the reflected world matrices.
+
+        :rtype: None
+        """
+
+        table = transformtable.TransformTable.random(8, seed=2)
+
+        reflected = table.mirrorMatrices(axis=1, behavior=False)
+        behavior = table.mirrorMatrices(axis=1, behavior=True)
+
+        self.assertTrue(np.allclose(behavior[:, :3, :3], -reflected[:, :3, :3]))
+        self.assertTrue(np.allclose(behavior[:, 3], reflected[:, 3]))
+        self.assertTrue(np.allclose(reflected[:, 3, :3], table.worldMatrices()[:, 3, :3] * (1.0, -1.0, 1.0)))
+    # endregion
+
+
+if __name__ == '__main__':
+
+    unittest.main()
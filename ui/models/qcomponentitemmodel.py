@@ -1,11 +1,12 @@
 import json
 
+from contextlib import contextmanager
 from maya.api import OpenMaya as om
 from mpy import mpyscene, mpynode
 from Qt import QtCore, QtWidgets, QtGui, QtCompat
 from enum import IntEnum
 from dcc.python import stringutils
-from ...libs import Status
+from ...libs import Status, stateutils, componenthierarchy
 from ...components import rootcomponent
 
 import logging
@@ -28,6 +29,8 @@ class ViewDetail(IntEnum):
 class QComponentItemModel(QtCore.QAbstractItemModel):
     """
     Overload of `QAbstractItemModel` used to represent rig components.
+    The component tree is cached by hash code so `index`, `parent` and `rowCount` never query any plugs once a parent has been visited!
+    Any child changes made outside of this model are diffed against the cache, per parent, and emitted as fine-grained row signals.
     """
 
     # region Dunderscores
@@ -49,6 +52,19 @@ class QComponentItemModel(QtCore.QAbstractItemModel):
         self._rootComponent = self.nullWeakReference
         self._viewDetails = [ViewDetail.NAME, ViewDetail.TYPE]
         self._headerLabels = [detail.name.title() for detail in self._viewDetails]
+        self._parents = {}
+        self._rows = {}
+        self._children = {}
+        self._editing = set()
+        self._pending = set()
+        self._isResetPending = False
+        self._isFlushPending = False
+
+        # Register component hierarchy callbacks
+        #
+        hierarchy = componenthierarchy.ComponentHierarchy.getInstance()
+        hierarchy.addCallback(self.componentChildrenChanged)
+        hierarchy.addChangedCallback(self.componentChanged)
     # endregion
 
     # region Properties
@@ -94,6 +110,7 @@ class QComponentItemModel(QtCore.QAbstractItemModel):
         # Signal model reset in progress
         #
         self.beginResetModel()
+        self.clearCache()
 
         # Evaluate invisible root item
         #
@@ -156,7 +173,341 @@ class QComponentItemModel(QtCore.QAbstractItemModel):
         return self._headerLabels
     # endregion
 
+    # region Callbacks
+    def componentChildrenChanged(self, component):
+        """
+        Callback method that updates the cached children of the supplied component.
+        Parents that are being edited by this model are discarded immediately since their rows have already been signalled.
+        Any other parents are diffed once control returns to the event loop, so consecutive changes are coalesced!
+        If no component is supplied then the model is reset instead.
+
+        :type component: Union[rigotron.abstract.abstractcomponent.AbstractComponent, None]
+        :rtype: None
+        """
+
+        # Check if entire rig has changed
+        #
+        if component is None:
+
+            self._isResetPending = True
+            self.scheduleFlush()
+
+            return
+
+        # Check if parent has been visited
+        #
+        hashCode = component.hashCode()
+
+        if hashCode not in self._children:
+
+            return
+
+        # Evaluate if parent is being edited
+        #
+        if hashCode in self._editing:
+
+            self.discardChildren(hashCode)
+
+        else:
+
+            self._pending.add(hashCode)
+            self.scheduleFlush()
+
+    def componentChanged(self, component, attributeName):
+        """
+        Callback method that signals any data changes for the supplied component.
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :type attributeName: str
+        :rtype: None
+        """
+
+        # Check if component has been visited
+        #
+        hashCode = component.hashCode()
+        rootComponent = self.rootComponent
+
+        isRoot = rootComponent is not None and rootComponent.hashCode() == hashCode
+        isVisible = isRoot or (self._parents.get(hashCode, None) in self._children)
+
+        if not isVisible:
+
+            return
+
+        # Signal data change across all columns
+        #
+        row = 0 if isRoot else self._rows[hashCode]
+        lastColumn = self.columnCount() - 1
+
+        topLeft = self.createIndex(row, 0, id=hashCode)
+        bottomRight = self.createIndex(row, lastColumn, id=hashCode)
+
+        self.dataChanged.emit(topLeft, bottomRight)
+    # endregion
+
     # region Methods
+    def clearCache(self):
+        """
+        Removes all cached parents, rows and children.
+
+        :rtype: None
+        """
+
+        self._parents.clear()
+        self._rows.clear()
+        self._children.clear()
+
+    def discardChildren(self, hashCode):
+        """
+        Removes the cached children of the supplied parent hash code, along with their cached descendants.
+        Any children that were re-parented will be re-cached by their new parent!
+
+        :type hashCode: int
+        :rtype: None
+        """
+
+        for childHashCode in self._children.pop(hashCode, []):
+
+            if self._parents.get(childHashCode, None) == hashCode:
+
+                self.discardComponent(childHashCode)
+
+    def discardComponent(self, hashCode):
+        """
+        Removes the cached parent and row of the supplied hash code, along with its entire cached subtree.
+
+        :type hashCode: int
+        :rtype: None
+        """
+
+        self._parents.pop(hashCode, None)
+        self._rows.pop(hashCode, None)
+
+        self.discardChildren(hashCode)
+
+    def updateRows(self, hashCode):
+        """
+        Updates the cached rows for the children of the supplied parent hash code.
+
+        :type hashCode: int
+        :rtype: None
+        """
+
+        for (row, childHashCode) in enumerate(self._children.get(hashCode, [])):
+
+            self._parents[childHashCode] = hashCode
+            self._rows[childHashCode] = row
+
+    @contextmanager
+    def editing(self, *indices):
+        """
+        Returns a context manager that marks the supplied parent indices as being edited by this model.
+        Any child changes to these parents have already been signalled so their caches are simply discarded!
+
+        :type indices: Union[QtCore.QModelIndex, List[QtCore.QModelIndex]]
+        :rtype: Iterator[None]
+        """
+
+        hashCodes = [index.internalId() for index in indices if index.isValid()]
+        editing = set(hashCodes).difference(self._editing)
+
+        self._editing.update(editing)
+
+        try:
+
+            yield
+
+        finally:
+
+            self._editing.difference_update(editing)
+
+    def scheduleFlush(self):
+        """
+        Schedules any pending changes to be flushed once control returns to the event loop.
+
+        :rtype: None
+        """
+
+        if not self._isFlushPending:
+
+            self._isFlushPending = True
+            QtCore.QTimer.singleShot(0, self.flushChanges)
+
+    def flushChanges(self):
+        """
+        Emits row signals for any pending child changes.
+        Live parents are diffed first so that any deleted parents are removed by their own parent's diff!
+
+        :rtype: None
+        """
+
+        self._isFlushPending = False
+
+        # Check if a reset is pending
+        #
+        if self._isResetPending:
+
+            self._isResetPending = False
+            self._pending.clear()
+
+            self.beginResetModel()
+            self.clearCache()
+            self.endResetModel()
+
+            return
+
+        # Diff any live parents
+        #
+        pending, self._pending = self._pending, set()
+        deleted = []
+
+        for hashCode in pending:
+
+            component = self.decodeInternalId(hashCode)
+
+            if component is not None and component.isAlive():
+
+                self.diffChildren(component)
+
+            else:
+
+                deleted.append(hashCode)
+
+        # Discard any deleted parents
+        #
+        for hashCode in deleted:
+
+            self.discardChildren(hashCode)
+
+    def diffChildren(self, component):
+        """
+        Emits the row removals and insertions required to update the cached children of the supplied component.
+        If the remaining children have been reordered then the parent's rows are replaced instead!
+
+        :type component: rigotron.abstract.abstractcomponent.AbstractComponent
+        :rtype: None
+        """
+
+        # Check if parent has been visited
+        #
+        hashCode = component.hashCode()
+        current = self._children.get(hashCode, None)
+
+        if current is None:
+
+            return
+
+        children = [child.hashCode() for child in component.iterComponentChildren()]
+
+        if current == children:
+
+            return
+
+        parentIndex = self.createIndex(self.cacheRow(component), 0, id=hashCode)
+
+        # Check if remaining children were reordered
+        #
+        childSet = set(children)
+        currentSet = set(current)
+
+        isReordered = [child for child in current if child in childSet] != [child for child in children if child in currentSet]
+
+        if isReordered:
+
+            removed = list(range(len(current)))
+
+        else:
+
+            removed = [row for (row, child) in enumerate(current) if child not in childSet]
+
+        # Remove rows in descending order
+        #
+        for row in reversed(removed):
+
+            self.beginRemoveRows(parentIndex, row, row)
+
+            childHashCode = current.pop(row)
+
+            if self._parents.get(childHashCode, None) == hashCode:
+
+                self.discardComponent(childHashCode)
+
+            self.updateRows(hashCode)
+            self.endRemoveRows()
+
+        # Insert rows in ascending order
+        #
+        currentSet = set(current)
+
+        for (row, childHashCode) in enumerate(children):
+
+            if childHashCode in currentSet:
+
+                continue
+
+            self.beginInsertRows(parentIndex, row, row)
+
+            current.insert(row, childHashCode)
+            self.updateRows(hashCode)
+
+            self.endInsertRows()
+
+    def cacheChildren(self, component):
+        """
+        Returns the cached child hash codes for the supplied component.
+        The children are only queried from the component hierarchy the first time this component is visited!
+
+        :type component: mpynode.MPyNode
+        :rtype: List[int]
+        """
+
+        hashCode = component.hashCode()
+        children = self._children.get(hashCode, None)
+
+        if children is None:
+
+            children = self._children[hashCode] = [child.hashCode() for child in component.iterComponentChildren()]
+            self.updateRows(hashCode)
+
+        return children
+
+    def cacheParent(self, component):
+        """
+        Returns the cached parent hash code for the supplied component.
+        Components without a parent, such as the root component, return none!
+
+        :type component: mpynode.MPyNode
+        :rtype: Union[int, None]
+        """
+
+        hashCode = component.hashCode()
+
+        if hashCode not in self._parents:
+
+            componentParent = component.componentParent()
+
+            if componentParent is not None:
+
+                self.cacheChildren(componentParent)
+
+            else:
+
+                self._parents[hashCode] = None
+                self._rows[hashCode] = 0
+
+        return self._parents.get(hashCode, None)
+
+    def cacheRow(self, component):
+        """
+        Returns the cached row for the supplied component.
+
+        :type component: mpynode.MPyNode
+        :rtype: int
+        """
+
+        self.cacheParent(component)
+        return self._rows.get(component.hashCode(), 0)
+
     def decodeInternalId(self, internalId):
         """
         Returns an item path from the supplied internal ID.
@@ -186,19 +537,7 @@ class QComponentItemModel(QtCore.QAbstractItemModel):
         :rtype: QtCore.QModelIndex
         """
 
-        componentParent = component.componentParent()
-        hashCode = component.hashCode()
-
-        if componentParent is not None:
-
-            componentChildren = list(componentParent.iterComponentChildren())
-            row = componentChildren.index(component)
-
-            return self.createIndex(row, column, id=hashCode)
-
-        else:
-
-            return self.createIndex(0, column, id=hashCode)
+        return self.createIndex(self.cacheRow(component), column, id=component.hashCode())
 
     def rowCount(self, parent=QtCore.QModelIndex()):
         """
@@ -218,7 +557,7 @@ class QComponentItemModel(QtCore.QAbstractItemModel):
         else:
 
             component = self.decodeInternalId(parent.internalId())
-            return component.componentChildCount()
+            return len(self.cacheChildren(component))
 
     def columnCount(self, parent=QtCore.QModelIndex()):
         """
@@ -250,12 +589,12 @@ class QComponentItemModel(QtCore.QAbstractItemModel):
 
         # Check if row is in range
         #
-        componentChildren = list(componentParent.iterComponentChildren())
+        componentChildren = self.cacheChildren(componentParent)
         componentChildrenCount = len(componentChildren)
 
         if 0 <= row < componentChildrenCount:
 
-            return self.createIndex(row, column, id=componentChildren[row].hashCode())
+            return self.createIndex(row, column, id=componentChildren[row])
 
         else:
 
@@ -289,10 +628,16 @@ class QComponentItemModel(QtCore.QAbstractItemModel):
 
         else:
 
-            componentParent = component.componentParent()
-            row = componentParent.componentSiblings(includeSelf=True).index(componentParent)
+            parentHashCode = self.cacheParent(component)
+
+            if parentHashCode is None:
+
+                return QtCore.QModelIndex()
+
+            componentParent = self.decodeInternalId(parentHashCode)
+            row = self.cacheRow(componentParent)
 
-            return self.createIndex(row, 0, id=componentParent.hashCode())
+            return self.createIndex(row, 0, id=parentHashCode)
 
     def hasChildren(self, parent=None):
         """
@@ -505,9 +850,11 @@ class QComponentItemModel(QtCore.QAbstractItemModel):
         #
         componentParent = self.componentFromIndex(parent)
 
-        for (index, item) in zip(range(firstRow, lastRow + 1), items):
+        with self.editing(parent):
 
-            componentParent.insertComponentChild(index, item)
+            for (index, item) in zip(range(firstRow, lastRow + 1), items):
+
+                componentParent.insertComponentChild(index, item)
 
         # Signal end of insertion
         #
@@ -568,11 +915,13 @@ class QComponentItemModel(QtCore.QAbstractItemModel):
 
         # Insert source items under destination parent
         #
-        sourceChildren = sourceComponent.popComponentChild(slice(sourceRow, lastSourceRow + 1))
+        with self.editing(sourceParent, destinationParent):
+
+            sourceChildren = sourceComponent.popComponentChild(slice(sourceRow, lastSourceRow + 1))
 
-        for (i, sourceChild) in zip(range(destinationRow, lastDestinationRow + 1), sourceChildren):
+            for (i, sourceChild) in zip(range(destinationRow, lastDestinationRow + 1), sourceChildren):
 
-            destinationComponent.insertComponentChild(i, sourceChild)
+                destinationComponent.insertComponentChild(i, sourceChild)
 
         # Signal end of move
         #
@@ -619,11 +968,33 @@ class QComponentItemModel(QtCore.QAbstractItemModel):
         # Get parent items
         #
         parentComponent = self.componentFromIndex(parent)
-        childComponents = parentComponent.popComponentChild(slice(row, lastRow + 1))
 
-        for childComponent in childComponents:
+        with self.editing(parent):
+
+            childComponents = parentComponent.popComponentChild(slice(row, lastRow + 1))
+
+        # Discard removed subtrees
+        # Deleted components never notify their own children so their caches would otherwise leak!
+        #
+        hashCodes = [childComponent.hashCode() for childComponent in childComponents]
+
+        for hashCode in hashCodes:
+
+            self.discardComponent(hashCode)
+
+        parentHashCode = parentComponent.hashCode()
+        children = self._children.get(parentHashCode, None)
+
+        if children is not None:
+
+            children[:] = [childHashCode for childHashCode in children if childHashCode not in hashCodes]
+            self.updateRows(parentHashCode)
+
+        with stateutils.deferSave(parentComponent.findControlRig()):
+
+            for childComponent in childComponents:
 
-            childComponent.delete()
+                childComponent.delete()
 
         # Signal end of removal
         #
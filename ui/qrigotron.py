@@ -1,3 +1,5 @@
+import os
+
 from maya import cmds as mc
 from maya.api import OpenMaya as om
 from mpy import mpyscene, mpynode
@@ -7,7 +9,7 @@ from Qt import QtCore, QtWidgets, QtGui, QtCompat
 from functools import partial
 from . import resources
 from .tabs import qrigtab, qpropstab, qskinstab, qlogstab
-from ..libs import componentfactory, interfacefactory
+from ..libs import componentfactory, interfacefactory, openrequest
 
 import logging
 logging.basicConfig()
@@ -142,6 +144,32 @@ class QRigotron(qsingletonwindow.QSingletonWindow):
         self.tabControl.addTab(self.logsTab, 'Logs')
 
         centralLayout.addWidget(self.tabControl)
+
+        # Initialize status bar
+        #
+        self.openProgressBar = QtWidgets.QProgressBar(parent=self)
+        self.openProgressBar.setObjectName('openProgressBar')
+        self.openProgressBar.setRange(0, 0)  # Busy indicator
+        self.openProgressBar.setMaximumWidth(150)
+        self.openProgressBar.setVisible(False)
+
+        self.statusBar().addPermanentWidget(self.openProgressBar)
+
+        # Initialize open timer
+        #
+        self.openTimer = QtCore.QTimer(self)
+        self.openTimer.setObjectName('openTimer')
+        self.openTimer.setInterval(100)
+        self.openTimer.timeout.connect(self.on_openTimer_timeout)
+
+        # Initialize invalidate timer
+        # Restarting a single-shot timer coalesces any repeated requests!
+        #
+        self.invalidateTimer = QtCore.QTimer(self)
+        self.invalidateTimer.setObjectName('invalidateTimer')
+        self.invalidateTimer.setSingleShot(True)
+        self.invalidateTimer.setInterval(0)
+        self.invalidateTimer.timeout.connect(self.on_invalidateTimer_timeout)
     # endregion
 
     # region Properties
@@ -169,10 +197,13 @@ class QRigotron(qsingletonwindow.QSingletonWindow):
     def standaloneClient(self):
         """
         Getter method that returns the standalone client.
+        Any pending open request is waited on first, the client cannot be shared with the background thread!
 
         :rtype: rpc.RPCClient
         """
 
+        openrequest.wait()
+
         return self._standaloneClient
 
     @property
@@ -230,12 +261,13 @@ class QRigotron(qsingletonwindow.QSingletonWindow):
     def sceneOpened(self, *args, **kwargs):
         """
         Notifies the component item model a scene has been opened.
+        Repeated notifications are coalesced into a single refresh!
 
         :key clientData: Any
         :rtype: None
         """
 
-        self.invalidate()
+        self.requestInvalidate()
     # endregion
 
     # region Methods
@@ -253,6 +285,7 @@ class QRigotron(qsingletonwindow.QSingletonWindow):
         # Initialize remote standalone server
         #
         self._standaloneProcess, self._standaloneClient = rpc.initializeRemoteStandalone()
+        openrequest.invalidate()
 
         if isinstance(self._standaloneProcess, QtCore.QProcess):
 
@@ -275,11 +308,16 @@ class QRigotron(qsingletonwindow.QSingletonWindow):
 
         # Uninitialize remote standalone server
         #
+        self.openTimer.stop()
+        openrequest.wait()
+
         if rpc.isRemoteStandaloneRunning():
 
             self._standaloneClient.quit()
             self._standaloneProcess, self._standaloneClient = None, None
 
+        openrequest.invalidate()
+
     def addCallbacks(self):
         """
         Adds any callbacks required by this window.
@@ -348,6 +386,39 @@ class QRigotron(qsingletonwindow.QSingletonWindow):
         for tab in self.iterTabs():
 
             tab.clear()
+            tab.markStale()
+
+    def openReferencedSkeleton(self, referencePath):
+        """
+        Opens the supplied referenced skeleton inside the standalone process without blocking the user interface.
+        Progress is displayed in the status bar until the request has finished!
+
+        :type referencePath: str
+        :rtype: None
+        """
+
+        # Check if an open request was required
+        #
+        request = openrequest.openAsync(referencePath)
+
+        if request is None:
+
+            return
+
+        # Display progress
+        #
+        self.statusBar().showMessage(f'Opening {os.path.basename(referencePath)}...')
+        self.openProgressBar.setVisible(True)
+        self.openTimer.start()
+
+    def requestInvalidate(self):
+        """
+        Requests the user interface be refreshed once control returns to the event loop.
+
+        :rtype: None
+        """
+
+        self.invalidateTimer.start()
 
     def invalidate(self):
         """
@@ -385,17 +456,26 @@ class QRigotron(qsingletonwindow.QSingletonWindow):
                 referenceNode = self.scene(controlRig.skeletonReference)
                 referencePath = referenceNode.filePath()
 
-                self.standaloneClient.open(referencePath)
+                self.openReferencedSkeleton(referencePath)
 
         else:
 
             log.debug('Scene contains no control-rigs...')
 
-        # Iterate through tabs and notify
+        # Mark tabs as stale
+        # Only the current tab is refreshed, any other tabs are refreshed once they are displayed!
         #
+        self.invalidateTimer.stop()
+
         for tab in self.iterTabs():
 
-            tab.invalidate()
+            tab.markStale()
+
+        currentTab = self.tabControl.currentWidget()
+
+        if currentTab is not None:
+
+            currentTab.refresh()
     # endregion
 
     # region Slots
@@ -411,5 +491,52 @@ class QRigotron(qsingletonwindow.QSingletonWindow):
         tabControl = self.sender()  # type: QtWidgets.QTabWidget
 
         tabWidget = tabControl.widget(index)
+
+        if self.isVisible():
+
+            tabWidget.refresh()  # Tabs are added before the window is initialized!
+
         tabWidget.activated()
+
+    @QtCore.Slot()
+    def on_invalidateTimer_timeout(self):
+        """
+        Slot method for the `invalidateTimer` widget's `timeout` signal.
+
+        :rtype: None
+        """
+
+        self.invalidate()
+
+    @QtCore.Slot()
+    def on_openTimer_timeout(self):
+        """
+        Slot method for the `openTimer` widget's `timeout` signal.
+
+        :rtype: None
+        """
+
+        # Check if open request is still running
+        #
+        request = openrequest.getRequest()
+
+        if openrequest.isPending():
+
+            self.statusBar().showMessage(f'Opening {os.path.basename(request.path)}... ({request.elapsed:.0f}s)')
+            return
+
+        # Display open request result
+        #
+        self.openTimer.stop()
+        self.openProgressBar.setVisible(False)
+
+        if request is None:
+
+            self.statusBar().clearMessage()
+            return
+
+        success = openrequest.wait()
+        message = 'Opened' if success else 'Unable to open'
+
+        self.statusBar().showMessage(f'{message} {os.path.basename(request.path)}', 5000)
     # endregion
@@ -30,6 +30,10 @@ class QAbstractTab(QtWidgets.QWidget, metaclass=qabcmeta.QABCMeta):
 
         super(QAbstractTab, self).__init__(parent=parent, f=f)
 
+        # Declare private variables
+        #
+        self._isStale = True
+
     def __post_init__(self, *args, **kwargs):
         """
         Private method called after an instance has initialized.
@@ -150,3 +154,36 @@ class QAbstractTab(QtWidgets.QWidget, metaclass=qabcmeta.QABCMeta):
 
         pass
     # endregion
+
+    # region Methods
+    def isStale(self):
+        """
+        Evaluates if this tab requires refreshing.
+
+        :rtype: bool
+        """
+
+        return self._isStale
+
+    def markStale(self):
+        """
+        Marks this tab as requiring a refresh the next time it is displayed.
+
+        :rtype: None
+        """
+
+        self._isStale = True
+
+    def refresh(self, force=False):
+        """
+        Refreshes the user interface, but only if this tab has been marked as stale.
+
+        :type force: bool
+        :rtype: None
+        """
+
+        if self._isStale or force:
+
+            self._isStale = False
+            self.invalidate()
+    # endregion
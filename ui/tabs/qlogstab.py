@@ -1,4 +1,4 @@
-from fnmatch import fnmatchcase
+from collections import deque
 from dcc.python import stringutils
 from dcc.ui import qsignalblocker
 from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
@@ -13,9 +13,17 @@ log.setLevel(logging.INFO)
 class QLogsTab(qabstracttab.QAbstractTab):
     """
     Overload of `QAbstractTab` that outputs logs from the remote standalone process.
+    Incoming lines are collected in a ring buffer and appended in batches by a timer, so verbose processes never stall the UI thread.
+    The text edit is capped to the same number of lines, any older lines are discarded first!
     """
 
     # region Dunderscores
+    __line_limit__ = 5000
+    __flush_interval__ = 100  # Milliseconds
+    __redundant_levels__ = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+    __level_colors__ = {'WARNING': 'orange', 'ERROR': 'red'}
+    __default_color__ = 'white'
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -32,6 +40,11 @@ class QLogsTab(qabstracttab.QAbstractTab):
         # Declare private variables
         #
         self._process = None
+        self._lineLimit = kwargs.get('lineLimit', self.__line_limit__)
+        self._flushInterval = kwargs.get('flushInterval', self.__flush_interval__)
+        self._plainText = kwargs.get('plainText', True)
+        self._pending = deque(maxlen=self._lineLimit)
+        self._formats = {}
 
     def __setup_ui__(self, *args, **kwargs):
         """
@@ -58,8 +71,18 @@ class QLogsTab(qabstracttab.QAbstractTab):
         self.logEdit.setObjectName('logEdit')
         self.logEdit.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding))
         self.logEdit.setReadOnly(True)
+        self.logEdit.setUndoRedoEnabled(False)
+        self.logEdit.setMaximumBlockCount(self._lineLimit)
 
         centralLayout.addWidget(self.logEdit)
+
+        # Initialize flush timer
+        #
+        self.flushTimer = QtCore.QTimer(self)
+        self.flushTimer.setObjectName('flushTimer')
+        self.flushTimer.setSingleShot(True)
+        self.flushTimer.setInterval(self._flushInterval)
+        self.flushTimer.timeout.connect(self.on_flushTimer_timeout)
     # endregion
 
     # region Properties
@@ -96,29 +119,127 @@ class QLogsTab(qabstracttab.QAbstractTab):
         else:
 
             raise TypeError(f'process.setter() expects a QProcess ({type(process).__name__} given)!')
-    # endregion
 
-    # region Slots
-    @QtCore.Slot()
-    def on_process_readyReadStandardOutput(self):
+    @property
+    def lineLimit(self):
         """
-        Slot method for the process widget's `readyReadStandardOutput` signal.
+        Getter method that returns the maximum number of displayed lines.
 
+        :rtype: int
+        """
+
+        return self._lineLimit
+
+    @lineLimit.setter
+    def lineLimit(self, lineLimit):
+        """
+        Setter method that updates the maximum number of displayed lines.
+
+        :type lineLimit: int
         :rtype: None
         """
 
-        # Decode standard output
-        #
-        sender = self.sender()
-        data = sender.readAllStandardOutput()
+        self._lineLimit = lineLimit
+        self._pending = deque(self._pending, maxlen=lineLimit)
 
-        stdout = bytes(data).decode("utf8")
+        self.logEdit.setMaximumBlockCount(lineLimit)
 
-        # Iterate through output lines
-        #
-        lines = stdout.splitlines()
+    @property
+    def flushInterval(self):
+        """
+        Getter method that returns the number of milliseconds between flushes.
+
+        :rtype: int
+        """
+
+        return self._flushInterval
+
+    @flushInterval.setter
+    def flushInterval(self, flushInterval):
+        """
+        Setter method that updates the number of milliseconds between flushes.
+
+        :type flushInterval: int
+        :rtype: None
+        """
+
+        self._flushInterval = flushInterval
+        self.flushTimer.setInterval(flushInterval)
+
+    @property
+    def plainText(self):
+        """
+        Getter method that returns the `plainText` flag.
+        When enabled, lines are inserted as plain text with a cached format per level instead of being parsed as HTML.
+
+        :rtype: bool
+        """
 
-        for line in lines:
+        return self._plainText
+
+    @plainText.setter
+    def plainText(self, plainText):
+        """
+        Setter method that updates the `plainText` flag.
+
+        :type plainText: bool
+        :rtype: None
+        """
+
+        self._plainText = plainText
+    # endregion
+
+    # region Methods
+    @classmethod
+    def levelColor(cls, line):
+        """
+        Returns the color for the supplied line based on its log level.
+
+        :type line: str
+        :rtype: str
+        """
+
+        for (level, color) in cls.__level_colors__.items():
+
+            if line.endswith(f':{level}:'):
+
+                return color
+
+        return cls.__default_color__
+
+    def textFormat(self, color):
+        """
+        Returns the cached text format for the supplied color.
+
+        :type color: str
+        :rtype: QtGui.QTextCharFormat
+        """
+
+        textFormat = self._formats.get(color, None)
+
+        if textFormat is None:
+
+            textFormat = QtGui.QTextCharFormat()
+            textFormat.setForeground(QtGui.QColor(color))
+            textFormat.setFontPointSize(10.5)  # Equivalent to 14px
+
+            self._formats[color] = textFormat
+
+        return textFormat
+
+    def queueLines(self, text, colorize=False):
+        """
+        Queues the lines from the supplied text to be appended on the next flush.
+        Any empty or redundant lines are ignored!
+
+        :type text: str
+        :type colorize: bool
+        :rtype: None
+        """
+
+        # Iterate through lines
+        #
+        for line in text.splitlines():
 
             # Ignore any empty lines
             #
@@ -130,54 +251,134 @@ class QLogsTab(qabstracttab.QAbstractTab):
 
             # Ignore any redundant logs
             #
-            if any(line.startswith(level) for level in ('DEBUG', 'INFO', 'WARNING', 'ERROR')):
+            if line.startswith(self.__redundant_levels__):
 
                 continue
 
-            # Append line to text-edit
+            # Queue line with color
             #
-            self.logTextEdit.appendHtml(f'<p style="font-size:14px; color:white;">{line}</p>')
+            color = self.levelColor(line) if colorize else self.__default_color__
+            self._pending.append((color, line))
 
-    @QtCore.Slot()
-    def on_process_readyReadStandardError(self):
+        # Check if flush is required
+        #
+        if len(self._pending) > 0 and not self.flushTimer.isActive():
+
+            self.flushTimer.start()
+
+    def flush(self):
         """
-        Slot method for the process widget's `readyReadStandardError` signal.
+        Appends any queued lines to the text edit in a single edit block.
+        Consecutive lines with the same color are inserted together!
 
         :rtype: None
         """
 
-        # Decode standard error
+        # Check if there are any pending lines
         #
-        sender = self.sender()
-        data = sender.readAllStandardError()
+        if len(self._pending) == 0:
 
-        stderr = bytes(data).decode("utf8")
+            return
 
-        # Iterate through output lines
+        pending, self._pending = self._pending, deque(maxlen=self._lineLimit)
+
+        # Group consecutive lines by color
         #
-        lines = stderr.splitlines()
+        runs = []
 
-        for line in lines:
+        for (color, line) in pending:
 
-            # Ignore any empty lines
-            #
-            line = line.strip(stringutils.__escape_chars__)
+            if len(runs) > 0 and runs[-1][0] == color:
 
-            if stringutils.isNullOrEmpty(line):
+                runs[-1][1].append(line)
 
-                continue
+            else:
 
-            # Ignore any redundant logs
-            #
-            if any(line.startswith(level) for level in ('DEBUG', 'INFO', 'WARNING', 'ERROR')):
+                runs.append((color, [line]))
 
-                continue
+        # Check if the scroll bar is at the bottom
+        #
+        scrollBar = self.logEdit.verticalScrollBar()
+        isAtBottom = scrollBar.value() == scrollBar.maximum()
 
-            # Append line to text-edit
-            #
-            isWarning = fnmatchcase(line, f'*:WARNING:')
-            isError = fnmatchcase(line, f'*:ERROR:')
-            color = 'orange' if isWarning else 'red' if isError else 'white'
+        # Append lines to end of document
+        #
+        if self._plainText:
+
+            cursor = QtGui.QTextCursor(self.logEdit.document())
+            cursor.movePosition(QtGui.QTextCursor.End)
+            cursor.beginEditBlock()
+
+            isEmpty = self.logEdit.document().isEmpty()
+
+            for (color, lines) in runs:
+
+                text = '\n'.join(lines)
+                cursor.insertText(text if isEmpty else f'\n{text}', self.textFormat(color))
+
+                isEmpty = False
+
+            cursor.endEditBlock()
+
+        else:
+
+            html = '<br>'.join(f'<span style="font-size:14px; color:{color};">{"<br>".join(lines)}</span>' for (color, lines) in runs)
+            self.logEdit.appendHtml(html)
+
+        # Restore scroll position
+        #
+        if isAtBottom:
+
+            scrollBar.setValue(scrollBar.maximum())
+
+    def clearLogs(self):
+        """
+        Removes all displayed and queued lines.
+        Unlike `clear`, which is called whenever a scene is changed, this must be invoked explicitly!
+
+        :rtype: None
+        """
+
+        self.flushTimer.stop()
+        self._pending.clear()
+
+        self.logEdit.clear()
+    # endregion
+
+    # region Slots
+    @QtCore.Slot()
+    def on_process_readyReadStandardOutput(self):
+        """
+        Slot method for the process widget's `readyReadStandardOutput` signal.
+
+        :rtype: None
+        """
+
+        sender = self.sender()
+        data = sender.readAllStandardOutput()
+
+        self.queueLines(bytes(data).decode('utf8'))
+
+    @QtCore.Slot()
+    def on_process_readyReadStandardError(self):
+        """
+        Slot method for the process widget's `readyReadStandardError` signal.
+
+        :rtype: None
+        """
+
+        sender = self.sender()
+        data = sender.readAllStandardError()
+
+        self.queueLines(bytes(data).decode('utf8'), colorize=True)
+
+    @QtCore.Slot()
+    def on_flushTimer_timeout(self):
+        """
+        Slot method for the flush timer's `timeout` signal.
+
+        :rtype: None
+        """
 
-            self.logEdit.appendHtml(f'<p style="font-size:14px; color:{color};">{line}</p>')
+        self.flush()
     # endregion
@@ -14,7 +14,7 @@ from itertools import chain
 from . import qabstracttab
 from ..dialogs import qinputdialog
 from ..models import qcomponentitemmodel, qpropertyitemmodel
-from ...libs import Status, stateutils, layerutils
+from ...libs import Status, stateutils, layerutils, transformtable
 
 import logging
 logging.basicConfig()
@@ -786,7 +786,15 @@ class QRigTab(qabstracttab.QAbstractTab):
         if self.controlRig is not None:
 
             self.nameLineEdit.setText(self.controlRig.rigName)
-            self.outlinerModel.rootComponent = self.scene(self.controlRig.rootComponent)
+
+            # Check if root component has changed
+            # Any changes beneath the root component are already signalled by the model!
+            #
+            rootComponent = self.scene(self.controlRig.rootComponent)
+
+            if rootComponent != self.outlinerModel.rootComponent:
+
+                self.outlinerModel.rootComponent = rootComponent
 
         elif self.legacyRig is not None:
 
@@ -911,6 +919,7 @@ class QRigTab(qabstracttab.QAbstractTab):
     def mirrorNodes(self, *nodes):
         """
         Mirrors the transforms on the supplied nodes.
+        Nodes without a parent space are mirrored by matrix, these matrices are collected and mirrored in a single batch afterward!
 
         :type nodes: Union[mpynode.MPyNode, List[mpynode.MPyNode]]
         :rtype: None
@@ -918,6 +927,9 @@ class QRigTab(qabstracttab.QAbstractTab):
 
         # Iterate through nodes
         #
+        pending = []
+        mirrored = set()
+
         for node in nodes:
 
             # Evaluate node type
@@ -966,17 +978,13 @@ class QRigTab(qabstracttab.QAbstractTab):
 
             if isIdentityMatrix:
 
-                matrix = node.matrix()
-                xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix, normalize=True)
-
-                mirrorXAxis = transformutils.mirrorVector(xAxis)
-                mirrorYAxis = transformutils.mirrorVector(yAxis)
-                mirrorZAxis = -transformutils.mirrorVector(zAxis)
-                mirrorPos = om.MPoint(-pos.x, pos.y, pos.z, pos.w)
-                mirrorMatrix = transformutils.makeMatrix(mirrorXAxis, mirrorYAxis, mirrorZAxis, mirrorPos)
+                # Check if the opposite node has already been mirrored onto this node
+                # Mirroring it back would only restore the original matrix!
+                #
+                if node.hashCode() not in mirrored:
 
-                oppositeNode = node.getOppositeNode()
-                oppositeNode.setMatrix(mirrorMatrix, skipScale=True)
+                    pending.append((oppositeNode, node.matrix()))
+                    mirrored.add(oppositeNode.hashCode())
 
             else:  # World space
 
@@ -1002,6 +1010,46 @@ class QRigTab(qabstracttab.QAbstractTab):
                 oppositeNurbsCurve = oppositeNode.shape()
                 oppositeNurbsCurve.setControlPoints(mirroredControlPoints)
 
+        # Mirror pending matrices
+        #
+        numPending = len(pending)
+
+        if numPending == 0:
+
+            return
+
+        if transformtable.isAvailable():
+
+            mirrorMatrices = transformtable.mirrorMatrices([list(matrix) for (oppositeNode, matrix) in pending], axis=0, negateAxes=(2,))
+            mirrorMatrices = [om.MMatrix(mirrorMatrix.ravel().tolist()) for mirrorMatrix in mirrorMatrices]
+
+        else:
+
+            mirrorMatrices = [self.mirrorMatrix(matrix) for (oppositeNode, matrix) in pending]
+
+        for ((oppositeNode, matrix), mirrorMatrix) in zip(pending, mirrorMatrices):
+
+            oppositeNode.setMatrix(mirrorMatrix, skipScale=True)
+
+    @staticmethod
+    def mirrorMatrix(matrix):
+        """
+        Returns the supplied matrix mirrored across the YZ plane.
+        This is the fallback used by `mirrorNodes` whenever numpy is unavailable!
+
+        :type matrix: om.MMatrix
+        :rtype: om.MMatrix
+        """
+
+        xAxis, yAxis, zAxis, pos = transformutils.breakMatrix(matrix, normalize=True)
+
+        mirrorXAxis = transformutils.mirrorVector(xAxis)
+        mirrorYAxis = transformutils.mirrorVector(yAxis)
+        mirrorZAxis = -transformutils.mirrorVector(zAxis)
+        mirrorPos = om.MPoint(-pos.x, pos.y, pos.z, pos.w)
+
+        return transformutils.makeMatrix(mirrorXAxis, mirrorYAxis, mirrorZAxis, mirrorPos)
+
     @undo.Undo(name='Sanitize Joints')
     def sanitizeJoints(self, *joints):
         """
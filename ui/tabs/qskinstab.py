@@ -8,6 +8,7 @@ from dcc.ui import qsignalblocker, qdivider
 from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
 from enum import IntEnum
 from . import qabstracttab
+from ...libs import openrequest
 
 import logging
 logging.basicConfig()
@@ -339,6 +340,8 @@ class QSkinsTab(qabstracttab.QAbstractTab):
         self.standaloneClient.file(referencePath, reference=True, namespace=':')
         self.standaloneClient.saveAs(filePath)
 
+        openrequest.invalidate()
+
         # Create reference to scene file
         #
         return self.controlRig.addSkin(resolvedPath, namespace=namespace)